@@ -68,6 +68,12 @@ interface BatchInsightStatus {
   estimated_remaining_seconds: number | null;
   avg_seconds_per_country: number | null;
   last_completed_country: string | null;
+  insights_planned?: number;
+  insights_per_minute?: number | null;
+  concurrency_window?: number | null;
+  active_requests?: number | null;
+  rate_limit_hits?: number;
+  backoff_remaining_seconds?: number | null;
 }
 
 interface PipelineStatus {
@@ -902,6 +908,34 @@ export function DatabaseFill() {
                     color="emerald"
                   />
                 )}
+                {insightRunning && insightStatus.insights_per_minute != null && (
+                  <StatBadge
+                    icon={Activity}
+                    label="Throughput"
+                    value={`${insightStatus.insights_per_minute} insights/min`}
+                    color="emerald"
+                  />
+                )}
+                {insightRunning && insightStatus.concurrency_window != null && (
+                  <StatBadge
+                    icon={Zap}
+                    label="Concurrency"
+                    value={`${insightStatus.active_requests ?? 0}/${insightStatus.concurrency_window}`}
+                    color="blue"
+                  />
+                )}
+                {(insightStatus.rate_limit_hits ?? 0) > 0 && (
+                  <StatBadge
+                    icon={AlertTriangle}
+                    label="Rate Limited"
+                    value={
+                      insightRunning && (insightStatus.backoff_remaining_seconds ?? 0) > 0
+                        ? `${insightStatus.rate_limit_hits} (backoff ${insightStatus.backoff_remaining_seconds}s)`
+                        : insightStatus.rate_limit_hits ?? 0
+                    }
+                    color="amber"
+                  />
+                )}
               </div>
 
               {/* Current processing info */}
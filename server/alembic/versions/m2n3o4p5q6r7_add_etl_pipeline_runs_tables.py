@@ -0,0 +1,72 @@
+"""Add etl_pipeline_runs and etl_pipeline_checkpoints tables
+
+Revision ID: m2n3o4p5q6r7
+Revises: 96e5e794bd48
+Create Date: 2026-10-16 12:00:00.000000
+
+Persistent ETL run IDs with per-country / per-source checkpoints, so an
+interrupted pipeline run can be resumed where it stopped.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers, used by Alembic.
+revision = 'm2n3o4p5q6r7'
+down_revision = '96e5e794bd48'
+branch_labels = None
+depends_on = None
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if a table exists in the database."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    if not table_exists('etl_pipeline_runs'):
+        op.create_table(
+            'etl_pipeline_runs',
+            sa.Column('id', sa.String(36), primary_key=True),
+            sa.Column('status', sa.String(20), nullable=False, server_default='running'),
+            sa.Column('options', JSONB, nullable=False, server_default='{}',
+                      comment='run_full_pipeline arguments, replayed on resume'),
+            sa.Column('target_countries', JSONB, nullable=False, server_default='[]'),
+            sa.Column('processed_count', sa.Integer, nullable=False, server_default='0'),
+            sa.Column('failed_count', sa.Integer, nullable=False, server_default='0'),
+            sa.Column('resume_count', sa.Integer, nullable=False, server_default='0'),
+            sa.Column('error', sa.Text, nullable=True),
+            sa.Column('started_at', sa.DateTime, nullable=False, server_default=sa.func.now()),
+            sa.Column('updated_at', sa.DateTime, nullable=True, server_default=sa.func.now()),
+            sa.Column('finished_at', sa.DateTime, nullable=True),
+        )
+        op.create_index('ix_etl_pipeline_runs_status', 'etl_pipeline_runs', ['status'])
+
+    if not table_exists('etl_pipeline_checkpoints'):
+        op.create_table(
+            'etl_pipeline_checkpoints',
+            sa.Column('id', sa.Integer, primary_key=True, autoincrement=True),
+            sa.Column('run_id', sa.String(36),
+                      sa.ForeignKey('etl_pipeline_runs.id', ondelete='CASCADE'),
+                      nullable=False),
+            sa.Column('country_iso_code', sa.String(3), nullable=False),
+            sa.Column('source', sa.String(32), nullable=False,
+                      comment='ilo | worldbank | who | worldbank_extended | pipeline'),
+            sa.Column('status', sa.String(20), nullable=False,
+                      comment='fetched | written | failed'),
+            sa.Column('payload', JSONB, nullable=True),
+            sa.Column('error', sa.Text, nullable=True),
+            sa.Column('updated_at', sa.DateTime, nullable=False, server_default=sa.func.now()),
+            sa.UniqueConstraint('run_id', 'country_iso_code', 'source', name='uq_etl_checkpoint'),
+        )
+        op.create_index('ix_etl_pipeline_checkpoints_run_id', 'etl_pipeline_checkpoints', ['run_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_etl_pipeline_checkpoints_run_id', 'etl_pipeline_checkpoints')
+    op.drop_table('etl_pipeline_checkpoints')
+    op.drop_index('ix_etl_pipeline_runs_status', 'etl_pipeline_runs')
+    op.drop_table('etl_pipeline_runs')
@@ -0,0 +1,66 @@
+"""Add country_score_snapshots and country_snapshot_dirty tables
+
+Revision ID: n3o4p5q6r7s8
+Revises: m2n3o4p5q6r7
+Create Date: 2026-10-16 14:00:00.000000
+
+Denormalised per-country read model for the display endpoints (maintained
+by app.services.country_snapshot), plus the queue of stale countries.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+# revision identifiers, used by Alembic.
+revision = 'n3o4p5q6r7s8'
+down_revision = 'm2n3o4p5q6r7'
+branch_labels = None
+depends_on = None
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if a table exists in the database."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    if not table_exists('country_score_snapshots'):
+        op.create_table(
+            'country_score_snapshots',
+            sa.Column('iso_code', sa.String(3), primary_key=True),
+            sa.Column('name', sa.String(100), nullable=False),
+            sa.Column('flag_url', sa.String(255), nullable=True),
+            sa.Column('strategic_summary_text', sa.Text, nullable=True),
+            sa.Column('maturity_score', sa.Float, nullable=True),
+            sa.Column('governance_score', sa.Float, nullable=True),
+            sa.Column('pillar1_score', sa.Float, nullable=True),
+            sa.Column('pillar2_score', sa.Float, nullable=True),
+            sa.Column('pillar3_score', sa.Float, nullable=True),
+            sa.Column('data_coverage_score', sa.Float, nullable=True),
+            sa.Column('layers', JSONB, nullable=False, server_default='{}'),
+            sa.Column('country_created_at', sa.DateTime, nullable=True),
+            sa.Column('country_updated_at', sa.DateTime, nullable=True),
+            sa.Column('version', sa.BigInteger, nullable=False, server_default='0'),
+            sa.Column('refreshed_at', sa.DateTime, nullable=False, server_default=sa.func.now()),
+        )
+        op.create_index('ix_country_score_snapshots_name', 'country_score_snapshots', ['name'])
+        op.create_index('ix_country_score_snapshots_version', 'country_score_snapshots', ['version'])
+
+    if not table_exists('country_snapshot_dirty'):
+        op.create_table(
+            'country_snapshot_dirty',
+            sa.Column('iso_code', sa.String(3), primary_key=True),
+            sa.Column('marked_at', sa.DateTime, nullable=False, server_default=sa.func.now()),
+        )
+        # Build the whole snapshot on first read
+        op.execute("INSERT INTO country_snapshot_dirty (iso_code) VALUES ('*')")
+
+
+def downgrade() -> None:
+    op.drop_table('country_snapshot_dirty')
+    op.drop_index('ix_country_score_snapshots_version', 'country_score_snapshots')
+    op.drop_index('ix_country_score_snapshots_name', 'country_score_snapshots')
+    op.drop_table('country_score_snapshots')
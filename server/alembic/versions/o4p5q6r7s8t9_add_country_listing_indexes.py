@@ -0,0 +1,37 @@
+"""Add country list keyset and maturity filter indexes
+
+Revision ID: o4p5q6r7s8t9
+Revises: n3o4p5q6r7s8
+Create Date: 2026-10-16 15:00:00.000000
+
+Composite (name, iso_code) index for keyset pagination of GET /countries/
+and a maturity_score index for the band / score range filters.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'o4p5q6r7s8t9'
+down_revision = 'n3o4p5q6r7s8'
+branch_labels = None
+depends_on = None
+
+
+def index_exists(table_name: str, index_name: str) -> bool:
+    """Check if an index exists on a table."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return any(index['name'] == index_name for index in inspector.get_indexes(table_name))
+
+
+def upgrade() -> None:
+    if not index_exists('countries', 'ix_countries_name_iso_code'):
+        op.create_index('ix_countries_name_iso_code', 'countries', ['name', 'iso_code'])
+    if not index_exists('countries', 'ix_countries_maturity_score'):
+        op.create_index('ix_countries_maturity_score', 'countries', ['maturity_score'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_countries_maturity_score', 'countries')
+    op.drop_index('ix_countries_name_iso_code', 'countries')
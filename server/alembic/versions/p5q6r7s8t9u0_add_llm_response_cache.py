@@ -0,0 +1,77 @@
+"""Add llm_response_cache table and ai_call_traces.cache_status
+
+Revision ID: p5q6r7s8t9u0
+Revises: o4p5q6r7s8t9
+Create Date: 2026-10-16 18:00:00.000000
+
+Stored LLM responses for app.services.llm_cache (when LLM_CACHE_URL is not
+set), plus the cache outcome of each traced AI call.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'p5q6r7s8t9u0'
+down_revision = 'o4p5q6r7s8t9'
+branch_labels = None
+depends_on = None
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if a table exists in the database."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return table_name in inspector.get_table_names()
+
+
+def column_exists(table_name: str, column_name: str) -> bool:
+    """Check if a column exists in a table."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    if table_name not in inspector.get_table_names():
+        return False
+    columns = [col['name'] for col in inspector.get_columns(table_name)]
+    return column_name in columns
+
+
+def upgrade() -> None:
+    if not table_exists('llm_response_cache'):
+        op.create_table(
+            'llm_response_cache',
+            sa.Column('key', sa.String(64), primary_key=True),
+            sa.Column('scope', sa.String(64), nullable=False),
+            sa.Column('provider', sa.String(50), nullable=False),
+            sa.Column('model_name', sa.String(100), nullable=False),
+            sa.Column('temperature', sa.Float, nullable=True),
+            sa.Column('prompt_preview', sa.String(200), nullable=True),
+            sa.Column('response', sa.Text, nullable=False),
+            sa.Column('embedding', sa.LargeBinary, nullable=True),
+            sa.Column('created_at', sa.DateTime, nullable=False, server_default=sa.func.now()),
+            sa.Column('last_hit_at', sa.DateTime, nullable=False, server_default=sa.func.now()),
+            sa.Column('expires_at', sa.DateTime, nullable=False),
+            sa.Column('hit_count', sa.Integer, nullable=False, server_default='0'),
+        )
+        op.create_index('ix_llm_response_cache_scope', 'llm_response_cache', ['scope'])
+        op.create_index('ix_llm_response_cache_last_hit_at', 'llm_response_cache', ['last_hit_at'])
+        op.create_index('ix_llm_response_cache_expires_at', 'llm_response_cache', ['expires_at'])
+
+    if table_exists('ai_call_traces') and not column_exists('ai_call_traces', 'cache_status'):
+        op.add_column(
+            'ai_call_traces',
+            sa.Column(
+                'cache_status',
+                sa.String(20),
+                nullable=True,
+                comment='LLM response cache outcome (hit, semantic_hit, miss) or null if not cached'
+            )
+        )
+
+
+def downgrade() -> None:
+    if column_exists('ai_call_traces', 'cache_status'):
+        op.drop_column('ai_call_traces', 'cache_status')
+    op.drop_index('ix_llm_response_cache_expires_at', 'llm_response_cache')
+    op.drop_index('ix_llm_response_cache_last_hit_at', 'llm_response_cache')
+    op.drop_index('ix_llm_response_cache_scope', 'llm_response_cache')
+    op.drop_table('llm_response_cache')
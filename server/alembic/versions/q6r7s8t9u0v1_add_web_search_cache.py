@@ -0,0 +1,50 @@
+"""Add web_search_cache table
+
+Revision ID: q6r7s8t9u0v1
+Revises: p5q6r7s8t9u0
+Create Date: 2026-10-16 20:00:00.000000
+
+Parsed web search results per provider and normalised query, maintained
+by app.services.web_search_cache.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'q6r7s8t9u0v1'
+down_revision = 'p5q6r7s8t9u0'
+branch_labels = None
+depends_on = None
+
+
+def table_exists(table_name: str) -> bool:
+    """Check if a table exists in the database."""
+    conn = op.get_bind()
+    inspector = sa.inspect(conn)
+    return table_name in inspector.get_table_names()
+
+
+def upgrade() -> None:
+    if not table_exists('web_search_cache'):
+        op.create_table(
+            'web_search_cache',
+            sa.Column('key', sa.String(64), primary_key=True),
+            sa.Column('provider', sa.String(30), nullable=False),
+            sa.Column('query', sa.String(500), nullable=False),
+            sa.Column('query_class', sa.String(30), nullable=False),
+            sa.Column('num_results', sa.Integer, nullable=False),
+            sa.Column('results', sa.JSON, nullable=False),
+            sa.Column('answer', sa.Text, nullable=True),
+            sa.Column('fetched_at', sa.DateTime, nullable=False, server_default=sa.func.now()),
+            sa.Column('expires_at', sa.DateTime, nullable=False),
+            sa.Column('hit_count', sa.Integer, nullable=False, server_default='0'),
+        )
+        op.create_index('ix_web_search_cache_query', 'web_search_cache', ['query'])
+        op.create_index('ix_web_search_cache_expires_at', 'web_search_cache', ['expires_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_web_search_cache_expires_at', 'web_search_cache')
+    op.drop_index('ix_web_search_cache_query', 'web_search_cache')
+    op.drop_table('web_search_cache')
@@ -22,6 +22,7 @@ from app.core.security import encrypt_api_key, decrypt_api_key
 from app.core.dependencies import get_current_admin_user
 from app.models.user import User, AIConfig, AIProvider, SUPPORTED_MODELS
 from app.services.ai_call_tracer import AICallTracer
+from app.services.llm_clients import invalidate_llm_clients
 
 # Create router
 router = APIRouter(prefix="/ai-config", tags=["AI Configuration"])
@@ -214,6 +215,9 @@ async def update_ai_config(
     db.commit()
     db.refresh(config)
     
+    # Clients built from the previous configuration must not be reused
+    invalidate_llm_clients()
+    
     return config_to_response(config)
 
 
@@ -488,6 +492,7 @@ class AICallTraceResponse(BaseModel):
     latency_ms: Optional[int]
     success: bool
     error_message: Optional[str]
+    cache_status: Optional[str] = None
     user_id: Optional[int]
 
 
@@ -509,6 +514,7 @@ class AICallStatsResponse(BaseModel):
     avg_latency_ms: float
     calls_by_provider: dict
     calls_by_operation: dict
+    cache: dict = {}
     recent_errors: List[dict]
 
 
@@ -591,6 +597,7 @@ async def list_ai_traces(
                 latency_ms=t.latency_ms,
                 success=t.success,
                 error_message=t.error_message,
+                cache_status=t.cache_status,
                 user_id=t.user_id,
             )
             for t in traces
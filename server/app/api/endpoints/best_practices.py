@@ -469,7 +469,7 @@ async def get_country_best_practice(
 # BACKGROUND TASK FUNCTIONS
 # =============================================================================
 
-def run_best_practice_generation_task(question_id: str):
+def run_best_practice_generation_task(question_id: str, force_regenerate: bool = False):
     """
     Background task that runs the AI generation for a best practice question.
     Creates its own database session since the request session will be closed.
@@ -516,6 +516,7 @@ def run_best_practice_generation_task(question_id: str):
                     },
                     update_stats=True,
                     enable_web_search=False,
+                    use_cache=not force_regenerate,
                 ),
                 timeout=120.0,
             )
@@ -583,7 +584,7 @@ def run_best_practice_generation_task(question_id: str):
         db.close()
 
 
-def run_country_best_practice_generation_task(iso_code: str, question_id: str):
+def run_country_best_practice_generation_task(iso_code: str, question_id: str, force_regenerate: bool = False):
     """
     Background task that runs the AI generation for a country best practice.
     Creates its own database session since the request session will be closed.
@@ -644,6 +645,7 @@ def run_country_best_practice_generation_task(iso_code: str, question_id: str):
                     },
                     update_stats=True,
                     enable_web_search=False,
+                    use_cache=not force_regenerate,
                 ),
                 timeout=120.0,
             )
@@ -771,7 +773,7 @@ async def generate_best_practice(
     db.commit()
     
     # Schedule background task
-    background_tasks.add_task(run_best_practice_generation_task, question_id)
+    background_tasks.add_task(run_best_practice_generation_task, question_id, request.force_regenerate)
     
     logger.info(f"Scheduled background generation for best practice: {question_id}")
     
@@ -870,7 +872,7 @@ async def generate_country_best_practice(
     db.commit()
     
     # Schedule background task
-    background_tasks.add_task(run_country_best_practice_generation_task, iso_code, question_id)
+    background_tasks.add_task(run_country_best_practice_generation_task, iso_code, question_id, request.force_regenerate)
     
     logger.info(f"Scheduled background generation for country best practice: {iso_code}/{question_id}")
     
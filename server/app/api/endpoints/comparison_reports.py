@@ -210,7 +210,8 @@ def parse_ai_response(response: str) -> Dict[str, Any]:
 async def generate_comparison_report(
     db: Session,
     comparison_iso: str,
-    user_email: Optional[str] = None
+    user_email: Optional[str] = None,
+    use_cache: Optional[bool] = None,
 ) -> ComparisonReport:
     """Generate a new comparison report using AI."""
     start_time = time.time()
@@ -254,7 +255,7 @@ async def generate_comparison_report(
     
     # Run agent
     runner = AgentRunner(db, ai_config)
-    result = await runner.run("comparison-research-analyst", variables)
+    result = await runner.run("comparison-research-analyst", variables, use_cache=use_cache)
     if not result.get("success"):
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
@@ -468,7 +469,7 @@ async def regenerate_report(
     comparison_iso = comparison_iso.upper()
     
     # Generate new report
-    report = await generate_comparison_report(db, comparison_iso, current_user.email)
+    report = await generate_comparison_report(db, comparison_iso, current_user.email, use_cache=False)
     
     comparison_country = get_country_data(db, comparison_iso)
     comparison_name = comparison_country.name if comparison_country else comparison_iso
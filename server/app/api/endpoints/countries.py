@@ -11,23 +11,52 @@ Key Features:
 - Includes status derivation for gap analysis
 """
 
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from enum import Enum
+import json
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, ValidationError
 from sqlalchemy.orm import Session, joinedload
 
 logger = logging.getLogger(__name__)
 
-from app.core.database import get_db
+from app.core.database import SessionLocal, get_db
 from app.models.country import Country, Pillar1Hazard, Pillar2Vigilance, Pillar3Restoration, GovernanceLayer, CountryIntelligence
 from app.schemas.country import (
     CountryResponse,
     CountryListResponse,
     CountryListPaginated,
 )
+from app.models.country_snapshot import CountryScoreSnapshot
+from app.services.country_snapshot import (
+    current_state,
+    mark_stale,
+    project_snapshot,
+    projection_fields,
+    read_snapshot,
+    snapshot_state,
+)
+from app.services.country_listing import (
+    MATURITY_BANDS,
+    REGIONS,
+    CountryFilters,
+    InvalidCursor,
+    cached_count,
+    fetch_page,
+    invalidate_country_counts,
+)
+from app.services.response_cache import ResponseCache
+from app.services.rule_engine import compile_rules
+from app.services.scoring_engine import (
+    EXPERT_PROFILE,
+    load_metric_matrix,
+    score_maturity,
+    score_one,
+    write_scores,
+)
 
 
 # =============================================================================
@@ -149,101 +178,47 @@ def derive_country_status(fatal_rate: Optional[float]) -> CountryStatus:
     """
 )
 async def get_geojson_metadata(
+    request: Request,
     db: Session = Depends(get_db)
-) -> GeoJSONMetadataResponse:
+) -> Response:
     """
     Fetch lightweight country metadata for map visualization.
     
-    READS STORED PILLAR SCORES from the countries table.
-    These scores are calculated and stored by the /admin/metric-config/recalculate endpoint.
-    
-    If scores are NULL, falls back to on-the-fly calculation for backward compatibility.
-    Uses raw SQL to avoid ORM enum processing issues.
-    """
-    from sqlalchemy import text
-    
-    # Query stored scores from countries table, with fallback metrics for calculation
-    query = text("""
-        SELECT 
-            c.iso_code,
-            c.name,
-            c.maturity_score,
-            c.governance_score,
-            c.pillar1_score,
-            c.pillar2_score,
-            c.pillar3_score,
-            c.flag_url,
-            -- Fallback metrics for on-the-fly calculation if stored scores are NULL
-            g.ilo_c187_status,
-            g.ilo_c155_status,
-            g.inspector_density,
-            g.mental_health_policy,
-            g.strategic_capacity_score,
-            p1.fatal_accident_rate,
-            p1.oel_compliance_pct,
-            p1.safety_training_hours_avg,
-            p1.carcinogen_exposure_pct,
-            p2.vulnerability_index,
-            p2.disease_detection_rate,
-            p2.occupational_disease_reporting_rate,
-            p2.lead_exposure_screening_rate,
-            p3.rehab_access_score,
-            p3.return_to_work_success_pct,
-            p3.rehab_participation_rate,
-            p3.avg_claim_settlement_days
-        FROM countries c
-        LEFT JOIN governance_layer g ON c.iso_code = g.country_iso_code
-        LEFT JOIN pillar_1_hazard p1 ON c.iso_code = p1.country_iso_code
-        LEFT JOIN pillar_2_vigilance p2 ON c.iso_code = p2.country_iso_code
-        LEFT JOIN pillar_3_restoration p3 ON c.iso_code = p3.country_iso_code
-        ORDER BY c.name
-    """)
-    
-    result = db.execute(query)
-    rows = result.fetchall()
-    
-    # Build lean response using STORED scores (with fallback calculation)
-    metadata = []
-    for row in rows:
-        (iso_code, name, maturity_score, 
-         stored_governance, stored_pillar1, stored_pillar2, stored_pillar3, flag_url,
-         # Fallback metrics
-         ilo_c187, ilo_c155, inspector_density, mental_health_policy, strategic_cap,
-         fatal_rate, oel_compliance, safety_training, carcinogen_exp,
-         vuln_idx, disease_detection, disease_reporting, lead_screening,
-         rehab_access, rtw_success, rehab_participation, claim_settlement) = row
-        
-        # Use stored scores if available, otherwise calculate on-the-fly
-        governance_score = stored_governance if stored_governance is not None else calculate_governance_score(
-            ilo_c187, ilo_c155, inspector_density, mental_health_policy, strategic_cap
+    READS THE COUNTRY SCORE SNAPSHOT (app.services.country_snapshot): one
+    row per country holding the stored pillar scores, calculated by the
+    /admin/metric-config/recalculate endpoint, with the on-the-fly fallback
+    calculation already applied where they are NULL.
+    
+    The serialised response is cached per snapshot version (pre-compressed,
+    with an ETag), so repeat map loads are a version check and a 304.
+    """
+    cached = _geojson_cache.get(current_state(db))
+    if cached is None:
+        rows = read_snapshot(db)
+        cached = _geojson_cache.put(snapshot_state(rows), build_geojson_metadata(rows).model_dump_json())
+    return cached.respond(request)
+
+
+_geojson_cache = ResponseCache("geojson-metadata")
+
+
+def build_geojson_metadata(rows: List[CountryScoreSnapshot]) -> GeoJSONMetadataResponse:
+    """Lean map payload from snapshot rows."""
+    metadata = [
+        GeoJSONCountryMetadata(
+            iso_code=row.iso_code,
+            name=row.name,
+            maturity_score=row.maturity_score,
+            governance_score=row.governance_score,
+            pillar1_score=row.pillar1_score,
+            pillar2_score=row.pillar2_score,
+            pillar3_score=row.pillar3_score,
+            # Derive status from maturity_score (1-4 scale)
+            status=derive_maturity_status(row.maturity_score),
+            flag_url=row.flag_url,
         )
-        
-        pillar1_score = stored_pillar1 if stored_pillar1 is not None else calculate_pillar1_score(
-            fatal_rate, oel_compliance, safety_training, carcinogen_exp, None
-        )
-        
-        pillar2_score = stored_pillar2 if stored_pillar2 is not None else calculate_pillar2_score(
-            vuln_idx, disease_detection, disease_reporting, lead_screening
-        )
-        
-        pillar3_score = stored_pillar3 if stored_pillar3 is not None else calculate_pillar3_score(
-            rehab_access, rtw_success, rehab_participation, claim_settlement
-        )
-        
-        # Derive status from maturity_score (1-4 scale)
-        status = derive_maturity_status(maturity_score)
-        
-        metadata.append(GeoJSONCountryMetadata(
-            iso_code=iso_code,
-            name=name,
-            maturity_score=maturity_score,
-            governance_score=governance_score,
-            pillar1_score=pillar1_score,
-            pillar2_score=pillar2_score,
-            pillar3_score=pillar3_score,
-            status=status,
-            flag_url=flag_url,
-        ))
+        for row in rows
+    ]
     
     return GeoJSONMetadataResponse(
         total=len(metadata),
@@ -254,32 +229,8 @@ async def get_geojson_metadata(
 # =============================================================================
 # PILLAR SCORE CALCULATION FUNCTIONS (Expert-Level WHO/ILO Aligned)
 # =============================================================================
-
-def safe_normalize(value: Optional[float], max_value: float, invert: bool = False) -> Optional[float]:
-    """Safely normalize a value to 0-100 scale."""
-    if value is None:
-        return None
-    normalized = min(100.0, max(0.0, (value / max_value) * 100))
-    return 100.0 - normalized if invert else normalized
-
-
-def weighted_average(components: list[tuple[Optional[float], float]]) -> Optional[float]:
-    """
-    Calculate weighted average of components.
-    Only includes non-None values, redistributing weights.
-    Returns None if no valid components.
-    """
-    valid_components = [(v, w) for v, w in components if v is not None]
-    if not valid_components:
-        return None
-    
-    total_weight = sum(w for _, w in valid_components)
-    if total_weight == 0:
-        return None
-    
-    weighted_sum = sum(v * (w / total_weight) for v, w in valid_components)
-    return round(weighted_sum, 1)
-
+# Single-country wrappers over app.services.scoring_engine (EXPERT_PROFILE);
+# endpoints scoring every country use score_matrix directly.
 
 def calculate_governance_score(
     ilo_c187: Optional[bool],
@@ -298,14 +249,13 @@ def calculate_governance_score(
     - Mental Health Policy: 15% (max 1 = has policy)
     - Strategic Capacity: 15% (max 100 points)
     """
-    components = [
-        (100.0 if ilo_c187 else (0.0 if ilo_c187 is not None else None), 0.20),
-        (100.0 if ilo_c155 else (0.0 if ilo_c155 is not None else None), 0.20),
-        (safe_normalize(inspector_density, 3.0), 0.30),
-        (100.0 if mental_health_policy else (0.0 if mental_health_policy is not None else None), 0.15),
-        (strategic_cap, 0.15),  # Already 0-100
-    ]
-    return weighted_average(components)
+    return score_one(EXPERT_PROFILE, "governance_score", {
+        "ilo_c187_status": ilo_c187,
+        "ilo_c155_status": ilo_c155,
+        "inspector_density": inspector_density,
+        "mental_health_policy": mental_health_policy,
+        "strategic_capacity_score": strategic_cap,
+    })
 
 
 def calculate_pillar1_score(
@@ -326,13 +276,12 @@ def calculate_pillar1_score(
     
     Note: control_maturity_score is excluded as it's a derived metric.
     """
-    components = [
-        (safe_normalize(fatal_rate, 10.0, invert=True), 0.40),
-        (oel_compliance, 0.25),  # Already percentage
-        (safe_normalize(safety_training, 40.0), 0.20),
-        (safe_normalize(carcinogen_exp, 50.0, invert=True), 0.15),
-    ]
-    return weighted_average(components)
+    return score_one(EXPERT_PROFILE, "pillar1_score", {
+        "fatal_accident_rate": fatal_rate,
+        "oel_compliance_pct": oel_compliance,
+        "safety_training_hours_avg": safety_training,
+        "carcinogen_exposure_pct": carcinogen_exp,
+    })
 
 
 def calculate_pillar2_score(
@@ -350,13 +299,12 @@ def calculate_pillar2_score(
     - Occupational Disease Reporting: 20% (max 100%)
     - Lead Exposure Screening: 20% (max 100%)
     """
-    components = [
-        (safe_normalize(vuln_idx, 100.0, invert=True), 0.30),
-        (disease_detection, 0.30),  # Already percentage
-        (disease_reporting, 0.20),  # Already percentage
-        (lead_screening, 0.20),  # Already percentage
-    ]
-    return weighted_average(components)
+    return score_one(EXPERT_PROFILE, "pillar2_score", {
+        "vulnerability_index": vuln_idx,
+        "disease_detection_rate": disease_detection,
+        "occupational_disease_reporting_rate": disease_reporting,
+        "lead_exposure_screening_rate": lead_screening,
+    })
 
 
 def calculate_pillar3_score(
@@ -374,13 +322,12 @@ def calculate_pillar3_score(
     - Rehab Participation Rate: 20% (max 100%)
     - Claim Settlement Days: 20% (max 365 days, INVERTED - lower is better)
     """
-    components = [
-        (rehab_access, 0.30),  # Already 0-100
-        (rtw_success, 0.30),  # Already percentage
-        (rehab_participation, 0.20),  # Already percentage
-        (safe_normalize(claim_settlement, 365.0, invert=True), 0.20),
-    ]
-    return weighted_average(components)
+    return score_one(EXPERT_PROFILE, "pillar3_score", {
+        "rehab_access_score": rehab_access,
+        "return_to_work_success_pct": rtw_success,
+        "rehab_participation_rate": rehab_participation,
+        "avg_claim_settlement_days": claim_settlement,
+    })
 
 
 def derive_maturity_status(maturity_score: Optional[float]) -> CountryStatus:
@@ -406,6 +353,36 @@ def derive_maturity_status(maturity_score: Optional[float]) -> CountryStatus:
         return CountryStatus.CRITICAL
 
 
+# Framework rules applied by /recalculate-scores (once capped, the +1.0
+# rules no longer apply)
+FRAMEWORK_MATURITY_RULES = [
+    {
+        "rule_key": "pillar1_fatal_cap",
+        "condition_type": "threshold",
+        "condition_config": {"metric": "fatal_accident_rate", "operator": ">", "value": 3.0},
+        "impact_type": "cap",
+        "impact_value": 2.0,
+    },
+    {
+        "rule_key": "pillar1_hazard_control",
+        "condition_type": "threshold",
+        "condition_config": {
+            "metric": "fatal_accident_rate", "operator": "<", "value": 1.0,
+            "and": {"metric": "inspector_density", "operator": ">", "value": 1.0},
+        },
+        "impact_type": "add",
+        "impact_value": 1.0,
+    },
+    {
+        "rule_key": "pillar3_reintegration",
+        "condition_type": "boolean",
+        "condition_config": {"metric": "reintegration_law", "equals": True},
+        "impact_type": "add",
+        "impact_value": 1.0,
+    },
+]
+
+
 @router.post(
     "/recalculate-scores",
     summary="Recalculate All Maturity Scores",
@@ -426,76 +403,18 @@ async def recalculate_all_scores(
     """
     Recalculate maturity scores for all countries using raw SQL.
     """
-    from sqlalchemy import text
-    from datetime import datetime
-    
-    # Step 1: Get all country data we need for scoring
-    query = text("""
-        SELECT 
-            c.iso_code,
-            p1.fatal_accident_rate,
-            g.inspector_density,
-            p3.reintegration_law
-        FROM countries c
-        LEFT JOIN pillar_1_hazard p1 ON c.iso_code = p1.country_iso_code
-        LEFT JOIN governance_layer g ON c.iso_code = g.country_iso_code
-        LEFT JOIN pillar_3_restoration p3 ON c.iso_code = p3.country_iso_code
-    """)
-    
-    result = db.execute(query)
-    rows = result.fetchall()
-    
-    updated_count = 0
-    scores_by_iso = {}
-    
-    for row in rows:
-        iso_code, fatal_rate, inspector_density, reintegration_law = row
-        
-        # Calculate score using framework rules
-        score = 1.0  # Base score
-        capped = False
-        
-        # Pillar 1: Cap at 2.0 if fatal_rate > 3.0
-        if fatal_rate is not None and fatal_rate > 3.0:
-            capped = True
-        
-        # Pillar 1: +1.0 if fatal_rate < 1.0 AND inspector_density > 1.0
-        if not capped and fatal_rate is not None and inspector_density is not None:
-            if fatal_rate < 1.0 and inspector_density > 1.0:
-                score += 1.0
-        
-        # Pillar 3: +1.0 if reintegration_law is True
-        if not capped and reintegration_law is True:
-            score += 1.0
-        
-        # Apply cap
-        if capped:
-            score = min(score, 2.0)
-        else:
-            score = min(score, 4.0)
-        
-        score = round(score, 1)
-        scores_by_iso[iso_code] = score
-    
-    # Step 2: Update all scores in a single transaction
-    for iso_code, score in scores_by_iso.items():
-        update_query = text("""
-            UPDATE countries 
-            SET maturity_score = :score, updated_at = :now
-            WHERE iso_code = :iso_code
-        """)
-        db.execute(update_query, {
-            "score": score,
-            "now": datetime.utcnow(),
-            "iso_code": iso_code
-        })
-        updated_count += 1
+    # Step 1: Score every country in one vectorised pass over the metric matrix
+    matrix = load_metric_matrix(db)
+    maturity = score_maturity(matrix, compile_rules(FRAMEWORK_MATURITY_RULES)).tolist()
     
+    # Step 2: Write all scores in set-based UPDATEs, in a single transaction
+    write_stats = write_scores(db, matrix.keys, {"maturity_score": maturity})
     db.commit()
+    updated_count = write_stats.rows
     
     # Count score distribution
     score_dist = {"1.0": 0, "2.0": 0, "3.0": 0, "4.0": 0}
-    for score in scores_by_iso.values():
+    for score in maturity:
         if score < 2.0:
             score_dist["1.0"] += 1
         elif score < 3.0:
@@ -513,7 +432,9 @@ async def recalculate_all_scores(
             "compliant (2.0-2.9)": score_dist["2.0"],
             "proactive (3.0-3.4)": score_dist["3.0"],
             "resilient (3.5-4.0)": score_dist["4.0"],
-        }
+        },
+        "write_statements": write_stats.statements,
+        "write_time_ms": write_stats.elapsed_ms,
     }
 
 
@@ -571,7 +492,9 @@ async def sync_missing_countries(
         except Exception as e:
             pass  # Country might already exist
     
+    mark_stale(db, inserted)
     db.commit()
+    invalidate_country_counts()
     
     return {
         "status": "success",
@@ -589,33 +512,50 @@ async def sync_missing_countries(
     description="Get a paginated list of all countries with summary information."
 )
 async def list_countries(
-    page: int = Query(1, ge=1, description="Page number"),
+    page: int = Query(1, ge=1, description="Page number (ignored when cursor is given)"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    band: Optional[str] = Query(None, description=f"Maturity band: {', '.join(MATURITY_BANDS)}"),
+    region: Optional[str] = Query(None, description=f"Region: {', '.join(REGIONS)}"),
+    min_score: Optional[float] = Query(None, description="Minimum maturity score"),
+    max_score: Optional[float] = Query(None, description="Maximum maturity score"),
     db: Session = Depends(get_db)
 ) -> CountryListPaginated:
     """
-    List all countries with pagination.
+    List all countries with keyset pagination.
+    
+    Follow next_cursor for later pages: each page is an index range scan on
+    (name, iso_code), however deep. Page numbers still work (OFFSET).
     
     For full country data, use GET /countries/{iso_code}
     For map visualization, use GET /countries/geojson-metadata
     """
-    # Count total
-    total = db.query(Country).count()
+    if band is not None and band not in MATURITY_BANDS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid band '{band}'. Valid options: {', '.join(MATURITY_BANDS)}"
+        )
+    if region is not None and region not in REGIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid region '{region}'. Valid options: {', '.join(REGIONS)}"
+        )
+    filters = CountryFilters(band=band, region=region, min_score=min_score, max_score=max_score)
     
-    # Fetch page
-    offset = (page - 1) * per_page
-    countries = (
-        db.query(Country)
-        .order_by(Country.name)
-        .offset(offset)
-        .limit(per_page)
-        .all()
-    )
+    try:
+        countries, next_cursor = fetch_page(
+            db, filters, per_page,
+            cursor=cursor,
+            offset=0 if cursor is not None else (page - 1) * per_page,
+        )
+    except InvalidCursor as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     
     return CountryListPaginated(
-        total=total,
+        total=cached_count(db, filters),
         page=page,
         per_page=per_page,
+        next_cursor=next_cursor,
         countries=[CountryListResponse.model_validate(c) for c in countries]
     )
 
@@ -639,30 +579,47 @@ class ComparisonCountriesResponse(BaseModel):
     **Use Case:**
     - Framework Comparison page country selection
     - Full metric comparison between any two countries
+    
+    **Sparse fieldsets / streaming:**
+    - `fields=maturity_score,pillar_1_hazard.fatal_accident_rate` returns only those values
+    - `format=ndjson` streams one country per line
     """
 )
 async def get_comparison_countries(
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated sparse fieldset, e.g. "
+                    "maturity_score,pillar_1_hazard.fatal_accident_rate,governance.inspector_density "
+                    "(iso_code and name are always included)",
+    ),
+    format: str = Query("json", pattern="^(json|ndjson)$", description="json, or ndjson (one country per line)"),
     db: Session = Depends(get_db)
-) -> ComparisonCountriesResponse:
+):
     """
     Fetch all countries with complete pillar data for comparison.
     
-    Uses eager loading to prevent N+1 queries.
+    Reads the country score snapshot (a single-table scan, no layer joins).
     Includes per-country error handling so one bad record doesn't break the response.
-    """
-    try:
-        # Query with eager loading of all layers
-        countries = (
-            db.query(Country)
-            .options(
-                joinedload(Country.governance),
-                joinedload(Country.pillar_1_hazard),
-                joinedload(Country.pillar_2_vigilance),
-                joinedload(Country.pillar_3_restoration),
+    
+    With `fields` (or format=ndjson) only the selected columns are projected
+    in SQL and the response is streamed as rows arrive: NDJSON, or a chunked
+    JSON object {"countries": [...], "total": n}.
+    """
+    if fields is not None or format == "ndjson":
+        selected = COMPARISON_DEFAULT_FIELDS if fields is None else [
+            field.strip() for field in fields.split(",") if field.strip()
+        ]
+        unknown = sorted(set(selected) - set(projection_fields()))
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(unknown)}"
             )
-            .order_by(Country.name)
-            .all()
-        )
+        media_type = "application/x-ndjson" if format == "ndjson" else "application/json"
+        return StreamingResponse(stream_comparison_rows(selected, format == "ndjson"), media_type=media_type)
+    
+    try:
+        rows = read_snapshot(db)
     except Exception as e:
         logger.error(f"Database query failed in get_comparison_countries: {e}")
         raise HTTPException(
@@ -673,28 +630,29 @@ async def get_comparison_countries(
     # Build full response for each country
     country_responses = []
     skipped_countries = []
-    for country in countries:
+    for row in rows:
+        layers = row.layers or {}
         try:
             response_data = {
-                "iso_code": country.iso_code,
-                "name": country.name,
-                "maturity_score": country.maturity_score,
-                "strategic_summary_text": country.strategic_summary_text,
-                "flag_url": country.flag_url,
-                "created_at": country.created_at,
-                "updated_at": country.updated_at,
-                "governance": country.governance,
-                "pillar_1_hazard": country.pillar_1_hazard,
-                "pillar_2_vigilance": country.pillar_2_vigilance,
-                "pillar_3_restoration": country.pillar_3_restoration,
-                "data_coverage_score": country.data_coverage_score(),
+                "iso_code": row.iso_code,
+                "name": row.name,
+                "maturity_score": row.maturity_score,
+                "strategic_summary_text": row.strategic_summary_text,
+                "flag_url": row.flag_url,
+                "created_at": row.country_created_at,
+                "updated_at": row.country_updated_at,
+                "governance": layers.get("governance"),
+                "pillar_1_hazard": layers.get("pillar_1_hazard"),
+                "pillar_2_vigilance": layers.get("pillar_2_vigilance"),
+                "pillar_3_restoration": layers.get("pillar_3_restoration"),
+                "data_coverage_score": row.data_coverage_score,
             }
             country_responses.append(CountryResponse.model_validate(response_data))
         except (ValidationError, Exception) as e:
             logger.warning(
-                f"Skipping country {country.iso_code} ({country.name}) due to validation error: {e}"
+                f"Skipping country {row.iso_code} ({row.name}) due to validation error: {e}"
             )
-            skipped_countries.append(country.iso_code)
+            skipped_countries.append(row.iso_code)
     
     if skipped_countries:
         logger.warning(
@@ -707,6 +665,36 @@ async def get_comparison_countries(
     )
 
 
+# Full comparison payload when streaming without a sparse fieldset
+COMPARISON_DEFAULT_FIELDS = [
+    "maturity_score", "strategic_summary_text", "flag_url", "data_coverage_score",
+    "governance", "pillar_1_hazard", "pillar_2_vigilance", "pillar_3_restoration",
+]
+
+
+def stream_comparison_rows(fields: List[str], ndjson: bool) -> Iterator[str]:
+    """
+    Serialise projected snapshot rows as they are fetched. Uses its own
+    session: the request session is closed before a streamed body is sent.
+    """
+    db = SessionLocal()
+    try:
+        total = 0
+        if not ndjson:
+            yield '{"countries": ['
+        for row in project_snapshot(db, fields):
+            line = json.dumps(row, default=str)
+            if ndjson:
+                yield line + "\n"
+            else:
+                yield ("," if total else "") + line
+            total += 1
+        if not ndjson:
+            yield f'], "total": {total}}}'
+    finally:
+        db.close()
+
+
 @router.get(
     "/{iso_code}",
     response_model=CountryResponse,
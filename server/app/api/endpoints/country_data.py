@@ -7,22 +7,22 @@ Allows multi-country selection (up to 10) with category filtering
 for dynamic data table generation.
 """
 
-from typing import List, Optional, Dict, Any
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterable, List, Optional, Dict, Any, Tuple
 from enum import Enum
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from pydantic import BaseModel, Field
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session
 
 from app.core.database import get_db
-from app.models.country import (
-    Country, 
-    GovernanceLayer, 
-    Pillar1Hazard, 
-    Pillar2Vigilance, 
-    Pillar3Restoration,
-    CountryIntelligence
-)
+from app.models.country import Country
+from app.services.country_snapshot import current_state, project_snapshot
+from app.services.response_cache import CachedResponse
 
 
 # =============================================================================
@@ -249,17 +249,113 @@ def format_value(value: Any, unit: Optional[str] = None) -> str:
     return str(value)
 
 
-def get_pillar_data(country: Country, category: DataCategory) -> Optional[Any]:
-    """Get the appropriate pillar/layer data for a category."""
-    if category == DataCategory.GOVERNANCE:
-        return country.governance
-    elif category == DataCategory.PILLAR_1_HAZARD:
-        return country.pillar_1_hazard
-    elif category == DataCategory.PILLAR_2_VIGILANCE:
-        return country.pillar_2_vigilance
-    elif category == DataCategory.PILLAR_3_RESTORATION:
-        return country.pillar_3_restoration
-    return None
+# Snapshot layer holding each category's metrics
+CATEGORY_LAYERS = {
+    DataCategory.GOVERNANCE: "governance",
+    DataCategory.PILLAR_1_HAZARD: "pillar_1_hazard",
+    DataCategory.PILLAR_2_VIGILANCE: "pillar_2_vigilance",
+    DataCategory.PILLAR_3_RESTORATION: "pillar_3_restoration",
+    DataCategory.INTELLIGENCE_GOVERNANCE: "intelligence",
+    DataCategory.INTELLIGENCE_HAZARD: "intelligence",
+    DataCategory.INTELLIGENCE_VIGILANCE: "intelligence",
+    DataCategory.INTELLIGENCE_RESTORATION: "intelligence",
+    DataCategory.INTELLIGENCE_ECONOMIC: "intelligence",
+}
+
+
+# =============================================================================
+# PIVOT PLANNER
+# =============================================================================
+
+# Memoised pivot responses (LRU)
+MAX_CACHED_PIVOTS = 256
+
+# Country metadata columns fetched with every pivot
+PIVOT_META_FIELDS = ["flag_url", "maturity_score"]
+
+
+@dataclass(frozen=True)
+class PivotPlan:
+    """Snapshot projection and row layout for a set of categories."""
+    categories: Tuple[DataCategory, ...]
+    # (snapshot field, metric) per pivot row, in display order
+    rows: Tuple[Tuple[str, MetricDefinition], ...]
+
+    @property
+    def fields(self) -> List[str]:
+        return PIVOT_META_FIELDS + [field for field, _ in self.rows]
+
+
+def plan_pivot(categories: List[DataCategory]) -> PivotPlan:
+    """Translate categories into the snapshot layer columns they display."""
+    return PivotPlan(
+        categories=tuple(categories),
+        rows=tuple(
+            (f"{CATEGORY_LAYERS[category]}.{metric.id}", metric)
+            for category in categories
+            for metric in CATEGORY_METRICS[category]
+        ),
+    )
+
+
+def build_pivot(plan: PivotPlan, countries: List[str], projected: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Assemble the pivot (PivotTableResponse layout) column by column from
+    projected snapshot rows, as plain dicts ready for serialisation.
+    """
+    found = {row["iso_code"]: row for row in projected}
+    present = [found.get(iso) for iso in countries]
+    unknown = {"iso_code": None, "country_name": "Unknown", "flag_url": None, "value": None, "formatted_value": "N/A"}
+    
+    rows = []
+    for field, metric in plan.rows:
+        layer, _, column = field.partition(".")
+        values = []
+        for iso, row in zip(countries, present):
+            if row is None:
+                values.append({**unknown, "iso_code": iso})
+                continue
+            raw_value = row[layer][column]
+            values.append({
+                "iso_code": iso,
+                "country_name": row["name"],
+                "flag_url": row["flag_url"],
+                "value": raw_value,
+                "formatted_value": format_value(raw_value, metric.unit),
+            })
+        rows.append({"metric": metric.model_dump(), "values": values})
+    
+    return {
+        "categories": [category.value for category in plan.categories],
+        "countries": [
+            {key: row[key] for key in ("iso_code", "name", "flag_url", "maturity_score")}
+            for row in present if row is not None
+        ],
+        "rows": rows,
+        "total_metrics": len(rows),
+        "generated_at": datetime.utcnow().isoformat(),
+    }
+
+
+_pivots: "OrderedDict[Tuple, CachedResponse]" = OrderedDict()
+_pivots_lock = threading.Lock()
+
+
+def _cached_pivot(key: Tuple) -> Optional[CachedResponse]:
+    with _pivots_lock:
+        cached = _pivots.get(key)
+        if cached is not None:
+            _pivots.move_to_end(key)
+        return cached
+
+
+def _store_pivot(key: Tuple, body: str) -> CachedResponse:
+    cached = CachedResponse.build(key[-1], body.encode("utf-8"))
+    with _pivots_lock:
+        _pivots[key] = cached
+        while len(_pivots) > MAX_CACHED_PIVOTS:
+            _pivots.popitem(last=False)
+    return cached
 
 
 # =============================================================================
@@ -337,13 +433,18 @@ async def get_available_categories() -> AvailableCategoriesResponse:
     """
 )
 async def generate_pivot_table(
+    request: Request,
     countries: List[str] = Query(..., description="List of ISO codes"),
     categories: List[str] = Query(..., description="List of category IDs"),
     db: Session = Depends(get_db)
-) -> PivotTableResponse:
-    """Generate a pivot table for the specified countries and categories."""
-    from datetime import datetime
+) -> Response:
+    """
+    Generate a pivot table for the specified countries and categories.
     
+    The plan selects exactly the requested metric columns from the country
+    snapshot in one query; finished tables are memoised per (countries,
+    categories, snapshot version) as serialised JSON.
+    """
     if len(countries) == 0:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -370,104 +471,14 @@ async def generate_pivot_table(
                 detail=f"Invalid category: {cat_id}"
             )
     
-    # Fetch countries with all related data
-    country_data = (
-        db.query(Country)
-        .options(
-            joinedload(Country.governance),
-            joinedload(Country.pillar_1_hazard),
-            joinedload(Country.pillar_2_vigilance),
-            joinedload(Country.pillar_3_restoration),
-        )
-        .filter(Country.iso_code.in_(countries))
-        .all()
-    )
-    
-    # Create a map for quick lookup, maintaining requested order
-    country_map = {c.iso_code: c for c in country_data}
-    
-    # Fetch intelligence data separately if needed
-    intelligence_categories = [
-        DataCategory.INTELLIGENCE_GOVERNANCE,
-        DataCategory.INTELLIGENCE_HAZARD,
-        DataCategory.INTELLIGENCE_VIGILANCE,
-        DataCategory.INTELLIGENCE_RESTORATION,
-        DataCategory.INTELLIGENCE_ECONOMIC,
-    ]
-    
-    intelligence_map = {}
-    if any(cat in valid_categories for cat in intelligence_categories):
-        intelligence_data = (
-            db.query(CountryIntelligence)
-            .filter(CountryIntelligence.country_iso_code.in_(countries))
-            .all()
-        )
-        intelligence_map = {i.country_iso_code: i for i in intelligence_data}
+    # Distinct countries and categories, in request order
+    countries = list(dict.fromkeys(countries))
+    valid_categories = list(dict.fromkeys(valid_categories))
     
-    # Build country metadata list (maintaining order)
-    countries_meta = []
-    for iso in countries:
-        if iso in country_map:
-            c = country_map[iso]
-            countries_meta.append({
-                "iso_code": c.iso_code,
-                "name": c.name,
-                "flag_url": c.flag_url,
-                "maturity_score": c.maturity_score,
-            })
-    
-    # Build pivot rows
-    rows = []
-    for category in valid_categories:
-        metrics = CATEGORY_METRICS[category]
-        
-        for metric in metrics:
-            values = []
-            
-            for iso in countries:
-                country = country_map.get(iso)
-                if not country:
-                    values.append(CountryMetricValue(
-                        iso_code=iso,
-                        country_name="Unknown",
-                        value=None,
-                        formatted_value="N/A"
-                    ))
-                    continue
-                
-                # Get the value based on category type
-                raw_value = None
-                
-                if category in intelligence_categories:
-                    # Get from intelligence data
-                    intel = intelligence_map.get(iso)
-                    if intel:
-                        raw_value = getattr(intel, metric.id, None)
-                else:
-                    # Get from pillar data
-                    pillar = get_pillar_data(country, category)
-                    if pillar:
-                        raw_value = getattr(pillar, metric.id, None)
-                
-                formatted = format_value(raw_value, metric.unit)
-                
-                values.append(CountryMetricValue(
-                    iso_code=iso,
-                    country_name=country.name,
-                    flag_url=country.flag_url,
-                    value=raw_value if not hasattr(raw_value, 'value') else raw_value.value,
-                    formatted_value=formatted
-                ))
-            
-            rows.append(PivotRow(
-                metric=metric,
-                values=values
-            ))
-    
-    return PivotTableResponse(
-        categories=[cat.value for cat in valid_categories],
-        countries=countries_meta,
-        rows=rows,
-        total_metrics=len(rows),
-        generated_at=datetime.utcnow().isoformat()
-    )
+    key = (tuple(countries), tuple(valid_categories), current_state(db))
+    cached = _cached_pivot(key)
+    if cached is None:
+        plan = plan_pivot(valid_categories)
+        table = build_pivot(plan, countries, project_snapshot(db, plan.fields, countries, refresh=False))
+        cached = _store_pivot(key, json.dumps(table, default=str))
+    return cached.respond(request)
@@ -8,6 +8,7 @@ Provides endpoints for:
 - Triggering ETL pipeline as a background task (202 Accepted)
 - Polling real-time pipeline logs
 - Per-country status tracking for visual grid
+- Resuming interrupted pipeline runs from their checkpoints
 - Fetching source registry data
 
 Features:
@@ -22,10 +23,11 @@ Features:
 import logging
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
+from uuid import uuid4
 
 logger = logging.getLogger(__name__)
 
-from fastapi import APIRouter, Depends, BackgroundTasks, HTTPException, status
+from fastapi import APIRouter, Depends, BackgroundTasks, HTTPException, Query, status
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from sqlalchemy.orm import Session, joinedload
@@ -33,8 +35,17 @@ from sqlalchemy.orm import Session, joinedload
 from app.core.database import get_db, SessionLocal
 from app.core.dependencies import get_current_admin_user
 from app.models.country import Country, Pillar1Hazard, GovernanceLayer
+from app.models.pipeline_run import PipelineRun
 from app.models.user import User
 from app.services.pipeline_logger import pipeline_logger, LogLevel
+from app.services.etl.http_pool import get_pool_stats
+from app.services.web_search_cache import (
+    SEARCH_PROVIDERS,
+    WARM_MAX_QUERIES,
+    WARM_PROVIDERS,
+    get_search_cache_stats,
+    warm_search_cache,
+)
 from app.services.database_fill_agent import (
     get_fill_status,
     reset_fill_status,
@@ -62,6 +73,10 @@ class PipelineRunRequest(BaseModel):
     """Request body for starting the pipeline."""
     countries: Optional[List[str]] = None  # ISO codes to process, None = all 50
     fetch_flags: bool = True  # Whether to fetch flag images from Wikipedia
+    concurrent: bool = False  # Fetch ILO/WB/WHO for many countries in parallel
+    source_concurrency: Optional[Dict[str, int]] = None  # e.g. {"ilo": 4, "worldbank": 8, "who": 8}
+    bulk_worldbank: bool = False  # Fetch World Bank indicators for all countries per request
+    incremental: bool = False  # Only refresh stale sources / new upstream data
 
 
 class PipelineRunResponse(BaseModel):
@@ -70,6 +85,7 @@ class PipelineRunResponse(BaseModel):
     message: str
     status: str
     countries_count: int = 50
+    run_id: Optional[str] = None  # Persistent run ID, usable with ?resume=
 
 
 class PipelineLogsResponse(BaseModel):
@@ -123,13 +139,23 @@ class PipelineStatusResponse(BaseModel):
     is_running: bool
     started_at: Optional[str]
     finished_at: Optional[str]
+    http_pool: Optional[Dict[str, Any]] = None  # Shared ETL connection pool statistics
+    rate_limits: Optional[Dict[str, Dict[str, Any]]] = None  # Per-host throughput / throttle counts
 
 
 # =============================================================================
 # BACKGROUND TASK: ETL PIPELINE
 # =============================================================================
 
-def run_etl_pipeline_task(countries: Optional[List[str]] = None, fetch_flags: bool = True):
+def run_etl_pipeline_task(
+    countries: Optional[List[str]] = None,
+    fetch_flags: bool = True,
+    concurrent: bool = False,
+    source_concurrency: Optional[Dict[str, int]] = None,
+    bulk_worldbank: bool = False,
+    incremental: bool = False,
+    run_id: Optional[str] = None,
+):
     """
     Execute the full 5-Point Dragnet ETL pipeline as a background task.
     
@@ -142,6 +168,11 @@ def run_etl_pipeline_task(countries: Optional[List[str]] = None, fetch_flags: bo
     Args:
         countries: Optional list of ISO codes to process. If None, processes all 50.
         fetch_flags: Whether to fetch flag images from Wikipedia.
+        concurrent: Use the concurrent multi-country fetch engine.
+        source_concurrency: Optional per-source concurrency limits.
+        bulk_worldbank: Prefetch World Bank indicators with paged all-country requests.
+        incremental: Delta refresh; unchanged countries keep their scores.
+        run_id: Persistent run ID for checkpoints (resume with ?resume=run_id).
     
     The 5-Point Dragnet:
     ====================
@@ -151,16 +182,7 @@ def run_etl_pipeline_task(countries: Optional[List[str]] = None, fetch_flags: bo
     4. [CONTEXT]  WB Vulnerable Employment → Pillar 2 Vulnerability
     5. [CONTEXT]  WB Health Expenditure → Pillar 3 Rehab Proxy
     """
-    # Import here to avoid circular imports at module load time
-    import sys
-    from pathlib import Path
-    
-    # Ensure run_pipeline is importable
-    server_path = Path(__file__).parent.parent.parent.parent
-    if str(server_path) not in sys.path:
-        sys.path.insert(0, str(server_path))
-    
-    from run_pipeline import run_full_pipeline
+    run_full_pipeline, _ = _import_pipeline()
     
     try:
         # Execute the canonical 5-Point Dragnet pipeline with UI logging enabled
@@ -169,7 +191,12 @@ def run_etl_pipeline_task(countries: Optional[List[str]] = None, fetch_flags: bo
             batch_size=len(countries) if countries else 195,
             use_pipeline_logger=True,
             country_filter=countries,
-            fetch_flags=fetch_flags
+            fetch_flags=fetch_flags,
+            concurrent=concurrent,
+            source_concurrency=source_concurrency,
+            bulk_worldbank=bulk_worldbank,
+            incremental=incremental,
+            run_id=run_id,
         )
     except Exception as e:
         # Ensure pipeline_logger is properly closed on crash
@@ -178,6 +205,37 @@ def run_etl_pipeline_task(countries: Optional[List[str]] = None, fetch_flags: bo
         raise
 
 
+def run_etl_resume_task(run_id: str):
+    """
+    Resume an interrupted pipeline run as a background task.
+    
+    Replays the run's original options; countries already written are
+    skipped and checkpointed source payloads are reused.
+    """
+    _, resume_run = _import_pipeline()
+    
+    try:
+        resume_run(run_id, use_pipeline_logger=True)
+    except Exception as e:
+        pipeline_logger.error(f"Pipeline crashed: {e}")
+        pipeline_logger.finish(success=False)
+        raise
+
+
+def _import_pipeline():
+    """Import run_pipeline lazily (avoids circular imports at module load time)."""
+    import sys
+    from pathlib import Path
+    
+    # Ensure run_pipeline is importable
+    server_path = Path(__file__).parent.parent.parent.parent
+    if str(server_path) not in sys.path:
+        sys.path.insert(0, str(server_path))
+    
+    from run_pipeline import run_full_pipeline, resume_run
+    return run_full_pipeline, resume_run
+
+
 # =============================================================================
 # ENDPOINTS
 # =============================================================================
@@ -199,6 +257,15 @@ def run_etl_pipeline_task(countries: Optional[List[str]] = None, fetch_flags: bo
     Request Body (optional):
     - countries: List of ISO 3166-1 alpha-3 codes to process. If omitted, all 50 are processed.
     - fetch_flags: Whether to download flag images from Wikipedia (default: true)
+    - concurrent: Fetch ILO/WB/WHO data for many countries in parallel (default: false)
+    - source_concurrency: Per-source concurrency limits for concurrent mode
+    - bulk_worldbank: Fetch World Bank indicators for all countries per request (default: false)
+    - incremental: Only refresh stale sources or new upstream data; skip rescoring unchanged countries (default: false)
+    
+    Query Parameters:
+    - resume: ID of an interrupted run to resume (the request body is ignored;
+      the run's original options are reused). Countries already written are
+      skipped and checkpointed source data is not fetched again.
     
     The pipeline will:
     1. Fetch data from ILO ILOSTAT API for each country
@@ -214,7 +281,8 @@ def run_etl_pipeline_task(countries: Optional[List[str]] = None, fetch_flags: bo
 )
 async def run_pipeline(
     background_tasks: BackgroundTasks,
-    request: Optional[PipelineRunRequest] = None
+    request: Optional[PipelineRunRequest] = None,
+    resume: Optional[str] = Query(None, description="Run ID to resume"),
 ):
     """
     Trigger the ETL pipeline to run in the background.
@@ -233,13 +301,48 @@ async def run_pipeline(
             ).model_dump()
         )
     
+    # Resume an interrupted run with its original options
+    if resume:
+        db = SessionLocal()
+        try:
+            run = db.get(PipelineRun, resume)
+            target_count = len(run.target_countries or []) if run else 0
+        finally:
+            db.close()
+        if run is None:
+            return JSONResponse(
+                status_code=status.HTTP_404_NOT_FOUND,
+                content={
+                    "success": False,
+                    "message": f"Pipeline run not found: {resume}",
+                    "status": "error",
+                    "countries_count": 0
+                }
+            )
+        background_tasks.add_task(run_etl_resume_task, resume)
+        return PipelineRunResponse(
+            success=True,
+            message=f"Resuming pipeline run {resume}",
+            status="accepted",
+            countries_count=target_count,
+            run_id=resume,
+        )
+    
     # Parse request parameters
     countries = None
     fetch_flags = True
+    concurrent = False
+    source_concurrency = None
+    bulk_worldbank = False
+    incremental = False
     
     if request:
         countries = request.countries
         fetch_flags = request.fetch_flags
+        concurrent = request.concurrent
+        source_concurrency = request.source_concurrency
+        bulk_worldbank = request.bulk_worldbank
+        incremental = request.incremental
     
     # Validate country codes if provided
     if countries:
@@ -260,14 +363,18 @@ async def run_pipeline(
     count = len(countries) if countries else len(UN_MEMBER_STATES)
     
     # Add pipeline to background tasks - returns immediately
-    background_tasks.add_task(run_etl_pipeline_task, countries, fetch_flags)
+    run_id = str(uuid4())
+    background_tasks.add_task(
+        run_etl_pipeline_task, countries, fetch_flags, concurrent, source_concurrency, bulk_worldbank, incremental, run_id
+    )
     
     # 202 Accepted - Fire-and-Forget pattern
     return PipelineRunResponse(
         success=True,
         message=f"Pipeline started - Processing {count} countries" + (" with flags" if fetch_flags else ""),
         status="accepted",
-        countries_count=count
+        countries_count=count,
+        run_id=run_id,
     )
 
 
@@ -284,6 +391,8 @@ async def run_pipeline(
     - failed_countries: List of failed ISO codes (red border)
     - country_data: Per-country metrics and status
     - logs: Last 10 log entries for the ticker
+    - http_pool: Shared ETL connection pool statistics (requests, TCP/TLS
+      handshakes, connection reuse rate, per-host counts)
     
     Poll every 1 second for real-time UI updates.
     """
@@ -311,6 +420,8 @@ async def get_pipeline_status():
         is_running=detailed["is_running"],
         started_at=detailed["started_at"],
         finished_at=detailed["finished_at"],
+        http_pool=get_pool_stats(),
+        rate_limits=detailed["rate_limits"],
     )
 
 
@@ -342,6 +453,87 @@ async def stop_pipeline():
     }
 
 
+_search_warmup_running = False
+
+
+def run_search_cache_warmup_task(countries: Optional[List[str]], max_queries: int, providers: List[str]):
+    """Pre-fetch the standard web research queries as a background task."""
+    global _search_warmup_running
+    _search_warmup_running = True
+    try:
+        warm_search_cache(countries, max_queries=max_queries, providers=providers)
+    except Exception as e:
+        logger.error(f"Web search cache warm-up failed: {e}", exc_info=True)
+    finally:
+        _search_warmup_running = False
+
+
+@router.post(
+    "/search-cache/warm",
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Warm Web Search Cache",
+    description="""
+    Pre-fetch the standard web research queries (deep dive and agent
+    research topics) for the given countries, or all UN member states, into
+    the web search cache. Queries with fresh cached results are skipped.
+    
+    By default only the free scrapers (bing, google, duckduckgo) are used
+    and a run stops after 200 uncached searches; add tavily / serpapi to
+    `providers` to spend API quota on the warm-up.
+    
+    Meant for off-peak runs; cron can run the same job with
+    `python -m app.services.web_search_cache --warm`.
+    """
+)
+async def warm_web_search_cache(
+    background_tasks: BackgroundTasks,
+    countries: Optional[List[str]] = Query(None, description="ISO codes (default: all UN member states)"),
+    max_queries: int = Query(WARM_MAX_QUERIES, ge=1, le=5000, description="Uncached searches per run"),
+    providers: List[str] = Query(list(WARM_PROVIDERS), description="Providers to search with"),
+    admin: User = Depends(get_current_admin_user),
+):
+    """Start the web search cache warm-up in the background."""
+    if _search_warmup_running:
+        return JSONResponse(
+            status_code=status.HTTP_409_CONFLICT,
+            content={"success": False, "message": "Warm-up is already running", "status": "running"}
+        )
+    
+    if countries:
+        invalid = [c for c in countries if c not in set(UN_MEMBER_STATES)]
+        if invalid:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid country codes: {', '.join(invalid)}"
+            )
+    
+    unknown = [p for p in providers if p not in SEARCH_PROVIDERS]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown search providers: {', '.join(unknown)} (available: {', '.join(SEARCH_PROVIDERS)})"
+        )
+    
+    background_tasks.add_task(run_search_cache_warmup_task, countries, max_queries, providers)
+    return {
+        "success": True,
+        "message": f"Warming web search cache for {len(countries) if countries else len(UN_MEMBER_STATES)} countries",
+        "status": "accepted",
+        "cache": get_search_cache_stats(),
+    }
+
+
+@router.get(
+    "/runs",
+    summary="List Pipeline Runs",
+    description="Recent ETL pipeline runs with their status; stopped, failed or interrupted runs can be resumed via POST /etl/run?resume={run_id}."
+)
+async def list_pipeline_runs(limit: int = Query(20, ge=1, le=100), db: Session = Depends(get_db)):
+    """List the most recent pipeline runs, newest first."""
+    runs = db.query(PipelineRun).order_by(PipelineRun.started_at.desc()).limit(limit).all()
+    return {"runs": [run.to_dict() for run in runs]}
+
+
 @router.get(
     "/logs",
     response_model=PipelineLogsResponse,
@@ -14,6 +14,7 @@ Endpoints:
 import logging
 import time
 import asyncio
+from concurrent.futures import Executor
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
@@ -23,6 +24,7 @@ from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
 from app.core.database import get_db
 from app.core.dependencies import get_current_user, get_current_user_optional, get_current_admin_user
 from app.models.user import User, UserRole, AIConfig, AIProvider
@@ -34,6 +36,7 @@ from app.models.country_insight import (
     CATEGORY_METADATA,
 )
 from app.services.agent_runner import AgentRunner
+from app.services.batch_scheduler import BatchScheduler, estimate_tokens, is_rate_limit_error
 from app.services.image_service import fetch_country_images
 
 
@@ -543,16 +546,19 @@ async def generate_insight_content_standalone(
     ai_config_data: Dict[str, Any],
     category: InsightCategory,
     user_email: Optional[str] = None,
+    executor: Optional[Executor] = None,
 ) -> Dict[str, Any]:
     """
     Generate AI insight content WITHOUT holding a DB session open.
     All data is passed as plain Python dicts extracted before the call.
+    The LLM call runs on executor (default: the loop's default executor).
 
     Returns dict with:
     - what_is_analysis: str (3 short paragraphs, ~150-200 words)
     - oh_implications: str (3 short paragraphs, ~150-200 words)
     - key_stats: list of 6 stat objects
     - ai_provider / ai_model: provider metadata
+    - usage_tokens: estimated prompt + response tokens
     """
     from app.services.ai_service import _call_llm_sync_safe
 
@@ -685,7 +691,7 @@ TONE:
     try:
         loop = asyncio.get_running_loop()
         result = await loop.run_in_executor(
-            None,  # default executor
+            executor,
             _call_llm_sync_safe,
             ai_config_data,
             prompt,
@@ -716,6 +722,7 @@ TONE:
             "key_stats": parsed.get("key_stats", []),
             "ai_provider": provider_name,
             "ai_model": ai_config_data.get("model_name"),
+            "usage_tokens": estimate_tokens(system_prompt, prompt, result),
         }
     except json.JSONDecodeError:
         logger.error(f"[InsightGen] JSON parse failed for {country_name}/{category.value}: {result[:500]}")
@@ -727,6 +734,7 @@ TONE:
             "key_stats": [],
             "ai_provider": provider_name,
             "ai_model": ai_config_data.get("model_name"),
+            "usage_tokens": estimate_tokens(system_prompt, prompt, result),
         }
 
 
@@ -871,7 +879,8 @@ async def test_ai_call(
             prompt="Say 'Hello from the insights AI service!' in exactly those words.",
             agent_id="diagnostic-test",
             user_email=current_user.email,
-            system_prompt="You are a helpful assistant. Respond exactly as requested."
+            system_prompt="You are a helpful assistant. Respond exactly as requested.",
+            use_cache=False,  # The test must reach the provider
         )
         
         elapsed = time.time() - start_time
@@ -898,11 +907,12 @@ async def test_ai_call(
 
 _batch_generation_status: Dict[str, Any] = {}
 _batch_stop_requested: bool = False
+_batch_scheduler: Optional[BatchScheduler] = None  # LLM call scheduler of the running (or last) batch
 
-BATCH_DELAY_BETWEEN_COUNTRIES = 1.0  # seconds between countries (reduced for parallel)
+BATCH_DELAY_BETWEEN_COUNTRIES = 0.0  # optional pause per country worker (LLM pacing is the scheduler's)
 BATCH_MAX_RETRIES = 2  # retry failed categories up to N times
+BATCH_MAX_RATE_LIMIT_RETRIES = 5  # extra attempts after 429s (the scheduler backs off in between)
 BATCH_RETRY_DELAY = 5.0  # seconds between retries
-BATCH_CONCURRENCY = 2  # number of countries processed concurrently
 BATCH_INSIGHT_MODEL = "gpt-4o-mini"  # cheaper & faster model for batch insight generation
 
 
@@ -941,6 +951,14 @@ class BatchGenerateStatusResponse(BaseModel):
     estimated_remaining_seconds: Optional[float] = None
     avg_seconds_per_country: Optional[float] = None
     last_completed_country: Optional[str] = None
+    # Scheduler metrics (ETA above is based on recent insight throughput when available)
+    insights_planned: int = 0
+    insights_per_minute: Optional[float] = None
+    concurrency_window: Optional[int] = None
+    active_requests: Optional[int] = None
+    rate_limit_hits: int = 0
+    backoff_remaining_seconds: Optional[float] = None
+    budgets: List[Dict[str, Any]] = []  # requests / tokens per minute per provider/model
 
 
 # =============================================================================
@@ -956,7 +974,8 @@ async def batch_generate_all_insights(
     """
     Start batch insight generation for all countries (or a filtered subset).
     
-    Admin only. Processes countries sequentially with rate limiting.
+    Admin only. LLM calls go through a batch scheduler with an adaptive
+    concurrency window and per-provider/model RPM / TPM budgets.
     Each country generates 6 insight categories (culture, infrastructure,
     industry, urban, workforce, political).
     
@@ -1053,17 +1072,20 @@ async def get_batch_generate_status():
     Get the current status of the batch insight generation.
     
     Poll this endpoint to track progress of the background batch generation.
-    Includes ETA, speed metrics, and current category.
+    Includes ETA, speed metrics, scheduler window / budgets, and current category.
     """
     if not _batch_generation_status:
         return BatchGenerateStatusResponse(status="idle")
 
+    running = _batch_generation_status.get("status") == "running"
+    scheduler = _batch_scheduler.snapshot() if _batch_scheduler else {}
+
     # Compute live timing metrics
     elapsed_seconds = None
     estimated_remaining = None
     avg_per_country = None
     started_at = _batch_generation_status.get("started_at")
-    if started_at and _batch_generation_status.get("status") == "running":
+    if started_at and running:
         try:
             start_dt = datetime.fromisoformat(started_at)
             elapsed_seconds = (datetime.utcnow() - start_dt).total_seconds()
@@ -1077,13 +1099,16 @@ async def get_batch_generate_status():
                 avg_per_country = elapsed_seconds / done
                 remaining = total - done
                 estimated_remaining = avg_per_country * remaining
+            # Countries run concurrently: remaining insights / recent throughput is the better estimate
+            if scheduler.get("eta_seconds") is not None:
+                estimated_remaining = scheduler["eta_seconds"]
         except Exception:
             pass
 
     # Build live category progress string (e.g., "culture [done], oh-infrastructure [done], industry, urban, workforce, political")
     raw_category = _batch_generation_status.get("current_category")
     done_cats = _batch_generation_status.get("_done_categories", set())
-    if raw_category and done_cats and _batch_generation_status.get("status") == "running":
+    if raw_category and done_cats and running:
         cat_list = [c.strip() for c in raw_category.split(",")]
         display_parts = []
         for c in cat_list:
@@ -1113,6 +1138,13 @@ async def get_batch_generate_status():
         estimated_remaining_seconds=round(estimated_remaining, 1) if estimated_remaining else None,
         avg_seconds_per_country=round(avg_per_country, 1) if avg_per_country else None,
         last_completed_country=_batch_generation_status.get("last_completed_country"),
+        insights_planned=scheduler.get("planned", 0),
+        insights_per_minute=scheduler.get("units_per_minute"),
+        concurrency_window=scheduler.get("window") if running else None,
+        active_requests=scheduler.get("active") if running else None,
+        rate_limit_hits=scheduler.get("rate_limited", 0),
+        backoff_remaining_seconds=scheduler.get("backoff_remaining_seconds") if running else None,
+        budgets=scheduler.get("budgets", []),
     )
 
 
@@ -1989,23 +2021,34 @@ async def _generate_single_category(
     category,
     user_id: int,
     force_regenerate: bool,
+    scheduler: BatchScheduler,
 ) -> Dict[str, Any]:
     """
     Generate a single insight category for a country.
 
     Architecture: 3-phase approach to avoid holding DB sessions during long AI calls.
       Phase A: Short-lived DB session — mark status, extract data, close session.
-      Phase B: AI call + image fetch — NO DB session held.
+      Phase B: AI call + image fetch — NO DB session held. The AI call waits
+               for a slot of the batch scheduler (window, RPM / TPM budget).
       Phase C: Short-lived DB session — save results, commit, close session.
 
-    Includes automatic retry logic with robust error handling.
+    Includes automatic retry logic with robust error handling. Rate-limited
+    attempts are retried without the fixed delay (the scheduler backs off)
+    and without counting against BATCH_MAX_RETRIES, up to
+    BATCH_MAX_RATE_LIMIT_RETRIES times.
     """
     last_error = None
+    attempt = 0
+    failures = 0  # failed attempts counted against BATCH_MAX_RETRIES
+    rate_limited = 0
+    retry_delay = BATCH_RETRY_DELAY
 
-    for attempt in range(1 + BATCH_MAX_RETRIES):
+    while failures <= BATCH_MAX_RETRIES:
         if attempt > 0:
-            logger.info(f"[BatchInsights] Retry {attempt}/{BATCH_MAX_RETRIES} for {country_iso}/{category.value}")
-            await asyncio.sleep(BATCH_RETRY_DELAY)
+            logger.info(f"[BatchInsights] Retry {attempt} for {country_iso}/{category.value}")
+            await asyncio.sleep(retry_delay)
+        attempt += 1
+        retry_delay = BATCH_RETRY_DELAY
 
         # ══════════════════════════════════════════════════════════════
         # PHASE A: Short-lived DB read — extract data, close session
@@ -2058,7 +2101,7 @@ async def _generate_single_category(
 
                 logger.info(
                     f"[BatchInsights] Phase A done: {country_iso}/{category.value} "
-                    f"(attempt {attempt + 1}) - AI: {ai_config_data['provider'].value}/{ai_config_data['model_name']}"
+                    f"(attempt {attempt}) - AI: {ai_config_data['provider'].value}/{ai_config_data['model_name']}"
                 )
             finally:
                 db_read.close()  # Session ALWAYS closed before AI call
@@ -2066,24 +2109,37 @@ async def _generate_single_category(
             last_error = f"{type(e).__name__}: {e}" if str(e) else f"{type(e).__name__}: {repr(e)}"
             logger.error(f"[BatchInsights] Phase A FAILED for {country_iso}/{category.value}: {last_error}", exc_info=True)
             _save_error_status(session_factory, country_iso, category, last_error)
+            failures += 1
             continue  # retry
 
         # ══════════════════════════════════════════════════════════════
         # PHASE B: AI call + image fetch — NO DB session held
         # ══════════════════════════════════════════════════════════════
+        async def scheduled_content() -> Dict[str, Any]:
+            # Waiting for admission is not part of the generation timeout
+            async with scheduler.slot(
+                ai_config_data["provider"].value,
+                ai_config_data["model_name"],
+                settings.BATCH_TOKENS_PER_INSIGHT,
+            ) as call:
+                generated = await asyncio.wait_for(
+                    generate_insight_content_standalone(
+                        country_name=country_name,
+                        country_iso=country_iso,
+                        intelligence_data=intelligence_data,
+                        country_scores=country_scores,
+                        ai_config_data=ai_config_data,
+                        category=category,
+                        user_email=user_email,
+                        executor=scheduler.executor,
+                    ),
+                    timeout=INSIGHT_GENERATION_TIMEOUT_SECONDS,
+                )
+                call.settle(generated.get("usage_tokens", settings.BATCH_TOKENS_PER_INSIGHT))
+                return generated
+
         try:
-            content_task = asyncio.wait_for(
-                generate_insight_content_standalone(
-                    country_name=country_name,
-                    country_iso=country_iso,
-                    intelligence_data=intelligence_data,
-                    country_scores=country_scores,
-                    ai_config_data=ai_config_data,
-                    category=category,
-                    user_email=user_email,
-                ),
-                timeout=INSIGHT_GENERATION_TIMEOUT_SECONDS,
-            )
+            content_task = scheduled_content()
             image_task = asyncio.wait_for(
                 fetch_country_images(
                     country_name=country_name,
@@ -2110,6 +2166,11 @@ async def _generate_single_category(
             last_error = f"{type(e).__name__}: {e}" if str(e) else f"{type(e).__name__}: {repr(e)}"
             logger.error(f"[BatchInsights] Phase B FAILED for {country_iso}/{category.value}: {last_error}", exc_info=True)
             _save_error_status(session_factory, country_iso, category, last_error)
+            if is_rate_limit_error(e) and rate_limited < BATCH_MAX_RATE_LIMIT_RETRIES:
+                rate_limited += 1
+                retry_delay = 0.0
+            else:
+                failures += 1
             continue  # retry
 
         # ══════════════════════════════════════════════════════════════
@@ -2156,6 +2217,7 @@ async def _generate_single_category(
             last_error = f"{type(e).__name__}: {e}" if str(e) else f"{type(e).__name__}: {repr(e)}"
             logger.error(f"[BatchInsights] Phase C COMMIT FAILED for {country_iso}/{category.value}: {last_error}", exc_info=True)
             _save_error_status(session_factory, country_iso, category, f"DB commit failed: {last_error}")
+            failures += 1
             continue  # retry
 
     return {"success": False, "category": category.value, "error": last_error or "Unknown error"}
@@ -2191,10 +2253,11 @@ async def _process_single_country(
     force_regenerate: bool,
     idx: int,
     total: int,
+    scheduler: BatchScheduler,
 ) -> None:
     """Process all insight categories for a single country (categories in parallel).
     
-    Uses a shared session_factory from the parent batch function.
+    Uses a shared session_factory and batch scheduler from the parent batch function.
     """
     global _batch_generation_status
 
@@ -2203,6 +2266,7 @@ async def _process_single_country(
     try:
         country = db.query(Country).filter(Country.iso_code == country_iso).first()
         if not country:
+            scheduler.plan(-len(COUNTRY_INSIGHT_CATEGORIES))
             _batch_generation_status["countries_failed"] += 1
             _batch_generation_status["errors"].append({
                 "country_iso": country_iso,
@@ -2229,6 +2293,9 @@ async def _process_single_country(
                 c for c in COUNTRY_INSIGHT_CATEGORIES if c not in existing_cats
             ]
 
+        # Only the missing categories of this country count towards the ETA
+        scheduler.plan(len(missing_categories) - len(COUNTRY_INSIGHT_CATEGORIES))
+
         if not missing_categories:
             _batch_generation_status["countries_skipped"] += 1
             logger.info(f"[BatchInsights] Skipping {country_iso} - all insights complete")
@@ -2248,18 +2315,22 @@ async def _process_single_country(
     finally:
         db.close()
 
-    # Generate ALL categories in PARALLEL using asyncio.gather
-    tasks = [
-        _generate_single_category(
-            session_factory=session_factory,
-            country_iso=country_iso,
-            country_name=country_name,
-            category=category,
-            user_id=user_id,
-            force_regenerate=force_regenerate,
-        )
-        for category in missing_categories
-    ]
+    async def generate(category) -> Dict[str, Any]:
+        try:
+            return await _generate_single_category(
+                session_factory=session_factory,
+                country_iso=country_iso,
+                country_name=country_name,
+                category=category,
+                user_id=user_id,
+                force_regenerate=force_regenerate,
+                scheduler=scheduler,
+            )
+        finally:
+            scheduler.unit_done()
+
+    # Generate ALL categories in PARALLEL (the scheduler admits their AI calls)
+    tasks = [generate(category) for category in missing_categories]
 
     results = await asyncio.gather(*tasks, return_exceptions=True)
 
@@ -2321,7 +2392,11 @@ async def run_batch_insight_generation(
     
     Performance features:
     - All 6 categories per country are generated in PARALLEL (asyncio.gather)
-    - 2 countries are processed concurrently (asyncio.Semaphore)
+    - AI calls are admitted by a BatchScheduler: adaptive concurrency window
+      (BATCH_CONCURRENCY_MIN..MAX), RPM / TPM budgets per provider/model and
+      backoff on rate-limit errors
+    - Country workers pull from a shared queue, enough of them to keep the
+      largest window busy (no fixed chunks, no fixed delay)
     - Content and images are fetched in parallel per category
     - Failed categories are retried up to 2 times with backoff
     - Graceful stop via _batch_stop_requested flag
@@ -2330,7 +2405,7 @@ async def run_batch_insight_generation(
     from sqlalchemy import create_engine
     from sqlalchemy.orm import sessionmaker
 
-    global _batch_generation_status, _batch_stop_requested
+    global _batch_generation_status, _batch_stop_requested, _batch_scheduler
 
     # Create a SINGLE shared engine for the entire batch run
     engine = create_engine(db_url, pool_size=10, max_overflow=20, pool_pre_ping=True, pool_recycle=300)
@@ -2342,6 +2417,7 @@ async def run_batch_insight_generation(
         ai_config = get_ai_config(test_db)
         if not ai_config:
             logger.error("[BatchInsights] No AI config found - aborting batch")
+            _batch_scheduler = None
             _batch_generation_status = {
                 "status": "completed",
                 "total_countries": 0,
@@ -2377,16 +2453,14 @@ async def run_batch_insight_generation(
         "last_completed_country": None,
     }
 
-    semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
-
-    async def process_with_semaphore(country_iso: str, idx: int):
-        """Wrap country processing with semaphore for concurrency control."""
-        # Check stop flag before acquiring semaphore
-        if _batch_stop_requested:
-            return
+    scheduler = _batch_scheduler = BatchScheduler.from_settings(
+        planned=total * len(COUNTRY_INSIGHT_CATEGORIES),
+    )
+    pending = iter(enumerate(country_isos))
 
-        async with semaphore:
-            # Check stop flag again after acquiring
+    async def country_worker():
+        """Process countries from the shared queue until it is empty or a stop is requested."""
+        for idx, country_iso in pending:
             if _batch_stop_requested:
                 return
 
@@ -2397,28 +2471,21 @@ async def run_batch_insight_generation(
                 force_regenerate=force_regenerate,
                 idx=idx,
                 total=total,
+                scheduler=scheduler,
             )
 
-            # Small delay between countries for rate limiting
-            if not _batch_stop_requested:
+            if delay_between and not _batch_stop_requested:
                 await asyncio.sleep(delay_between)
 
-    # Process countries with concurrency control
-    # We use a loop with gather in chunks to allow stop checks between batches
-    i = 0
-    while i < total:
-        if _batch_stop_requested:
-            logger.info("[BatchInsights] Stop requested, halting batch generation")
-            break
-
-        # Create a batch of tasks up to BATCH_CONCURRENCY * 2
-        chunk_size = min(BATCH_CONCURRENCY * 2, total - i)
-        tasks = [
-            process_with_semaphore(country_isos[i + j], i + j)
-            for j in range(chunk_size)
-        ]
-        await asyncio.gather(*tasks)
-        i += chunk_size
+    # Enough countries in flight for their categories to fill the largest window
+    workers = min(total, -(-scheduler.max_concurrency // len(COUNTRY_INSIGHT_CATEGORIES)) + 1)
+    try:
+        await asyncio.gather(*(country_worker() for _ in range(workers)))
+    finally:
+        scheduler.close()
+
+    if _batch_stop_requested:
+        logger.info("[BatchInsights] Stop requested, halted batch generation")
 
     # Final status
     final_status = "stopped" if _batch_stop_requested else "completed"
@@ -2437,5 +2504,6 @@ async def run_batch_insight_generation(
         f"{_batch_generation_status['countries_completed']} countries done, "
         f"{_batch_generation_status['countries_failed']} failed, "
         f"{_batch_generation_status['countries_skipped']} skipped. "
-        f"{_batch_generation_status['total_insights_generated']} insights generated."
+        f"{_batch_generation_status['total_insights_generated']} insights generated. "
+        f"Scheduler: {scheduler.snapshot()}"
     )
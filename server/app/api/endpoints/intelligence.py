@@ -17,6 +17,7 @@ from sqlalchemy.orm import Session
 
 from app.core.database import get_db
 from app.models.country import CountryIntelligence, Country
+from app.services.rank_index import get_rank_index, ranked_fields
 
 
 router = APIRouter(prefix="/intelligence", tags=["Intelligence"])
@@ -200,6 +201,45 @@ METRIC_CONFIG = {
     },
 }
 
+# Intelligence columns where a lower value ranks better
+LOWER_IS_BETTER_COLUMNS = {
+    "corruption_rank", "epi_rank", "hdi_rank",
+    "daly_occupational_total", "daly_occupational_injuries", "daly_occupational_carcinogens",
+    "daly_occupational_noise", "daly_occupational_ergonomic", "daly_occupational_particulates",
+    "daly_occupational_asthmagens", "deaths_occupational_total", "deaths_occupational_injuries",
+    "deaths_occupational_diseases", "non_fatal_injury_rate", "injury_frequency_rate",
+    "days_lost_per_injury", "road_traffic_deaths_rate", "out_of_pocket_health_pct",
+    "oecd_hours_worked_annual", "oecd_long_hours_pct", "unemployment_rate",
+    "youth_unemployment_rate", "informal_employment_pct",
+}
+
+# Comment prefix -> data source, for the generated METRIC_CONFIG entries
+COMMENT_SOURCES = {
+    "TI": "Transparency International", "WJP": "World Justice Project", "WB": "World Bank",
+    "WHO": "WHO", "UNDP": "UNDP", "Yale": "Yale EPI", "EPI": "Yale EPI", "OECD": "OECD",
+}
+
+
+def _intelligence_metric_config(column) -> dict:
+    """METRIC_CONFIG entry for a numeric CountryIntelligence column, from its comment."""
+    comment = column.comment or column.key.replace("_", " ").title()
+    first_word = comment.split(" ", 1)[0]
+    return {
+        "column": column.key,
+        "label": comment,
+        "unit": "%" if "%" in comment else "",
+        "source": COMMENT_SOURCES.get(first_word, "Country Intelligence"),
+        "higher_is_better": column.key not in LOWER_IS_BETTER_COLUMNS,
+    }
+
+
+# Every other numeric intelligence column is rankable under its column name
+_configured_columns = {config["column"] for config in METRIC_CONFIG.values()}
+for _field in ranked_fields():
+    _layer, _, _column = _field.partition(".")
+    if _layer == "intelligence" and _column not in _configured_columns:
+        METRIC_CONFIG[_column] = _intelligence_metric_config(CountryIntelligence.__table__.columns[_column])
+
 
 # =============================================================================
 # ENDPOINTS
@@ -451,6 +491,7 @@ async def get_global_rankings(
     - life_expectancy: Life expectancy at birth (years)
     - urban_population: Urban population (%)
     - hdi_score: Human Development Index (0-1)
+    - any other numeric intelligence column by name (e.g. epi_score, unemployment_rate)
     """
     metric = metric.lower()
     
@@ -464,89 +505,50 @@ async def get_global_rankings(
     column_name = config["column"]
     higher_is_better = config["higher_is_better"]
     
-    # Get the column attribute from the model
-    column_attr = getattr(CountryIntelligence, column_name, None)
-    if column_attr is None:
+    # Pre-sorted ranking from the shared rank index (synced with the country snapshot)
+    index = get_rank_index(db)
+    ranking = index.ranking(f"intelligence.{column_name}")
+    if ranking is None:
         raise HTTPException(
             status_code=500,
             detail=f"Column {column_name} not found in CountryIntelligence model"
         )
     
-    # Query all countries with this metric, join with Country for names
-    results = db.query(
-        CountryIntelligence.country_iso_code,
-        Country.name,
-        column_attr
-    ).join(
-        Country, CountryIntelligence.country_iso_code == Country.iso_code
-    ).filter(
-        column_attr.isnot(None)
-    ).all()
-    
-    if not results:
+    if not ranking.size:
         raise HTTPException(
             status_code=404,
             detail=f"No data found for metric '{metric}'"
         )
     
-    # Sort by value (descending for higher_is_better, ascending otherwise)
-    sorted_results = sorted(
-        results,
-        key=lambda x: x[2] if x[2] is not None else float('-inf'),
-        reverse=higher_is_better
-    )
-    
-    # Assign ranks
-    ranked_countries = []
-    for rank, (iso_code, name, value) in enumerate(sorted_results, start=1):
-        ranked_countries.append({
-            "iso_code": iso_code,
-            "name": name,
-            "value": value,
-            "rank": rank
-        })
-    
-    total_countries = len(ranked_countries)
+    total_countries = ranking.size
+    current_iso_upper = current_iso.upper() if current_iso else None
     
-    # Get top 10 and bottom 10
-    top_10 = []
-    bottom_10 = []
+    def ranked(entries) -> List[CountryRank]:
+        return [
+            CountryRank(
+                iso_code=iso_code,
+                name=index.names.get(iso_code, iso_code),
+                value=value,
+                rank=ranking.rank(value, higher_is_better),
+                is_current=iso_code == current_iso_upper,
+            )
+            for iso_code, value in entries
+        ]
     
-    for entry in ranked_countries[:10]:
-        is_current = current_iso and entry["iso_code"].upper() == current_iso.upper()
-        top_10.append(CountryRank(
-            iso_code=entry["iso_code"],
-            name=entry["name"],
-            value=entry["value"],
-            rank=entry["rank"],
-            is_current=is_current
-        ))
-    
-    for entry in ranked_countries[-10:]:
-        is_current = current_iso and entry["iso_code"].upper() == current_iso.upper()
-        bottom_10.append(CountryRank(
-            iso_code=entry["iso_code"],
-            name=entry["name"],
-            value=entry["value"],
-            rank=entry["rank"],
-            is_current=is_current
-        ))
+    top_10 = ranked(ranking.top(10, higher_is_better))
+    bottom_10 = ranked(ranking.bottom(10, higher_is_better))
     
     # Find current country ranking
     current_country_rank = None
-    if current_iso:
-        current_iso_upper = current_iso.upper()
-        for entry in ranked_countries:
-            if entry["iso_code"].upper() == current_iso_upper:
-                percentile = round(((total_countries - entry["rank"] + 1) / total_countries) * 100, 1)
-                current_country_rank = CurrentCountryRank(
-                    iso_code=entry["iso_code"],
-                    name=entry["name"],
-                    value=entry["value"],
-                    rank=entry["rank"],
-                    percentile=percentile
-                )
-                break
+    value = ranking.values_by_iso.get(current_iso_upper) if current_iso_upper else None
+    if value is not None:
+        current_country_rank = CurrentCountryRank(
+            iso_code=current_iso_upper,
+            name=index.names.get(current_iso_upper, current_iso_upper),
+            value=value,
+            rank=ranking.rank(value, higher_is_better),
+            percentile=round(ranking.percentile(value, higher_is_better), 1)
+        )
     
     return GlobalRankingsResponse(
         metric=metric,
@@ -29,6 +29,25 @@ from app.models.metric_config import (
     DEFAULT_MATURITY_RULES,
     DEFAULT_PILLAR_SUMMARIES,
 )
+from app.services.rule_engine import (
+    OPERATORS,
+    compile_condition,
+    compile_rules,
+    invalidate_rule_cache,
+)
+from app.services.scenario_simulator import Scenario, get_metric_snapshot, simulate
+from app.services.scoring_engine import (
+    Component,
+    MetricMatrix,
+    ScoringProfile,
+    load_metric_matrix,
+    profile_from_pillar_weights,
+    score_matrix,
+    score_pillars,
+    to_optional_list,
+    weighted_components,
+    write_scores,
+)
 
 router = APIRouter()
 
@@ -148,6 +167,42 @@ class RuleUpdateRequest(BaseModel):
     is_active: Optional[bool] = None
 
 
+class ScenarioSpec(BaseModel):
+    """One what-if scenario: rule and/or pillar weight overrides."""
+    name: str
+    rule_overrides: Dict[str, Dict[str, Any]] = Field(
+        default_factory=dict,
+        description="{rule_key: {field: value}}; dotted fields such as 'condition_config.value' set one nested value",
+    )
+    weight_overrides: Dict[str, Dict[str, float]] = Field(
+        default_factory=dict,
+        description="{pillar: {metric_key: weight}}",
+    )
+
+
+class RuleSweep(BaseModel):
+    """One scenario per value of a single rule field."""
+    rule_key: str
+    field: str = Field("condition_config.value", description="Rule field or dotted condition path")
+    values: List[Any]
+
+
+class WeightSweep(BaseModel):
+    """One scenario per weight of a single pillar component."""
+    pillar: str
+    metric_key: str
+    values: List[float]
+
+
+class ScenarioBatchRequest(BaseModel):
+    """Batch of what-if scenarios, scored in memory against the metric snapshot."""
+    scenarios: List[ScenarioSpec] = Field(default_factory=list)
+    rule_sweeps: List[RuleSweep] = Field(default_factory=list)
+    weight_sweeps: List[WeightSweep] = Field(default_factory=list)
+    country_detail: str = Field("changed", pattern="^(none|changed|all)$")
+    refresh_snapshot: bool = False
+
+
 # =============================================================================
 # INITIALIZATION / SEED ENDPOINTS
 # =============================================================================
@@ -474,6 +529,10 @@ async def update_rule(
         raise HTTPException(status_code=404, detail=f"Rule '{rule_key}' not found")
     
     if update.condition_config is not None:
+        try:
+            compile_condition(rule.condition_type, update.condition_config)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid condition_config: {e}")
         rule.condition_config = update.condition_config
     if update.impact_value is not None:
         rule.impact_value = update.impact_value
@@ -489,6 +548,9 @@ async def update_rule(
     db.commit()
     db.refresh(rule)
     
+    # Compiled rule sets are rebuilt from the updated rules on next use
+    invalidate_rule_cache()
+    
     return MaturityRuleResponse(**rule.to_dict())
 
 
@@ -587,145 +649,23 @@ async def recalculate_all_scores(
         MaturityScoringRule.is_active == True
     ).order_by(MaturityScoringRule.priority).all()
     rule_config = [r.to_dict() for r in rules]
+    try:
+        compiled_rules = compile_rules(rule_config)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid maturity rule: {e}")
     
-    # Get ALL country data needed for both pillar and maturity scoring
-    query = text("""
-        SELECT 
-            c.iso_code,
-            -- Governance metrics
-            g.ilo_c187_status,
-            g.ilo_c155_status,
-            g.inspector_density,
-            g.mental_health_policy,
-            g.strategic_capacity_score,
-            -- Pillar 1: Hazard Control metrics
-            p1.fatal_accident_rate,
-            p1.oel_compliance_pct,
-            p1.safety_training_hours_avg,
-            p1.carcinogen_exposure_pct,
-            p1.control_maturity_score,
-            -- Pillar 2: Health Vigilance metrics
-            p2.vulnerability_index,
-            p2.disease_detection_rate,
-            p2.occupational_disease_reporting_rate,
-            p2.lead_exposure_screening_rate,
-            p2.surveillance_logic,
-            -- Pillar 3: Restoration metrics
-            p3.rehab_access_score,
-            p3.return_to_work_success_pct,
-            p3.rehab_participation_rate,
-            p3.avg_claim_settlement_days,
-            p3.reintegration_law,
-            p3.payer_mechanism
-        FROM countries c
-        LEFT JOIN governance_layer g ON c.iso_code = g.country_iso_code
-        LEFT JOIN pillar_1_hazard p1 ON c.iso_code = p1.country_iso_code
-        LEFT JOIN pillar_2_vigilance p2 ON c.iso_code = p2.country_iso_code
-        LEFT JOIN pillar_3_restoration p3 ON c.iso_code = p3.country_iso_code
-    """)
-    
-    result = db.execute(query)
-    rows = result.fetchall()
-    
-    updated_count = 0
-    maturity_scores = {}
-    
-    for row in rows:
-        (iso_code,
-         # Governance
-         ilo_c187, ilo_c155, inspector_density, mental_health_policy, strategic_cap,
-         # Pillar 1
-         fatal_rate, oel_compliance, safety_training, carcinogen_exp, control_maturity,
-         # Pillar 2
-         vuln_idx, disease_detection, disease_reporting, lead_screening, surveillance,
-         # Pillar 3
-         rehab_access, rtw_success, rehab_participation, claim_settlement, reintegration, payer) = row
-        
-        # Calculate Governance Score (0-100)
-        governance_score = calculate_pillar_score_from_weights(
-            pillar_weights.get("governance", {}),
-            {
-                "ilo_c187_status": 100.0 if ilo_c187 else (0.0 if ilo_c187 is not None else None),
-                "ilo_c155_status": 100.0 if ilo_c155 else (0.0 if ilo_c155 is not None else None),
-                "inspector_density": safe_normalize(inspector_density, 3.0),
-                "mental_health_policy": 100.0 if mental_health_policy else (0.0 if mental_health_policy is not None else None),
-                "strategic_capacity_score": strategic_cap,
-            }
-        )
-        
-        # Calculate Pillar 1: Hazard Control Score (0-100)
-        pillar1_score = calculate_pillar_score_from_weights(
-            pillar_weights.get("pillar_1_hazard", {}),
-            {
-                "fatal_accident_rate": safe_normalize(fatal_rate, 10.0, invert=True),
-                "oel_compliance_pct": oel_compliance,
-                "safety_training_hours_avg": safe_normalize(safety_training, 40.0),
-                "carcinogen_exposure_pct": safe_normalize(carcinogen_exp, 50.0, invert=True),
-                "control_maturity_score": control_maturity,
-            }
-        )
-        
-        # Calculate Pillar 2: Health Vigilance Score (0-100)
-        pillar2_score = calculate_pillar_score_from_weights(
-            pillar_weights.get("pillar_2_vigilance", {}),
-            {
-                "vulnerability_index": safe_normalize(vuln_idx, 100.0, invert=True),
-                "disease_detection_rate": disease_detection,
-                "occupational_disease_reporting_rate": disease_reporting,
-                "lead_exposure_screening_rate": lead_screening,
-            }
-        )
-        
-        # Calculate Pillar 3: Restoration Score (0-100)
-        pillar3_score = calculate_pillar_score_from_weights(
-            pillar_weights.get("pillar_3_restoration", {}),
-            {
-                "rehab_access_score": rehab_access,
-                "return_to_work_success_pct": rtw_success,
-                "rehab_participation_rate": rehab_participation,
-                "avg_claim_settlement_days": safe_normalize(claim_settlement, 365.0, invert=True),
-            }
-        )
-        
-        # Calculate Maturity Score using rule-based system
-        maturity_score = calculate_score_with_rules(
-            rule_config,
-            fatal_rate=fatal_rate,
-            inspector_density=inspector_density,
-            surveillance_logic=surveillance,
-            reintegration_law=reintegration,
-            payer_mechanism=payer
-        )
-        
-        maturity_scores[iso_code] = maturity_score
-        
-        # Update ALL scores in database
-        update_query = text("""
-            UPDATE countries 
-            SET maturity_score = :maturity_score,
-                governance_score = :governance_score,
-                pillar1_score = :pillar1_score,
-                pillar2_score = :pillar2_score,
-                pillar3_score = :pillar3_score,
-                updated_at = :now
-            WHERE iso_code = :iso_code
-        """)
-        db.execute(update_query, {
-            "maturity_score": maturity_score,
-            "governance_score": governance_score,
-            "pillar1_score": pillar1_score,
-            "pillar2_score": pillar2_score,
-            "pillar3_score": pillar3_score,
-            "now": datetime.utcnow(),
-            "iso_code": iso_code
-        })
-        updated_count += 1
+    # Score ALL countries (pillars + maturity) in one vectorised pass
+    matrix = load_metric_matrix(db)
+    scores = score_matrix(matrix, profile_from_pillar_weights(pillar_weights), rules=compiled_rules)
     
+    # Write ALL scores back in set-based UPDATEs (one per WRITE_CHUNK_SIZE countries)
+    write_stats = write_scores(db, matrix.keys, scores)
     db.commit()
+    updated_count = write_stats.rows
     
     # Calculate distribution based on maturity scores
     distribution = {"reactive": 0, "compliant": 0, "proactive": 0, "resilient": 0}
-    for score in maturity_scores.values():
+    for score in scores["maturity_score"]:
         if score < 2.0:
             distribution["reactive"] += 1
         elif score < 3.0:
@@ -744,7 +684,10 @@ async def recalculate_all_scores(
         execution_time_ms=execution_time,
         details={
             "rules_applied": len(rule_config),
+            "rule_set_version": compiled_rules.version[:12],
             "pillar_configs_loaded": len(pillar_weights),
+            "write_statements": write_stats.statements,
+            "write_time_ms": write_stats.elapsed_ms,
             "updated_by": current_user.email,
         }
     )
@@ -765,6 +708,9 @@ def calculate_pillar_score_from_weights(
     """
     Calculate a pillar score using configurable weighted average.
     
+    Single-country wrapper over app.services.scoring_engine; /recalculate
+    scores every country at once with profile_from_pillar_weights().
+    
     Args:
         weight_config: Dict of metric_key -> {weight, invert, max_value, normalize}
         metric_values: Dict of metric_key -> actual value (already normalized if needed)
@@ -772,33 +718,10 @@ def calculate_pillar_score_from_weights(
     Returns:
         Weighted average score (0-100) or None if no valid values
     """
-    if not weight_config:
-        return None
-    
-    valid_components = []
-    for metric_key, config in weight_config.items():
-        value = metric_values.get(metric_key)
-        if value is None:
-            continue
-        
-        weight = config.get("weight", 0)
-        if weight <= 0:
-            continue
-        
-        # Apply inversion if specified in config (may already be inverted in metric_values)
-        # We skip this as we handle inversion in safe_normalize above
-        valid_components.append((value, weight))
-    
-    if not valid_components:
-        return None
-    
-    # Redistribute weights for missing values
-    total_weight = sum(w for _, w in valid_components)
-    if total_weight == 0:
-        return None
-    
-    weighted_sum = sum(v * (w / total_weight) for v, w in valid_components)
-    return round(weighted_sum, 1)
+    # Values arrive already normalized, so every metric is used as-is
+    available = {metric_key: Component(metric_key, 0) for metric_key in (weight_config or {})}
+    profile = ScoringProfile(pillars=(("score", weighted_components(weight_config, available)),))
+    return to_optional_list(score_pillars(MetricMatrix.from_values(metric_values), profile)["score"])[0]
 
 
 def calculate_score_with_rules(
@@ -813,56 +736,17 @@ def calculate_score_with_rules(
     Calculate maturity score using configurable rules.
     
     This function evaluates each rule in priority order and applies
-    the impact to the score based on conditions.
+    the impact to the score based on conditions. The rule set is compiled
+    once and cached by version hash (see app.services.rule_engine); when
+    scoring many countries, call compile_rules(rules).score(metrics) directly.
     """
-    score = 1.0  # Base score
-    capped = False
-    cap_value = 4.0
-    
-    # Create metric lookup
-    metrics = {
+    return compile_rules(rules).score({
         "fatal_accident_rate": fatal_rate,
         "inspector_density": inspector_density,
         "surveillance_logic": surveillance_logic,
         "reintegration_law": reintegration_law,
         "payer_mechanism": payer_mechanism,
-    }
-    
-    for rule in rules:
-        if not rule.get("is_active", True):
-            continue
-        
-        condition_type = rule.get("condition_type")
-        condition_config = rule.get("condition_config", {})
-        impact_type = rule.get("impact_type", "add")
-        impact_value = rule.get("impact_value", 0)
-        
-        # Skip if already capped and this isn't a cap rule
-        if capped and impact_type != "cap":
-            continue
-        
-        # Evaluate condition
-        condition_met = evaluate_condition(condition_type, condition_config, metrics)
-        
-        if condition_met:
-            if impact_type == "set":
-                score = impact_value
-            elif impact_type == "add":
-                score += impact_value
-            elif impact_type == "multiply":
-                score *= impact_value
-            elif impact_type == "cap":
-                capped = True
-                cap_value = min(cap_value, impact_value)
-    
-    # Apply cap
-    if capped:
-        score = min(score, cap_value)
-    
-    # Ensure within bounds
-    score = max(1.0, min(4.0, score))
-    
-    return round(score, 1)
+    })
 
 
 def evaluate_condition(
@@ -871,84 +755,16 @@ def evaluate_condition(
     metrics: Dict[str, Any]
 ) -> bool:
     """Evaluate a single condition against metric values."""
-    
-    if condition_type == "always":
-        return True
-    
-    if condition_type == "threshold":
-        metric_key = config.get("metric")
-        operator = config.get("operator", "==")
-        value = config.get("value")
-        metric_value = metrics.get(metric_key)
-        
-        if metric_value is None:
-            return False
-        
-        result = compare_values(metric_value, operator, value)
-        
-        # Check for AND condition
-        if result and "and" in config:
-            and_config = config["and"]
-            result = evaluate_condition("threshold", and_config, metrics)
-        
-        return result
-    
-    if condition_type == "boolean":
-        metric_key = config.get("metric")
-        expected = config.get("equals")
-        metric_value = metrics.get(metric_key)
-        return metric_value == expected
-    
-    if condition_type == "enum":
-        metric_key = config.get("metric")
-        expected = config.get("equals")
-        metric_value = metrics.get(metric_key)
-        
-        if metric_value is None:
-            return False
-        
-        # Handle enum comparison (might be stored as different formats)
-        if isinstance(metric_value, str):
-            return metric_value.lower().replace("-", "_").replace(" ", "_") == \
-                   expected.lower().replace("-", "_").replace(" ", "_")
-        return str(metric_value) == str(expected)
-    
-    if condition_type == "compound":
-        operator = config.get("operator", "AND")
-        conditions = config.get("conditions", [])
-        
-        results = []
-        for cond in conditions:
-            cond_type = "threshold" if "operator" in cond else "boolean"
-            results.append(evaluate_condition(cond_type, cond, metrics))
-        
-        if operator == "AND":
-            return all(results)
-        elif operator == "OR":
-            return any(results)
-        
-        return False
-    
-    return False
+    return compile_condition(condition_type, config)(metrics)
 
 
 def compare_values(actual: Any, operator: str, expected: Any) -> bool:
     """Compare two values using the specified operator."""
+    compare = OPERATORS.get(operator)
+    if compare is None:
+        return False
     try:
-        if operator == "==":
-            return actual == expected
-        elif operator == "!=":
-            return actual != expected
-        elif operator == "<":
-            return actual < expected
-        elif operator == "<=":
-            return actual <= expected
-        elif operator == ">":
-            return actual > expected
-        elif operator == ">=":
-            return actual >= expected
-        else:
-            return False
+        return compare(actual, expected)
     except (TypeError, ValueError):
         return False
 
@@ -1012,34 +828,24 @@ async def preview_calculation(
             if rule["rule_key"] in rule_overrides:
                 rule.update(rule_overrides[rule["rule_key"]])
     
-    # Calculate new score
-    new_score = calculate_score_with_rules(
-        rule_config,
-        fatal_rate=fatal_rate,
-        inspector_density=inspector_density,
-        surveillance_logic=surveillance,
-        reintegration_law=reintegration,
-        payer_mechanism=payer
-    )
+    # Calculate new score (overridden rule sets compile and cache separately)
+    try:
+        compiled_rules = compile_rules(rule_config)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid maturity rule: {e}")
+    metrics = {
+        "fatal_accident_rate": fatal_rate,
+        "inspector_density": inspector_density,
+        "surveillance_logic": surveillance,
+        "reintegration_law": reintegration,
+        "payer_mechanism": payer,
+    }
+    new_score = compiled_rules.score(metrics)
     
     # Build rule application breakdown
+    active_rules = [rule for rule in rule_config if rule.get("is_active", True)]
     breakdown = []
-    for rule in rule_config:
-        if not rule.get("is_active", True):
-            continue
-        
-        condition_met = evaluate_condition(
-            rule.get("condition_type"),
-            rule.get("condition_config", {}),
-            {
-                "fatal_accident_rate": fatal_rate,
-                "inspector_density": inspector_density,
-                "surveillance_logic": surveillance,
-                "reintegration_law": reintegration,
-                "payer_mechanism": payer,
-            }
-        )
-        
+    for rule, (_, condition_met) in zip(active_rules, compiled_rules.conditions(metrics)):
         breakdown.append({
             "rule_key": rule["rule_key"],
             "name": rule["name"],
@@ -1054,12 +860,73 @@ async def preview_calculation(
         "current_score": current_score,
         "calculated_score": new_score,
         "score_change": round(new_score - (current_score or 0), 1),
-        "input_values": {
-            "fatal_accident_rate": fatal_rate,
-            "inspector_density": inspector_density,
-            "surveillance_logic": surveillance,
-            "reintegration_law": reintegration,
-            "payer_mechanism": payer,
-        },
+        "input_values": metrics,
         "rule_breakdown": breakdown,
     }
+
+
+# =============================================================================
+# SCENARIO SIMULATOR
+# =============================================================================
+
+# Scenarios per /simulate-scenarios request (after sweeps are expanded)
+MAX_SCENARIOS_PER_REQUEST = 1000
+
+
+@router.post(
+    "/simulate-scenarios",
+    summary="Simulate What-If Scenarios",
+    description="Score every country under a batch of rule/weight scenarios, in memory. Nothing is written."
+)
+async def simulate_scenarios(
+    request: ScenarioBatchRequest,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_admin_user)
+):
+    """
+    Score every country under each scenario and report the maturity stage
+    distribution and stage transitions against the current configuration.
+    
+    Scenarios are evaluated against a cached metric snapshot; pillar and
+    maturity scores are cached per weight set and rule set, so sweeps and
+    repeated scenarios are cheap.
+    """
+    pillar_summaries = db.query(PillarSummaryMetric).filter(
+        PillarSummaryMetric.is_active == True
+    ).all()
+    pillar_weights = {s.pillar.value: s.component_weights for s in pillar_summaries}
+    
+    rules = db.query(MaturityScoringRule).filter(
+        MaturityScoringRule.is_active == True
+    ).order_by(MaturityScoringRule.priority).all()
+    baseline = Scenario("current configuration", [r.to_dict() for r in rules], pillar_weights)
+    
+    # Expand explicit scenarios and sweeps
+    scenarios = []
+    for spec in request.scenarios:
+        scenario = baseline.with_rule_overrides(spec.name, spec.rule_overrides)
+        scenarios.append(scenario.with_weight_overrides(spec.name, spec.weight_overrides))
+    for sweep in request.rule_sweeps:
+        for value in sweep.values:
+            scenarios.append(baseline.with_rule_overrides(
+                f"{sweep.rule_key}.{sweep.field}={value}", {sweep.rule_key: {sweep.field: value}}
+            ))
+    for sweep in request.weight_sweeps:
+        for value in sweep.values:
+            scenarios.append(baseline.with_weight_overrides(
+                f"{sweep.pillar}.{sweep.metric_key}={value}", {sweep.pillar: {sweep.metric_key: value}}
+            ))
+    
+    if not scenarios:
+        raise HTTPException(status_code=400, detail="No scenarios given")
+    if len(scenarios) > MAX_SCENARIOS_PER_REQUEST:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many scenarios ({len(scenarios)}), maximum is {MAX_SCENARIOS_PER_REQUEST}",
+        )
+    
+    snapshot = get_metric_snapshot(db, refresh=request.refresh_snapshot)
+    try:
+        return simulate(snapshot, baseline, scenarios, request.country_detail)
+    except (TypeError, ValueError, AttributeError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid scenario configuration: {e}")
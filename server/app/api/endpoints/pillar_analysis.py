@@ -609,6 +609,7 @@ async def generate_pillar_analysis(
                 "BEST_PRACTICE_LEADERS": best_practice_context,
             },
             enable_web_search=True,
+            use_cache=not request.force_regenerate,
         )
         
         # Parse JSON response from agent
@@ -898,6 +899,7 @@ async def generate_summary_report(
                 "COMPARISON_DATA": comparison_context,
             },
             enable_web_search=True,
+            use_cache=not request.force_regenerate,
         )
         
         parsed = parse_agent_response(result.get("output", ""))
@@ -765,6 +765,7 @@ async def generate_report(
                     },
                     update_stats=True,
                     enable_web_search=request.enable_web_search,
+                    use_cache=not request.force_regenerate,
                 ),
                 timeout=45.0  # 45 seconds for primary model (leave room for fallback)
             )
@@ -790,6 +791,7 @@ async def generate_report(
                         },
                         update_stats=True,
                         enable_web_search=False,  # Skip web search for faster fallback
+                        use_cache=not request.force_regenerate,
                     ),
                     timeout=45.0  # 45 seconds for fallback
                 )
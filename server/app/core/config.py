@@ -47,6 +47,35 @@ class Settings(BaseSettings):
     TAVILY_API_KEY: Optional[str] = None  # Primary: 1000 free/month
     SERPAPI_KEY: Optional[str] = None     # Backup: 100 free/month
 
+    # Web Search Result Cache (parsed results per provider + normalised query)
+    WEB_SEARCH_CACHE_ENABLED: bool = True
+
+    # ETL HTTP Response Cache (ILO / World Bank / WHO payloads)
+    ETL_CACHE_ENABLED: bool = True
+    ETL_CACHE_DIR: str = ".etl_cache"
+    ETL_CACHE_MAX_MB: int = 256
+    ETL_OFFLINE: bool = False  # Serve ETL requests from cache only (no network)
+
+    # ETL Database Writes
+    ETL_WRITE_BATCH_SIZE: int = 50  # Countries per bulk upsert transaction
+
+    # LLM Response Cache (AgentRunner, ai_service, orchestrator synthesis)
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_URL: Optional[str] = None  # e.g. sqlite:///.llm_cache.db; default: application database
+    LLM_CACHE_TTL_HOURS: int = 24 * 7
+    LLM_CACHE_MAX_ENTRIES: int = 5000
+    LLM_CACHE_SEMANTIC: bool = False  # Also answer near-duplicate prompts
+    LLM_CACHE_SEMANTIC_THRESHOLD: float = 0.98  # Cosine similarity of prompt embeddings
+
+    # Batch Insight Generation (adaptive concurrency window + per-model budgets)
+    BATCH_CONCURRENCY_MIN: int = 1
+    BATCH_CONCURRENCY_INITIAL: int = 4
+    BATCH_CONCURRENCY_MAX: int = 16
+    BATCH_RPM_LIMIT: int = 450      # Requests per minute per provider/model (0: unlimited)
+    BATCH_TPM_LIMIT: int = 180000   # Tokens per minute per provider/model (0: unlimited)
+    BATCH_RATE_LIMITS: str = ""     # Overrides, e.g. "openai/gpt-4o-mini=500:200000,anthropic=50:40000"
+    BATCH_TOKENS_PER_INSIGHT: int = 3000  # Budget reserved per insight call until its size is known
+
 
 # Global settings instance
 settings = Settings()
@@ -151,6 +151,10 @@ async def startup_event():
     from app.models import country  # noqa: F401 - includes CountryDeepDive
     from app.models import user  # noqa: F401
     from app.models import agent  # noqa: F401 - AI Agent Registry
+    from app.models import pipeline_run  # noqa: F401 - ETL run checkpoints
+    from app.models import country_snapshot  # noqa: F401 - display read model
+    from app.models import llm_cache  # noqa: F401 - LLM response cache
+    from app.models import web_search_cache  # noqa: F401 - parsed web search results
     print("Models imported successfully", flush=True)
     
     # Create tables that don't exist yet
@@ -192,6 +196,19 @@ async def startup_event():
     print("=" * 60, flush=True)
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the ETL event loop and release the shared ETL and web research HTTP connection pools."""
+    from app.services.etl.http_pool import aclose_async_client, close_pools
+    from app.services.etl.loop_runner import shutdown_loop_runner
+    from app.services.web_research import aclose_research_client
+    
+    await aclose_async_client()
+    await aclose_research_client()
+    shutdown_loop_runner()
+    close_pools()
+
+
 @app.get("/health", tags=["System"])
 async def health_check():
     """
@@ -46,6 +46,10 @@ from app.models.metric_config import (
 
 from app.models.ai_call_trace import AICallTrace
 
+from app.models.llm_cache import LLMResponseCacheEntry
+
+from app.models.web_search_cache import WebSearchCacheEntry
+
 from app.models.agent import Agent, DEFAULT_AGENTS
 
 from app.models.best_practice import (
@@ -58,6 +62,10 @@ from app.models.best_practice import (
 
 from app.models.comparison_report import ComparisonReport
 
+from app.models.pipeline_run import PipelineRun, PipelineCheckpoint
+
+from app.models.country_snapshot import CountryScoreSnapshot, CountrySnapshotDirty
+
 from app.models.country_insight import (
     InsightCategory,
     InsightStatus,
@@ -99,6 +107,10 @@ __all__ = [
     "DEFAULT_PILLAR_SUMMARIES",
     # AI Call Trace
     "AICallTrace",
+    # LLM Response Cache
+    "LLMResponseCacheEntry",
+    # Web Search Cache
+    "WebSearchCacheEntry",
     # Agent Registry
     "Agent",
     "DEFAULT_AGENTS",
@@ -110,6 +122,12 @@ __all__ = [
     "get_question_by_id",
     # Comparison Reports
     "ComparisonReport",
+    # ETL Pipeline Runs
+    "PipelineRun",
+    "PipelineCheckpoint",
+    # Country Score Snapshot
+    "CountryScoreSnapshot",
+    "CountrySnapshotDirty",
     # Country Insights
     "InsightCategory",
     "InsightStatus",
@@ -33,6 +33,7 @@ class AICallTrace(Base):
     - Provider and model information
     - Request context (endpoint, operation type)
     - Performance metrics (latency, success/failure)
+    - Response cache outcome (answered from the LLM cache or not)
     - User tracking for audit purposes
     """
     __tablename__ = "ai_call_traces"
@@ -108,6 +109,11 @@ class AICallTrace(Base):
         nullable=True,
         comment="Error message if the call failed"
     )
+    cache_status = Column(
+        String(20),
+        nullable=True,
+        comment="LLM response cache outcome (hit, semantic_hit, miss) or null if not cached"
+    )
     
     # User tracking
     user_id = Column(
@@ -148,5 +154,6 @@ class AICallTrace(Base):
             "latency_ms": self.latency_ms,
             "success": self.success,
             "error_message": self.error_message,
+            "cache_status": self.cache_status,
             "user_id": self.user_id,
         }
@@ -31,6 +31,7 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -84,6 +85,11 @@ class Country(Base):
     """
     __tablename__ = "countries"
 
+    # Keyset pagination order of GET /countries/
+    __table_args__ = (
+        Index("ix_countries_name_iso_code", "name", "iso_code"),
+    )
+
     # Primary Key - ISO 3166-1 alpha-3 code
     iso_code = Column(String(3), primary_key=True, index=True)
     
@@ -94,7 +100,7 @@ class Country(Base):
     flag_url = Column(String(255), nullable=True, comment="URL path to country flag image")
     
     # Computed Maturity Score (aggregate of all layers)
-    maturity_score = Column(Float, nullable=True)
+    maturity_score = Column(Float, nullable=True, index=True)
     
     # Framework-Aligned Pillar Scores (0-100 scale)
     # These are calculated from component metrics using configurable weights
@@ -0,0 +1,59 @@
+"""
+GOHIP Platform - Country Score Snapshot Models
+Denormalised per-country read model for the display endpoints, plus the
+queue of countries whose snapshot row is stale.
+"""
+
+from sqlalchemy import BigInteger, Column, DateTime, Float, String, Text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class CountryScoreSnapshot(Base):
+    """
+    One row per country: identity, effective scores and every display
+    metric of the governance / pillar / intelligence layers.
+
+    Maintained by app.services.country_snapshot; never edited directly.
+    """
+    __tablename__ = "country_score_snapshots"
+
+    iso_code = Column(String(3), primary_key=True)
+    name = Column(String(100), nullable=False, index=True)
+    flag_url = Column(String(255), nullable=True)
+    strategic_summary_text = Column(Text, nullable=True)
+
+    # Scores: maturity as stored, pillar scores stored or calculated fallback
+    maturity_score = Column(Float, nullable=True)
+    governance_score = Column(Float, nullable=True)
+    pillar1_score = Column(Float, nullable=True)
+    pillar2_score = Column(Float, nullable=True)
+    pillar3_score = Column(Float, nullable=True)
+    data_coverage_score = Column(Float, nullable=True)
+
+    # {layer: {column: value} | null} for governance, pillar_1_hazard,
+    # pillar_2_vigilance, pillar_3_restoration and intelligence
+    layers = Column(JSONB, nullable=False, default=dict)
+
+    country_created_at = Column(DateTime, nullable=True)
+    country_updated_at = Column(DateTime, nullable=True)
+
+    # Snapshot refresh that produced this row (monotonic across refreshes)
+    version = Column(BigInteger, nullable=False, default=0, index=True)
+    refreshed_at = Column(DateTime, server_default=func.now(), nullable=False)
+
+    def __repr__(self):
+        return f"<CountryScoreSnapshot(iso_code='{self.iso_code}', version={self.version})>"
+
+
+class CountrySnapshotDirty(Base):
+    """
+    Countries whose snapshot row must be rebuilt before the next read.
+    iso_code "*" marks every country.
+    """
+    __tablename__ = "country_snapshot_dirty"
+
+    iso_code = Column(String(3), primary_key=True)
+    marked_at = Column(DateTime, server_default=func.now(), nullable=False)
@@ -0,0 +1,47 @@
+"""
+GOHIP Platform - LLM Response Cache Model
+Stored LLM responses keyed by a hash of the full request, maintained by
+app.services.llm_cache (in the application database, or in the separate
+database named by LLM_CACHE_URL).
+"""
+
+from sqlalchemy import Column, DateTime, Float, Index, Integer, LargeBinary, String, Text
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class LLMResponseCacheEntry(Base):
+    """
+    One cached LLM response.
+
+    key is the SHA-256 of (provider, model, system prompt, user prompt,
+    temperature); scope hashes everything but the user prompt and groups
+    the entries that may answer a near-duplicate prompt.
+    """
+    __tablename__ = "llm_response_cache"
+
+    key = Column(String(64), primary_key=True)
+    scope = Column(String(64), nullable=False)
+    provider = Column(String(50), nullable=False)
+    model_name = Column(String(100), nullable=False)
+    temperature = Column(Float, nullable=True)
+
+    prompt_preview = Column(String(200), nullable=True)
+    response = Column(Text, nullable=False)
+    # float32 embedding of the user prompt (semantic tier only)
+    embedding = Column(LargeBinary, nullable=True)
+
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+    last_hit_at = Column(DateTime, server_default=func.now(), nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+    hit_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("ix_llm_response_cache_scope", scope),
+        Index("ix_llm_response_cache_last_hit_at", last_hit_at),
+        Index("ix_llm_response_cache_expires_at", expires_at),
+    )
+
+    def __repr__(self):
+        return f"<LLMResponseCacheEntry(key='{self.key[:12]}...', model='{self.model_name}', hits={self.hit_count})>"
@@ -0,0 +1,107 @@
+"""
+GOHIP Platform - ETL Pipeline Run Models
+Persistent run IDs and per-country / per-source checkpoints for the ETL
+pipeline, so an interrupted run can be resumed instead of restarted.
+"""
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class PipelineRun(Base):
+    """
+    One run_full_pipeline execution.
+
+    Status lifecycle: running -> completed | stopped | failed. A run left in
+    "running" by a dead process, or stopped/failed, can be resumed.
+    """
+    __tablename__ = "etl_pipeline_runs"
+
+    id = Column(String(36), primary_key=True)
+    status = Column(String(20), nullable=False, default="running", index=True)
+
+    # run_full_pipeline arguments, replayed on resume
+    options = Column(JSONB, nullable=False, default=dict)
+    target_countries = Column(JSONB, nullable=False, default=list)
+
+    # Outcome counters (updated when the run finishes or stops)
+    processed_count = Column(Integer, nullable=False, default=0)
+    failed_count = Column(Integer, nullable=False, default=0)
+    resume_count = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+
+    # Timestamps
+    started_at = Column(DateTime, server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    checkpoints = relationship(
+        "PipelineCheckpoint",
+        back_populates="run",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
+    def __repr__(self) -> str:
+        return f"<PipelineRun {self.id}: {self.status}>"
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for API response."""
+        return {
+            "id": self.id,
+            "status": self.status,
+            "options": self.options,
+            "target_count": len(self.target_countries or []),
+            "processed_count": self.processed_count,
+            "failed_count": self.failed_count,
+            "resume_count": self.resume_count,
+            "error": self.error,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+
+class PipelineCheckpoint(Base):
+    """
+    Progress of one country within a run.
+
+    source is a fetched source ("ilo", "worldbank", "who",
+    "worldbank_extended") with its payload, or "pipeline" for the country as
+    a whole (status "written" once its batch is committed, or "failed").
+    """
+    __tablename__ = "etl_pipeline_checkpoints"
+    __table_args__ = (
+        UniqueConstraint("run_id", "country_iso_code", "source", name="uq_etl_checkpoint"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    run_id = Column(
+        String(36),
+        ForeignKey("etl_pipeline_runs.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    country_iso_code = Column(String(3), nullable=False)
+    source = Column(String(32), nullable=False)
+    status = Column(String(20), nullable=False)  # fetched | written | failed
+    payload = Column(JSONB, nullable=True)
+    error = Column(Text, nullable=True)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    run = relationship("PipelineRun", back_populates="checkpoints")
+
+    def __repr__(self) -> str:
+        return f"<PipelineCheckpoint {self.run_id} {self.country_iso_code}/{self.source}: {self.status}>"
@@ -0,0 +1,43 @@
+"""
+GOHIP Platform - Web Search Cache Model
+Parsed web search results per (provider, normalised query), maintained by
+app.services.web_search_cache.
+"""
+
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String, Text
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class WebSearchCacheEntry(Base):
+    """
+    Results of one query at one search provider.
+
+    results holds the parsed hits ([{title, url, snippet}]), never the
+    formatted text, so every consumer can format them its own way.
+    """
+    __tablename__ = "web_search_cache"
+
+    # SHA-256 of provider + normalised query
+    key = Column(String(64), primary_key=True)
+    provider = Column(String(30), nullable=False)
+    query = Column(String(500), nullable=False)
+    # Freshness class of the query (recent, statistics, policy, ...)
+    query_class = Column(String(30), nullable=False)
+
+    num_results = Column(Integer, nullable=False)
+    results = Column(JSON, nullable=False, default=list)
+    answer = Column(Text, nullable=True)  # Provider summary (Tavily)
+
+    fetched_at = Column(DateTime, server_default=func.now(), nullable=False)
+    expires_at = Column(DateTime, nullable=False)
+    hit_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("ix_web_search_cache_query", query),
+        Index("ix_web_search_cache_expires_at", expires_at),
+    )
+
+    def __repr__(self):
+        return f"<WebSearchCacheEntry(provider='{self.provider}', query='{self.query[:40]}', class='{self.query_class}')>"
@@ -293,4 +293,5 @@ class CountryListPaginated(BaseModel):
     total: int
     page: int
     per_page: int
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page (None on the last page)")
     countries: List[CountryListResponse]
@@ -6,7 +6,9 @@ Runs any agent with automatic database context injection and optional web search
 Provides all agents with comprehensive country knowledge baseline.
 """
 
+import asyncio
 import logging
+import time
 from datetime import datetime
 from typing import Optional, Dict, Any
 
@@ -15,8 +17,16 @@ from langchain_core.messages import SystemMessage, HumanMessage
 
 from app.models.agent import Agent
 from app.models.user import AIConfig
+from app.services.ai_call_tracer import AICallTracer
 from app.services.ai_orchestrator import get_llm_from_config
 from app.services.country_data_provider import CountryDataProvider, detect_country_from_name
+from app.services.llm_cache import LLMRequest, cache_enabled, llm_cache
+from app.services.web_research import (
+    RESEARCH_QUERIES,
+    RESEARCH_RESULTS_PER_QUERY,
+    build_research_queries,
+    gather_research,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +40,7 @@ class AgentRunner:
     - Optional web search for real-time information
     - Template variable substitution
     - Execution tracking
+    - LLM response cache for byte-identical (or near-duplicate) prompts
     
     Simple usage:
         runner = AgentRunner(db)
@@ -102,35 +113,27 @@ class AgentRunner:
         """
         Perform web search for additional context.
         
-        Uses the existing web search infrastructure (Tavily, SerpAPI, etc.)
+        Runs the research queries concurrently on the event loop (see
+        app.services.web_research), so other requests are not blocked.
         """
         try:
-            from app.services.ai_orchestrator import perform_extended_research
-            
             country = variables.get("COUNTRY_NAME", "")
             topic = variables.get("TOPIC", "occupational health")
             
-            # Build search query
-            query = f"{country} {topic} occupational health safety 2024 2025 2026"
-            
-            logger.info(f"Performing web search: {query[:50]}...")
+            queries = build_research_queries(country, topic, num_queries=RESEARCH_QUERIES)
+            logger.info(f"Performing web search: {len(queries)} queries for {country} - {topic}")
             
-            # Perform search
-            results = perform_extended_research(query, max_queries=3)
+            results = await gather_research(queries, results_per_query=RESEARCH_RESULTS_PER_QUERY, limit=10)
             
             if not results:
                 return "No web search results available."
             
             # Format results
             formatted = ["## WEB RESEARCH RESULTS", ""]
-            for i, result in enumerate(results[:10], 1):
-                title = result.get("title", "No title")
-                snippet = result.get("snippet", result.get("content", ""))[:300]
-                url = result.get("url", "")
-                formatted.append(f"{i}. **{title}**")
-                formatted.append(f"   {snippet}")
-                if url:
-                    formatted.append(f"   Source: {url}")
+            for i, result in enumerate(results, 1):
+                formatted.append(f"{i}. **{result.title}**")
+                formatted.append(f"   {result.snippet[:300]}")
+                formatted.append(f"   Source: {result.url}")
                 formatted.append("")
             
             return "\n".join(formatted)
@@ -139,6 +142,36 @@ class AgentRunner:
             logger.warning(f"Web search failed: {e}")
             return f"Web search unavailable: {str(e)}"
     
+    def _trace(
+        self,
+        request: LLMRequest,
+        agent_id: str,
+        iso_code: Optional[str],
+        start_time: float,
+        cache_status: Optional[str],
+        error: Optional[str] = None,
+    ) -> None:
+        """
+        Record the agent's LLM call (or cache hit) in the AI call traces.
+        
+        Uses its own session rather than self.db; run() calls it via
+        asyncio.to_thread.
+        """
+        try:
+            AICallTracer.trace_detached(
+                provider=request.provider,
+                model_name=request.model,
+                operation_type="agent_run",
+                success=error is None,
+                latency_ms=int((time.time() - start_time) * 1000),
+                country_iso_code=iso_code if iso_code and len(iso_code) == 3 else None,
+                topic=agent_id,
+                error_message=error,
+                cache_status=cache_status,
+            )
+        except Exception as trace_error:
+            logger.warning(f"Failed to log AI call trace: {trace_error}")
+    
     def _fill_template(self, template: str, variables: dict) -> str:
         """Fill template variables in the prompt."""
         if not template:
@@ -159,6 +192,7 @@ class AgentRunner:
         update_stats: bool = True,
         enable_web_search: bool = False,
         override_model: str = None,
+        use_cache: Optional[bool] = None,
     ) -> dict:
         """
         Run an agent with the provided variables.
@@ -169,6 +203,8 @@ class AgentRunner:
             update_stats: Whether to update execution count and last_run_at
             enable_web_search: Whether to perform web search for additional context
             override_model: Optional model name override (e.g., "gpt-4o-mini" for cheaper batch runs)
+            use_cache: Whether to answer from / store in the LLM response cache
+                (default: only when the configured temperature is 0)
             
         Returns:
             Dict with 'success', 'output', and 'error' keys
@@ -234,8 +270,34 @@ class AgentRunner:
             
             logger.info(f"Running agent '{agent_id}' with {len(enriched_variables)} variables")
             
-            response = await llm.ainvoke(messages)
-            output = response.content
+            # Identical filled prompts (same template, same country data) are
+            # answered from the LLM response cache
+            iso_code = enriched_variables.get("ISO_CODE")
+            cache_request = LLMRequest(
+                provider=self.ai_config.provider.value,
+                model=override_model or self.ai_config.model_name,
+                system_prompt=system_prompt,
+                user_prompt=user_prompt,
+                temperature=self.ai_config.temperature,
+                partition=iso_code,
+            )
+            # The cache is database-backed: keep its round-trips off the event loop
+            use_cache = cache_enabled(cache_request, use_cache)
+            output, cache_status = await asyncio.to_thread(llm_cache.lookup, cache_request) if use_cache else (None, None)
+            
+            start_time = time.time()
+            if output is None:
+                try:
+                    response = await llm.ainvoke(messages)
+                except Exception as e:
+                    await asyncio.to_thread(
+                        self._trace, cache_request, agent_id, iso_code, start_time, cache_status, str(e)
+                    )
+                    raise
+                output = response.content
+                if use_cache:
+                    await asyncio.to_thread(llm_cache.store, cache_request, output)
+            await asyncio.to_thread(self._trace, cache_request, agent_id, iso_code, start_time, cache_status)
             
             # Log the LLM output for debugging
             logger.info(f"[AgentRunner] LLM response type: {type(output)}")
@@ -273,8 +335,6 @@ class AgentRunner:
         Synchronous version of run() for non-async contexts.
         Uses asyncio to run the async method.
         """
-        import asyncio
-        
         try:
             loop = asyncio.get_event_loop()
         except RuntimeError:
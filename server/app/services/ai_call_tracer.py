@@ -13,9 +13,10 @@ from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any, Generator
 
-from sqlalchemy import func, desc
+from sqlalchemy import func, desc, or_
 from sqlalchemy.orm import Session
 
+from app.core.database import SessionLocal
 from app.models.ai_call_trace import AICallTrace
 
 logger = logging.getLogger(__name__)
@@ -49,6 +50,7 @@ class AICallTracer:
         topic: Optional[str] = None,
         error_message: Optional[str] = None,
         user_id: Optional[int] = None,
+        cache_status: Optional[str] = None,
     ) -> AICallTrace:
         """
         Create and persist a call trace.
@@ -65,6 +67,7 @@ class AICallTracer:
             topic: Topic or subject of the AI call
             error_message: Error message if the call failed
             user_id: User who initiated the call
+            cache_status: LLM response cache outcome (hit, semantic_hit, miss)
             
         Returns:
             The created AICallTrace record
@@ -82,6 +85,7 @@ class AICallTracer:
             topic=topic,
             error_message=error_message,
             user_id=user_id,
+            cache_status=cache_status,
         )
         
         try:
@@ -94,6 +98,21 @@ class AICallTracer:
             
         return trace
     
+    @staticmethod
+    def trace_detached(**fields: Any) -> None:
+        """
+        Persist a call trace in a short-lived session of its own.
+        
+        For LLM call paths: never commits (or rolls back) the caller's
+        session, and can run in a worker thread via asyncio.to_thread.
+        Takes the keyword arguments of trace() except db.
+        """
+        db = SessionLocal()
+        try:
+            AICallTracer.trace(db=db, **fields)
+        finally:
+            db.close()
+    
     @staticmethod
     def get_traces(
         db: Session,
@@ -209,10 +228,11 @@ class AICallTracer:
         success_count = base_query.filter(AICallTrace.success == True).count()
         success_rate = (success_count / total_calls * 100) if total_calls > 0 else 0
         
-        # Average latency (excluding nulls)
+        # Average latency (excluding nulls and calls answered from the LLM cache)
         avg_latency = db.query(func.avg(AICallTrace.latency_ms)).filter(
             AICallTrace.timestamp >= start_date,
-            AICallTrace.latency_ms.isnot(None)
+            AICallTrace.latency_ms.isnot(None),
+            or_(AICallTrace.cache_status.is_(None), AICallTrace.cache_status == "miss"),
         ).scalar() or 0
         
         # Calls by provider
@@ -239,6 +259,22 @@ class AICallTracer:
         
         calls_by_operation = {o.operation_type: o.count for o in operation_stats}
         
+        # LLM response cache outcomes
+        cache_stats = db.query(
+            AICallTrace.cache_status,
+            func.count(AICallTrace.id).label('count')
+        ).filter(
+            AICallTrace.timestamp >= start_date,
+            AICallTrace.cache_status.isnot(None)
+        ).group_by(
+            AICallTrace.cache_status
+        ).all()
+        
+        cache_counts = {c.cache_status: c.count for c in cache_stats}
+        cache_hits = cache_counts.get("hit", 0)
+        cache_semantic_hits = cache_counts.get("semantic_hit", 0)
+        cache_lookups = cache_hits + cache_semantic_hits + cache_counts.get("miss", 0)
+        
         # Recent errors
         recent_errors = base_query.filter(
             AICallTrace.success == False
@@ -255,6 +291,12 @@ class AICallTracer:
             "avg_latency_ms": round(avg_latency, 0),
             "calls_by_provider": calls_by_provider,
             "calls_by_operation": calls_by_operation,
+            "cache": {
+                "hits": cache_hits,
+                "semantic_hits": cache_semantic_hits,
+                "misses": cache_counts.get("miss", 0),
+                "hit_rate": round((cache_hits + cache_semantic_hits) / cache_lookups * 100, 2) if cache_lookups else 0,
+            },
             "recent_errors": [
                 {
                     "id": e.id,
@@ -21,7 +21,7 @@ Supports multiple AI providers:
 import logging
 import json
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 
@@ -38,6 +38,9 @@ from app.models.country import (
 )
 from app.models.user import AIConfig, AIProvider
 from app.services.ai_call_tracer import AICallTracer, trace_ai_call
+from app.services.llm_cache import LLMRequest, cache_enabled, llm_cache
+from app.services.llm_clients import ClientKey, key_fingerprint, llm_clients
+from app.services.web_search_cache import search_cache
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -273,425 +276,383 @@ def format_metrics_for_llm(metrics: Dict[str, Any]) -> str:
 # WEB SEARCH (Tavily + Multi-Source Fallback)
 # =============================================================================
 
-def perform_web_search(query: str, num_results: int = 10) -> str:
+# Headings of formatted results per provider
+SEARCH_PROVIDER_LABELS = {
+    "tavily": "Tavily Web Research",
+    "serpapi": "SerpAPI Google Results",
+    "bing": "Bing Search Results",
+    "google": "Google Search Results",
+    "duckduckgo": "DuckDuckGo Results",
+}
+
+_BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate',
+    'Connection': 'keep-alive',
+}
+
+
+@dataclass
+class WebSearchResults:
+    """Parsed results of one query ([{title, url, snippet}]) and their provider."""
+    query: str
+    provider: Optional[str] = None
+    results: List[Dict[str, str]] = field(default_factory=list)
+    answer: Optional[str] = None
+    cached: bool = False
+
+
+def _search_providers() -> List[Tuple[str, Callable]]:
+    """Fallback chain, best first (API providers only when configured)."""
+    providers = []
+    if settings.TAVILY_API_KEY:
+        providers.append(("tavily", _tavily_results))
+    if settings.SERPAPI_KEY:
+        providers.append(("serpapi", _serpapi_results))
+    providers += [("bing", _bing_results), ("google", _google_results), ("duckduckgo", _duckduckgo_results)]
+    return providers
+
+
+def search_web(
+    query: str,
+    num_results: int = 10,
+    providers: Optional[Sequence[str]] = None,
+) -> WebSearchResults:
     """
-    Perform web search with intelligent fallback chain.
+    Parsed web search results with intelligent fallback chain.
     
     Priority order:
     1. Tavily (if configured - FREE 1000/month, most reliable for AI)
     2. SerpAPI (if configured - 100/month free)
     3. Bing/Google/DuckDuckGo scraping (may be blocked)
-    4. Knowledge base fallback
+    
+    Fresh cached results of any provider in the chain are served without
+    a search (see app.services.web_search_cache); new results are cached.
     
     Args:
         query: Search query string
         num_results: Number of results to return
+        providers: Optional allow-list of provider names to search with
+            (cached results of any provider in the chain are still served)
         
     Returns:
-        Formatted search results as text
+        WebSearchResults (empty results if every provider failed)
     """
-    # Try Tavily first (FREE, most reliable, designed for AI)
-    tavily_key = settings.TAVILY_API_KEY
-    if tavily_key:
-        result = _tavily_search(query, num_results, tavily_key)
-        if result and "[Search failed" not in result:
-            return result
-    
-    # Try SerpAPI if configured
-    serpapi_key = settings.SERPAPI_KEY
-    if serpapi_key:
-        result = _serpapi_search(query, num_results, serpapi_key)
-        if result and "[Search failed" not in result:
-            return result
-    
-    # Try Bing Search (scraping, may be blocked)
-    result = _bing_search(query, num_results)
-    if result and "[No results" not in result and "[Search failed" not in result:
-        return result
+    chain = _search_providers()
+    cached = search_cache.get(query, num_results, [name for name, _ in chain])
+    if cached:
+        return WebSearchResults(query, cached.provider, cached.results, cached.answer, cached=True)
+    
+    for name, fetch in chain:
+        if providers is not None and name not in providers:
+            continue
+        try:
+            results, answer = fetch(query, num_results)
+        except ImportError as e:
+            logger.warning(f"[ResearchAgent] {name} search unavailable: {e}")
+            continue
+        except Exception as e:
+            logger.error(f"[ResearchAgent] {name} search failed: {e}")
+            continue
+        
+        results = [r for r in results if r.get("url")]
+        if results:
+            logger.info(f"[ResearchAgent] {name} search completed: {len(results)} results")
+            search_cache.put(name, query, num_results, results, answer)
+            return WebSearchResults(query, name, results, answer)
+        logger.warning(f"[ResearchAgent] {name} returned no results for: {query}")
     
-    # Try Google Search (scraping, often blocked)
-    result = _google_search(query, num_results)
-    if result and "[No results" not in result and "[Search failed" not in result:
-        return result
+    return WebSearchResults(query)
+
+
+def format_search_results(search: WebSearchResults) -> str:
+    """Search results as text for LLM prompts."""
+    formatted = [f"=== {SEARCH_PROVIDER_LABELS.get(search.provider, 'Web Search Results')} ===\nQuery: {search.query}\n"]
     
-    # Try DuckDuckGo as final scraping option
-    result = _duckduckgo_search(query, num_results)
-    if result and "[No search results" not in result and "[Search failed" not in result:
-        return result
+    if search.answer:
+        formatted.append(f"Summary: {search.answer}\n")
     
-    # Final fallback to knowledge base
-    return _generate_fallback_research(query)
+    for i, result in enumerate(search.results, 1):
+        formatted.append(f"{i}. {result['title']}")
+        if result.get("snippet"):
+            formatted.append(f"   {result['snippet']}")
+        formatted.append(f"   Source: {result['url']}")
+        formatted.append("")
+    
+    return "\n".join(formatted)
 
 
-def _tavily_search(query: str, num_results: int, api_key: str) -> str:
+def perform_web_search(query: str, num_results: int = 10) -> str:
     """
-    Perform search using Tavily API (FREE tier: 1000 searches/month).
+    Perform web search with intelligent fallback chain (see search_web).
     
-    Tavily is specifically designed for AI applications and provides
-    high-quality, structured search results optimized for LLM consumption.
+    Falls back to the knowledge base when no provider returns results.
     
     Args:
         query: Search query string
         num_results: Number of results to return
-        api_key: Tavily API key
         
     Returns:
         Formatted search results as text
     """
-    try:
-        from tavily import TavilyClient
-        
-        logger.info(f"[ResearchAgent] Tavily search for: {query[:60]}...")
-        
-        client = TavilyClient(api_key=api_key)
-        
-        # Use search_depth="advanced" for more comprehensive results
-        response = client.search(
-            query=query,
-            search_depth="advanced",
-            max_results=num_results,
-            include_answer=True,
-            include_raw_content=False
-        )
-        
-        results = response.get("results", [])
-        answer = response.get("answer", "")
-        
-        if not results:
-            logger.warning(f"[ResearchAgent] Tavily returned no results")
-            return f"[Search failed: No results from Tavily]"
-        
-        # Format results
-        formatted = [f"=== Tavily Web Research ===\nQuery: {query}\n"]
-        
-        if answer:
-            formatted.append(f"AI Summary: {answer}\n")
-        
-        for i, result in enumerate(results, 1):
-            title = result.get("title", "No title")
-            content = result.get("content", "")[:300]
-            url = result.get("url", "")
-            score = result.get("score", 0)
-            
-            formatted.append(f"{i}. {title}")
-            if content:
-                formatted.append(f"   {content}")
-            formatted.append(f"   Source: {url}")
-            formatted.append(f"   Relevance: {score:.2f}")
-            formatted.append("")
-        
-        logger.info(f"[ResearchAgent] Tavily search completed: {len(results)} results")
-        return "\n".join(formatted)
-        
-    except ImportError:
-        logger.error("[ResearchAgent] tavily-python not installed")
-        return "[Search failed: tavily-python not installed]"
-    except Exception as e:
-        logger.error(f"[ResearchAgent] Tavily search failed: {e}")
-        return f"[Search failed: {str(e)}]"
+    search = search_web(query, num_results)
+    if not search.results:
+        return _generate_fallback_research(query)
+    return format_search_results(search)
 
 
-def _bing_search(query: str, num_results: int = 10) -> str:
+def _tavily_results(query: str, num_results: int) -> Tuple[List[Dict[str, str]], Optional[str]]:
     """
-    Perform Bing search using web scraping (free, no API key).
+    Search using Tavily API (FREE tier: 1000 searches/month).
     
-    Bing is more scraping-friendly than Google.
+    Tavily is specifically designed for AI applications and provides
+    high-quality, structured search results optimized for LLM consumption.
     
-    Args:
-        query: Search query string
-        num_results: Number of results to return
-        
     Returns:
-        Formatted search results as text
+        (results, Tavily's answer summary)
     """
-    import requests
+    from tavily import TavilyClient
+    
+    logger.info(f"[ResearchAgent] Tavily search for: {query[:60]}...")
+    
+    client = TavilyClient(api_key=settings.TAVILY_API_KEY)
+    
+    # Use search_depth="advanced" for more comprehensive results
+    response = client.search(
+        query=query,
+        search_depth="advanced",
+        max_results=num_results,
+        include_answer=True,
+        include_raw_content=False
+    )
+    
+    results = [
+        {
+            "title": result.get("title", "No title"),
+            "url": result.get("url", ""),
+            "snippet": (result.get("content") or "")[:300],
+        }
+        for result in response.get("results", [])
+    ]
+    return results, response.get("answer") or None
+
+
+def _parse_bing_results(html: str, num_results: int) -> List[Dict[str, str]]:
+    """Extract title / url / description entries from a Bing results page."""
     from bs4 import BeautifulSoup
+    
+    soup = BeautifulSoup(html, 'html.parser')
+    
+    results = []
+    
+    # Bing search result selectors
+    search_results = soup.find_all('li', class_='b_algo')
+    
+    for item in search_results[:num_results]:
+        try:
+            # Extract title and URL
+            title_elem = item.find('h2')
+            if title_elem:
+                link = title_elem.find('a')
+                title = link.get_text() if link else None
+                url = link.get('href') if link else None
+            else:
+                continue
+            
+            # Extract description
+            desc_elem = item.find('p') or item.find('div', class_='b_caption')
+            description = desc_elem.get_text() if desc_elem else ''
+            
+            if title and url:
+                results.append({
+                    'title': title.strip(),
+                    'url': url,
+                    'description': description[:300].strip() if description else ''
+                })
+        except Exception:
+            continue
+    
+    return results
+
+
+def _bing_results(query: str, num_results: int = 10) -> Tuple[List[Dict[str, str]], Optional[str]]:
+    """
+    Bing search using web scraping (free, no API key).
+    
+    Bing is more scraping-friendly than Google.
+    """
+    import requests
     import urllib.parse
     import time
     import random
     
     logger.info(f"[ResearchAgent] Bing search for: {query[:60]}...")
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate',
-        'Connection': 'keep-alive',
-    }
+    encoded_query = urllib.parse.quote_plus(query)
+    url = f"https://www.bing.com/search?q={encoded_query}&count={num_results}"
     
-    try:
-        encoded_query = urllib.parse.quote_plus(query)
-        url = f"https://www.bing.com/search?q={encoded_query}&count={num_results}"
-        
-        time.sleep(random.uniform(0.3, 0.8))
-        
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        results = []
-        
-        # Bing search result selectors
-        search_results = soup.find_all('li', class_='b_algo')
-        
-        for item in search_results[:num_results]:
-            try:
-                # Extract title and URL
-                title_elem = item.find('h2')
-                if title_elem:
-                    link = title_elem.find('a')
-                    title = link.get_text() if link else None
-                    url = link.get('href') if link else None
-                else:
-                    continue
-                
-                # Extract description
-                desc_elem = item.find('p') or item.find('div', class_='b_caption')
-                description = desc_elem.get_text() if desc_elem else ''
-                
-                if title and url:
-                    results.append({
-                        'title': title.strip(),
-                        'url': url,
-                        'description': description[:300].strip() if description else ''
-                    })
-            except Exception:
-                continue
-        
-        if not results:
-            logger.warning(f"[ResearchAgent] Bing returned no results for: {query}")
-            return f"[No results from Bing]\nQuery: {query}"
-        
-        # Format results
-        formatted = [f"=== Bing Search Results ===\nQuery: {query}\n"]
-        
-        for i, result in enumerate(results, 1):
-            formatted.append(f"{i}. {result['title']}")
-            if result['description']:
-                formatted.append(f"   {result['description']}")
-            formatted.append(f"   Source: {result['url']}")
-            formatted.append("")
-        
-        logger.info(f"[ResearchAgent] Bing search completed: {len(results)} results")
-        return "\n".join(formatted)
-        
-    except Exception as e:
-        logger.error(f"[ResearchAgent] Bing search failed: {e}")
-        return f"[Search failed: {str(e)}]"
+    time.sleep(random.uniform(0.3, 0.8))
+    
+    response = requests.get(url, headers=_BROWSER_HEADERS, timeout=10)
+    response.raise_for_status()
+    
+    results = [
+        {"title": result["title"], "url": result["url"], "snippet": result["description"]}
+        for result in _parse_bing_results(response.text, num_results)
+    ]
+    return results, None
 
 
-def _google_search(query: str, num_results: int = 10) -> str:
-    """
-    Perform Google search using direct HTTP requests with proper headers.
+def _parse_google_results(html: str, num_results: int) -> List[Dict[str, str]]:
+    """Extract title / url / description entries from a Google results page."""
+    from bs4 import BeautifulSoup
+    import urllib.parse
     
-    Uses web scraping with realistic browser headers to avoid blocks.
+    soup = BeautifulSoup(html, 'html.parser')
     
-    Args:
-        query: Search query string
-        num_results: Number of results to return
-        
-    Returns:
-        Formatted search results as text
+    results = []
+    
+    # Try multiple selectors for Google search results
+    # Google frequently changes their HTML structure
+    search_divs = soup.find_all('div', class_='g') or soup.find_all('div', {'data-hveid': True})
+    
+    for div in search_divs[:num_results]:
+        try:
+            # Extract title
+            title_elem = div.find('h3')
+            title = title_elem.get_text() if title_elem else None
+            
+            # Extract URL
+            link_elem = div.find('a', href=True)
+            url = link_elem['href'] if link_elem else None
+            
+            # Clean URL (remove Google redirect wrapper)
+            if url and url.startswith('/url?'):
+                url = urllib.parse.parse_qs(urllib.parse.urlparse(url).query).get('q', [url])[0]
+            
+            # Extract description/snippet
+            desc_elem = div.find('div', class_='VwiC3b') or div.find('span', class_='st') or div.find('div', {'data-sncf': True})
+            description = desc_elem.get_text() if desc_elem else ''
+            
+            if title and url and not url.startswith('/search'):
+                results.append({
+                    'title': title,
+                    'url': url,
+                    'description': description[:300] if description else ''
+                })
+        except Exception:
+            continue
+    
+    return results
+
+
+def _google_results(query: str, num_results: int = 10) -> Tuple[List[Dict[str, str]], Optional[str]]:
+    """
+    Google search using direct HTTP requests with realistic browser
+    headers (scraping, often blocked).
     """
     import requests
-    from bs4 import BeautifulSoup
     import urllib.parse
     import time
     import random
     
     logger.info(f"[ResearchAgent] Google search for: {query[:60]}...")
     
-    # Realistic browser headers
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-        'Accept-Encoding': 'gzip, deflate',
-        'DNT': '1',
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-    }
+    encoded_query = urllib.parse.quote_plus(query)
+    url = f"https://www.google.com/search?q={encoded_query}&num={num_results}&hl=en"
     
-    try:
-        # Encode query for URL
-        encoded_query = urllib.parse.quote_plus(query)
-        url = f"https://www.google.com/search?q={encoded_query}&num={num_results}&hl=en"
-        
-        # Add small random delay to appear more human-like
-        time.sleep(random.uniform(0.5, 1.5))
-        
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        results = []
-        
-        # Try multiple selectors for Google search results
-        # Google frequently changes their HTML structure
-        search_divs = soup.find_all('div', class_='g') or soup.find_all('div', {'data-hveid': True})
-        
-        for div in search_divs[:num_results]:
-            try:
-                # Extract title
-                title_elem = div.find('h3')
-                title = title_elem.get_text() if title_elem else None
-                
-                # Extract URL
-                link_elem = div.find('a', href=True)
-                url = link_elem['href'] if link_elem else None
-                
-                # Clean URL (remove Google redirect wrapper)
-                if url and url.startswith('/url?'):
-                    url = urllib.parse.parse_qs(urllib.parse.urlparse(url).query).get('q', [url])[0]
-                
-                # Extract description/snippet
-                desc_elem = div.find('div', class_='VwiC3b') or div.find('span', class_='st') or div.find('div', {'data-sncf': True})
-                description = desc_elem.get_text() if desc_elem else ''
-                
-                if title and url and not url.startswith('/search'):
-                    results.append({
-                        'title': title,
-                        'url': url,
-                        'description': description[:300] if description else ''
-                    })
-            except Exception:
-                continue
-        
-        if not results:
-            logger.warning(f"[ResearchAgent] Google returned no parseable results for: {query}")
-            return f"[No results from Google]\nQuery: {query}"
-        
-        # Format results
-        formatted = [f"=== Google Search Results ===\nQuery: {query}\n"]
-        
-        for i, result in enumerate(results, 1):
-            formatted.append(f"{i}. {result['title']}")
-            if result['description']:
-                formatted.append(f"   {result['description']}")
-            formatted.append(f"   Source: {result['url']}")
-            formatted.append("")
-        
-        logger.info(f"[ResearchAgent] Google search completed: {len(results)} results")
-        return "\n".join(formatted)
-        
-    except requests.exceptions.Timeout:
-        logger.error("[ResearchAgent] Google search timed out")
-        return "[Search failed: timeout]"
-    except requests.exceptions.RequestException as e:
-        logger.error(f"[ResearchAgent] Google search request failed: {e}")
-        return f"[Search failed: {str(e)}]"
-    except Exception as e:
-        logger.error(f"[ResearchAgent] Google search failed: {e}")
-        return f"[Search failed: {str(e)}]"
+    # Add small random delay to appear more human-like
+    time.sleep(random.uniform(0.5, 1.5))
+    
+    response = requests.get(url, headers={**_BROWSER_HEADERS, 'DNT': '1', 'Upgrade-Insecure-Requests': '1'}, timeout=10)
+    response.raise_for_status()
+    
+    results = [
+        {"title": result["title"], "url": result["url"], "snippet": result["description"]}
+        for result in _parse_google_results(response.text, num_results)
+    ]
+    return results, None
 
 
-def _serpapi_search(query: str, num_results: int, api_key: str) -> str:
+def _serpapi_results(query: str, num_results: int) -> Tuple[List[Dict[str, str]], Optional[str]]:
     """
-    Perform Google search using SerpAPI (paid, requires API key).
+    Google search using SerpAPI (paid, requires API key).
     
-    Args:
-        query: Search query string
-        num_results: Number of results to return
-        api_key: SerpAPI API key
-        
     Returns:
-        Formatted search results as text
+        (organic results, answer box text)
     """
-    try:
-        from serpapi import GoogleSearch
-        
-        logger.info(f"[ResearchAgent] SerpAPI search for: {query[:60]}...")
-        
-        search = GoogleSearch({
-            "q": query,
-            "api_key": api_key,
-            "num": num_results,
-        })
-        
-        results = search.get_dict()
-        
-        # Format organic results
-        formatted = [f"=== SerpAPI Google Results ===\nQuery: {query}\n"]
-        
-        if "organic_results" in results:
-            for i, result in enumerate(results["organic_results"][:num_results], 1):
-                title = result.get("title", "No title")
-                snippet = result.get("snippet", "")
-                link = result.get("link", "")
-                formatted.append(f"{i}. {title}")
-                if snippet:
-                    formatted.append(f"   {snippet}")
-                if link:
-                    formatted.append(f"   Source: {link}")
-                formatted.append("")
-        
-        if "answer_box" in results:
-            answer = results["answer_box"]
-            if "answer" in answer:
-                formatted.insert(2, f"Quick Answer: {answer['answer']}\n")
-            elif "snippet" in answer:
-                formatted.insert(2, f"Quick Answer: {answer['snippet']}\n")
-        
-        logger.info(f"[ResearchAgent] SerpAPI search completed: {len(results.get('organic_results', []))} results")
-        return "\n".join(formatted)
-        
-    except ImportError:
-        logger.warning("[ResearchAgent] SerpAPI not installed")
-        return "[Search failed: SerpAPI not installed]"
-    except Exception as e:
-        logger.warning(f"[ResearchAgent] SerpAPI failed: {e}")
-        return f"[Search failed: {str(e)}]"
+    from serpapi import GoogleSearch
+    
+    logger.info(f"[ResearchAgent] SerpAPI search for: {query[:60]}...")
+    
+    search = GoogleSearch({
+        "q": query,
+        "api_key": settings.SERPAPI_KEY,
+        "num": num_results,
+    })
+    
+    response = search.get_dict()
+    
+    results = [
+        {
+            "title": result.get("title", "No title"),
+            "url": result.get("link", ""),
+            "snippet": result.get("snippet", ""),
+        }
+        for result in response.get("organic_results", [])[:num_results]
+    ]
+    
+    answer_box = response.get("answer_box") or {}
+    return results, answer_box.get("answer") or answer_box.get("snippet")
 
 
-def _duckduckgo_search(query: str, num_results: int = 10) -> str:
-    """
-    Perform web search using DuckDuckGo (free, no API key required).
+def _duckduckgo_results(query: str, num_results: int = 10) -> Tuple[List[Dict[str, str]], Optional[str]]:
+    """Web search using DuckDuckGo (free, no API key required)."""
+    from duckduckgo_search import DDGS
     
-    Args:
-        query: Search query string
-        num_results: Number of results to return
-        
-    Returns:
-        Formatted search results as text
+    logger.info(f"[ResearchAgent] DuckDuckGo search for: {query[:60]}...")
+    
+    with DDGS() as ddgs:
+        hits = list(ddgs.text(query, max_results=num_results))
+    
+    results = [
+        {"title": hit.get("title", "No title"), "url": hit.get("href", ""), "snippet": hit.get("body", "")}
+        for hit in hits
+    ]
+    return results, None
+
+
+def build_research_queries(country_name: str, topic: str, num_queries: int = 3) -> List[str]:
     """
-    try:
-        from duckduckgo_search import DDGS
-        
-        logger.info(f"[ResearchAgent] DuckDuckGo search for: {query[:60]}...")
-        
-        with DDGS() as ddgs:
-            results = list(ddgs.text(query, max_results=num_results))
-        
-        if not results:
-            logger.warning(f"[ResearchAgent] DuckDuckGo returned no results")
-            return f"[No search results from DuckDuckGo]\nQuery: {query}"
-        
-        # Format results
-        formatted = [f"=== DuckDuckGo Results ===\nQuery: {query}\n"]
-        
-        for i, result in enumerate(results, 1):
-            title = result.get("title", "No title")
-            body = result.get("body", "")
-            link = result.get("href", "")
-            formatted.append(f"{i}. {title}")
-            if body:
-                formatted.append(f"   {body}")
-            if link:
-                formatted.append(f"   Source: {link}")
-            formatted.append("")
-        
-        logger.info(f"[ResearchAgent] DuckDuckGo completed: {len(results)} results")
-        return "\n".join(formatted)
-        
-    except ImportError:
-        logger.error("[ResearchAgent] duckduckgo-search not installed")
-        return "[Search failed: duckduckgo-search not installed]"
-    except Exception as e:
-        logger.error(f"[ResearchAgent] DuckDuckGo failed: {e}")
-        return f"[Search failed: {str(e)}]"
+    Targeted search queries for a country / topic:
+    1. Policy and regulations query
+    2. Statistics and data query
+    3. Recent developments query
+    plus topic-specific queries, limited to num_queries.
+    """
+    queries = [
+        f"{country_name} {topic} policy regulations legislation",
+        f"{country_name} {topic} statistics data reports",
+        f"{country_name} {topic} latest developments 2025 2024",
+    ]
+    
+    # Add topic-specific queries
+    if "health" in topic.lower() or "occupational" in topic.lower():
+        queries.append(f"{country_name} occupational health safety ILO WHO")
+    if "compensation" in topic.lower() or "worker" in topic.lower():
+        queries.append(f"{country_name} workers compensation insurance system")
+    if "hazard" in topic.lower() or "safety" in topic.lower():
+        queries.append(f"{country_name} workplace safety hazard prevention")
+    
+    # Limit to requested number of queries
+    return queries[:num_queries]
+
+
+def deep_dive_search_query(country_name: str, topic: str) -> str:
+    """Web search query of a strategic deep dive (DeepDiveOrchestrator)."""
+    return f"{country_name} {topic} occupational health policy strategy"
 
 
 def perform_extended_research(
@@ -719,23 +680,7 @@ def perform_extended_research(
     """
     logger.info(f"[ResearchAgent] Starting extended research for {country_name} - {topic}")
     
-    # Generate targeted search queries
-    queries = [
-        f"{country_name} {topic} policy regulations legislation",
-        f"{country_name} {topic} statistics data reports",
-        f"{country_name} {topic} latest developments 2025 2024",
-    ]
-    
-    # Add topic-specific queries
-    if "health" in topic.lower() or "occupational" in topic.lower():
-        queries.append(f"{country_name} occupational health safety ILO WHO")
-    if "compensation" in topic.lower() or "worker" in topic.lower():
-        queries.append(f"{country_name} workers compensation insurance system")
-    if "hazard" in topic.lower() or "safety" in topic.lower():
-        queries.append(f"{country_name} workplace safety hazard prevention")
-    
-    # Limit to requested number of queries
-    queries = queries[:num_queries]
+    queries = build_research_queries(country_name, topic, num_queries)
     
     all_results = []
     seen_urls = set()
@@ -743,25 +688,19 @@ def perform_extended_research(
     for i, query in enumerate(queries, 1):
         logger.info(f"[ResearchAgent] Query {i}/{len(queries)}: {query[:50]}...")
         
-        # Perform search with fallback
-        result = perform_web_search(query, num_results=results_per_query)
+        # Perform search with fallback (cached results are reused)
+        search = search_web(query, num_results=results_per_query)
         
-        # Parse and deduplicate results
-        if result and "[Search failed" not in result and "[No " not in result:
-            # Extract unique entries
-            lines = result.split("\n")
-            current_entry = []
-            
-            for line in lines:
-                if line.startswith("Source: "):
-                    url = line.replace("Source: ", "").strip()
-                    if url and url not in seen_urls:
-                        seen_urls.add(url)
-                        current_entry.append(line)
-                        all_results.append("\n".join(current_entry))
-                    current_entry = []
-                elif line.strip() and not line.startswith("===") and not line.startswith("Query:"):
-                    current_entry.append(line)
+        # Deduplicate by URL
+        for result in search.results:
+            if result["url"] in seen_urls:
+                continue
+            seen_urls.add(result["url"])
+            entry = [result["title"]]
+            if result.get("snippet"):
+                entry.append(result["snippet"])
+            entry.append(f"Source: {result['url']}")
+            all_results.append("\n".join(entry))
     
     # Compile final research document
     if all_results:
@@ -1070,6 +1009,9 @@ def get_llm_from_config(config: AIConfig, override_provider: str = None, overrid
     """
     Get the appropriate LangChain LLM based on configuration.
     
+    Clients are built once per provider / model / endpoint / API key and
+    reused from the LLM client registry (app.services.llm_clients).
+    
     Args:
         config: AIConfig from database
         override_provider: Optional provider override (for per-agent LLM selection)
@@ -1082,18 +1024,6 @@ def get_llm_from_config(config: AIConfig, override_provider: str = None, overrid
         logger.error("[LLM Factory] No AI config provided")
         raise ValueError("AI configuration is required")
     
-    # Decrypt API key
-    api_key = None
-    if config.api_key_encrypted:
-        try:
-            api_key = decrypt_api_key(config.api_key_encrypted)
-            logger.info(f"[LLM Factory] API key decrypted successfully (length: {len(api_key) if api_key else 0})")
-        except Exception as e:
-            logger.error(f"[LLM Factory] Failed to decrypt API key: {e}")
-            raise ValueError(f"Failed to decrypt API key: {e}")
-    else:
-        logger.warning("[LLM Factory] No encrypted API key found in config")
-    
     # Use override values if provided, otherwise use config defaults
     if override_provider:
         provider = AIProvider(override_provider)
@@ -1119,6 +1049,40 @@ def get_llm_from_config(config: AIConfig, override_provider: str = None, overrid
     else:
         max_tokens = base_max_tokens
     
+    # Plain values only: the client may outlive this session
+    api_key_encrypted = config.api_key_encrypted
+    api_endpoint = config.api_endpoint
+    key = ClientKey(
+        "orchestrator", provider.value, model, api_endpoint,
+        key_fingerprint(api_key_encrypted), temperature, max_tokens,
+    )
+    return llm_clients.get(
+        key,
+        lambda: _create_llm(provider, model, temperature, max_tokens, api_key_encrypted, api_endpoint),
+    )
+
+
+def _create_llm(
+    provider: AIProvider,
+    model: str,
+    temperature: Optional[float],
+    max_tokens: int,
+    api_key_encrypted: Optional[str],
+    api_endpoint: Optional[str],
+):
+    """Build a LangChain chat model (on a registry miss)."""
+    # Decrypt API key
+    api_key = None
+    if api_key_encrypted:
+        try:
+            api_key = decrypt_api_key(api_key_encrypted)
+            logger.info(f"[LLM Factory] API key decrypted successfully (length: {len(api_key) if api_key else 0})")
+        except Exception as e:
+            logger.error(f"[LLM Factory] Failed to decrypt API key: {e}")
+            raise ValueError(f"Failed to decrypt API key: {e}")
+    else:
+        logger.warning("[LLM Factory] No encrypted API key found in config")
+    
     logger.info(f"[LLM Factory] Creating LLM: provider={provider.value}, model={model}, temp={temperature}, max_tokens={max_tokens}")
     
     try:
@@ -1165,7 +1129,7 @@ def get_llm_from_config(config: AIConfig, override_provider: str = None, overrid
                 deployment_name=model,
                 temperature=temperature,
                 api_key=api_key,
-                azure_endpoint=config.api_endpoint,
+                azure_endpoint=api_endpoint,
                 api_version="2024-02-01",
                 request_timeout=120,
             )
@@ -1185,7 +1149,7 @@ def get_llm_from_config(config: AIConfig, override_provider: str = None, overrid
             return ChatOllama(
                 model=model,
                 temperature=temperature,
-                base_url=config.api_endpoint or "http://localhost:11434",
+                base_url=api_endpoint or "http://localhost:11434",
             )
         
         else:
@@ -1216,12 +1180,11 @@ def call_orchestrator_llm(
     start_time = time.time()
     success = False
     error_message = None
+    cache_status = None
     
     try:
         from langchain_core.messages import SystemMessage, HumanMessage
         
-        llm = get_llm_from_config(config)
-        
         user_prompt = f"""Analyze the following information about {country_name}'s strategy for: {topic}
 
 === WEB RESEARCH FINDINGS ===
@@ -1233,15 +1196,29 @@ def call_orchestrator_llm(
 Generate a comprehensive strategic analysis as specified in your instructions.
 Output ONLY valid JSON matching the required schema."""
         
-        messages = [
-            SystemMessage(content=ORCHESTRATOR_PROMPT),
-            HumanMessage(content=user_prompt),
-        ]
+        cache_request = LLMRequest(
+            provider=config.provider.value,
+            model=config.model_name,
+            system_prompt=ORCHESTRATOR_PROMPT,
+            user_prompt=user_prompt,
+            temperature=config.temperature,
+            partition=country_iso_code or country_name,
+        )
+        raw_content, cache_status = llm_cache.lookup(cache_request) if cache_enabled(cache_request) else (None, None)
         
-        response = llm.invoke(messages)
+        if raw_content is None:
+            llm = get_llm_from_config(config)
+            
+            messages = [
+                SystemMessage(content=ORCHESTRATOR_PROMPT),
+                HumanMessage(content=user_prompt),
+            ]
+            
+            response = llm.invoke(messages)
+            raw_content = response.content
         
         # Parse JSON response
-        content = response.content.strip()
+        content = raw_content.strip()
         if content.startswith("```"):
             content = content.split("```")[1]
             if content.startswith("json"):
@@ -1249,6 +1226,9 @@ Output ONLY valid JSON matching the required schema."""
             content = content.strip()
         
         result = json.loads(content)
+        # Only responses that parsed are worth replaying
+        if cache_status == "miss":
+            llm_cache.store(cache_request, raw_content)
         success = True
         return result
         
@@ -1277,6 +1257,7 @@ Output ONLY valid JSON matching the required schema."""
                     topic=topic,
                     error_message=error_message,
                     user_id=user_id,
+                    cache_status=cache_status,
                 )
             except Exception as trace_error:
                 logger.warning(f"Failed to log AI call trace: {trace_error}")
@@ -1610,7 +1591,7 @@ class DeepDiveOrchestrator:
         self._log("ResearchAgent", AgentStatus.RESEARCHING,
                   f"Searching web for '{country.name} {topic} occupational health'...", "🔍")
         
-        search_query = f"{country.name} {topic} occupational health policy strategy"
+        search_query = deep_dive_search_query(country.name, topic)
         search_results = perform_web_search(search_query)
         
         self._log("ResearchAgent", AgentStatus.COMPLETE,
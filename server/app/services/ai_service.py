@@ -10,10 +10,15 @@ with all LangChain LLM providers.
 
 IMPORTANT: This module extracts config values BEFORE passing to thread pool
 to avoid SQLAlchemy session/thread-safety issues.
+
+Responses are served from the shared LLM response cache (app.services.llm_cache)
+when the same prompt was answered before; every call is traced with its
+cache outcome.
 """
 
 import logging
 import asyncio
+import time
 from typing import Optional, Dict, Any
 from concurrent.futures import ThreadPoolExecutor
 from sqlalchemy.orm import Session
@@ -21,6 +26,9 @@ from langchain_core.messages import SystemMessage, HumanMessage
 
 from app.models.user import AIConfig, AIProvider
 from app.core.security import decrypt_api_key
+from app.services.ai_call_tracer import AICallTracer
+from app.services.llm_cache import LLMRequest, cache_enabled, llm_cache
+from app.services.llm_clients import ClientKey, key_fingerprint, llm_clients
 
 logger = logging.getLogger(__name__)
 
@@ -131,16 +139,8 @@ def _create_llm_from_values(
         raise ValueError(f"Unsupported AI provider: {provider}")
 
 
-def _call_llm_sync_safe(
-    config_data: Dict[str, Any],
-    prompt: str,
-    system_prompt: Optional[str] = None,
-) -> str:
-    """
-    Thread-safe synchronous LLM call using plain dict values.
-    
-    This avoids SQLAlchemy session issues by not accessing model objects.
-    """
+def _create_llm_from_config_data(config_data: Dict[str, Any]):
+    """Decrypt the API key and build the LLM (on a client registry miss)."""
     # Decrypt API key (safe - no SQLAlchemy access)
     api_key = None
     if config_data.get("api_key_encrypted"):
@@ -152,7 +152,7 @@ def _call_llm_sync_safe(
             raise ValueError("Failed to decrypt API key")
     
     # Create LLM from plain values
-    llm = _create_llm_from_values(
+    return _create_llm_from_values(
         provider=config_data["provider"],
         model_name=config_data["model_name"],
         api_key=api_key,
@@ -160,6 +160,30 @@ def _call_llm_sync_safe(
         max_tokens=config_data.get("max_tokens", 4096),
         api_endpoint=config_data.get("api_endpoint"),
     )
+
+
+def _call_llm_sync_safe(
+    config_data: Dict[str, Any],
+    prompt: str,
+    system_prompt: Optional[str] = None,
+) -> str:
+    """
+    Thread-safe synchronous LLM call using plain dict values.
+    
+    This avoids SQLAlchemy session issues by not accessing model objects.
+    The LLM client is reused from the client registry when one was already
+    built for the same provider, model, endpoint and API key.
+    """
+    key = ClientKey(
+        "ai_service",
+        config_data["provider"].value,
+        config_data["model_name"],
+        config_data.get("api_endpoint"),
+        key_fingerprint(config_data.get("api_key_encrypted")),
+        config_data.get("temperature", 0.7),
+        config_data.get("max_tokens", 4096),
+    )
+    llm = llm_clients.get(key, lambda: _create_llm_from_config_data(config_data))
     
     # Build messages
     messages = []
@@ -177,6 +201,51 @@ def _call_llm_sync_safe(
     return result
 
 
+def _cache_request(
+    config_data: Dict[str, Any],
+    prompt: str,
+    system_prompt: Optional[str],
+    agent_id: str,
+) -> LLMRequest:
+    """LLM cache request for a call (near-duplicates only match within the same agent)."""
+    return LLMRequest(
+        provider=config_data["provider"].value,
+        model=config_data["model_name"],
+        system_prompt=system_prompt or "",
+        user_prompt=prompt,
+        temperature=config_data.get("temperature"),
+        partition=agent_id,
+    )
+
+
+def _trace_call(
+    request: LLMRequest,
+    agent_id: str,
+    start_time: float,
+    cache_status: Optional[str],
+    error: Optional[str] = None,
+) -> None:
+    """
+    Record an AI service call (or cache hit) in the AI call traces.
+    
+    Uses its own session (the caller's may hold pending work); async callers
+    run it via asyncio.to_thread.
+    """
+    try:
+        AICallTracer.trace_detached(
+            provider=request.provider,
+            model_name=request.model,
+            operation_type="ai_service",
+            success=error is None,
+            latency_ms=int((time.time() - start_time) * 1000),
+            topic=agent_id,
+            error_message=error,
+            cache_status=cache_status,
+        )
+    except Exception as trace_error:
+        logger.warning(f"Failed to log AI call trace: {trace_error}")
+
+
 async def call_ai_api(
     db: Session,
     ai_config: AIConfig,
@@ -184,6 +253,7 @@ async def call_ai_api(
     agent_id: str = "generic-agent",
     user_email: Optional[str] = None,
     system_prompt: Optional[str] = None,
+    use_cache: Optional[bool] = None,
 ) -> str:
     """
     Async wrapper to call the configured AI provider.
@@ -195,12 +265,14 @@ async def call_ai_api(
     to avoid SQLAlchemy session/thread-safety issues.
     
     Args:
-        db: Database session (not used in thread pool)
+        db: Caller's database session (not used: traces get their own session)
         ai_config: Active AI configuration
         prompt: The user prompt to send
         agent_id: Identifier for logging/tracing
         user_email: Optional user email for tracing
         system_prompt: Optional system message
+        use_cache: Whether to answer from / store in the LLM response cache
+            (default: only when the configured temperature is 0)
         
     Returns:
         The AI response as a string
@@ -223,6 +295,15 @@ async def call_ai_api(
     
     logger.info(f"[AI Service] Config extracted: provider={config_data['provider'].value}, model={config_data['model_name']}")
     
+    cache_request = _cache_request(config_data, prompt, system_prompt, agent_id)
+    # The cache is database-backed: keep its round-trips off the event loop
+    use_cache = cache_enabled(cache_request, use_cache)
+    cached, cache_status = await asyncio.to_thread(llm_cache.lookup, cache_request) if use_cache else (None, None)
+    start_time = time.time()
+    if cached is not None:
+        await asyncio.to_thread(_trace_call, cache_request, agent_id, start_time, cache_status)
+        return cached
+    
     try:
         # Use get_running_loop() for modern Python (3.10+)
         loop = asyncio.get_running_loop()
@@ -236,10 +317,14 @@ async def call_ai_api(
         
         logger.info(f"[AI Service] Received response ({len(result)} chars)")
         
+        if use_cache:
+            await asyncio.to_thread(llm_cache.store, cache_request, result)
+        await asyncio.to_thread(_trace_call, cache_request, agent_id, start_time, cache_status)
         return result
         
     except Exception as e:
         logger.error(f"[AI Service] Error calling AI: {e}", exc_info=True)
+        await asyncio.to_thread(_trace_call, cache_request, agent_id, start_time, cache_status, error=str(e))
         raise
 
 
@@ -250,6 +335,7 @@ def call_ai_api_sync(
     agent_id: str = "generic-agent",
     user_email: Optional[str] = None,
     system_prompt: Optional[str] = None,
+    use_cache: Optional[bool] = None,
 ) -> str:
     """
     Synchronous version of call_ai_api for non-async contexts.
@@ -269,11 +355,23 @@ def call_ai_api_sync(
         "api_endpoint": getattr(ai_config, 'api_endpoint', None),
     }
     
+    cache_request = _cache_request(config_data, prompt, system_prompt, agent_id)
+    use_cache = cache_enabled(cache_request, use_cache)
+    cached, cache_status = llm_cache.lookup(cache_request) if use_cache else (None, None)
+    start_time = time.time()
+    if cached is not None:
+        _trace_call(cache_request, agent_id, start_time, cache_status)
+        return cached
+    
     try:
         result = _call_llm_sync_safe(config_data, prompt, system_prompt)
         logger.info(f"[AI Service] Received response ({len(result)} chars)")
+        if use_cache:
+            llm_cache.store(cache_request, result)
+        _trace_call(cache_request, agent_id, start_time, cache_status)
         return result
         
     except Exception as e:
         logger.error(f"[AI Service] Error calling AI: {e}", exc_info=True)
+        _trace_call(cache_request, agent_id, start_time, cache_status, error=str(e))
         raise
@@ -0,0 +1,351 @@
+"""
+GOHIP Platform - Batch LLM Scheduler
+=====================================
+
+Admission control for bulk LLM work (batch insight generation).
+
+Batch generation used to process two countries at a time with a fixed
+pause between countries and run the calls on the default thread pool: it
+never used more of the provider quota than that, and a 429 simply failed
+the category, to be retried after a fixed delay into the same rate limit.
+The scheduler instead:
+
+- Admits at most `window` LLM calls at once. The window adapts (AIMD): it
+  grows by one after a window's worth of successful calls and halves on a
+  rate-limit error, between BATCH_CONCURRENCY_MIN and BATCH_CONCURRENCY_MAX
+- Tracks requests and tokens per minute per provider/model over a sliding
+  60 s window and holds a call back until it fits the budget
+  (BATCH_RPM_LIMIT / BATCH_TPM_LIMIT, overridable per provider or
+  provider/model with BATCH_RATE_LIMITS)
+- Backs off on rate-limit errors: new calls wait out the provider's
+  Retry-After hint, or an exponential pause (1 s doubling up to 60 s)
+  when there is none
+- Runs calls on an executor of its own, sized to the largest window
+- Measures throughput over the most recent completions, for a live ETA
+
+Token counts are estimates (characters / 4); keep the TPM limits a little
+below the provider's.
+
+Usage:
+    scheduler = BatchScheduler.from_settings(planned=195 * 6)
+    async with scheduler.slot("openai", "gpt-4o-mini", tokens=3000) as call:
+        result = await loop.run_in_executor(scheduler.executor, fn, ...)
+        call.settle(estimate_tokens(prompt, result))
+    scheduler.unit_done()
+    scheduler.snapshot()  # window, RPM / TPM per model, throughput, ETA
+"""
+
+import asyncio
+import logging
+import re
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+WINDOW_SECONDS = 60.0     # Sliding window of the RPM / TPM budgets
+BACKOFF_BASE = 1.0        # First pause after a rate-limit error without Retry-After
+BACKOFF_MAX = 60.0
+THROUGHPUT_SAMPLES = 50   # Recent completions the throughput (and ETA) is measured over
+
+_RATE_LIMIT_MESSAGE = re.compile(r"\b429\b|rate.?limit|too many requests|quota exceeded", re.I)
+_RETRY_AFTER_MESSAGE = re.compile(r"(?:retry.?after|try again in)\D{0,5}(\d+(?:\.\d+)?)\s*(ms|s)?", re.I)
+
+
+def estimate_tokens(*texts: Optional[str]) -> int:
+    """Rough token count of some texts (about 4 characters per token)."""
+    return sum(len(text) for text in texts if text) // 4
+
+
+def parse_rate_limits(spec: str) -> Dict[str, Tuple[int, int]]:
+    """'openai/gpt-4o-mini=500:200000,anthropic=50:40000' -> {key: (rpm, tpm)}."""
+    limits = {}
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        try:
+            key, values = item.split("=", 1)
+            rpm, tpm = values.split(":", 1)
+            limits[key.strip().lower()] = (int(rpm), int(tpm))
+        except ValueError:
+            logger.warning(f"[BatchScheduler] Ignoring malformed rate limit '{item}'")
+    return limits
+
+
+def _error_chain(error: BaseException) -> List[BaseException]:
+    """The error and the errors it was raised from (wrappers hide provider errors)."""
+    chain = []
+    while error is not None and error not in chain:
+        chain.append(error)
+        error = error.__cause__ or error.__context__
+    return chain
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Whether an LLM call failed on a provider rate limit (HTTP 429)."""
+    for e in _error_chain(error):
+        response = getattr(e, "response", None)
+        if 429 in (getattr(e, "status_code", None), getattr(response, "status_code", None)):
+            return True
+        if "ratelimit" in type(e).__name__.lower() or _RATE_LIMIT_MESSAGE.search(str(e)):
+            return True
+    return False
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """Seconds the provider asked to wait (Retry-After header or message), if any."""
+    for e in _error_chain(error):
+        headers = getattr(getattr(e, "response", None), "headers", None)
+        try:
+            if headers and headers.get("retry-after"):
+                return float(headers["retry-after"])
+        except (TypeError, ValueError):
+            pass
+        match = _RETRY_AFTER_MESSAGE.search(str(e))
+        if match:
+            seconds = float(match.group(1))
+            return seconds / 1000 if match.group(2) == "ms" else seconds
+    return None
+
+
+class RateBudget:
+    """Sliding-minute request and token counts of one provider/model."""
+
+    def __init__(self, rpm_limit: int = 0, tpm_limit: int = 0):
+        self.rpm_limit = rpm_limit  # 0: unlimited
+        self.tpm_limit = tpm_limit
+        # [started_at, tokens] of the calls of the last minute, oldest first
+        self._calls: Deque[List[float]] = deque()
+
+    def _prune(self, now: float) -> None:
+        while self._calls and self._calls[0][0] <= now - WINDOW_SECONDS:
+            self._calls.popleft()
+
+    def wait_time(self, tokens: int, now: float) -> float:
+        """Seconds until a call of `tokens` tokens fits the budget (0: now)."""
+        self._prune(now)
+        waits = [0.0]
+        if self.rpm_limit and len(self._calls) >= self.rpm_limit:
+            waits.append(self._calls[len(self._calls) - self.rpm_limit][0] + WINDOW_SECONDS - now)
+        excess = self.tokens(now) + tokens - self.tpm_limit
+        if self.tpm_limit and self._calls and excess > 0:
+            # Until enough of the oldest calls have left the window
+            freed = 0
+            for started_at, used in self._calls:
+                freed += used
+                if freed >= excess:
+                    waits.append(started_at + WINDOW_SECONDS - now)
+                    break
+            else:
+                waits.append(self._calls[-1][0] + WINDOW_SECONDS - now)
+        return max(waits)
+
+    def record(self, tokens: int, now: float) -> List[float]:
+        """Count an admitted call; the returned entry can be settled with its actual tokens."""
+        entry = [now, tokens]
+        self._calls.append(entry)
+        return entry
+
+    def requests(self, now: float) -> int:
+        self._prune(now)
+        return len(self._calls)
+
+    def tokens(self, now: float) -> int:
+        self._prune(now)
+        return int(sum(used for _, used in self._calls))
+
+
+class ScheduledCall:
+    """An admitted call; settle() replaces its token estimate with the actual count."""
+
+    def __init__(self, entry: List[float]):
+        self.started_at = entry[0]
+        self._entry = entry
+
+    def settle(self, tokens: int) -> None:
+        self._entry[1] = tokens
+
+
+class BatchScheduler:
+    """Adaptive concurrency window + per-model RPM / TPM budgets for one batch run."""
+
+    def __init__(
+        self,
+        min_concurrency: int = 1,
+        max_concurrency: int = 16,
+        initial_concurrency: int = 4,
+        rpm_limit: int = 0,
+        tpm_limit: int = 0,
+        rate_limits: Optional[Dict[str, Tuple[int, int]]] = None,
+        planned: int = 0,
+    ):
+        self.min_concurrency = max(1, min_concurrency)
+        self.max_concurrency = max(self.min_concurrency, max_concurrency)
+        self.window = min(max(initial_concurrency, self.min_concurrency), self.max_concurrency)
+        self.rpm_limit = rpm_limit
+        self.tpm_limit = tpm_limit
+        self.rate_limits = rate_limits or {}
+        self.executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="batch-llm")
+
+        self._condition = asyncio.Condition()
+        self._active = 0
+        self._budgets: Dict[str, RateBudget] = {}
+        self._successes = 0          # Since the window last changed
+        self._last_decrease = 0.0    # Calls started before it do not shrink the window again
+        self._backoff = 0.0
+        self._paused_until = 0.0
+
+        self.started_at = time.monotonic()
+        self.planned = planned
+        self.done = 0
+        self._completions: Deque[float] = deque(maxlen=THROUGHPUT_SAMPLES)
+        self._stats = {"calls": 0, "succeeded": 0, "failed": 0, "rate_limited": 0}
+
+    @classmethod
+    def from_settings(cls, planned: int = 0) -> "BatchScheduler":
+        return cls(
+            min_concurrency=settings.BATCH_CONCURRENCY_MIN,
+            max_concurrency=settings.BATCH_CONCURRENCY_MAX,
+            initial_concurrency=settings.BATCH_CONCURRENCY_INITIAL,
+            rpm_limit=settings.BATCH_RPM_LIMIT,
+            tpm_limit=settings.BATCH_TPM_LIMIT,
+            rate_limits=parse_rate_limits(settings.BATCH_RATE_LIMITS),
+            planned=planned,
+        )
+
+    def budget(self, provider: str, model: str) -> RateBudget:
+        """RPM / TPM budget of a provider/model (most specific configured limit)."""
+        key = f"{provider}/{model}".lower()
+        budget = self._budgets.get(key)
+        if budget is None:
+            rpm, tpm = self.rate_limits.get(key) or self.rate_limits.get(provider.lower()) or (self.rpm_limit, self.tpm_limit)
+            budget = self._budgets[key] = RateBudget(rpm, tpm)
+        return budget
+
+    # -------------------------------------------------------------------------
+    # Admission
+    # -------------------------------------------------------------------------
+
+    @asynccontextmanager
+    async def slot(self, provider: str, model: str, tokens: int) -> AsyncIterator[ScheduledCall]:
+        """
+        Wait for a free place in the window, the end of any backoff pause and
+        room in the provider/model budget, then run the body as one call.
+        A rate-limit error raised by the body shrinks the window and pauses
+        admissions; the error itself is re-raised.
+        """
+        budget = self.budget(provider, model)
+        async with self._condition:
+            while True:
+                now = time.monotonic()
+                wait = max(self._paused_until - now, budget.wait_time(tokens, now))
+                if self._active < self.window and wait <= 0:
+                    break
+                # Woken by a finished call, or when the pause / budget allows
+                try:
+                    await asyncio.wait_for(self._condition.wait(), timeout=wait if wait > 0 else None)
+                except asyncio.TimeoutError:
+                    pass
+            self._active += 1
+            self._stats["calls"] += 1
+            call = ScheduledCall(budget.record(tokens, now))
+
+        try:
+            yield call
+        except Exception as e:
+            if is_rate_limit_error(e):
+                self._on_rate_limit(call, retry_after(e))
+            else:
+                self._stats["failed"] += 1
+            raise
+        else:
+            self._on_success()
+        finally:
+            async with self._condition:
+                self._active -= 1
+                self._condition.notify_all()
+
+    def _on_success(self) -> None:
+        self._stats["succeeded"] += 1
+        self._backoff = 0.0
+        self._successes += 1
+        if self._successes >= self.window and self.window < self.max_concurrency:
+            self.window += 1
+            self._successes = 0
+
+    def _on_rate_limit(self, call: ScheduledCall, delay: Optional[float]) -> None:
+        self._stats["rate_limited"] += 1
+        now = time.monotonic()
+        # Calls already in flight when the window shrank hit the same limit: count it once
+        if call.started_at >= self._last_decrease:
+            self.window = max(self.min_concurrency, self.window // 2)
+            self._successes = 0
+            self._last_decrease = now
+        self._backoff = min(BACKOFF_MAX, max(BACKOFF_BASE, self._backoff * 2))
+        pause = delay if delay else self._backoff
+        self._paused_until = max(self._paused_until, now + pause)
+        logger.warning(
+            f"[BatchScheduler] Rate limited - window {self.window}, pausing admissions {pause:g}s"
+        )
+
+    # -------------------------------------------------------------------------
+    # Progress
+    # -------------------------------------------------------------------------
+
+    def plan(self, units: int) -> None:
+        """Add (or with a negative count, drop) units of work from the plan."""
+        self.planned = max(self.done, self.planned + units)
+
+    def unit_done(self) -> None:
+        """One planned unit finished (successfully or not)."""
+        self.done += 1
+        self._completions.append(time.monotonic())
+
+    def throughput(self) -> Optional[float]:
+        """Units per second over the most recent completions."""
+        if not self._completions:
+            return None
+        now = time.monotonic()
+        if len(self._completions) == self._completions.maxlen:
+            count, since = len(self._completions) - 1, self._completions[0]
+        else:
+            count, since = len(self._completions), self.started_at
+        return count / (now - since) if now > since and count else None
+
+    def eta_seconds(self) -> Optional[float]:
+        rate = self.throughput()
+        if not rate:
+            return None
+        return max(0, self.planned - self.done) / rate
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Window, budgets, throughput and ETA for status reporting."""
+        now = time.monotonic()
+        rate = self.throughput()
+        eta = self.eta_seconds()
+        return {
+            "window": self.window,
+            "active": self._active,
+            "backoff_remaining_seconds": round(max(0.0, self._paused_until - now), 1),
+            "planned": self.planned,
+            "done": self.done,
+            "units_per_minute": round(rate * 60, 1) if rate else None,
+            "eta_seconds": round(eta, 1) if eta is not None else None,
+            "budgets": [
+                {
+                    "model": key,
+                    "requests_per_minute": budget.requests(now),
+                    "tokens_per_minute": budget.tokens(now),
+                    "rpm_limit": budget.rpm_limit or None,
+                    "tpm_limit": budget.tpm_limit or None,
+                }
+                for key, budget in self._budgets.items()
+            ],
+            **self._stats,
+        }
+
+    def close(self) -> None:
+        self.executor.shutdown(wait=False)
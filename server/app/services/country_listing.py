@@ -0,0 +1,163 @@
+"""
+GOHIP Platform - Country Listing
+Keyset pagination, indexed filters and cached totals for GET /countries/
+
+Pages are addressed by an opaque cursor holding the (name, iso_code) of the
+last row served, so every page is an index range scan on countries.name
+regardless of depth (OFFSET scans and discards every earlier row), served
+by the composite index ix_countries_name_iso_code.
+
+Filters map onto indexed columns:
+- maturity band / score range: countries.maturity_score (indexed)
+- region: iso_code IN (...) on the primary key, from the reference-data
+  region table
+
+Totals per filter set are cached for COUNT_CACHE_TTL_SECONDS and dropped by
+invalidate_country_counts() when countries are inserted (sync-missing and
+the ETL bulk writer).
+
+Usage:
+    filters = CountryFilters(band="leading", region="Europe")
+    countries, next_cursor = fetch_page(db, filters, per_page=20, cursor=cursor)
+    total = cached_count(db, filters)
+"""
+
+import base64
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Query, Session
+
+from app.data.reference_data import COUNTRY_REGIONS
+from app.models.country import Country
+
+logger = logging.getLogger(__name__)
+
+COUNT_CACHE_TTL_SECONDS = 300
+
+# Maturity bands (1.0-4.0 scale), as in schemas.country.get_maturity_label_from_score:
+# band -> [lower, upper), None for unbounded
+MATURITY_BANDS: Dict[str, Tuple[Optional[float], Optional[float]]] = {
+    "critical": (None, 2.0),
+    "developing": (2.0, 2.5),
+    "advancing": (2.5, 3.5),
+    "leading": (3.5, None),
+}
+
+# Countries missing from COUNTRY_REGIONS fall back to this region
+DEFAULT_REGION = "Asia"
+REGIONS = sorted(set(COUNTRY_REGIONS.values()) | {DEFAULT_REGION})
+
+
+class InvalidCursor(ValueError):
+    """Raised for a cursor token that was not produced by encode_cursor."""
+
+
+@dataclass(frozen=True)
+class CountryFilters:
+    """Optional server-side filters for the country list."""
+    band: Optional[str] = None
+    region: Optional[str] = None
+    min_score: Optional[float] = None
+    max_score: Optional[float] = None
+
+    def apply(self, query: Query) -> Query:
+        if self.band is not None:
+            lower, upper = MATURITY_BANDS[self.band]
+            query = query.filter(Country.maturity_score.isnot(None))
+            if lower is not None:
+                query = query.filter(Country.maturity_score >= lower)
+            if upper is not None:
+                query = query.filter(Country.maturity_score < upper)
+        if self.min_score is not None:
+            query = query.filter(Country.maturity_score >= self.min_score)
+        if self.max_score is not None:
+            query = query.filter(Country.maturity_score <= self.max_score)
+        if self.region is not None:
+            if self.region == DEFAULT_REGION:
+                others = [iso for iso, region in COUNTRY_REGIONS.items() if region != DEFAULT_REGION]
+                query = query.filter(Country.iso_code.notin_(others))
+            else:
+                members = [iso for iso, region in COUNTRY_REGIONS.items() if region == self.region]
+                query = query.filter(Country.iso_code.in_(members))
+        return query
+
+
+# =============================================================================
+# CURSORS
+# =============================================================================
+
+def encode_cursor(country: Country) -> str:
+    """Opaque token for the position after country."""
+    raw = json.dumps([country.name, country.iso_code], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: str) -> Tuple[str, str]:
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        name, iso_code = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor(f"Invalid cursor: {token}") from e
+    if not isinstance(name, str) or not isinstance(iso_code, str):
+        raise InvalidCursor(f"Invalid cursor: {token}")
+    return name, iso_code
+
+
+def fetch_page(
+    db: Session,
+    filters: CountryFilters,
+    per_page: int,
+    cursor: Optional[str] = None,
+    offset: int = 0,
+) -> Tuple[List[Country], Optional[str]]:
+    """
+    One page ordered by (name, iso_code) and the cursor of the next page
+    (None on the last page). offset is only for legacy page numbers.
+    """
+    query = filters.apply(db.query(Country))
+    if cursor is not None:
+        name, iso_code = decode_cursor(cursor)
+        # Row-value comparison: a range scan on ix_countries_name_iso_code
+        query = query.filter(tuple_(Country.name, Country.iso_code) > tuple_(name, iso_code))
+    query = query.order_by(Country.name, Country.iso_code)
+    if offset:
+        query = query.offset(offset)
+
+    # One extra row tells whether another page follows
+    rows = query.limit(per_page + 1).all()
+    if len(rows) > per_page:
+        return rows[:per_page], encode_cursor(rows[per_page - 1])
+    return rows, None
+
+
+# =============================================================================
+# CACHED TOTALS
+# =============================================================================
+
+_counts: Dict[CountryFilters, Tuple[int, float]] = {}
+_counts_lock = threading.Lock()
+
+
+def cached_count(db: Session, filters: CountryFilters) -> int:
+    """Number of countries matching filters (cached per filter set)."""
+    with _counts_lock:
+        cached = _counts.get(filters)
+    if cached is not None and time.monotonic() - cached[1] < COUNT_CACHE_TTL_SECONDS:
+        return cached[0]
+
+    total = filters.apply(db.query(Country)).count()
+    with _counts_lock:
+        _counts[filters] = (total, time.monotonic())
+    return total
+
+
+def invalidate_country_counts() -> None:
+    """Drop cached totals (called after countries are inserted or rescored)."""
+    with _counts_lock:
+        _counts.clear()
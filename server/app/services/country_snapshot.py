@@ -0,0 +1,395 @@
+"""
+GOHIP Platform - Country Score Snapshot
+Denormalised, versioned read model for the country display endpoints
+
+/countries/geojson-metadata, /countries/comparison/all, /country-data/pivot
+and /intelligence/rankings/{metric} used to join countries with the
+governance, pillar 1-3 and intelligence tables on every request (and the map
+endpoint recomputed fallback pillar scores). They now read
+country_score_snapshots, one row per country, with a single-table scan.
+
+Dependency tracking:
+- ORM writes to Country, GovernanceLayer, Pillar1-3 or CountryIntelligence
+  are recorded automatically (Session after_flush hook) as dirty countries
+  in country_snapshot_dirty, inside the writing transaction
+- Raw SQL / bulk writers call mark_stale() in their transaction
+  (write_scores, the ETL bulk writer, intelligence rescoring, sync-missing)
+- Readers call read_snapshot(), which first rebuilds only the dirty rows
+  (or everything for the "*" marker) and clears their markers
+
+Every refresh stamps its rows with a new version number, so
+snapshot_state() (latest version, row count) changes whenever any displayed
+value may have changed; response caches key on it.
+
+Usage:
+    rows = read_snapshot(db)                    # all countries, by name
+    rows = read_snapshot(db, ["DEU", "SAU"])
+    mark_stale(db, ["DEU"]); db.commit()        # after a raw SQL write
+"""
+
+import enum
+import logging
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import delete, event, func, inspect, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, selectinload
+
+from app.models.country import (
+    Country,
+    CountryIntelligence,
+    GovernanceLayer,
+    Pillar1Hazard,
+    Pillar2Vigilance,
+    Pillar3Restoration,
+)
+from app.models.country_snapshot import CountryScoreSnapshot, CountrySnapshotDirty
+from app.services.scoring_engine import EXPERT_PROFILE, SCORE_FIELDS, MetricMatrix, score_matrix
+
+logger = logging.getLogger(__name__)
+
+# Dirty marker meaning "rebuild every country"
+ALL_COUNTRIES = "*"
+
+# Snapshot layer key -> model (Country relationship of the same name, except intelligence)
+SNAPSHOT_LAYERS = {
+    "governance": GovernanceLayer,
+    "pillar_1_hazard": Pillar1Hazard,
+    "pillar_2_vigilance": Pillar2Vigilance,
+    "pillar_3_restoration": Pillar3Restoration,
+    "intelligence": CountryIntelligence,
+}
+
+# Large, non-display columns left out of the snapshot
+EXCLUDED_COLUMNS = {"data_sources", "ai_deep_summary", "ai_risk_assessment", "ai_opportunity_areas"}
+
+TRACKED_MODELS = (Country,) + tuple(SNAPSHOT_LAYERS.values())
+
+# Top-level snapshot columns selectable in a projection
+SNAPSHOT_COLUMNS = (
+    "iso_code", "name", "flag_url", "strategic_summary_text",
+    "maturity_score", *SCORE_FIELDS, "data_coverage_score",
+)
+
+# Metric columns the fallback pillar scores are computed from
+FALLBACK_COLUMNS = sorted({
+    component.column for _, components in EXPERT_PROFILE.pillars for component in components
+})
+
+
+# =============================================================================
+# DEPENDENCY TRACKING
+# =============================================================================
+
+def mark_stale(db: Session, iso_codes: Optional[Iterable[str]] = None) -> None:
+    """
+    Mark countries (all when iso_codes is None) for rebuild on the next read.
+    Does not commit: the marker commits with the write it describes.
+    """
+    keys = [ALL_COUNTRIES] if iso_codes is None else sorted(set(iso_codes))
+    if keys:
+        db.connection().execute(_mark_statement(keys))
+
+
+def _mark_statement(keys: List[str]):
+    statement = pg_insert(CountrySnapshotDirty).values([{"iso_code": key} for key in keys])
+    return statement.on_conflict_do_update(index_elements=["iso_code"], set_={"marked_at": func.now()})
+
+
+def _instance_iso_code(instance: Any) -> Optional[str]:
+    if isinstance(instance, Country):
+        return instance.iso_code
+    return getattr(instance, "country_iso_code", None)
+
+
+# Engines on which the dirty table has been seen (scripts may run against
+# databases created before it existed)
+_tracking_ready: Dict[int, bool] = {}
+
+
+@event.listens_for(Session, "after_flush")
+def _track_orm_writes(session: Session, flush_context) -> None:
+    """Record countries touched by this flush as dirty, in the same transaction."""
+    iso_codes = {
+        _instance_iso_code(instance)
+        for instance in (*session.new, *session.dirty, *session.deleted)
+        if isinstance(instance, TRACKED_MODELS)
+    }
+    iso_codes.discard(None)
+    if not iso_codes:
+        return
+
+    connection = session.connection()
+    engine_key = id(connection.engine)
+    if engine_key not in _tracking_ready:
+        _tracking_ready[engine_key] = inspect(connection).has_table(CountrySnapshotDirty.__tablename__)
+    if _tracking_ready[engine_key]:
+        connection.execute(_mark_statement(sorted(iso_codes)))
+
+
+# =============================================================================
+# REFRESH
+# =============================================================================
+
+def _json_value(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _layer_dict(record: Any, model) -> Optional[Dict[str, Any]]:
+    if record is None:
+        return None
+    return {
+        attribute.key: _json_value(getattr(record, attribute.key))
+        for attribute in inspect(model).column_attrs
+        if attribute.key not in EXCLUDED_COLUMNS
+    }
+
+
+def snapshot_version(db: Session) -> int:
+    """Version of the most recent snapshot refresh (0 before the first)."""
+    return db.query(func.coalesce(func.max(CountryScoreSnapshot.version), 0)).scalar()
+
+
+def snapshot_state(rows: Optional[List[CountryScoreSnapshot]] = None, db: Optional[Session] = None) -> Tuple[int, int]:
+    """
+    (latest version, row count) of the snapshot, from already scanned rows
+    or from the table. Changes whenever a refresh rewrote or removed a row.
+    """
+    if rows is not None:
+        return max((row.version for row in rows), default=0), len(rows)
+    version, count = db.query(
+        func.coalesce(func.max(CountryScoreSnapshot.version), 0), func.count()
+    ).select_from(CountryScoreSnapshot).one()
+    return version, count
+
+
+def refresh_snapshot(db: Session, iso_codes: Optional[Iterable[str]] = None) -> int:
+    """
+    Rebuild snapshot rows from the source tables (all countries when
+    iso_codes is None) and drop rows of countries that no longer exist.
+    Does not commit. Returns the number of rows written.
+    """
+    query = db.query(Country).options(
+        selectinload(Country.governance),
+        selectinload(Country.pillar_1_hazard),
+        selectinload(Country.pillar_2_vigilance),
+        selectinload(Country.pillar_3_restoration),
+    )
+    intel_query = db.query(CountryIntelligence)
+    if iso_codes is not None:
+        iso_codes = sorted(set(iso_codes))
+        query = query.filter(Country.iso_code.in_(iso_codes))
+        intel_query = intel_query.filter(CountryIntelligence.country_iso_code.in_(iso_codes))
+    countries = query.order_by(Country.iso_code).all()
+    intelligence = {intel.country_iso_code: intel for intel in intel_query}
+
+    version = snapshot_version(db) + 1
+    now = datetime.utcnow()
+    rows = []
+    for country in countries:
+        layers = {
+            key: _layer_dict(
+                intelligence.get(country.iso_code) if key == "intelligence" else getattr(country, key),
+                model,
+            )
+            for key, model in SNAPSHOT_LAYERS.items()
+        }
+        rows.append({
+            "iso_code": country.iso_code,
+            "name": country.name,
+            "flag_url": country.flag_url,
+            "strategic_summary_text": country.strategic_summary_text,
+            "maturity_score": country.maturity_score,
+            **{field: getattr(country, field) for field in SCORE_FIELDS},
+            "data_coverage_score": country.data_coverage_score(),
+            "layers": layers,
+            "country_created_at": country.created_at,
+            "country_updated_at": country.updated_at,
+            "version": version,
+            "refreshed_at": now,
+        })
+
+    if rows:
+        # Stored pillar scores win; NULLs fall back to the expert-weight calculation
+        values = [
+            {
+                column: value
+                for key in ("governance", "pillar_1_hazard", "pillar_2_vigilance", "pillar_3_restoration")
+                for column, value in (row["layers"][key] or {}).items()
+            }
+            for row in rows
+        ]
+        metrics = MetricMatrix(
+            [row["iso_code"] for row in rows],
+            {column: [country.get(column) for country in values] for column in FALLBACK_COLUMNS},
+        )
+        fallback = score_matrix(metrics, EXPERT_PROFILE)
+        for index, row in enumerate(rows):
+            for field in SCORE_FIELDS:
+                if row[field] is None:
+                    row[field] = fallback[field][index]
+
+        statement = pg_insert(CountryScoreSnapshot).values(rows)
+        db.execute(statement.on_conflict_do_update(
+            index_elements=["iso_code"],
+            set_={column: statement.excluded[column] for column in rows[0] if column != "iso_code"},
+        ))
+
+    # Countries deleted (or never present) since the last refresh
+    gone = delete(CountryScoreSnapshot).where(CountryScoreSnapshot.version != version)
+    if iso_codes is not None:
+        gone = gone.where(CountryScoreSnapshot.iso_code.in_(iso_codes))
+    db.execute(gone)
+
+    logger.info(f"Refreshed country snapshot v{version}: {len(rows)} "
+                f"{'countries' if iso_codes is None else 'changed countries'}")
+    return len(rows)
+
+
+def ensure_fresh(db: Session) -> bool:
+    """
+    Rebuild dirty snapshot rows, if any, and commit. Markers are claimed
+    with SKIP LOCKED so concurrent readers do not repeat the same refresh.
+    Returns True when a refresh ran.
+    """
+    dirty = (
+        db.query(CountrySnapshotDirty.iso_code, CountrySnapshotDirty.marked_at)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    if not dirty:
+        db.rollback()
+        return False
+
+    keys = {iso_code for iso_code, _ in dirty}
+    refresh_snapshot(db, None if ALL_COUNTRIES in keys else keys)
+    # Only the markers seen: a write marked again meanwhile stays dirty
+    db.execute(delete(CountrySnapshotDirty).where(
+        tuple_(CountrySnapshotDirty.iso_code, CountrySnapshotDirty.marked_at).in_(
+            [(iso_code, marked_at) for iso_code, marked_at in dirty]
+        )
+    ))
+    db.commit()
+    return True
+
+
+def _ensure_fresh_or_warn(db: Session) -> None:
+    try:
+        ensure_fresh(db)
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"Country snapshot refresh failed, serving last snapshot: {e}")
+
+
+def current_state(db: Session) -> Tuple[int, int]:
+    """
+    snapshot_state() after refreshing dirty rows (building the snapshot on
+    first use); cheap enough to check per request.
+    """
+    _ensure_fresh_or_warn(db)
+    _build_if_empty(db)
+    return snapshot_state(db=db)
+
+
+def read_snapshot(db: Session, iso_codes: Optional[Iterable[str]] = None) -> List[CountryScoreSnapshot]:
+    """Snapshot rows (all, or the given countries) ordered by name, refreshed first if stale."""
+    _ensure_fresh_or_warn(db)
+
+    def scan() -> List[CountryScoreSnapshot]:
+        query = db.query(CountryScoreSnapshot)
+        if iso_codes is not None:
+            query = query.filter(CountryScoreSnapshot.iso_code.in_(list(iso_codes)))
+        return query.order_by(CountryScoreSnapshot.name).all()
+
+    rows = scan()
+    if not rows and _build_if_empty(db):
+        rows = scan()
+    return rows
+
+
+def _build_if_empty(db: Session) -> bool:
+    """First read after deployment: build the whole snapshot."""
+    if snapshot_version(db) != 0:
+        return False
+    refresh_snapshot(db)
+    db.commit()
+    return True
+
+
+# =============================================================================
+# PROJECTIONS
+# =============================================================================
+
+def projection_fields() -> List[str]:
+    """
+    Field selectors accepted by project_snapshot: top-level columns,
+    whole layers ("governance") and layer columns ("governance.inspector_density").
+    """
+    fields = list(SNAPSHOT_COLUMNS)
+    for layer, model in SNAPSHOT_LAYERS.items():
+        fields.append(layer)
+        fields.extend(
+            f"{layer}.{attribute.key}"
+            for attribute in inspect(model).column_attrs
+            if attribute.key not in EXCLUDED_COLUMNS
+        )
+    return fields
+
+
+def project_snapshot(
+    db: Session,
+    fields: List[str],
+    iso_codes: Optional[Iterable[str]] = None,
+    batch_size: int = 50,
+    refresh: bool = True,
+    since_version: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream snapshot rows (all, or the given countries) ordered by name with
+    only the selected fields, as nested dicts ({"iso_code", "name",
+    "governance": {"inspector_density"}}). Layer columns are extracted in
+    SQL, so unselected metrics never leave the database. Fields must come
+    from projection_fields(). refresh=False skips the staleness check (the
+    caller just ran current_state); since_version limits the scan to rows
+    rewritten by later refreshes.
+    """
+    if refresh:
+        _ensure_fresh_or_warn(db)
+        _build_if_empty(db)
+
+    requested = set(fields)
+    selected = ["iso_code", "name"] + [
+        field for field in dict.fromkeys(fields)
+        if field not in ("iso_code", "name") and field.partition(".")[0] not in requested - {field}
+    ]
+    columns = []
+    for field in selected:
+        layer, _, column = field.partition(".")
+        if not column and layer in SNAPSHOT_COLUMNS:
+            expression = getattr(CountryScoreSnapshot, layer)
+        elif not column:
+            expression = CountryScoreSnapshot.layers[layer]
+        else:
+            expression = CountryScoreSnapshot.layers[(layer, column)]
+        columns.append(expression.label(field.replace(".", "__")))
+
+    query = db.query(*columns)
+    if iso_codes is not None:
+        query = query.filter(CountryScoreSnapshot.iso_code.in_(list(iso_codes)))
+    if since_version is not None:
+        query = query.filter(CountryScoreSnapshot.version > since_version)
+    query = query.order_by(CountryScoreSnapshot.name).execution_options(yield_per=batch_size)
+    for row in query:
+        item: Dict[str, Any] = {}
+        for field, value in zip(selected, row):
+            layer, _, column = field.partition(".")
+            if column:
+                item.setdefault(layer, {})[column] = value
+            else:
+                item[layer] = value
+        yield item
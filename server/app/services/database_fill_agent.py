@@ -23,6 +23,7 @@ from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 from uuid import uuid4
 
+import numpy as np
 from sqlalchemy.orm import Session
 
 from app.models.country import (
@@ -35,6 +36,15 @@ from app.models.country import (
 )
 from app.models.user import AIConfig
 from app.services.agent_runner import AgentRunner
+from app.services.scenario_simulator import invalidate_metric_snapshot
+from app.services.scoring_engine import (
+    FILL_AGENT_PROFILE,
+    MetricMatrix,
+    load_metric_matrix,
+    round_half_even_safe,
+    score_matrix,
+    write_scores,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -502,7 +512,7 @@ async def fill_country(
     runner = AgentRunner(db, ai_config)
     try:
         result = await asyncio.wait_for(
-            runner.run(agent_id="database-fill-agent", variables={"COUNTRY_NAME": country.name, "COUNTRY_ISO": country_iso, "ISO_CODE": country_iso, "EXISTING_DATA": existing_str, "NULL_FIELDS": null_fields_str}, enable_web_search=True),
+            runner.run(agent_id="database-fill-agent", variables={"COUNTRY_NAME": country.name, "COUNTRY_ISO": country_iso, "ISO_CODE": country_iso, "EXISTING_DATA": existing_str, "NULL_FIELDS": null_fields_str}, enable_web_search=True, use_cache=not force_regenerate),
             timeout=300,
         )
     except asyncio.TimeoutError:
@@ -593,6 +603,7 @@ async def fill_country_batch(
                     },
                     enable_web_search=True,
                     override_model=BATCH_FILL_MODEL,
+                    use_cache=not force_regenerate,
                 ),
                 timeout=300,
             )
@@ -817,144 +828,34 @@ def recalculate_all_scores_standalone(db: Session) -> int:
     Recalculate pillar scores and maturity scores for all countries.
     
     Standalone version that doesn't require FastAPI request context.
-    Uses the same logic as the /recalculate endpoint in metric_config.py.
+    Scores every country in one pass with the columnar scoring engine
+    (FILL_AGENT_PROFILE weights, aligned with DEFAULT_PILLAR_SUMMARIES)
+    and writes them back with set-based UPDATEs.
     """
-    from sqlalchemy import text
-    from app.models.metric_config import PillarSummaryMetric, MaturityScoringRule
-
-    # Load pillar summary configurations
-    pillar_summaries = db.query(PillarSummaryMetric).filter(
-        PillarSummaryMetric.is_active == True
-    ).all()
-    pillar_weights = {s.pillar.value: s.component_weights for s in pillar_summaries}
-
-    # Load active maturity rules
-    rules = db.query(MaturityScoringRule).filter(
-        MaturityScoringRule.is_active == True
-    ).order_by(MaturityScoringRule.priority).all()
-    rule_config = [r.to_dict() for r in rules]
-
-    # Fetch all country data
-    query = text("""
-        SELECT 
-            c.iso_code,
-            g.ilo_c187_status, g.ilo_c155_status, g.inspector_density,
-            g.mental_health_policy, g.strategic_capacity_score,
-            p1.fatal_accident_rate, p1.oel_compliance_pct, p1.safety_training_hours_avg,
-            p1.carcinogen_exposure_pct, p1.control_maturity_score,
-            p2.vulnerability_index, p2.disease_detection_rate,
-            p2.occupational_disease_reporting_rate, p2.lead_exposure_screening_rate,
-            p2.surveillance_logic,
-            p3.rehab_access_score, p3.return_to_work_success_pct,
-            p3.rehab_participation_rate, p3.avg_claim_settlement_days,
-            p3.reintegration_law, p3.payer_mechanism
-        FROM countries c
-        LEFT JOIN governance_layer g ON c.iso_code = g.country_iso_code
-        LEFT JOIN pillar_1_hazard p1 ON c.iso_code = p1.country_iso_code
-        LEFT JOIN pillar_2_vigilance p2 ON c.iso_code = p2.country_iso_code
-        LEFT JOIN pillar_3_restoration p3 ON c.iso_code = p3.country_iso_code
-    """)
-
-    result = db.execute(query)
-    rows = result.fetchall()
-
-    updated = 0
-    for row in rows:
-        (iso_code,
-         ilo_c187, ilo_c155, inspector_density_val, mental_health, strategic_cap,
-         fatal_rate, oel_comp, safety_train, carcinogen_exp, control_mat,
-         vuln_idx, disease_det, disease_rep, lead_screen, surveillance,
-         rehab_access, rtw_success, rehab_part, claim_settle, reintegration, payer) = row
-
-        # Calculate pillar scores using weighted average
-        # Weights aligned with DEFAULT_PILLAR_SUMMARIES in metric_config.py
-        gov_score = _safe_weighted_avg([
-            (100.0 if ilo_c187 else (0.0 if ilo_c187 is not None else None), 0.20),
-            (100.0 if ilo_c155 else (0.0 if ilo_c155 is not None else None), 0.20),
-            (_safe_normalize(inspector_density_val, 3.0), 0.30),
-            (100.0 if mental_health else (0.0 if mental_health is not None else None), 0.15),
-            (strategic_cap, 0.15),
-        ])
-
-        p1_score = _safe_weighted_avg([
-            (_safe_normalize(fatal_rate, 10.0, invert=True), 0.35),
-            (oel_comp, 0.25),
-            (control_mat, 0.20),
-            (_safe_normalize(safety_train, 40.0), 0.10),
-            (_safe_normalize(carcinogen_exp, 50.0, invert=True), 0.10),
-        ])
-
-        p2_score = _safe_weighted_avg([
-            (_safe_normalize(vuln_idx, 100.0, invert=True), 0.30),
-            (disease_det, 0.30),
-            (disease_rep, 0.20),
-            (lead_screen, 0.20),
-        ])
-
-        p3_score = _safe_weighted_avg([
-            (rehab_access, 0.30),
-            (rtw_success, 0.30),
-            (rehab_part, 0.20),
-            (_safe_normalize(claim_settle, 365.0, invert=True), 0.20),
-        ])
-
-        # Calculate maturity score (1.0 - 4.0)
-        maturity = 1.0
-        if fatal_rate is not None and fatal_rate < 1.0 and inspector_density_val is not None and inspector_density_val > 1.0:
-            maturity += 1.0
-        if fatal_rate is not None and fatal_rate > 3.0:
-            maturity = min(maturity, 2.0)
-        if surveillance is not None and surveillance == "Risk-Based":
-            maturity += 0.5
-        if reintegration is True:
-            maturity += 1.0
-        if payer is not None and payer == "No-Fault":
-            maturity += 0.5
-        maturity = round(max(1.0, min(4.0, maturity)), 1)
-
-        update_q = text("""
-            UPDATE countries 
-            SET maturity_score = :maturity,
-                governance_score = :gov,
-                pillar1_score = :p1,
-                pillar2_score = :p2,
-                pillar3_score = :p3,
-                updated_at = :now
-            WHERE iso_code = :iso
-        """)
-        db.execute(update_q, {
-            "maturity": maturity,
-            "gov": gov_score,
-            "p1": p1_score,
-            "p2": p2_score,
-            "p3": p3_score,
-            "now": datetime.utcnow(),
-            "iso": iso_code,
-        })
-        updated += 1
+    matrix = load_metric_matrix(db)
+    scores = score_matrix(matrix, FILL_AGENT_PROFILE, maturity=_fill_agent_maturity)
 
+    write_stats = write_scores(db, matrix.keys, scores)
     db.commit()
-    return updated
+    # Filled metrics invalidate the what-if simulator's metric snapshot
+    invalidate_metric_snapshot()
+    return write_stats.rows
 
 
-def _safe_normalize(value, max_val, invert=False):
-    """Normalize a value to 0-100 scale."""
-    if value is None:
-        return None
-    normalized = min(100.0, max(0.0, (value / max_val) * 100.0))
-    if invert:
-        normalized = 100.0 - normalized
-    return round(normalized, 1)
-
-
-def _safe_weighted_avg(items):
-    """Calculate weighted average, skipping None values and redistributing weights."""
-    total_weight = 0.0
-    weighted_sum = 0.0
-    for value, weight in items:
-        if value is not None:
-            weighted_sum += value * weight
-            total_weight += weight
-    if total_weight == 0:
-        return None
-    return round(weighted_sum / total_weight, 1)
+def _fill_agent_maturity(matrix: MetricMatrix) -> np.ndarray:
+    """
+    Maturity score (1.0 - 4.0) for every row of a MetricMatrix.
+
+    Unlike the configurable rule set, the fatal-rate cap applies only to the
+    score so far; later bonuses still add on top of it.
+    """
+    fatal_rate = matrix.numeric("fatal_accident_rate")
+    inspector_density = matrix.numeric("inspector_density")
+
+    with np.errstate(invalid="ignore"):
+        maturity = np.where((fatal_rate < 1.0) & (inspector_density > 1.0), 2.0, 1.0)
+        maturity = np.where(fatal_rate > 3.0, np.minimum(maturity, 2.0), maturity)
+    maturity = maturity + np.where(matrix.values("surveillance_logic") == "Risk-Based", 0.5, 0.0)
+    maturity = maturity + np.array([1.0 if value is True else 0.0 for value in matrix.values("reintegration_law")])
+    maturity = maturity + np.where(matrix.values("payer_mechanism") == "No-Fault", 0.5, 0.0)
+    return round_half_even_safe(np.maximum(1.0, np.minimum(4.0, maturity)), 1)
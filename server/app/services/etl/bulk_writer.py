@@ -0,0 +1,309 @@
+"""
+GOHIP Platform - ETL Bulk Upsert Writer
+=======================================
+
+Buffers scored pipeline results and writes them in batches with PostgreSQL
+INSERT ... ON CONFLICT DO UPDATE, one transaction per batch.
+
+Each country used to be written row by row through the ORM: a SELECT per
+Country / GovernanceLayer / Pillar 1-3 row, a commit, a refresh, a second
+commit for the maturity score, then another SELECT + commit for
+CountryIntelligence - around 15 round trips per country. A batch of N
+countries now costs a fixed handful of statements: one preload query per
+table plus one multi-row upsert per table.
+
+Crash Safety:
+- Upserts are keyed on natural keys (countries.iso_code and the unique
+  country_iso_code of each child table), so re-writing a batch is idempotent
+- A country's scores, intelligence and incremental refresh state commit in
+  the same transaction. A crash loses at most the unflushed buffer, and the
+  next run (full or incremental) picks those countries up again
+- A failed batch is retried one country per transaction, so a single bad
+  row does not fail the whole batch
+
+Usage:
+    writer = BulkUpsertWriter(db, batch_size=50)
+    for ...:
+        failures = writer.add(CountryWrite(...))   # flushes when full
+    failures = writer.flush()
+"""
+
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+from uuid import uuid4
+
+from sqlalchemy import inspect
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.config import settings
+from app.models.country import (
+    Country,
+    CountryIntelligence,
+    GovernanceLayer,
+    Pillar1Hazard,
+    Pillar2Vigilance,
+    Pillar3Restoration,
+)
+from app.services.country_listing import invalidate_country_counts
+from app.services.country_snapshot import mark_stale
+from app.services.etl.incremental import REFRESH_STATE_KEY, RefreshUpdate
+from app.services.etl.intelligence_pipeline import IntelligencePipeline
+from app.services.scenario_simulator import invalidate_metric_snapshot
+from app.services.scoring import calculate_maturity_score
+
+logger = logging.getLogger(__name__)
+
+# Layer key -> (model, Country relationship name)
+LAYER_MODELS = {
+    "governance": (GovernanceLayer, "governance"),
+    "pillar1": (Pillar1Hazard, "pillar_1_hazard"),
+    "pillar2": (Pillar2Vigilance, "pillar_2_vigilance"),
+    "pillar3": (Pillar3Restoration, "pillar_3_restoration"),
+}
+
+# Set on insert only, never overwritten by the upsert
+INSERT_ONLY_COLUMNS = {"id", "iso_code", "country_iso_code", "name", "created_at"}
+
+
+@dataclass
+class CountryWrite:
+    """
+    Everything the pipeline writes for one country.
+
+    country/layers are None/empty for a refresh-only write (incremental run
+    where the scoring inputs were unchanged): only the refresh state and
+    freshness timestamps on CountryIntelligence are updated.
+
+    intelligence_only writes just the CountryIntelligence record, rebuilt
+    from wb_extended and the reference data (IntelligencePipeline.run).
+    """
+    iso_code: str
+    name: str
+    country: Optional[Dict[str, Any]] = None   # Country columns (pillar scores, flag_url)
+    layers: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # LAYER_MODELS key -> columns
+    wb_extended: Optional[Dict[str, Any]] = None  # IntelligencePipeline World Bank input
+    refresh: Optional[RefreshUpdate] = None
+    intelligence_only: bool = False
+    intelligence_fingerprint: Optional[str] = None  # Stored in the refresh state when set
+
+
+def _column_values(model, record) -> Dict[str, Any]:
+    """Current column values of a persistent record (all None when missing)."""
+    return {
+        column.key: getattr(record, column.key) if record is not None else None
+        for column in model.__table__.columns
+    }
+
+
+class BulkUpsertWriter:
+    """
+    Buffers CountryWrite results and upserts them batch_size at a time.
+
+    before_commit, when given, is called with the batch's ISO codes inside
+    the batch transaction (e.g. to checkpoint them as written atomically).
+    intelligence is the IntelligencePipeline whose apply_sources (and hit
+    statistics) are used; a new one is created when omitted.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        batch_size: Optional[int] = None,
+        before_commit: Optional[Callable[[List[str]], None]] = None,
+        intelligence: Optional[IntelligencePipeline] = None,
+    ):
+        self.db = db
+        self.batch_size = max(1, batch_size or settings.ETL_WRITE_BATCH_SIZE)
+        self.before_commit = before_commit
+        self.intelligence = intelligence or IntelligencePipeline(db)
+        self._buffer: List[CountryWrite] = []
+        self.stats = {
+            "batches": 0,
+            "countries_written": 0,
+            "countries_failed": 0,
+            "statements": 0,
+        }
+
+    @property
+    def pending(self) -> int:
+        return len(self._buffer)
+
+    def add(self, write: CountryWrite) -> Dict[str, str]:
+        """
+        Buffer a country; flush when the batch is full.
+
+        Returns:
+            {iso_code: error} for countries whose write failed (empty when
+            nothing was flushed or everything succeeded)
+        """
+        self._buffer.append(write)
+        if len(self._buffer) >= self.batch_size:
+            return self.flush()
+        return {}
+
+    def flush(self) -> Dict[str, str]:
+        """Write all buffered countries. Returns {iso_code: error} for failures."""
+        if not self._buffer:
+            return {}
+        batch, self._buffer = self._buffer, []
+        failures: Dict[str, str] = {}
+
+        try:
+            self._write_batch(batch)
+        except Exception as e:
+            self.db.rollback()
+            if len(batch) == 1:
+                failures[batch[0].iso_code] = str(e)
+            else:
+                logger.warning(f"Bulk write of {len(batch)} countries failed ({e}); retrying per country")
+                for write in batch:
+                    try:
+                        self._write_batch([write])
+                    except Exception as country_error:
+                        self.db.rollback()
+                        failures[write.iso_code] = str(country_error)
+
+        for iso_code, error in failures.items():
+            logger.error(f"Bulk write failed for {iso_code}: {error}")
+        self.stats["countries_written"] += len(batch) - len(failures)
+        self.stats["countries_failed"] += len(failures)
+        return failures
+
+    # -------------------------------------------------------------------------
+    # Batch write
+    # -------------------------------------------------------------------------
+
+    def _write_batch(self, batch: List[CountryWrite]) -> None:
+        """Preload existing rows, build upsert rows and write them in one transaction."""
+        iso_codes = [write.iso_code for write in batch]
+        countries = {
+            country.iso_code: country
+            for country in self.db.query(Country).options(
+                *(selectinload(getattr(Country, relationship)) for _, relationship in LAYER_MODELS.values())
+            ).filter(Country.iso_code.in_(iso_codes))
+        }
+        intelligence = {
+            intel.country_iso_code: intel
+            for intel in self.db.query(CountryIntelligence).filter(
+                CountryIntelligence.country_iso_code.in_(iso_codes)
+            )
+        }
+
+        now = datetime.utcnow()
+        country_rows: List[Dict[str, Any]] = []
+        layer_rows: Dict[str, List[Dict[str, Any]]] = {key: [] for key in LAYER_MODELS}
+        intel_records: List[CountryIntelligence] = []
+        intel_columns = set()
+
+        for write in batch:
+            existing = countries.get(write.iso_code)
+
+            if write.country is not None:
+                views = {}
+                for key, (model, relationship) in LAYER_MODELS.items():
+                    current = getattr(existing, relationship) if existing else None
+                    row = {
+                        "id": current.id if current else str(uuid4()),
+                        "country_iso_code": write.iso_code,
+                        **write.layers.get(key, {}),
+                        "updated_at": now,
+                    }
+                    layer_rows[key].append(row)
+                    views[relationship] = SimpleNamespace(**{**_column_values(model, current), **row})
+
+                # Maturity rules read the merged (stored + new) layer values
+                maturity_score, _ = calculate_maturity_score(SimpleNamespace(**views))
+                country_rows.append({
+                    "iso_code": write.iso_code,
+                    "name": existing.name if existing else write.name,
+                    "flag_url": existing.flag_url if existing else None,
+                    **write.country,
+                    "maturity_score": maturity_score,
+                    "updated_at": now,
+                })
+
+            intel = self._build_intelligence(write, intelligence.get(write.iso_code))
+            intel_columns.update(
+                attr.key for attr in inspect(intel).attrs if attr.history.has_changes()
+            )
+            intel_records.append(intel)
+
+        intel_columns.update(("id", "country_iso_code"))
+        intel_rows = [
+            {column: getattr(intel, column) for column in sorted(intel_columns)}
+            for intel in intel_records
+        ]
+
+        # Parents before children (foreign keys), one statement per table
+        self._upsert(Country, country_rows, "iso_code")
+        for key, (model, _) in LAYER_MODELS.items():
+            self._upsert(model, layer_rows[key], "country_iso_code")
+        self._upsert(CountryIntelligence, intel_rows, "country_iso_code")
+        mark_stale(self.db, iso_codes)
+        if self.before_commit is not None:
+            self.before_commit(iso_codes)
+        # Committing also expires the preloaded (now stale) ORM records
+        self.db.commit()
+        invalidate_metric_snapshot()
+        invalidate_country_counts()
+        self.stats["batches"] += 1
+
+    def _build_intelligence(
+        self,
+        write: CountryWrite,
+        current: Optional[CountryIntelligence],
+    ) -> CountryIntelligence:
+        """
+        Transient intelligence record seeded with the stored values.
+
+        Only attributes changed afterwards show up in the attribute history,
+        so the upsert touches just the columns the pipeline actually set.
+        """
+        intel = CountryIntelligence()
+        for key, value in _column_values(CountryIntelligence, current).items():
+            set_committed_value(intel, key, value)
+
+        if current is None:
+            intel.id = str(uuid4())
+            intel.country_iso_code = write.iso_code
+            intel.data_sources = {}
+
+        if write.country is not None or write.intelligence_only:
+            result = {"iso_code": write.iso_code, "sources_used": []}
+            self.intelligence.apply_sources(intel, write.iso_code, write.wb_extended or {}, result)
+
+        if write.refresh is not None or write.intelligence_fingerprint is not None:
+            data_sources = dict(intel.data_sources or {})
+            if write.refresh is not None:
+                for column, timestamp in write.refresh.timestamps.items():
+                    setattr(intel, column, timestamp)
+                data_sources[REFRESH_STATE_KEY] = write.refresh.state
+            if write.intelligence_fingerprint is not None:
+                state = dict(data_sources.get(REFRESH_STATE_KEY) or {})
+                state["intelligence_fingerprint"] = write.intelligence_fingerprint
+                data_sources[REFRESH_STATE_KEY] = state
+            intel.data_sources = json.loads(json.dumps(data_sources, default=str))
+
+        return intel
+
+    def _upsert(self, model, rows: List[Dict[str, Any]], conflict_column: str) -> None:
+        """INSERT ... ON CONFLICT (conflict_column) DO UPDATE for rows sharing one key set."""
+        if not rows:
+            return
+        stmt = pg_insert(model.__table__)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[conflict_column],
+            set_={
+                column: stmt.excluded[column]
+                for column in rows[0]
+                if column not in INSERT_ONLY_COLUMNS
+            },
+        )
+        self.db.execute(stmt, rows)
+        self.stats["statements"] += 1
@@ -0,0 +1,184 @@
+"""
+GOHIP Platform - ETL Run Checkpoints
+====================================
+
+Persistent run IDs and per-country / per-source checkpoints for
+run_full_pipeline, so a run interrupted by a crash, a deploy or
+/etl/stop resumes where it stopped instead of starting over from
+country #1.
+
+What is checkpointed (etl_pipeline_checkpoints):
+- Every fetched source payload per country (ilo, worldbank, who,
+  worldbank_extended), committed as soon as the country is fetched.
+  A resumed run reuses these instead of calling the upstream APIs again
+- A "pipeline" row per country: "written" in the same transaction as the
+  country's batched database write (see BulkUpsertWriter before_commit),
+  or "failed". Written countries are skipped entirely on resume
+
+Usage:
+    store = RunCheckpointStore(db, run_id)     # run_id=None for a new run
+    store.start(options, target_countries)     # creates or resumes the run
+    remaining = [c for c in target_countries if c not in store.written_countries]
+    ...
+    store.finish("completed", processed, failed)
+"""
+
+import json
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set
+from uuid import uuid4
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.pipeline_run import PipelineRun, PipelineCheckpoint
+
+logger = logging.getLogger(__name__)
+
+# Sources whose payloads are checkpointed and reused on resume
+CHECKPOINT_SOURCES = ("ilo", "worldbank", "who", "worldbank_extended")
+
+# Checkpoint "source" for the country as a whole
+COUNTRY_STAGE = "pipeline"
+
+# Runs in these states can be resumed ("running" = the process died)
+RESUMABLE_STATUSES = {"running", "stopped", "failed"}
+
+
+class RunCheckpointStore:
+    """Reads and writes the checkpoints of one pipeline run."""
+
+    def __init__(self, db: Session, run_id: Optional[str] = None):
+        self.db = db
+        self.run_id = run_id or str(uuid4())
+        self.resumed = False
+        self.written_countries: Set[str] = set()
+        self._fetched: Dict[str, Dict[str, Any]] = {}
+        self._fetched_at: Dict[str, Dict[str, datetime]] = {}
+
+    # -------------------------------------------------------------------------
+    # Run lifecycle
+    # -------------------------------------------------------------------------
+
+    def start(self, options: Dict[str, Any], target_countries: List[str]) -> PipelineRun:
+        """Create the run, or reopen it and load its checkpoints when it already exists."""
+        run = self.db.get(PipelineRun, self.run_id)
+        if run is None:
+            run = PipelineRun(
+                id=self.run_id,
+                status="running",
+                options=options,
+                target_countries=target_countries,
+            )
+            self.db.add(run)
+        else:
+            self.resumed = True
+            if run.status not in RESUMABLE_STATUSES:
+                logger.info(f"Re-opening {run.status} run {self.run_id} to retry unwritten countries")
+            run.status = "running"
+            run.resume_count = (run.resume_count or 0) + 1
+            run.finished_at = None
+            run.error = None
+            self._load()
+        self.db.commit()
+        return run
+
+    def _load(self) -> None:
+        checkpoints = self.db.query(PipelineCheckpoint).filter(
+            PipelineCheckpoint.run_id == self.run_id
+        ).all()
+        for checkpoint in checkpoints:
+            if checkpoint.source == COUNTRY_STAGE:
+                if checkpoint.status == "written":
+                    self.written_countries.add(checkpoint.country_iso_code)
+            elif checkpoint.status == "fetched":
+                self._fetched.setdefault(checkpoint.country_iso_code, {})[checkpoint.source] = checkpoint.payload
+                self._fetched_at.setdefault(checkpoint.country_iso_code, {})[checkpoint.source] = checkpoint.updated_at
+        logger.info(
+            f"Resuming run {self.run_id}: {len(self.written_countries)} countries written, "
+            f"{len(self._fetched)} with fetched sources"
+        )
+
+    def finish(self, status: str, processed: int, failed: int, error: Optional[str] = None) -> None:
+        """Record the run outcome (completed, stopped or failed)."""
+        run = self.db.get(PipelineRun, self.run_id)
+        if run is None:
+            return
+        run.status = status
+        run.processed_count = processed
+        run.failed_count = failed
+        run.error = error
+        run.finished_at = datetime.utcnow()
+        self.db.commit()
+
+    # -------------------------------------------------------------------------
+    # Checkpoints
+    # -------------------------------------------------------------------------
+
+    def fetched_sources(self, iso_code: str) -> Dict[str, Any]:
+        """Source payloads already fetched for a country in this run."""
+        return self._fetched.get(iso_code, {})
+
+    def fetched_at(self, iso_code: str) -> Dict[str, datetime]:
+        """When each checkpointed source payload of a country was fetched."""
+        return self._fetched_at.get(iso_code, {})
+
+    def record_fetch(self, iso_code: str, payloads: Dict[str, Any]) -> None:
+        """Checkpoint freshly fetched source payloads for a country. Commits."""
+        payloads = {source: data for source, data in payloads.items() if source in CHECKPOINT_SOURCES}
+        if not payloads:
+            return
+        self._upsert([
+            {
+                "country_iso_code": iso_code,
+                "source": source,
+                "status": "fetched",
+                "payload": json.loads(json.dumps(data, default=str)),
+            }
+            for source, data in payloads.items()
+        ])
+        self.db.commit()
+        self._fetched.setdefault(iso_code, {}).update(payloads)
+        now = datetime.utcnow()
+        self._fetched_at.setdefault(iso_code, {}).update({source: now for source in payloads})
+
+    def mark_written(self, iso_codes: Iterable[str]) -> None:
+        """
+        Mark countries as written. Does not commit: called by the bulk writer
+        inside the transaction that writes the countries.
+        """
+        iso_codes = list(iso_codes)
+        self._upsert([
+            {"country_iso_code": iso_code, "source": COUNTRY_STAGE, "status": "written"}
+            for iso_code in iso_codes
+        ])
+        self.written_countries.update(iso_codes)
+
+    def record_failures(self, failures: Dict[str, str]) -> None:
+        """Mark countries as failed (retried on resume). Commits."""
+        if not failures:
+            return
+        self._upsert([
+            {"country_iso_code": iso_code, "source": COUNTRY_STAGE, "status": "failed", "error": error}
+            for iso_code, error in failures.items()
+        ])
+        self.db.commit()
+
+    def _upsert(self, rows: List[Dict[str, Any]]) -> None:
+        if not rows:
+            return
+        now = datetime.utcnow()
+        rows = [
+            {"run_id": self.run_id, "payload": None, "error": None, **row, "updated_at": now}
+            for row in rows
+        ]
+        stmt = pg_insert(PipelineCheckpoint.__table__)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["run_id", "country_iso_code", "source"],
+            set_={
+                column: stmt.excluded[column]
+                for column in ("status", "payload", "error", "updated_at")
+            },
+        )
+        self.db.execute(stmt, rows)
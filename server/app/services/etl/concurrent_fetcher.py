@@ -0,0 +1,209 @@
+"""
+GOHIP Platform - Concurrent Source Fetcher
+==========================================
+
+Concurrent multi-country fetch engine for the core ETL sources.
+
+Fetches ILO, World Bank and WHO data for many countries in parallel on the
+shared ETL event loop (see loop_runner) instead of walking the country list
+one API call at a time.
+
+Concurrency Model:
+- A fixed pool of country workers pulls ISO codes off a shared work list
+- Each upstream source has its own semaphore, so the number of countries
+  with in-flight requests against ILO, World Bank or WHO stays bounded
+  independently of the others
+- Results are handed back one country at a time in completion order, so the
+  pipeline can persist and report per-country progress while the remaining
+  countries are still being fetched
+
+Usage:
+    fetcher = ConcurrentSourceFetcher(source_concurrency={"ilo": 4})
+    for iso_code, source_data, error in fetcher.iter_results(["DEU", "SAU"]):
+        ...
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from app.services.etl.ilo_client import ILOClient
+from app.services.etl.wb_client import WorldBankClient
+from app.services.etl.who_client import WHOClient
+from app.services.etl.loop_runner import loop_runner
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of countries with in-flight requests per upstream source
+DEFAULT_SOURCE_CONCURRENCY: Dict[str, int] = {
+    "ilo": 8,
+    "worldbank": 8,
+    "who": 8,
+}
+
+# Number of countries being fetched at the same time
+DEFAULT_COUNTRY_WORKERS = 16
+
+# Sentinel marking the end of the result stream
+_DONE = object()
+
+# (iso_code, source_data, error) - source_data is None when error is set
+CountryResult = Tuple[str, Optional[Dict[str, Any]], Optional[str]]
+
+
+class ConcurrentSourceFetcher:
+    """
+    Fetches ILO, World Bank and WHO data for many countries concurrently.
+
+    Each country produces a dict with the same shape the sequential pipeline
+    builds from the sync client wrappers:
+
+        {
+            "ilo": {...} | None,
+            "worldbank": {"gov_effectiveness": {...}, ...},
+            "who": {"uhc_index": {...}, "road_safety": {...}},
+        }
+    """
+
+    def __init__(
+        self,
+        ilo_client: Optional[ILOClient] = None,
+        wb_client: Optional[WorldBankClient] = None,
+        who_client: Optional[WHOClient] = None,
+        source_concurrency: Optional[Dict[str, int]] = None,
+        country_workers: int = DEFAULT_COUNTRY_WORKERS,
+        wb_prefetched: Optional[Dict[str, Dict[str, Any]]] = None,
+        source_plan: Optional[Dict[str, Set[str]]] = None,
+    ):
+        self.ilo_client = ilo_client or ILOClient()
+        self.wb_client = wb_client or WorldBankClient()
+        self.who_client = who_client or WHOClient()
+        self.source_concurrency = {**DEFAULT_SOURCE_CONCURRENCY, **(source_concurrency or {})}
+        self.country_workers = max(1, country_workers)
+        # World Bank results already fetched in bulk mode (skips per-country WB calls)
+        self.wb_prefetched = wb_prefetched
+        # Incremental mode: sources to fetch per country (others are left out)
+        self.source_plan = source_plan
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._stop_event = threading.Event()
+
+    def stop(self) -> None:
+        """Stop handing out new countries; in-flight countries still finish."""
+        self._stop_event.set()
+
+    async def _fetch_source(self, source: str, fetch: Callable, iso_code: str) -> Any:
+        """Run a single source fetch for a country under that source's semaphore."""
+        async with self._semaphores[source]:
+            return await fetch(iso_code)
+
+    async def _prefetched_worldbank(self, iso_code: str) -> Dict[str, Any]:
+        """Return bulk-prefetched World Bank data in place of a per-country fetch."""
+        return self.wb_prefetched.get(iso_code) or {}
+
+    async def _skipped(self) -> None:
+        """Placeholder for a source that is not due in incremental mode."""
+        return None
+
+    async def fetch_country(self, iso_code: str) -> Dict[str, Any]:
+        """
+        Fetch the core sources for one country concurrently.
+
+        In incremental mode only the sources listed in source_plan[iso_code]
+        (plus bulk-prefetched World Bank data) are fetched; the others are
+        left out of the result for the caller to fill in.
+        """
+        wanted = self.source_plan.get(iso_code, set()) if self.source_plan is not None else None
+
+        def fetch(source: str, method: Callable):
+            if wanted is not None and source not in wanted:
+                return self._skipped()
+            return self._fetch_source(source, method, iso_code)
+
+        if self.wb_prefetched is not None:
+            wb_fetch = self._prefetched_worldbank(iso_code)
+        else:
+            wb_fetch = fetch("worldbank", self.wb_client.fetch_all_context_indicators)
+
+        ilo_data, wb_data, who_data = await asyncio.gather(
+            fetch("ilo", self.ilo_client.fetch_fatality_rate),
+            wb_fetch,
+            fetch("who", self.who_client.fetch_all_indicators),
+        )
+        source_data = {
+            "ilo": ilo_data,
+            "worldbank": wb_data or {},
+            "who": who_data or {},
+        }
+        if wanted is not None:
+            fetched = wanted | ({"worldbank"} if self.wb_prefetched is not None else set())
+            source_data = {source: data for source, data in source_data.items() if source in fetched}
+        return source_data
+
+    async def fetch_all(
+        self,
+        iso_codes: List[str],
+        on_result: Callable[[str, Optional[Dict[str, Any]], Optional[str]], None],
+    ) -> None:
+        """
+        Fetch every country in iso_codes with a bounded worker pool.
+
+        Args:
+            iso_codes: ISO Alpha-3 codes to fetch
+            on_result: Called once per country as (iso_code, source_data, error)
+        """
+        # Semaphores must be created on the loop that uses them
+        self._semaphores = {
+            source: asyncio.Semaphore(max(1, limit))
+            for source, limit in self.source_concurrency.items()
+        }
+        pending = list(reversed(iso_codes))
+
+        async def worker() -> None:
+            while pending and not self._stop_event.is_set():
+                iso_code = pending.pop()
+                try:
+                    source_data = await self.fetch_country(iso_code)
+                    on_result(iso_code, source_data, None)
+                except Exception as e:
+                    logger.error(f"Concurrent fetch failed for {iso_code}: {e}")
+                    on_result(iso_code, None, str(e))
+
+        worker_count = min(self.country_workers, len(iso_codes))
+        await asyncio.gather(*(worker() for _ in range(worker_count)))
+
+    def iter_results(self, iso_codes: List[str]) -> Iterator[CountryResult]:
+        """
+        Fetch countries on the shared ETL event loop and yield results as they complete.
+
+        The consumer runs in the calling thread, so database sessions and
+        other thread-bound resources never cross into the fetch loop.
+        Breaking out of the iteration stops the fetcher.
+        """
+        results: "queue.Queue" = queue.Queue()
+
+        def on_done(future) -> None:
+            if not future.cancelled() and future.exception() is not None:
+                logger.error(f"Concurrent fetch engine crashed: {future.exception()}")
+            results.put(_DONE)
+
+        future = loop_runner.submit(self.fetch_all(iso_codes, lambda *result: results.put(result)))
+        future.add_done_callback(on_done)
+
+        try:
+            while True:
+                item = results.get()
+                if item is _DONE:
+                    break
+                yield item
+        finally:
+            self.stop()
+
+    def fetch_all_sync(self, iso_codes: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Fetch every country and return {iso_code: source_data} once all are done."""
+        return {
+            iso_code: source_data
+            for iso_code, source_data, error in self.iter_results(iso_codes)
+            if error is None
+        }
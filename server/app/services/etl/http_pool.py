@@ -0,0 +1,386 @@
+"""
+GOHIP Platform - Shared ETL HTTP Pool
+=====================================
+
+Process-wide, lifecycle-managed HTTP connection pool shared by every ETL
+client (ILO, World Bank, WHO and the intelligence client).
+
+Before this module each indicator request opened its own httpx client, so a
+full 195-country refresh paid a fresh TCP (+TLS) handshake for every
+indicator of every country. All clients now borrow one of two pooled clients:
+
+- get_async_client(): httpx.AsyncClient for the async clients. Async
+  connections belong to the event loop that opened them, so one client is
+  kept per running loop. get_async_client(cached=False) skips the response
+  cache (non-ETL downloads such as flags keep pooling and rate limiting).
+- get_sync_client(): thread-safe httpx.Client for synchronous callers.
+
+Pool Features:
+- Keep-alive connection reuse across countries and indicators
+- HTTP/2 when the optional `h2` package is installed (HTTPS hosts only)
+- Per-host connection limits on top of the global pool limit
+- On-disk response cache with conditional revalidation in front of the
+  pool (see response_cache), so cache hits never open a connection
+- Adaptive per-host token buckets with retry/backoff between the cache and
+  the pool (see rate_limiter)
+- Statistics (requests, TCP connects, TLS handshakes, reuse rate, HTTP
+  versions) exposed via get_pool_stats() and GET /etl/status
+"""
+
+import asyncio
+import importlib.util
+import logging
+import threading
+import weakref
+from collections import Counter
+from typing import Any, Callable, Dict, Optional
+
+import httpx
+
+from app.services.etl.response_cache import (
+    CachingAsyncTransport,
+    CachingSyncTransport,
+    get_cache_stats,
+    response_cache,
+)
+from app.services.etl.rate_limiter import RateLimitedAsyncTransport, RateLimitedSyncTransport
+
+logger = logging.getLogger(__name__)
+
+# Pool Configuration
+POOL_MAX_CONNECTIONS = 100          # Across all hosts
+POOL_MAX_KEEPALIVE = 40             # Idle connections kept open
+POOL_KEEPALIVE_EXPIRY = 60.0        # Seconds an idle connection stays open
+POOL_MAX_CONNECTIONS_PER_HOST = 16  # In-flight requests per upstream host
+POOL_DEFAULT_TIMEOUT = 30.0
+
+DEFAULT_HEADERS = {
+    "User-Agent": "GOHIP-Platform/1.0 (Occupational Health Intelligence)",
+}
+
+# HTTP/2 needs the optional h2 package (pip install httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+# =============================================================================
+# POOL STATISTICS
+# =============================================================================
+
+class PoolStats:
+    """Thread-safe counters for pooled ETL traffic."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._clients_created = 0
+            self._requests = 0
+            self._errors = 0
+            self._tcp_connects = 0
+            self._tls_handshakes = 0
+            self._http_versions: Counter = Counter()
+            self._hosts: Dict[str, Dict[str, int]] = {}
+
+    def _host(self, host: str) -> Dict[str, int]:
+        if host not in self._hosts:
+            self._hosts[host] = {"requests": 0, "tcp_connects": 0, "tls_handshakes": 0, "errors": 0}
+        return self._hosts[host]
+
+    def client_created(self) -> None:
+        with self._lock:
+            self._clients_created += 1
+
+    def request(self, host: str) -> None:
+        with self._lock:
+            self._requests += 1
+            self._host(host)["requests"] += 1
+
+    def error(self, host: str) -> None:
+        with self._lock:
+            self._errors += 1
+            self._host(host)["errors"] += 1
+
+    def response(self, http_version: Optional[bytes]) -> None:
+        if http_version:
+            with self._lock:
+                self._http_versions[http_version.decode("ascii", "replace")] += 1
+
+    def trace(self, host: str, event_name: str) -> None:
+        """Record connection-level events reported by httpcore's trace extension."""
+        if event_name.endswith("connect_tcp.complete"):
+            with self._lock:
+                self._tcp_connects += 1
+                self._host(host)["tcp_connects"] += 1
+        elif event_name.endswith("start_tls.complete"):
+            with self._lock:
+                self._tls_handshakes += 1
+                self._host(host)["tls_handshakes"] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            reuse_rate = None
+            if self._requests:
+                reuse_rate = round(1 - (self._tcp_connects / self._requests), 3)
+            return {
+                "http2_enabled": HTTP2_AVAILABLE,
+                "clients_created": self._clients_created,
+                "requests": self._requests,
+                "errors": self._errors,
+                "tcp_connects": self._tcp_connects,
+                "tls_handshakes": self._tls_handshakes,
+                "connection_reuse_rate": reuse_rate,
+                "http_versions": dict(self._http_versions),
+                "hosts": {host: counts.copy() for host, counts in self._hosts.items()},
+                "limits": {
+                    "max_connections": POOL_MAX_CONNECTIONS,
+                    "max_keepalive_connections": POOL_MAX_KEEPALIVE,
+                    "max_connections_per_host": POOL_MAX_CONNECTIONS_PER_HOST,
+                },
+            }
+
+
+pool_stats = PoolStats()
+
+
+# =============================================================================
+# INSTRUMENTED TRANSPORTS
+# =============================================================================
+
+class _ReleasingAsyncStream(httpx.AsyncByteStream):
+    """Response body stream that releases the per-host slot once closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+
+class _ReleasingSyncStream(httpx.SyncByteStream):
+    """Sync counterpart of _ReleasingAsyncStream."""
+
+    def __init__(self, stream: httpx.SyncByteStream, release: Callable[[], None]):
+        self._stream = stream
+        self._release = release
+
+    def __iter__(self):
+        for chunk in self._stream:
+            yield chunk
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._release()
+
+
+def _release_once(semaphore) -> Callable[[], None]:
+    """Build an idempotent release callback for a host semaphore."""
+    released = False
+
+    def release() -> None:
+        nonlocal released
+        if not released:
+            released = True
+            semaphore.release()
+
+    return release
+
+
+class PooledAsyncTransport(httpx.AsyncBaseTransport):
+    """
+    Wraps httpx.AsyncHTTPTransport with per-host limits and statistics.
+
+    A host slot is held from request start until the response body is
+    closed, so the limit counts connections actually in use.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, per_host_limit: int = POOL_MAX_CONNECTIONS_PER_HOST):
+        self._transport = transport
+        self._per_host_limit = per_host_limit
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        semaphore = self._host_slots.setdefault(host, asyncio.Semaphore(self._per_host_limit))
+
+        async def trace(event_name: str, info: Dict[str, Any]) -> None:
+            pool_stats.trace(host, event_name)
+
+        request.extensions = {**request.extensions, "trace": trace}
+        pool_stats.request(host)
+
+        await semaphore.acquire()
+        release = _release_once(semaphore)
+        try:
+            response = await self._transport.handle_async_request(request)
+        except Exception:
+            release()
+            pool_stats.error(host)
+            raise
+
+        pool_stats.response(response.extensions.get("http_version"))
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingAsyncStream(response.stream, release),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class PooledSyncTransport(httpx.BaseTransport):
+    """Sync counterpart of PooledAsyncTransport (thread-safe host limits)."""
+
+    def __init__(self, transport: httpx.BaseTransport, per_host_limit: int = POOL_MAX_CONNECTIONS_PER_HOST):
+        self._transport = transport
+        self._per_host_limit = per_host_limit
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._slots_lock = threading.Lock()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        with self._slots_lock:
+            semaphore = self._host_slots.setdefault(host, threading.BoundedSemaphore(self._per_host_limit))
+
+        def trace(event_name: str, info: Dict[str, Any]) -> None:
+            pool_stats.trace(host, event_name)
+
+        request.extensions = {**request.extensions, "trace": trace}
+        pool_stats.request(host)
+
+        semaphore.acquire()
+        release = _release_once(semaphore)
+        try:
+            response = self._transport.handle_request(request)
+        except Exception:
+            release()
+            pool_stats.error(host)
+            raise
+
+        pool_stats.response(response.extensions.get("http_version"))
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingSyncStream(response.stream, release),
+            extensions=response.extensions,
+        )
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+# =============================================================================
+# POOLED CLIENTS
+# =============================================================================
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=POOL_MAX_CONNECTIONS,
+        max_keepalive_connections=POOL_MAX_KEEPALIVE,
+        keepalive_expiry=POOL_KEEPALIVE_EXPIRY,
+    )
+
+
+def _create_async_client(cached: bool = True) -> httpx.AsyncClient:
+    transport = httpx.AsyncHTTPTransport(http2=HTTP2_AVAILABLE, limits=_limits(), retries=1)
+    pool_stats.client_created()
+    limited = RateLimitedAsyncTransport(PooledAsyncTransport(transport))
+    return httpx.AsyncClient(
+        transport=CachingAsyncTransport(limited, response_cache) if cached else limited,
+        timeout=POOL_DEFAULT_TIMEOUT,
+        headers=DEFAULT_HEADERS,
+        follow_redirects=True,
+    )
+
+
+def _create_sync_client() -> httpx.Client:
+    transport = httpx.HTTPTransport(http2=HTTP2_AVAILABLE, limits=_limits(), retries=1)
+    pool_stats.client_created()
+    return httpx.Client(
+        transport=CachingSyncTransport(
+            RateLimitedSyncTransport(PooledSyncTransport(transport)),
+            response_cache,
+        ),
+        timeout=POOL_DEFAULT_TIMEOUT,
+        headers=DEFAULT_HEADERS,
+        follow_redirects=True,
+    )
+
+
+_lock = threading.Lock()
+_sync_client: Optional[httpx.Client] = None
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_uncached_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def get_async_client(cached: bool = True) -> httpx.AsyncClient:
+    """
+    Get the pooled AsyncClient for the running event loop.
+
+    cached=False returns a client without the response cache (same pooling
+    and per-host rate limiting), for requests that are not ETL payloads.
+
+    Must be called from inside a coroutine. Do not close the returned
+    client; use close_pools() / aclose_async_client() at shutdown.
+    """
+    loop = asyncio.get_running_loop()
+    clients = _async_clients if cached else _uncached_async_clients
+    with _lock:
+        client = clients.get(loop)
+        if client is None or client.is_closed:
+            client = _create_async_client(cached)
+            clients[loop] = client
+        return client
+
+
+def get_sync_client() -> httpx.Client:
+    """Get the process-wide pooled httpx.Client (safe to share across threads)."""
+    global _sync_client
+    with _lock:
+        if _sync_client is None or _sync_client.is_closed:
+            _sync_client = _create_sync_client()
+        return _sync_client
+
+
+async def aclose_async_client() -> None:
+    """Close the pooled AsyncClients bound to the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        clients = [_async_clients.pop(loop, None), _uncached_async_clients.pop(loop, None)]
+    for client in clients:
+        if client is not None:
+            await client.aclose()
+
+
+def close_pools() -> None:
+    """Close the sync pool and drop async pools (called on application shutdown)."""
+    global _sync_client
+    with _lock:
+        client, _sync_client = _sync_client, None
+        _async_clients.clear()
+        _uncached_async_clients.clear()
+    if client is not None:
+        client.close()
+
+
+def get_pool_stats() -> Dict[str, Any]:
+    """Current pool statistics for GET /etl/status."""
+    stats = pool_stats.snapshot()
+    with _lock:
+        stats["active_async_pools"] = len(_async_clients) + len(_uncached_async_clients)
+        stats["sync_pool_open"] = _sync_client is not None and not _sync_client.is_closed
+    stats["response_cache"] = get_cache_stats()
+    return stats
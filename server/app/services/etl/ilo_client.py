@@ -16,17 +16,17 @@ Features:
 """
 
 import logging
-import asyncio
 from typing import Dict, Optional
 from datetime import datetime
 
-import httpx
-
 from app.data.targets import GLOBAL_ECONOMIES_50, get_country_name
+from app.services.etl.http_pool import get_async_client
+from app.services.etl.loop_runner import run_sync
 
 logger = logging.getLogger(__name__)
 
 # ILO API Configuration
+ILO_BASE_URL = "https://www.ilo.org/sdmx/rest"
 ILO_TIMEOUT = 30.0
 
 # Reference fatality rates from official sources when API is unavailable
@@ -213,6 +213,7 @@ class ILOClient:
     """
     
     def __init__(self, timeout: float = ILO_TIMEOUT):
+        self.base_url = ILO_BASE_URL
         self.timeout = timeout
         self.target_countries = GLOBAL_ECONOMIES_50
         self.reference_data = REFERENCE_FATALITY_RATES
@@ -228,25 +229,26 @@ class ILOClient:
             Dict with value, year, source or None if unavailable
         """
         # Try the SDMX API
-        url = f"https://www.ilo.org/sdmx/rest/data/ILO,DF_SDG_0881_SEX_MIG_RT_A/{country_code}.SEX_T.."
+        url = f"{self.base_url}/data/ILO,DF_SDG_0881_SEX_MIG_RT_A/{country_code}.SEX_T.."
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
-                response = await client.get(
-                    url,
-                    headers={"Accept": "application/vnd.sdmx.data+json;version=1.0.0"}
-                )
-                
-                if response.status_code == 404:
-                    return None
-                
-                if response.status_code != 200:
-                    logger.debug(f"ILO API returned status {response.status_code} for {country_code}")
-                    return None
-                
-                data = response.json()
-                return self._parse_sdmx_response(data, country_code)
-                
+            client = get_async_client()
+            response = await client.get(
+                url,
+                headers={"Accept": "application/vnd.sdmx.data+json;version=1.0.0"},
+                timeout=self.timeout,
+            )
+            
+            if response.status_code == 404:
+                return None
+            
+            if response.status_code != 200:
+                logger.debug(f"ILO API returned status {response.status_code} for {country_code}")
+                return None
+            
+            data = response.json()
+            return self._parse_sdmx_response(data, country_code)
+            
         except Exception as e:
             logger.debug(f"ILO API error for {country_code}: {e}")
             return None
@@ -404,19 +406,7 @@ class ILOClient:
         Returns:
             Dict with value, year, source or None if unavailable
         """
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = None
-        
-        if loop and loop.is_running():
-            # We're in an async context, create a new thread
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                future = pool.submit(asyncio.run, self.fetch_fatality_rate(country_code))
-                return future.result()
-        else:
-            return asyncio.run(self.fetch_fatality_rate(country_code))
+        return run_sync(self.fetch_fatality_rate(country_code))
     
     async def fetch_all_fatality_rates(self) -> Dict[str, dict]:
         """
@@ -446,19 +436,7 @@ def fetch_fatality_rates_sync() -> Dict[str, dict]:
     Use this in non-async contexts like standalone scripts.
     """
     client = ILOClient()
-    
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop = None
-    
-    if loop and loop.is_running():
-        import concurrent.futures
-        with concurrent.futures.ThreadPoolExecutor() as pool:
-            future = pool.submit(asyncio.run, client.fetch_all_fatality_rates())
-            return future.result()
-    else:
-        return asyncio.run(client.fetch_all_fatality_rates())
+    return run_sync(client.fetch_all_fatality_rates())
 
 
 if __name__ == "__main__":
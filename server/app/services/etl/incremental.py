@@ -0,0 +1,343 @@
+"""
+GOHIP Platform - Incremental ETL Refresh
+========================================
+
+Decides, per country and per upstream source, whether a refresh is due, so
+a nightly run only touches countries with stale or new data instead of
+sweeping all 195 countries and every source.
+
+Refresh State:
+    CountryIntelligence already carries last_ilostat_update,
+    last_worldbank_update and last_who_update. In addition, the last payload
+    fetched from each core source, the data year it reported and a
+    fingerprint of the scoring inputs are kept under
+    CountryIntelligence.data_sources["refresh_state"]:
+
+        {
+            "sources": {
+                "ilo":       {"year": 2022, "fetched_at": "...", "data": {...}},
+                "worldbank": {"year": 2023, "fetched_at": "...", "data": {...}},
+                "who":       {"year": 2021, "fetched_at": "...", "data": {...}},
+            },
+            "inputs_fingerprint": "sha256...",
+            "scored_at": "...",
+        }
+
+A source is due for a country when:
+- it has never been fetched for that country
+- its last fetch is older than the staleness policy for that source
+- upstream metadata reports a newer data year than the one stored, or a
+  revised value (World Bank: probed for all countries at once with the
+  bulk /country/all/ endpoint; ILO and WHO publish no cheap per-country
+  metadata, so they rely on the staleness policy)
+
+Sources that are not due reuse their stored payload, and a country whose
+scoring inputs fingerprint is unchanged keeps its existing scores.
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy.orm import Session
+
+from app.models.country import CountryIntelligence
+from app.services.etl.intelligence_client import get_cpi_data, get_hdi_data, get_epi_data
+from app.data.intelligence_reference import get_ihme_gbd_data, get_wjp_data, get_oecd_data
+
+logger = logging.getLogger(__name__)
+
+# Core network sources, in the key names used by the pipeline's source_data
+CORE_SOURCES = ("ilo", "worldbank", "who")
+
+# CountryIntelligence freshness column per core source
+SOURCE_TIMESTAMP_FIELDS: Dict[str, str] = {
+    "ilo": "last_ilostat_update",
+    "worldbank": "last_worldbank_update",
+    "who": "last_who_update",
+}
+
+# Maximum age before a source is refetched regardless of upstream metadata
+STALENESS_POLICY: Dict[str, timedelta] = {
+    "ilo": timedelta(days=30),
+    "worldbank": timedelta(days=30),
+    "who": timedelta(days=30),
+}
+
+REFRESH_STATE_KEY = "refresh_state"
+
+
+def source_data_year(source: str, payload: Optional[Dict[str, Any]]) -> Optional[int]:
+    """Most recent data year reported by a core source payload."""
+    if not payload:
+        return None
+    if source == "ilo":
+        candidates = [payload.get("year")]
+    else:
+        candidates = [item.get("year") for item in payload.values() if isinstance(item, dict)]
+    years = []
+    for year in candidates:
+        try:
+            years.append(int(year))
+        except (TypeError, ValueError):
+            continue
+    return max(years) if years else None
+
+
+def reference_inputs(iso_code: str) -> Dict[str, Any]:
+    """Bundled reference data that feeds scoring (changes only with a deploy)."""
+    return {
+        "cpi": get_cpi_data(iso_code),
+        "hdi": get_hdi_data(iso_code),
+        "epi": get_epi_data(iso_code),
+        "gbd": get_ihme_gbd_data(iso_code),
+        "wjp": get_wjp_data(iso_code),
+        "oecd": get_oecd_data(iso_code),
+    }
+
+
+def _payload_values(payload: Any) -> Any:
+    """Strip fetch metadata (source URLs, labels) from a source payload."""
+    if isinstance(payload, dict):
+        return {
+            key: _payload_values(value)
+            for key, value in payload.items()
+            if key not in ("source", "source_name", "fetched_at", "sources_used")
+        }
+    return payload
+
+
+def _canonical(payload: Any) -> str:
+    return json.dumps(_payload_values(payload), sort_keys=True, default=str)
+
+
+def inputs_fingerprint(iso_code: str, source_data: Dict[str, Any]) -> str:
+    """
+    Stable hash of every input that feeds a country's scores.
+
+    Covers the core ILO/WB/WHO values, the World Bank extended indicators (when
+    present) and the bundled reference datasets. Fetch metadata such as
+    source URLs is ignored.
+    """
+    material = {
+        "core": {source: _payload_values(source_data.get(source)) for source in CORE_SOURCES},
+        "worldbank_extended": _payload_values(source_data.get("worldbank_extended")),
+        "reference": reference_inputs(iso_code),
+    }
+    encoded = json.dumps(material, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def intelligence_fingerprint(iso_code: str, wb_extended: Optional[Dict[str, Any]]) -> str:
+    """Stable hash of the IntelligencePipeline inputs (WB extended + reference data)."""
+    material = {
+        "worldbank_extended": _payload_values(wb_extended),
+        "reference": reference_inputs(iso_code),
+    }
+    encoded = json.dumps(material, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+@dataclass
+class RefreshPlan:
+    """What needs refreshing for one country."""
+    iso_code: str
+    due_sources: Set[str] = field(default_factory=set)
+    reasons: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def is_due(self) -> bool:
+        return bool(self.due_sources)
+
+
+@dataclass
+class RefreshUpdate:
+    """Refresh state and last_*_update values to persist for one country."""
+    state: Dict[str, Any]
+    timestamps: Dict[str, datetime] = field(default_factory=dict)
+
+
+class IncrementalPlanner:
+    """
+    Builds refresh plans from CountryIntelligence freshness data and the
+    refresh state to persist once a country has been processed.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        staleness: Optional[Dict[str, timedelta]] = None,
+        now: Optional[datetime] = None,
+    ):
+        self.db = db
+        self.staleness = {**STALENESS_POLICY, **(staleness or {})}
+        self.now = now or datetime.utcnow()
+        # iso_code -> freshness snapshot (None = no intelligence record). Plain
+        # dicts, so commits elsewhere on the session do not trigger reloads
+        self._snapshots: Dict[str, Optional[Dict[str, Any]]] = {}
+
+    # -------------------------------------------------------------------------
+    # State access
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _snapshot(record: Optional[CountryIntelligence]) -> Optional[Dict[str, Any]]:
+        if record is None:
+            return None
+        return {
+            "timestamps": {
+                source: getattr(record, column) for source, column in SOURCE_TIMESTAMP_FIELDS.items()
+            },
+            "state": (record.data_sources or {}).get(REFRESH_STATE_KEY) or {},
+        }
+
+    def load(self, iso_codes: Iterable[str]) -> None:
+        """Load freshness data for all countries in one query."""
+        iso_codes = list(iso_codes)
+        records = self.db.query(CountryIntelligence).filter(
+            CountryIntelligence.country_iso_code.in_(iso_codes)
+        ).all()
+        by_iso = {record.country_iso_code: record for record in records}
+        for iso_code in iso_codes:
+            self._snapshots[iso_code] = self._snapshot(by_iso.get(iso_code))
+
+    def _record(self, iso_code: str) -> Optional[Dict[str, Any]]:
+        if iso_code not in self._snapshots:
+            self._snapshots[iso_code] = self._snapshot(self.db.query(CountryIntelligence).filter(
+                CountryIntelligence.country_iso_code == iso_code
+            ).first())
+        return self._snapshots[iso_code]
+
+    def state(self, iso_code: str) -> Dict[str, Any]:
+        record = self._record(iso_code)
+        return record["state"] if record else {}
+
+    def previous_fingerprint(self, iso_code: str) -> Optional[str]:
+        return self.state(iso_code).get("inputs_fingerprint")
+
+    # -------------------------------------------------------------------------
+    # Planning
+    # -------------------------------------------------------------------------
+
+    def plan(
+        self,
+        iso_codes: List[str],
+        upstream_years: Optional[Dict[str, Dict[str, Optional[int]]]] = None,
+        upstream_data: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> Dict[str, RefreshPlan]:
+        """
+        Decide which core sources are due for each country.
+
+        Args:
+            iso_codes: Countries to consider
+            upstream_years: Optional {iso_code: {source: latest_year}} reported
+                by upstream metadata probes (e.g. probe_worldbank_years)
+            upstream_data: Optional {iso_code: {source: payload}} already
+                fetched cheaply (bulk mode); a differing value marks the
+                source due even when the year is unchanged
+
+        Returns:
+            Dict mapping ISO code to its RefreshPlan
+        """
+        self.load(iso_codes)
+        upstream_years = upstream_years or {}
+        upstream_data = upstream_data or {}
+        plans: Dict[str, RefreshPlan] = {}
+
+        for iso_code in iso_codes:
+            plan = RefreshPlan(iso_code)
+            record = self._record(iso_code)
+            stored_sources = self.state(iso_code).get("sources", {})
+
+            for source in CORE_SOURCES:
+                last_update = record["timestamps"][source] if record else None
+                stored = stored_sources.get(source)
+                upstream_year = upstream_years.get(iso_code, {}).get(source)
+                upstream_payload = upstream_data.get(iso_code, {}).get(source)
+
+                if last_update is None or stored is None:
+                    reason = "never fetched"
+                elif self.now - last_update > self.staleness[source]:
+                    reason = f"stale ({(self.now - last_update).days}d old)"
+                elif upstream_year is not None and upstream_year > (stored.get("year") or 0):
+                    reason = f"new upstream data ({upstream_year})"
+                elif upstream_payload is not None and _canonical(upstream_payload) != _canonical(stored.get("data")):
+                    reason = "upstream revision"
+                else:
+                    continue
+
+                plan.due_sources.add(source)
+                plan.reasons[source] = reason
+
+            plans[iso_code] = plan
+
+        due = sum(1 for plan in plans.values() if plan.is_due)
+        logger.info(f"Incremental plan: {due}/{len(iso_codes)} countries due for refresh")
+        return plans
+
+    def stored_source_data(self, iso_code: str) -> Dict[str, Any]:
+        """Last fetched payload per core source (for sources that are not due)."""
+        stored_sources = self.state(iso_code).get("sources", {})
+        return {source: (stored_sources.get(source) or {}).get("data") for source in CORE_SOURCES}
+
+    # -------------------------------------------------------------------------
+    # Refresh state
+    # -------------------------------------------------------------------------
+
+    def refresh_update(
+        self,
+        iso_code: str,
+        source_data: Dict[str, Any],
+        fetched_sources: Iterable[str],
+        fingerprint: str,
+        scored: bool,
+        fetched_at: Optional[Dict[str, datetime]] = None,
+    ) -> RefreshUpdate:
+        """
+        Build the refresh state and freshness timestamps for a country.
+
+        fetched_at gives the fetch time of sources that were not fetched
+        just now (checkpointed by an earlier attempt of a resumed run);
+        the others are stamped with the current time.
+
+        Nothing is written here: the update is handed to the bulk writer so
+        it commits in the same transaction as the country's scores.
+        """
+        now = datetime.utcnow()
+        fetched_at = fetched_at or {}
+        state = dict(self.state(iso_code))
+        sources = dict(state.get("sources") or {})
+        timestamps: Dict[str, datetime] = {}
+
+        for source in fetched_sources:
+            payload = source_data.get(source)
+            source_fetched_at = fetched_at.get(source) or now
+            sources[source] = {
+                "year": source_data_year(source, payload),
+                "fetched_at": source_fetched_at.isoformat(),
+                "data": payload,
+            }
+            timestamps[SOURCE_TIMESTAMP_FIELDS[source]] = source_fetched_at
+
+        state["sources"] = sources
+        state["inputs_fingerprint"] = fingerprint
+        if scored:
+            state["scored_at"] = now.isoformat()
+        return RefreshUpdate(state=state, timestamps=timestamps)
+
+
+def probe_worldbank_years(wb_prefetched: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Optional[int]]]:
+    """
+    Latest World Bank data year per country from a bulk prefetch.
+
+    The bulk /country/all/ fetch (a handful of paged requests) doubles as the
+    upstream metadata probe: its most-recent-value-per-country records carry
+    the year, which is compared with the year stored at the last refresh.
+    """
+    return {
+        iso_code: {"worldbank": source_data_year("worldbank", data)}
+        for iso_code, data in wb_prefetched.items()
+    }
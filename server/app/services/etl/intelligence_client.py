@@ -20,14 +20,14 @@ Note: Some sources don't have public APIs, so we use:
 """
 
 import logging
-import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
+
 import httpx
 
-logger = logging.getLogger(__name__)
+from app.services.etl.http_pool import get_sync_client
+from app.services.etl.wb_client import WB_BULK_PER_PAGE, BulkFetchIncompleteError, fold_bulk_records
 
-# Rate limiting - reduced for faster processing
-RATE_LIMIT_DELAY = 0.05  # 50ms between calls
+logger = logging.getLogger(__name__)
 
 # Complete ISO3 to ISO2 mapping for all 195 countries
 ISO3_TO_ISO2_WB: Dict[str, str] = {
@@ -73,6 +73,43 @@ ISO3_TO_ISO2_WB: Dict[str, str] = {
 }
 
 
+# World Bank extended indicator sets, keyed by the tag recorded in sources_used
+WB_INDICATOR_GROUPS: Dict[str, Dict[str, str]] = {
+    "WB_GOVERNANCE": {
+        "government_effectiveness": "GE.EST",
+        "regulatory_quality": "RQ.EST",
+        "rule_of_law_wb": "RL.EST",
+        "control_of_corruption_wb": "CC.EST",
+        "political_stability": "PV.EST",
+        "voice_accountability": "VA.EST",
+    },
+    "WB_ECONOMIC": {
+        "gdp_per_capita_ppp": "NY.GDP.PCAP.PP.CD",
+        "gdp_growth_rate": "NY.GDP.MKTP.KD.ZG",
+        "industry_pct_gdp": "NV.IND.TOTL.ZS",
+        "manufacturing_pct_gdp": "NV.IND.MANF.ZS",
+        "services_pct_gdp": "NV.SRV.TOTL.ZS",
+        "agriculture_pct_gdp": "NV.AGR.TOTL.ZS",
+    },
+    "WB_LABOR": {
+        "labor_force_participation": "SL.TLF.CACT.ZS",
+        "unemployment_rate": "SL.UEM.TOTL.ZS",
+        "youth_unemployment_rate": "SL.UEM.1524.ZS",
+        "informal_employment_pct": "SL.ISV.IFRM.ZS",
+    },
+    "WB_HEALTH": {
+        "health_expenditure_gdp_pct": "SH.XPD.CHEX.GD.ZS",
+        "health_expenditure_per_capita": "SH.XPD.CHEX.PC.CD",
+        "out_of_pocket_health_pct": "SH.XPD.OOPC.CH.ZS",
+        "life_expectancy_at_birth": "SP.DYN.LE00.IN",
+    },
+    "WB_POPULATION": {
+        "population_total": "SP.POP.TOTL",
+        "urban_population_pct": "SP.URB.TOTL.IN.ZS",
+    },
+}
+
+
 class IntelligenceClient:
     """
     Unified client for fetching intelligence data from multiple sources.
@@ -118,33 +155,126 @@ class IntelligenceClient:
         url = f"{self.base_urls['worldbank']}/country/{iso2}/indicator/{indicator}?format=json&date=2018:2023&per_page=10"
         
         try:
-            with httpx.Client(timeout=self.timeout, headers=self.headers) as client:
-                response = client.get(url)
-                
-                if response.status_code != 200:
-                    return None
-                
-                data = response.json()
-                
-                if not data or len(data) < 2 or not data[1]:
-                    return None
-                
-                # Get most recent non-null value
-                for entry in data[1]:
-                    if entry.get("value") is not None:
-                        return {
-                            "value": entry["value"],
-                            "year": entry.get("date"),
-                            "indicator": indicator,
-                            "source": f"https://data.worldbank.org/indicator/{indicator}"
-                        }
-                
+            client = get_sync_client()
+            response = client.get(url, headers=self.headers, timeout=self.timeout)
+            
+            if response.status_code != 200:
+                return None
+            
+            data = response.json()
+            
+            if not data or len(data) < 2 or not data[1]:
                 return None
-                
+            
+            # Get most recent non-null value
+            for entry in data[1]:
+                if entry.get("value") is not None:
+                    return {
+                        "value": entry["value"],
+                        "year": entry.get("date"),
+                        "indicator": indicator,
+                        "source": f"https://data.worldbank.org/indicator/{indicator}"
+                    }
+            
+            return None
+            
         except Exception as e:
             logger.debug(f"WB indicator {indicator} for {iso_code}: {e}")
             return None
     
+    def fetch_wb_indicator_bulk_sync(
+        self,
+        indicator: str,
+        country_codes: Optional[List[str]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch a World Bank indicator for all countries with paged /country/all/ requests.
+        
+        Each page is folded into the per-country results as it arrives and
+        then discarded, keeping the most recent non-null value per country.
+        
+        Args:
+            indicator: World Bank indicator code (e.g., 'NY.GDP.PCAP.PP.CD')
+            country_codes: Optional ISO Alpha-3 codes to keep (default: all countries)
+            
+        Returns:
+            Dict mapping ISO Alpha-3 code to the same dict shape as fetch_wb_indicator_sync
+            
+        Raises:
+            BulkFetchIncompleteError: a page could not be fetched; partial
+                results are never returned, so callers can fall back to
+                per-country fetches
+        """
+        url = f"{self.base_urls['worldbank']}/country/all/indicator/{indicator}"
+        params = {"format": "json", "date": "2018:2023", "per_page": WB_BULK_PER_PAGE}
+        wanted = set(country_codes) if country_codes else None
+        latest: Dict[str, dict] = {}
+        
+        client = get_sync_client()
+        page, total_pages = 1, 1
+        while page <= total_pages:
+            try:
+                response = client.get(url, params={**params, "page": page}, headers=self.headers, timeout=self.timeout)
+                response.raise_for_status()
+                data = response.json()
+            except (httpx.HTTPError, ValueError) as e:
+                raise BulkFetchIncompleteError(f"WB bulk indicator {indicator}: page {page} failed: {e!r}") from e
+            
+            # World Bank errors come back as 200 with a single message object
+            if not isinstance(data, list) or len(data) < 2:
+                raise BulkFetchIncompleteError(f"WB bulk indicator {indicator}: page {page} returned {data!r:.200}")
+            
+            total_pages = int(data[0].get("pages") or 1)
+            fold_bulk_records(data[1], latest, wanted)
+            page += 1
+        
+        return {
+            iso_code: {
+                "value": record["value"],
+                "year": str(record["year"]),
+                "indicator": indicator,
+                "source": f"https://data.worldbank.org/indicator/{indicator}"
+            }
+            for iso_code, record in latest.items()
+        }
+    
+    def fetch_all_intelligence_bulk(self, iso_codes: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch every World Bank extended indicator for many countries in bulk mode.
+        
+        Issues one paged request set per indicator (governance, economic,
+        labor, health and population sets) instead of one request per
+        country per indicator.
+        
+        Args:
+            iso_codes: ISO Alpha-3 country codes
+            
+        Returns:
+            Dict mapping ISO Alpha-3 code to the same dict shape as fetch_all_intelligence
+            
+        Raises:
+            BulkFetchIncompleteError: an indicator could not be fetched completely
+        """
+        results = {
+            iso_code: {"iso_code": iso_code, "sources_used": []}
+            for iso_code in iso_codes
+        }
+        
+        for source_tag, indicators in WB_INDICATOR_GROUPS.items():
+            group_hits = set()
+            for field, indicator in indicators.items():
+                by_country = self.fetch_wb_indicator_bulk_sync(indicator, iso_codes)
+                for iso_code, data in by_country.items():
+                    results[iso_code][field] = data["value"]
+                    group_hits.add(iso_code)
+            
+            for iso_code in group_hits:
+                results[iso_code]["sources_used"].append(source_tag)
+            
+            logger.info(f"WB bulk {source_tag}: {len(group_hits)}/{len(iso_codes)} countries")
+        
+        return results
+    
     def fetch_governance_indicators(self, iso_code: str, skip_api: bool = False) -> Dict[str, Any]:
         """
         Fetch World Bank Worldwide Governance Indicators.
@@ -158,18 +288,10 @@ class IntelligenceClient:
         if skip_api:
             return {}
             
-        indicators = {
-            "government_effectiveness": "GE.EST",
-            "regulatory_quality": "RQ.EST",
-            "rule_of_law_wb": "RL.EST",
-            "control_of_corruption_wb": "CC.EST",
-            "political_stability": "PV.EST",
-            "voice_accountability": "VA.EST",
-        }
+        indicators = WB_INDICATOR_GROUPS["WB_GOVERNANCE"]
         
         results = {}
         for field, indicator in indicators.items():
-            time.sleep(RATE_LIMIT_DELAY)
             data = self.fetch_wb_indicator_sync(iso_code, indicator)
             if data:
                 results[field] = data["value"]
@@ -187,18 +309,10 @@ class IntelligenceClient:
         if skip_api:
             return {}
             
-        indicators = {
-            "gdp_per_capita_ppp": "NY.GDP.PCAP.PP.CD",
-            "gdp_growth_rate": "NY.GDP.MKTP.KD.ZG",
-            "industry_pct_gdp": "NV.IND.TOTL.ZS",
-            "manufacturing_pct_gdp": "NV.IND.MANF.ZS",
-            "services_pct_gdp": "NV.SRV.TOTL.ZS",
-            "agriculture_pct_gdp": "NV.AGR.TOTL.ZS",
-        }
+        indicators = WB_INDICATOR_GROUPS["WB_ECONOMIC"]
         
         results = {}
         for field, indicator in indicators.items():
-            time.sleep(RATE_LIMIT_DELAY)
             data = self.fetch_wb_indicator_sync(iso_code, indicator)
             if data:
                 results[field] = data["value"]
@@ -216,16 +330,10 @@ class IntelligenceClient:
         if skip_api:
             return {}
             
-        indicators = {
-            "labor_force_participation": "SL.TLF.CACT.ZS",
-            "unemployment_rate": "SL.UEM.TOTL.ZS",
-            "youth_unemployment_rate": "SL.UEM.1524.ZS",
-            "informal_employment_pct": "SL.ISV.IFRM.ZS",
-        }
+        indicators = WB_INDICATOR_GROUPS["WB_LABOR"]
         
         results = {}
         for field, indicator in indicators.items():
-            time.sleep(RATE_LIMIT_DELAY)
             data = self.fetch_wb_indicator_sync(iso_code, indicator)
             if data:
                 results[field] = data["value"]
@@ -243,16 +351,10 @@ class IntelligenceClient:
         if skip_api:
             return {}
             
-        indicators = {
-            "health_expenditure_gdp_pct": "SH.XPD.CHEX.GD.ZS",
-            "health_expenditure_per_capita": "SH.XPD.CHEX.PC.CD",
-            "out_of_pocket_health_pct": "SH.XPD.OOPC.CH.ZS",
-            "life_expectancy_at_birth": "SP.DYN.LE00.IN",
-        }
+        indicators = WB_INDICATOR_GROUPS["WB_HEALTH"]
         
         results = {}
         for field, indicator in indicators.items():
-            time.sleep(RATE_LIMIT_DELAY)
             data = self.fetch_wb_indicator_sync(iso_code, indicator)
             if data:
                 results[field] = data["value"]
@@ -270,14 +372,10 @@ class IntelligenceClient:
         if skip_api:
             return {}
             
-        indicators = {
-            "population_total": "SP.POP.TOTL",
-            "urban_population_pct": "SP.URB.TOTL.IN.ZS",
-        }
+        indicators = WB_INDICATOR_GROUPS["WB_POPULATION"]
         
         results = {}
         for field, indicator in indicators.items():
-            time.sleep(RATE_LIMIT_DELAY)
             data = self.fetch_wb_indicator_sync(iso_code, indicator)
             if data:
                 results[field] = data["value"]
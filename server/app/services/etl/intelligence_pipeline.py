@@ -16,23 +16,43 @@ Orchestrates the collection and storage of deep intelligence data from:
 
 import logging
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from uuid import uuid4
 
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
 from app.models.country import CountryIntelligence, Country
+from app.services.country_snapshot import mark_stale
 from app.services.etl.intelligence_client import (
     IntelligenceClient,
     get_cpi_data,
     get_hdi_data,
     get_epi_data,
 )
+from app.services.etl.wb_client import BulkFetchIncompleteError
 from app.data.intelligence_reference import (
     get_ihme_gbd_data,
     get_wjp_data,
     get_oecd_data,
 )
+from app.services.etl.incremental import (
+    REFRESH_STATE_KEY,
+    STALENESS_POLICY,
+    intelligence_fingerprint,
+)
+from app.services.etl.intelligence_scoring import (
+    DEFAULT_CHUNK_SIZE,
+    SCORE_FIELDS,
+    compute_governance_score,
+    compute_hazard_score,
+    compute_intelligence_scores,
+    compute_overall_score,
+    compute_restoration_score,
+    compute_vigilance_score,
+    score_countries,
+    scoring_inputs,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +82,7 @@ class IntelligencePipeline:
             "gbd_hits": 0,
             "wjp_hits": 0,
             "oecd_hits": 0,
+            "unchanged": 0,
             "errors": [],
         }
     
@@ -84,12 +105,28 @@ class IntelligencePipeline:
         
         return intel
     
-    def process_country(self, iso_code: str) -> Dict[str, Any]:
+    @staticmethod
+    def _inputs_unchanged(intel: Optional[CountryIntelligence], fingerprint: str) -> bool:
+        """
+        True when the stored scores were computed from identical inputs and
+        the World Bank data is still within the staleness policy.
+        """
+        if not intel or intel.overall_intelligence_score is None or not intel.last_worldbank_update:
+            return False
+        if datetime.utcnow() - intel.last_worldbank_update > STALENESS_POLICY["worldbank"]:
+            return False
+        state = (intel.data_sources or {}).get(REFRESH_STATE_KEY) or {}
+        return state.get("intelligence_fingerprint") == fingerprint
+    
+    def process_country(self, iso_code: str, wb_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Process a single country and collect all intelligence data.
         
         Args:
             iso_code: ISO Alpha-3 country code
+            wb_data: Optional pre-fetched World Bank extended data (from
+                IntelligenceClient.fetch_all_intelligence_bulk). Fetched
+                per-country when omitted.
             
         Returns:
             Dict with processing results and data sources used
@@ -115,165 +152,7 @@ class IntelligencePipeline:
             if intel.data_sources is None:
                 intel.data_sources = {}
             
-            # =================================================================
-            # SOURCE 1: World Bank Extended Indicators (API)
-            # =================================================================
-            try:
-                wb_data = self.client.fetch_all_intelligence(iso_code)
-                
-                if wb_data and wb_data.get("sources_used"):
-                    # Governance indicators
-                    if wb_data.get("government_effectiveness") is not None:
-                        intel.government_effectiveness = wb_data["government_effectiveness"]
-                    if wb_data.get("regulatory_quality") is not None:
-                        intel.regulatory_quality = wb_data["regulatory_quality"]
-                    if wb_data.get("rule_of_law_wb") is not None:
-                        intel.rule_of_law_wb = wb_data["rule_of_law_wb"]
-                    if wb_data.get("control_of_corruption_wb") is not None:
-                        intel.control_of_corruption_wb = wb_data["control_of_corruption_wb"]
-                    if wb_data.get("political_stability") is not None:
-                        intel.political_stability = wb_data["political_stability"]
-                    if wb_data.get("voice_accountability") is not None:
-                        intel.voice_accountability = wb_data["voice_accountability"]
-                    
-                    # Economic indicators
-                    if wb_data.get("gdp_per_capita_ppp") is not None:
-                        intel.gdp_per_capita_ppp = wb_data["gdp_per_capita_ppp"]
-                    if wb_data.get("gdp_growth_rate") is not None:
-                        intel.gdp_growth_rate = wb_data["gdp_growth_rate"]
-                    if wb_data.get("industry_pct_gdp") is not None:
-                        intel.industry_pct_gdp = wb_data["industry_pct_gdp"]
-                    if wb_data.get("manufacturing_pct_gdp") is not None:
-                        intel.manufacturing_pct_gdp = wb_data["manufacturing_pct_gdp"]
-                    if wb_data.get("services_pct_gdp") is not None:
-                        intel.services_pct_gdp = wb_data["services_pct_gdp"]
-                    if wb_data.get("agriculture_pct_gdp") is not None:
-                        intel.agriculture_pct_gdp = wb_data["agriculture_pct_gdp"]
-                    
-                    # Labor indicators
-                    if wb_data.get("labor_force_participation") is not None:
-                        intel.labor_force_participation = wb_data["labor_force_participation"]
-                    if wb_data.get("unemployment_rate") is not None:
-                        intel.unemployment_rate = wb_data["unemployment_rate"]
-                    if wb_data.get("youth_unemployment_rate") is not None:
-                        intel.youth_unemployment_rate = wb_data["youth_unemployment_rate"]
-                    if wb_data.get("informal_employment_pct") is not None:
-                        intel.informal_employment_pct = wb_data["informal_employment_pct"]
-                    
-                    # Health indicators
-                    if wb_data.get("health_expenditure_gdp_pct") is not None:
-                        intel.health_expenditure_gdp_pct = wb_data["health_expenditure_gdp_pct"]
-                    if wb_data.get("health_expenditure_per_capita") is not None:
-                        intel.health_expenditure_per_capita = wb_data["health_expenditure_per_capita"]
-                    if wb_data.get("out_of_pocket_health_pct") is not None:
-                        intel.out_of_pocket_health_pct = wb_data["out_of_pocket_health_pct"]
-                    if wb_data.get("life_expectancy_at_birth") is not None:
-                        intel.life_expectancy_at_birth = wb_data["life_expectancy_at_birth"]
-                    
-                    # Population indicators
-                    if wb_data.get("population_total") is not None:
-                        intel.population_total = wb_data["population_total"]
-                    if wb_data.get("urban_population_pct") is not None:
-                        intel.urban_population_pct = wb_data["urban_population_pct"]
-                    
-                    intel.last_worldbank_update = datetime.utcnow()
-                    result["sources_used"].append("WORLD_BANK")
-                    self.stats["wb_hits"] += 1
-                    
-            except Exception as e:
-                logger.warning(f"World Bank data fetch failed for {iso_code}: {e}")
-            
-            # =================================================================
-            # SOURCE 2: Transparency International CPI (Reference)
-            # =================================================================
-            cpi_data = get_cpi_data(iso_code)
-            if cpi_data:
-                intel.corruption_perception_index = cpi_data.get("score")
-                intel.corruption_rank = cpi_data.get("rank")
-                intel.last_cpi_update = datetime.utcnow()
-                result["sources_used"].append("TI_CPI")
-                self.stats["cpi_hits"] += 1
-            
-            # =================================================================
-            # SOURCE 3: UNDP Human Development Index (Reference)
-            # =================================================================
-            hdi_data = get_hdi_data(iso_code)
-            if hdi_data:
-                intel.hdi_score = hdi_data.get("score")
-                intel.hdi_rank = hdi_data.get("rank")
-                intel.last_undp_update = datetime.utcnow()
-                result["sources_used"].append("UNDP_HDI")
-                self.stats["hdi_hits"] += 1
-            
-            # =================================================================
-            # SOURCE 4: Yale EPI (Reference)
-            # =================================================================
-            epi_data = get_epi_data(iso_code)
-            if epi_data:
-                intel.epi_score = epi_data.get("score")
-                intel.epi_rank = epi_data.get("rank")
-                intel.epi_air_quality = epi_data.get("air_quality")
-                intel.last_epi_update = datetime.utcnow()
-                result["sources_used"].append("YALE_EPI")
-                self.stats["epi_hits"] += 1
-            
-            # =================================================================
-            # SOURCE 5: IHME Global Burden of Disease (Reference)
-            # =================================================================
-            gbd_data = get_ihme_gbd_data(iso_code)
-            if gbd_data:
-                intel.daly_occupational_total = gbd_data.get("daly_occupational_total")
-                intel.daly_occupational_injuries = gbd_data.get("daly_occupational_injuries")
-                intel.daly_occupational_carcinogens = gbd_data.get("daly_occupational_carcinogens")
-                intel.daly_occupational_noise = gbd_data.get("daly_occupational_noise")
-                intel.daly_occupational_ergonomic = gbd_data.get("daly_occupational_ergonomic")
-                intel.daly_occupational_particulates = gbd_data.get("daly_occupational_particulates")
-                intel.daly_occupational_asthmagens = gbd_data.get("daly_occupational_asthmagens")
-                intel.deaths_occupational_total = gbd_data.get("deaths_occupational_total")
-                intel.deaths_occupational_injuries = gbd_data.get("deaths_occupational_injuries")
-                intel.deaths_occupational_diseases = gbd_data.get("deaths_occupational_diseases")
-                intel.last_ihme_update = datetime.utcnow()
-                result["sources_used"].append("IHME_GBD")
-                self.stats["gbd_hits"] += 1
-            
-            # =================================================================
-            # SOURCE 6: World Justice Project (Reference)
-            # =================================================================
-            wjp_data = get_wjp_data(iso_code)
-            if wjp_data:
-                intel.rule_of_law_index = wjp_data.get("rule_of_law_index")
-                intel.regulatory_enforcement_score = wjp_data.get("regulatory_enforcement")
-                intel.civil_justice_score = wjp_data.get("civil_justice")
-                intel.constraints_on_gov_powers = wjp_data.get("constraints_gov")
-                intel.open_government_score = wjp_data.get("open_government")
-                intel.last_wjp_update = datetime.utcnow()
-                result["sources_used"].append("WJP_ROL")
-                self.stats["wjp_hits"] += 1
-            
-            # =================================================================
-            # SOURCE 7: OECD Work-Life Balance (Reference, OECD only)
-            # =================================================================
-            oecd_data = get_oecd_data(iso_code)
-            if oecd_data:
-                intel.oecd_work_life_balance = oecd_data.get("work_life_balance")
-                intel.oecd_hours_worked_annual = oecd_data.get("hours_worked_annual")
-                intel.oecd_long_hours_pct = oecd_data.get("long_hours_pct")
-                intel.oecd_time_for_leisure = oecd_data.get("time_for_leisure")
-                intel.last_oecd_update = datetime.utcnow()
-                result["sources_used"].append("OECD")
-                self.stats["oecd_hits"] += 1
-            
-            # =================================================================
-            # COMPUTE INTELLIGENCE SCORES
-            # =================================================================
-            intel.governance_intelligence_score = self._compute_governance_score(intel)
-            intel.hazard_intelligence_score = self._compute_hazard_score(intel)
-            intel.vigilance_intelligence_score = self._compute_vigilance_score(intel)
-            intel.restoration_intelligence_score = self._compute_restoration_score(intel)
-            intel.overall_intelligence_score = self._compute_overall_score(intel)
-            
-            # Update timestamp
-            intel.updated_at = datetime.utcnow()
+            self.apply_sources(intel, iso_code, wb_data, result)
             
             # Commit changes
             self.db.commit()
@@ -289,124 +168,353 @@ class IntelligencePipeline:
         
         return result
     
-    def _compute_governance_score(self, intel: CountryIntelligence) -> Optional[float]:
-        """Compute composite governance intelligence score."""
-        components = []
+    def apply_sources(
+        self,
+        intel: CountryIntelligence,
+        iso_code: str,
+        wb_data: Optional[Dict[str, Any]],
+        result: Dict[str, Any],
+    ) -> None:
+        """
+        Populate an intelligence record from all sources and compute its scores.
         
-        # CPI (0-100)
-        if intel.corruption_perception_index is not None:
-            components.append(intel.corruption_perception_index)
+        Does not touch the session, so it also works on a transient record
+        (used by the ETL bulk writer). Appends source names to
+        result["sources_used"].
+        """
+        # =================================================================
+        # SOURCE 1: World Bank Extended Indicators (API)
+        # =================================================================
+        try:
+            if wb_data is None:
+                wb_data = self.client.fetch_all_intelligence(iso_code)
+            
+            if wb_data and wb_data.get("sources_used"):
+                # Governance indicators
+                if wb_data.get("government_effectiveness") is not None:
+                    intel.government_effectiveness = wb_data["government_effectiveness"]
+                if wb_data.get("regulatory_quality") is not None:
+                    intel.regulatory_quality = wb_data["regulatory_quality"]
+                if wb_data.get("rule_of_law_wb") is not None:
+                    intel.rule_of_law_wb = wb_data["rule_of_law_wb"]
+                if wb_data.get("control_of_corruption_wb") is not None:
+                    intel.control_of_corruption_wb = wb_data["control_of_corruption_wb"]
+                if wb_data.get("political_stability") is not None:
+                    intel.political_stability = wb_data["political_stability"]
+                if wb_data.get("voice_accountability") is not None:
+                    intel.voice_accountability = wb_data["voice_accountability"]
+                
+                # Economic indicators
+                if wb_data.get("gdp_per_capita_ppp") is not None:
+                    intel.gdp_per_capita_ppp = wb_data["gdp_per_capita_ppp"]
+                if wb_data.get("gdp_growth_rate") is not None:
+                    intel.gdp_growth_rate = wb_data["gdp_growth_rate"]
+                if wb_data.get("industry_pct_gdp") is not None:
+                    intel.industry_pct_gdp = wb_data["industry_pct_gdp"]
+                if wb_data.get("manufacturing_pct_gdp") is not None:
+                    intel.manufacturing_pct_gdp = wb_data["manufacturing_pct_gdp"]
+                if wb_data.get("services_pct_gdp") is not None:
+                    intel.services_pct_gdp = wb_data["services_pct_gdp"]
+                if wb_data.get("agriculture_pct_gdp") is not None:
+                    intel.agriculture_pct_gdp = wb_data["agriculture_pct_gdp"]
+                
+                # Labor indicators
+                if wb_data.get("labor_force_participation") is not None:
+                    intel.labor_force_participation = wb_data["labor_force_participation"]
+                if wb_data.get("unemployment_rate") is not None:
+                    intel.unemployment_rate = wb_data["unemployment_rate"]
+                if wb_data.get("youth_unemployment_rate") is not None:
+                    intel.youth_unemployment_rate = wb_data["youth_unemployment_rate"]
+                if wb_data.get("informal_employment_pct") is not None:
+                    intel.informal_employment_pct = wb_data["informal_employment_pct"]
+                
+                # Health indicators
+                if wb_data.get("health_expenditure_gdp_pct") is not None:
+                    intel.health_expenditure_gdp_pct = wb_data["health_expenditure_gdp_pct"]
+                if wb_data.get("health_expenditure_per_capita") is not None:
+                    intel.health_expenditure_per_capita = wb_data["health_expenditure_per_capita"]
+                if wb_data.get("out_of_pocket_health_pct") is not None:
+                    intel.out_of_pocket_health_pct = wb_data["out_of_pocket_health_pct"]
+                if wb_data.get("life_expectancy_at_birth") is not None:
+                    intel.life_expectancy_at_birth = wb_data["life_expectancy_at_birth"]
+                
+                # Population indicators
+                if wb_data.get("population_total") is not None:
+                    intel.population_total = wb_data["population_total"]
+                if wb_data.get("urban_population_pct") is not None:
+                    intel.urban_population_pct = wb_data["urban_population_pct"]
+                
+                intel.last_worldbank_update = datetime.utcnow()
+                result["sources_used"].append("WORLD_BANK")
+                self.stats["wb_hits"] += 1
+                
+        except Exception as e:
+            logger.warning(f"World Bank data fetch failed for {iso_code}: {e}")
         
-        # Rule of Law (0-1 -> 0-100)
-        if intel.rule_of_law_index is not None:
-            components.append(intel.rule_of_law_index * 100)
+        # =================================================================
+        # SOURCE 2: Transparency International CPI (Reference)
+        # =================================================================
+        cpi_data = get_cpi_data(iso_code)
+        if cpi_data:
+            intel.corruption_perception_index = cpi_data.get("score")
+            intel.corruption_rank = cpi_data.get("rank")
+            intel.last_cpi_update = datetime.utcnow()
+            result["sources_used"].append("TI_CPI")
+            self.stats["cpi_hits"] += 1
         
-        # WB Government Effectiveness (-2.5 to 2.5 -> 0-100)
-        if intel.government_effectiveness is not None:
-            normalized = ((intel.government_effectiveness + 2.5) / 5) * 100
-            components.append(normalized)
+        # =================================================================
+        # SOURCE 3: UNDP Human Development Index (Reference)
+        # =================================================================
+        hdi_data = get_hdi_data(iso_code)
+        if hdi_data:
+            intel.hdi_score = hdi_data.get("score")
+            intel.hdi_rank = hdi_data.get("rank")
+            intel.last_undp_update = datetime.utcnow()
+            result["sources_used"].append("UNDP_HDI")
+            self.stats["hdi_hits"] += 1
         
-        if components:
-            return round(sum(components) / len(components), 1)
-        return None
-    
-    def _compute_hazard_score(self, intel: CountryIntelligence) -> Optional[float]:
-        """Compute composite hazard intelligence score (inverted - lower DALYs = higher score)."""
-        components = []
+        # =================================================================
+        # SOURCE 4: Yale EPI (Reference)
+        # =================================================================
+        epi_data = get_epi_data(iso_code)
+        if epi_data:
+            intel.epi_score = epi_data.get("score")
+            intel.epi_rank = epi_data.get("rank")
+            intel.epi_air_quality = epi_data.get("air_quality")
+            intel.last_epi_update = datetime.utcnow()
+            result["sources_used"].append("YALE_EPI")
+            self.stats["epi_hits"] += 1
+        
+        # =================================================================
+        # SOURCE 5: IHME Global Burden of Disease (Reference)
+        # =================================================================
+        gbd_data = get_ihme_gbd_data(iso_code)
+        if gbd_data:
+            intel.daly_occupational_total = gbd_data.get("daly_occupational_total")
+            intel.daly_occupational_injuries = gbd_data.get("daly_occupational_injuries")
+            intel.daly_occupational_carcinogens = gbd_data.get("daly_occupational_carcinogens")
+            intel.daly_occupational_noise = gbd_data.get("daly_occupational_noise")
+            intel.daly_occupational_ergonomic = gbd_data.get("daly_occupational_ergonomic")
+            intel.daly_occupational_particulates = gbd_data.get("daly_occupational_particulates")
+            intel.daly_occupational_asthmagens = gbd_data.get("daly_occupational_asthmagens")
+            intel.deaths_occupational_total = gbd_data.get("deaths_occupational_total")
+            intel.deaths_occupational_injuries = gbd_data.get("deaths_occupational_injuries")
+            intel.deaths_occupational_diseases = gbd_data.get("deaths_occupational_diseases")
+            intel.last_ihme_update = datetime.utcnow()
+            result["sources_used"].append("IHME_GBD")
+            self.stats["gbd_hits"] += 1
         
-        # DALY burden (inverted: 0-1000 DALYs -> 100-0 score)
-        if intel.daly_occupational_total is not None:
-            # Higher DALYs = worse = lower score
-            score = max(0, 100 - (intel.daly_occupational_total / 10))
-            components.append(score)
+        # =================================================================
+        # SOURCE 6: World Justice Project (Reference)
+        # =================================================================
+        wjp_data = get_wjp_data(iso_code)
+        if wjp_data:
+            intel.rule_of_law_index = wjp_data.get("rule_of_law_index")
+            intel.regulatory_enforcement_score = wjp_data.get("regulatory_enforcement")
+            intel.civil_justice_score = wjp_data.get("civil_justice")
+            intel.constraints_on_gov_powers = wjp_data.get("constraints_gov")
+            intel.open_government_score = wjp_data.get("open_government")
+            intel.last_wjp_update = datetime.utcnow()
+            result["sources_used"].append("WJP_ROL")
+            self.stats["wjp_hits"] += 1
         
-        # EPI Air Quality (0-100)
-        if intel.epi_air_quality is not None:
-            components.append(intel.epi_air_quality)
+        # =================================================================
+        # SOURCE 7: OECD Work-Life Balance (Reference, OECD only)
+        # =================================================================
+        oecd_data = get_oecd_data(iso_code)
+        if oecd_data:
+            intel.oecd_work_life_balance = oecd_data.get("work_life_balance")
+            intel.oecd_hours_worked_annual = oecd_data.get("hours_worked_annual")
+            intel.oecd_long_hours_pct = oecd_data.get("long_hours_pct")
+            intel.oecd_time_for_leisure = oecd_data.get("time_for_leisure")
+            intel.last_oecd_update = datetime.utcnow()
+            result["sources_used"].append("OECD")
+            self.stats["oecd_hits"] += 1
         
-        if components:
-            return round(sum(components) / len(components), 1)
-        return None
+        # =================================================================
+        # COMPUTE INTELLIGENCE SCORES
+        # =================================================================
+        for field, score in compute_intelligence_scores(scoring_inputs(intel)).items():
+            setattr(intel, field, score)
+        
+        # Update timestamp
+        intel.updated_at = datetime.utcnow()
+    
+    def _compute_governance_score(self, intel: CountryIntelligence) -> Optional[float]:
+        """Compute composite governance intelligence score."""
+        return compute_governance_score(scoring_inputs(intel))
+    
+    def _compute_hazard_score(self, intel: CountryIntelligence) -> Optional[float]:
+        """Compute composite hazard intelligence score (inverted - lower DALYs = higher score)."""
+        return compute_hazard_score(scoring_inputs(intel))
     
     def _compute_vigilance_score(self, intel: CountryIntelligence) -> Optional[float]:
         """Compute composite vigilance intelligence score."""
-        components = []
-        
-        # UHC Coverage (0-100)
-        if intel.uhc_service_coverage_index is not None:
-            components.append(intel.uhc_service_coverage_index)
-        
-        # Health Expenditure per capita (normalized, capped at 10000)
-        if intel.health_expenditure_per_capita is not None:
-            normalized = min(100, (intel.health_expenditure_per_capita / 100))
-            components.append(normalized)
-        
-        # Life Expectancy (normalized 50-90 years -> 0-100)
-        if intel.life_expectancy_at_birth is not None:
-            normalized = ((intel.life_expectancy_at_birth - 50) / 40) * 100
-            components.append(min(100, max(0, normalized)))
-        
-        if components:
-            return round(sum(components) / len(components), 1)
-        return None
+        return compute_vigilance_score(scoring_inputs(intel))
     
     def _compute_restoration_score(self, intel: CountryIntelligence) -> Optional[float]:
         """Compute composite restoration intelligence score."""
-        components = []
+        return compute_restoration_score(scoring_inputs(intel))
+    
+    def _compute_overall_score(self, intel: CountryIntelligence) -> Optional[float]:
+        """Compute overall intelligence score from pillar scores."""
+        return compute_overall_score({field: getattr(intel, field) for field in SCORE_FIELDS})
+    
+    def rescore(
+        self,
+        target_countries: Optional[List[str]] = None,
+        workers: int = 1,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        overrides: Optional[Dict[str, Dict[str, Any]]] = None,
+        persist: bool = True,
+    ) -> Dict[str, Dict[str, Optional[float]]]:
+        """
+        Recompute intelligence scores from the stored inputs, without fetching.
         
-        # HDI (0-1 -> 0-100)
-        if intel.hdi_score is not None:
-            components.append(intel.hdi_score * 100)
+        The scoring stage runs on plain dicts (see intelligence_scoring), so
+        with workers > 1 it is fanned out to a process pool in chunks.
         
-        # OECD Work-Life Balance (0-10 -> 0-100)
-        if intel.oecd_work_life_balance is not None:
-            components.append(intel.oecd_work_life_balance * 10)
+        Args:
+            target_countries: ISO codes to rescore (None = every stored record)
+            workers: Scoring worker processes (1 = inline)
+            chunk_size: Countries per worker task
+            overrides: Optional what-if input overrides,
+                {iso_code: {input_field: value}}
+            persist: Write the scores back (one bulk UPDATE, sorted by ISO code).
+                Set to False to only compute, e.g. for what-if variants
         
-        # GDP per capita (normalized, capped)
-        if intel.gdp_per_capita_ppp is not None:
-            normalized = min(100, (intel.gdp_per_capita_ppp / 1000))
-            components.append(normalized)
+        Returns:
+            {iso_code: scores} in sorted ISO order
+        """
+        query = self.db.query(CountryIntelligence)
+        if target_countries is not None:
+            query = query.filter(CountryIntelligence.country_iso_code.in_(target_countries))
+        records = {intel.country_iso_code: intel for intel in query}
         
-        if components:
-            return round(sum(components) / len(components), 1)
-        return None
-    
-    def _compute_overall_score(self, intel: CountryIntelligence) -> Optional[float]:
-        """Compute overall intelligence score from pillar scores."""
-        scores = [
-            intel.governance_intelligence_score,
-            intel.hazard_intelligence_score,
-            intel.vigilance_intelligence_score,
-            intel.restoration_intelligence_score,
-        ]
-        
-        valid_scores = [s for s in scores if s is not None]
-        
-        if valid_scores:
-            return round(sum(valid_scores) / len(valid_scores), 1)
-        return None
+        inputs = {iso: scoring_inputs(intel) for iso, intel in records.items()}
+        for iso_code, values in (overrides or {}).items():
+            if iso_code in inputs:
+                inputs[iso_code].update(values)
+        
+        scores = score_countries(inputs, workers=workers, chunk_size=chunk_size)
+        
+        if persist and scores:
+            now = datetime.utcnow()
+            self.db.execute(
+                update(CountryIntelligence),
+                [{"id": records[iso].id, **values, "updated_at": now} for iso, values in scores.items()],
+            )
+            mark_stale(self.db, scores)
+            self.db.commit()
+            logger.info(f"Rescored {len(scores)} countries ({workers} worker(s))")
+        
+        return scores
     
-    def run(self, target_countries: list) -> Dict[str, Any]:
+    def run(
+        self,
+        target_countries: List[str],
+        bulk_worldbank: bool = False,
+        incremental: bool = False,
+        batch_size: Optional[int] = None,
+    ) -> Dict[str, Any]:
         """
         Run the intelligence pipeline for all target countries.
         
+        Records are written with the ETL BulkUpsertWriter: one multi-row
+        INSERT ... ON CONFLICT per batch of countries, with each country's
+        inputs fingerprint in the same transaction.
+        
         Args:
             target_countries: List of ISO Alpha-3 country codes
+            bulk_worldbank: Fetch World Bank extended indicators once for all
+                countries (indicators x pages requests) instead of per country
+            incremental: Skip score recomputation for countries whose inputs
+                (World Bank extended + reference data) are unchanged since the
+                last run and not stale. Implies bulk_worldbank, which is the
+                cheap way to see the current upstream values
+            batch_size: Countries per write transaction (default:
+                ETL_WRITE_BATCH_SIZE)
             
         Returns:
             Dict with pipeline execution statistics
         """
+        # Imported here: bulk_writer builds on this module
+        from app.services.etl.bulk_writer import BulkUpsertWriter, CountryWrite
+        
         logger.info(f"Starting Intelligence Pipeline for {len(target_countries)} countries...")
         
+        wb_bulk: Dict[str, Dict[str, Any]] = {}
+        wb_fallback = False
+        if bulk_worldbank or incremental:
+            logger.info("Fetching World Bank extended indicators in bulk...")
+            try:
+                wb_bulk = self.client.fetch_all_intelligence_bulk(target_countries)
+            except BulkFetchIncompleteError as e:
+                # Partial bulk data would store countries without indicators: fetch per country instead
+                wb_fallback = True
+                logger.warning(f"World Bank extended bulk fetch incomplete, falling back to per-country fetches: {e}")
+        
+        # Existing countries and intelligence records, loaded once
+        names = dict(
+            self.db.query(Country.iso_code, Country.name).filter(Country.iso_code.in_(target_countries))
+        )
+        stored = {
+            intel.country_iso_code: intel
+            for intel in self.db.query(CountryIntelligence).filter(
+                CountryIntelligence.country_iso_code.in_(target_countries)
+            )
+        }
+        
+        writer = BulkUpsertWriter(self.db, batch_size=batch_size, intelligence=self)
+        written: List[str] = []
+        failures: Dict[str, str] = {}
+        
+        def record(batch: List[str], batch_failures: Dict[str, str]) -> None:
+            failures.update(batch_failures)
+            written.extend(iso for iso in batch if iso not in batch_failures)
+        
+        pending: List[str] = []
         for idx, iso_code in enumerate(target_countries, 1):
             logger.info(f"[{idx}/{len(target_countries)}] Processing {iso_code}...")
-            result = self.process_country(iso_code)
             
-            if result["success"]:
-                sources = ", ".join(result["sources_used"]) if result["sources_used"] else "None"
-                logger.info(f"  -> {iso_code}: Sources={sources}")
-            else:
-                logger.error(f"  -> {iso_code}: FAILED - {result['error']}")
+            if iso_code not in names:
+                failures[iso_code] = f"Country {iso_code} not found in database"
+                continue
+            
+            wb_data = wb_bulk.get(iso_code)
+            if wb_fallback:
+                wb_data = self.client.fetch_all_intelligence(iso_code, fast_mode=False)
+            
+            fingerprint = intelligence_fingerprint(iso_code, wb_data)
+            if incremental and self._inputs_unchanged(stored.get(iso_code), fingerprint):
+                self.stats["unchanged"] += 1
+                logger.info(f"  -> {iso_code}: inputs unchanged - scores kept")
+                continue
+            
+            pending.append(iso_code)
+            batch_failures = writer.add(CountryWrite(
+                iso_code=iso_code,
+                name=names[iso_code],
+                wb_extended=wb_data,
+                intelligence_only=True,
+                intelligence_fingerprint=fingerprint if wb_data is not None else None,
+            ))
+            if writer.pending == 0:
+                record(pending, batch_failures)
+                pending = []
+        
+        record(pending, writer.flush())
+        
+        for iso_code in written:
+            self.stats["intelligence_updated" if iso_code in stored else "intelligence_created"] += 1
+        self.stats["countries_processed"] += len(written)
+        for iso_code, error in failures.items():
+            self.stats["errors"].append(f"{iso_code}: {error}")
+            logger.error(f"  -> {iso_code}: FAILED - {error}")
+        logger.info(
+            f"Intelligence written: {len(written)} countries in "
+            f"{writer.stats['batches']} batches, {writer.stats['statements']} upsert statements"
+        )
         
         logger.info("=" * 60)
         logger.info("INTELLIGENCE PIPELINE SUMMARY")
@@ -421,6 +529,8 @@ class IntelligencePipeline:
         logger.info(f"IHME GBD Hits: {self.stats['gbd_hits']}")
         logger.info(f"WJP Rule of Law Hits: {self.stats['wjp_hits']}")
         logger.info(f"OECD Hits: {self.stats['oecd_hits']}")
+        if incremental:
+            logger.info(f"Unchanged (not rescored): {self.stats['unchanged']}")
         logger.info(f"Errors: {len(self.stats['errors'])}")
         
         return self.stats
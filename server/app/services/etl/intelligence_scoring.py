@@ -0,0 +1,207 @@
+"""
+GOHIP Platform - Intelligence Scoring
+=====================================
+
+Pure scoring functions for the CountryIntelligence composite scores
+(governance, hazard, vigilance, restoration and overall), split out of
+IntelligencePipeline so the CPU side of scoring can run without a database
+session or ORM objects.
+
+Inputs and outputs are plain dicts, so a whole country set (or many what-if
+variants of it) can be scored in a ProcessPoolExecutor:
+
+    inputs = {iso: scoring_inputs(intel) for intel in records}
+    scores = score_countries(inputs, workers=4)
+    # {iso: {"governance_intelligence_score": ..., ...}}
+
+Work is dispatched in chunks of countries and the results are merged back in
+sorted ISO order, so the output (and any database write that follows it) is
+identical regardless of the number of workers or chunk completion order.
+"""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# CountryIntelligence columns read by the scoring functions
+SCORING_INPUT_FIELDS = (
+    "corruption_perception_index",
+    "rule_of_law_index",
+    "government_effectiveness",
+    "daly_occupational_total",
+    "epi_air_quality",
+    "uhc_service_coverage_index",
+    "health_expenditure_per_capita",
+    "life_expectancy_at_birth",
+    "hdi_score",
+    "oecd_work_life_balance",
+    "gdp_per_capita_ppp",
+)
+
+# CountryIntelligence columns written by compute_intelligence_scores
+SCORE_FIELDS = (
+    "governance_intelligence_score",
+    "hazard_intelligence_score",
+    "vigilance_intelligence_score",
+    "restoration_intelligence_score",
+    "overall_intelligence_score",
+)
+
+# Countries per task sent to a worker process
+DEFAULT_CHUNK_SIZE = 1024
+
+
+def scoring_inputs(intel: Any) -> Dict[str, Any]:
+    """Plain-dict snapshot of the scoring inputs of an intelligence record."""
+    return {field: getattr(intel, field, None) for field in SCORING_INPUT_FIELDS}
+
+
+def _average(components: List[float]) -> Optional[float]:
+    if components:
+        return round(sum(components) / len(components), 1)
+    return None
+
+
+# =============================================================================
+# PILLAR SCORES
+# =============================================================================
+
+def compute_governance_score(values: Dict[str, Any]) -> Optional[float]:
+    """Compute composite governance intelligence score."""
+    components = []
+
+    # CPI (0-100)
+    if values.get("corruption_perception_index") is not None:
+        components.append(values["corruption_perception_index"])
+
+    # Rule of Law (0-1 -> 0-100)
+    if values.get("rule_of_law_index") is not None:
+        components.append(values["rule_of_law_index"] * 100)
+
+    # WB Government Effectiveness (-2.5 to 2.5 -> 0-100)
+    if values.get("government_effectiveness") is not None:
+        normalized = ((values["government_effectiveness"] + 2.5) / 5) * 100
+        components.append(normalized)
+
+    return _average(components)
+
+
+def compute_hazard_score(values: Dict[str, Any]) -> Optional[float]:
+    """Compute composite hazard intelligence score (inverted - lower DALYs = higher score)."""
+    components = []
+
+    # DALY burden (inverted: 0-1000 DALYs -> 100-0 score)
+    if values.get("daly_occupational_total") is not None:
+        # Higher DALYs = worse = lower score
+        score = max(0, 100 - (values["daly_occupational_total"] / 10))
+        components.append(score)
+
+    # EPI Air Quality (0-100)
+    if values.get("epi_air_quality") is not None:
+        components.append(values["epi_air_quality"])
+
+    return _average(components)
+
+
+def compute_vigilance_score(values: Dict[str, Any]) -> Optional[float]:
+    """Compute composite vigilance intelligence score."""
+    components = []
+
+    # UHC Coverage (0-100)
+    if values.get("uhc_service_coverage_index") is not None:
+        components.append(values["uhc_service_coverage_index"])
+
+    # Health Expenditure per capita (normalized, capped at 10000)
+    if values.get("health_expenditure_per_capita") is not None:
+        normalized = min(100, (values["health_expenditure_per_capita"] / 100))
+        components.append(normalized)
+
+    # Life Expectancy (normalized 50-90 years -> 0-100)
+    if values.get("life_expectancy_at_birth") is not None:
+        normalized = ((values["life_expectancy_at_birth"] - 50) / 40) * 100
+        components.append(min(100, max(0, normalized)))
+
+    return _average(components)
+
+
+def compute_restoration_score(values: Dict[str, Any]) -> Optional[float]:
+    """Compute composite restoration intelligence score."""
+    components = []
+
+    # HDI (0-1 -> 0-100)
+    if values.get("hdi_score") is not None:
+        components.append(values["hdi_score"] * 100)
+
+    # OECD Work-Life Balance (0-10 -> 0-100)
+    if values.get("oecd_work_life_balance") is not None:
+        components.append(values["oecd_work_life_balance"] * 10)
+
+    # GDP per capita (normalized, capped)
+    if values.get("gdp_per_capita_ppp") is not None:
+        normalized = min(100, (values["gdp_per_capita_ppp"] / 1000))
+        components.append(normalized)
+
+    return _average(components)
+
+
+def compute_overall_score(scores: Dict[str, Any]) -> Optional[float]:
+    """Compute overall intelligence score from pillar scores."""
+    valid_scores = [
+        scores.get(field)
+        for field in SCORE_FIELDS[:4]
+        if scores.get(field) is not None
+    ]
+    return _average(valid_scores)
+
+
+def compute_intelligence_scores(values: Dict[str, Any]) -> Dict[str, Optional[float]]:
+    """All five intelligence scores for one country's scoring inputs."""
+    scores = {
+        "governance_intelligence_score": compute_governance_score(values),
+        "hazard_intelligence_score": compute_hazard_score(values),
+        "vigilance_intelligence_score": compute_vigilance_score(values),
+        "restoration_intelligence_score": compute_restoration_score(values),
+    }
+    scores["overall_intelligence_score"] = compute_overall_score(scores)
+    return scores
+
+
+# =============================================================================
+# BATCH SCORING
+# =============================================================================
+
+def score_chunk(chunk: List[Tuple[str, Dict[str, Any]]]) -> List[Tuple[str, Dict[str, Optional[float]]]]:
+    """Score a chunk of (key, inputs) pairs. Module-level so worker processes can import it."""
+    return [(key, compute_intelligence_scores(values)) for key, values in chunk]
+
+
+def score_countries(
+    inputs: Dict[str, Dict[str, Any]],
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Dict[str, Dict[str, Optional[float]]]:
+    """
+    Score many countries (or what-if variants) from plain-dict inputs.
+
+    Args:
+        inputs: {key: scoring inputs}, typically keyed by ISO code
+        workers: Worker processes; 1 scores inline in this process
+        chunk_size: Countries per task sent to a worker
+
+    Returns:
+        {key: scores}, ordered by sorted key regardless of workers/chunking
+    """
+    items = sorted(inputs.items())
+    chunk_size = max(1, chunk_size)
+    chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+    if workers <= 1 or len(chunks) <= 1:
+        results = [score_chunk(chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # map() yields in submission order, so the merge is deterministic
+            results = list(executor.map(score_chunk, chunks))
+
+    return {key: scores for chunk in results for key, scores in chunk}
@@ -0,0 +1,143 @@
+"""
+GOHIP Platform - ETL Background Event Loop
+==========================================
+
+A single long-lived asyncio event loop, running in a daemon thread, that
+every synchronous ETL caller submits coroutines to.
+
+The ILO, World Bank and WHO clients are async, but most of the pipeline is
+synchronous. Their *_sync wrappers used to call asyncio.run() per call
+(building and tearing down a fresh event loop every time, and spawning a
+throwaway ThreadPoolExecutor when a loop was already running). They now
+hand the coroutine to this runner instead, so:
+
+- No per-call event loop construction / teardown
+- In-flight requests from different callers (threads, the concurrent
+  fetcher, the sequential pipeline) share one loop and therefore one pooled
+  AsyncClient from http_pool
+- Calling from inside another running loop (e.g. a FastAPI handler) works
+  without an extra thread pool
+
+Usage:
+    from app.services.etl.loop_runner import run_sync
+    result = run_sync(client.fetch_fatality_rate("DEU"))
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from typing import Any, Awaitable, Optional
+
+from app.services.etl.http_pool import aclose_async_client
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for pending work when the runner is shut down
+SHUTDOWN_TIMEOUT = 10.0
+
+
+class BackgroundLoopRunner:
+    """
+    Owns one asyncio event loop running forever in a daemon thread.
+
+    Thread-safe: any thread may submit coroutines. The loop thread is started
+    lazily on first use and restarted if it was shut down.
+    """
+
+    def __init__(self, name: str = "etl-event-loop"):
+        self._name = name
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def _run_loop(self, loop: asyncio.AbstractEventLoop, started: threading.Event) -> None:
+        asyncio.set_event_loop(loop)
+        loop.call_soon(started.set)
+        try:
+            loop.run_forever()
+        finally:
+            try:
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            finally:
+                loop.close()
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed() or not self._thread.is_alive():
+                loop = asyncio.new_event_loop()
+                started = threading.Event()
+                thread = threading.Thread(
+                    target=self._run_loop,
+                    args=(loop, started),
+                    name=self._name,
+                    daemon=True,
+                )
+                thread.start()
+                started.wait()
+                self._loop, self._thread = loop, thread
+                logger.debug(f"Started background event loop ({self._name})")
+            return self._loop
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The runner's event loop (started on first access)."""
+        return self._ensure_started()
+
+    def in_runner_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, coro: Awaitable[Any]) -> concurrent.futures.Future:
+        """Schedule a coroutine on the runner loop and return a concurrent Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_started())
+
+    def run(self, coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """
+        Run a coroutine on the runner loop and block until it finishes.
+
+        Raises:
+            RuntimeError: If called from the runner thread itself (would deadlock);
+                coroutines already on the loop should simply await.
+        """
+        if self.in_runner_thread():
+            if asyncio.iscoroutine(coro):
+                coro.close()
+            raise RuntimeError("run() called from the ETL event loop thread; await the coroutine instead")
+
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def shutdown(self, timeout: float = SHUTDOWN_TIMEOUT) -> None:
+        """Close the loop's pooled HTTP client, then stop and join the loop thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+
+        if loop is None or loop.is_closed():
+            return
+
+        try:
+            asyncio.run_coroutine_threadsafe(aclose_async_client(), loop).result(timeout)
+        except Exception as e:
+            logger.warning(f"Error closing ETL async client: {e}")
+
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+
+
+# Process-wide runner shared by all ETL clients
+loop_runner = BackgroundLoopRunner()
+
+
+def run_sync(coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+    """Run a coroutine on the shared ETL event loop from synchronous code."""
+    return loop_runner.run(coro, timeout)
+
+
+def shutdown_loop_runner() -> None:
+    """Stop the shared ETL event loop (called on application shutdown)."""
+    loop_runner.shutdown()
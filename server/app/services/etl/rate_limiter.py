@@ -0,0 +1,320 @@
+"""
+GOHIP Platform - Adaptive ETL Rate Limiter
+==========================================
+
+Per-host token-bucket rate limiting and retry scheduling for upstream APIs
+(ILO, WHO, World Bank, Wikimedia).
+
+Replaces the fixed sleeps that used to sit between calls (0.3s between
+World Bank and WHO, 0.5s between countries, 0.5s between flag batches),
+which were too slow when the APIs were healthy and did nothing useful when
+they started returning 429s.
+
+Behaviour:
+- Each known upstream host has a token bucket (rate + burst). Requests wait
+  only as long as the bucket requires, so healthy hosts run at full rate
+- Throughput adapts to the observed error rate (AIMD): every 429/503 halves
+  the host's rate, sustained success grows it back towards max_rate
+- Retry-After (seconds or HTTP date) pauses the whole host, not just the
+  request that received it
+- Retryable failures (429, 502, 503, 504, connect/read errors) are retried
+  with exponential backoff and full jitter
+- Hosts without a configured bucket are not throttled but still get retries
+
+Per-host throughput and throttle counts are exposed via get_rate_limit_stats()
+and pipeline_logger.get_detailed_status().
+"""
+
+import asyncio
+import email.utils
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Retry Configuration
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.5      # Seconds; attempt n waits up to BACKOFF_BASE * 2**n
+BACKOFF_MAX = 30.0
+RETRY_AFTER_MAX = 120.0  # Never honour a Retry-After longer than this
+RETRY_STATUSES = {429, 502, 503, 504}
+THROTTLE_STATUSES = {429, 503}
+
+# AIMD Configuration
+RATE_DECREASE_FACTOR = 0.5   # Multiply rate by this on throttle ...
+RATE_DECREASE_COOLDOWN = 2.0 # ... at most once per this many seconds
+RATE_INCREASE_STEP = 0.1     # Add this fraction of the base rate ...
+RATE_INCREASE_EVERY = 20     # ... after this many consecutive successes
+
+
+@dataclass
+class HostLimit:
+    """Token bucket settings for one upstream host."""
+    rate: float          # Base requests per second
+    burst: int           # Bucket capacity
+    min_rate: float      # Floor when backing off
+    max_rate: float      # Ceiling when healthy
+
+
+# Starting limits per upstream host
+HOST_LIMITS: Dict[str, HostLimit] = {
+    "www.ilo.org": HostLimit(rate=5.0, burst=10, min_rate=0.5, max_rate=10.0),
+    "api.worldbank.org": HostLimit(rate=20.0, burst=40, min_rate=1.0, max_rate=40.0),
+    "ghoapi.azureedge.net": HostLimit(rate=10.0, burst=20, min_rate=1.0, max_rate=20.0),
+    "en.wikipedia.org": HostLimit(rate=5.0, burst=10, min_rate=0.5, max_rate=10.0),
+    "upload.wikimedia.org": HostLimit(rate=5.0, burst=10, min_rate=0.5, max_rate=10.0),
+}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            seconds = email.utils.parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+    return max(0.0, min(seconds, RETRY_AFTER_MAX))
+
+
+def backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter for retry attempt 0, 1, 2..."""
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+
+
+# =============================================================================
+# TOKEN BUCKET
+# =============================================================================
+
+class HostBucket:
+    """
+    Thread-safe adaptive token bucket for one host.
+
+    reserve() takes a token (possibly going into debt) and returns how long
+    the caller must wait, so sync and async callers can sleep outside the lock.
+    """
+
+    def __init__(self, host: str, limit: Optional[HostLimit]):
+        self.host = host
+        self.limit = limit
+        self.rate = limit.rate if limit else None
+        self._tokens = float(limit.burst) if limit else 0.0
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._success_streak = 0
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+        self._first_request: Optional[float] = None
+        self.requests = 0
+        self.throttled = 0
+        self.retries = 0
+        self.errors = 0
+        self.wait_seconds = 0.0
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            if self._first_request is None:
+                self._first_request = now
+            self.requests += 1
+            pause = max(0.0, self._paused_until - now)
+
+            if self.limit is None:
+                self.wait_seconds += pause
+                return pause
+
+            self._tokens = min(self.limit.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = max(pause, -self._tokens / self.rate if self._tokens < 0 else 0.0)
+            self.wait_seconds += wait
+            return wait
+
+    def pause(self, seconds: float) -> None:
+        """Hold every request to this host for `seconds` (Retry-After)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def record(self, status_code: Optional[int]) -> None:
+        """Adapt the rate to a completed attempt (None = transport error)."""
+        with self._lock:
+            if status_code is None or status_code >= 500:
+                self.errors += 1
+            if status_code in THROTTLE_STATUSES:
+                self.throttled += 1
+
+            if status_code in THROTTLE_STATUSES or status_code is None:
+                self._success_streak = 0
+                # In-flight requests often fail together; back off once per burst
+                now = time.monotonic()
+                if self.limit and now - self._last_decrease >= RATE_DECREASE_COOLDOWN:
+                    self._last_decrease = now
+                    self.rate = max(self.limit.min_rate, self.rate * RATE_DECREASE_FACTOR)
+            elif status_code < 500:
+                self._success_streak += 1
+                if self.limit and self._success_streak >= RATE_INCREASE_EVERY:
+                    self._success_streak = 0
+                    self.rate = min(self.limit.max_rate, self.rate + self.limit.rate * RATE_INCREASE_STEP)
+
+    def record_retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            elapsed = time.monotonic() - self._first_request if self._first_request else 0.0
+            return {
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "retries": self.retries,
+                "errors": self.errors,
+                "current_rate": round(self.rate, 2) if self.rate else None,
+                "base_rate": self.limit.rate if self.limit else None,
+                "throughput_rps": round(self.requests / elapsed, 2) if elapsed >= 1.0 else None,
+                "wait_seconds": round(self.wait_seconds, 2),
+                "paused": self._paused_until > time.monotonic(),
+            }
+
+
+class RateLimiter:
+    """Registry of per-host buckets."""
+
+    def __init__(self, host_limits: Optional[Dict[str, HostLimit]] = None):
+        self._limits = dict(host_limits or HOST_LIMITS)
+        self._buckets: Dict[str, HostBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, host: str) -> HostBucket:
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = HostBucket(host, self._limits.get(host))
+                self._buckets[host] = bucket
+            return bucket
+
+    def configure_host(self, host: str, limit: Optional[HostLimit]) -> None:
+        """Set (or remove, with None) the limit for a host; resets its bucket."""
+        with self._lock:
+            if limit is None:
+                self._limits.pop(host, None)
+            else:
+                self._limits[host] = limit
+            self._buckets.pop(host, None)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            buckets = list(self._buckets.values())
+        return {bucket.host: bucket.snapshot() for bucket in buckets}
+
+
+rate_limiter = RateLimiter()
+
+
+def _should_retry(response: httpx.Response, bucket: HostBucket, attempt: int) -> Optional[float]:
+    """Return the delay before retrying a response, or None to hand it back."""
+    if response.status_code not in RETRY_STATUSES or attempt >= MAX_RETRIES:
+        return None
+    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+    if retry_after is not None:
+        bucket.pause(retry_after)
+        return retry_after
+    return backoff_delay(attempt)
+
+
+# =============================================================================
+# RATE-LIMITED TRANSPORTS
+# =============================================================================
+
+class RateLimitedAsyncTransport(httpx.AsyncBaseTransport):
+    """Applies the host bucket and retry policy around the wrapped transport."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, limiter: RateLimiter = rate_limiter):
+        self._transport = transport
+        self._limiter = limiter
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        bucket = self._limiter.bucket(request.url.host)
+        attempt = 0
+        while True:
+            wait = bucket.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                response = await self._transport.handle_async_request(request)
+            except (httpx.ConnectError, httpx.ReadTimeout, httpx.RemoteProtocolError) as e:
+                bucket.record(None)
+                if attempt >= MAX_RETRIES:
+                    raise
+                delay = backoff_delay(attempt)
+                logger.debug(f"Retrying {request.url.host} in {delay:.1f}s after {type(e).__name__}")
+            else:
+                bucket.record(response.status_code)
+                delay = _should_retry(response, bucket, attempt)
+                if delay is None:
+                    return response
+                await response.aclose()
+                logger.debug(f"Retrying {request.url.host} in {delay:.1f}s after HTTP {response.status_code}")
+
+            bucket.record_retry()
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class RateLimitedSyncTransport(httpx.BaseTransport):
+    """Sync counterpart of RateLimitedAsyncTransport."""
+
+    def __init__(self, transport: httpx.BaseTransport, limiter: RateLimiter = rate_limiter):
+        self._transport = transport
+        self._limiter = limiter
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        bucket = self._limiter.bucket(request.url.host)
+        attempt = 0
+        while True:
+            wait = bucket.reserve()
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                response = self._transport.handle_request(request)
+            except (httpx.ConnectError, httpx.ReadTimeout, httpx.RemoteProtocolError) as e:
+                bucket.record(None)
+                if attempt >= MAX_RETRIES:
+                    raise
+                delay = backoff_delay(attempt)
+                logger.debug(f"Retrying {request.url.host} in {delay:.1f}s after {type(e).__name__}")
+            else:
+                bucket.record(response.status_code)
+                delay = _should_retry(response, bucket, attempt)
+                if delay is None:
+                    return response
+                response.close()
+                logger.debug(f"Retrying {request.url.host} in {delay:.1f}s after HTTP {response.status_code}")
+
+            bucket.record_retry()
+            attempt += 1
+            time.sleep(delay)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+def get_rate_limit_stats() -> Dict[str, Dict[str, Any]]:
+    """Per-host throughput, throttle and retry counts."""
+    return rate_limiter.stats()
@@ -0,0 +1,436 @@
+"""
+GOHIP Platform - ETL HTTP Response Cache
+========================================
+
+Persistent on-disk cache for upstream API responses (ILOSTAT SDMX, WHO GHO
+OData, World Bank JSON), shared by every client in app/services/etl/ through
+the pooled HTTP clients in http_pool.
+
+Re-running the pipeline used to re-download identical payloads even when
+nothing upstream had changed. With the cache:
+
+- Fresh entries (younger than the source TTL) are served without any request
+- Stale entries are revalidated with If-None-Match / If-Modified-Since; a
+  304 Not Modified refreshes the entry without re-downloading the body
+- If the network fails while revalidating, the stale copy is served
+- Offline mode serves everything from cache (stale or not) and never touches
+  the network; uncached requests get a 504 response, which the clients
+  already treat as "no data"
+
+Storage:
+- One gzip file per entry, named by the SHA-256 of method + full URL
+  (<cache_dir>/<key[:2]>/<key>.gz), holding a JSON metadata line and the
+  raw response body
+- Writes are atomic (temp file + rename), so concurrent runs never see a
+  partial entry
+- Total size is bounded; least recently used entries are evicted first
+
+Configuration (app.core.config.Settings):
+    ETL_CACHE_ENABLED, ETL_CACHE_DIR, ETL_CACHE_MAX_MB, ETL_OFFLINE
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Freshness per upstream host (seconds). ILOSTAT and WDI publish annual series,
+# so a day-old copy is as good as a live one; stale entries are revalidated.
+SOURCE_TTLS: Dict[str, int] = {
+    "www.ilo.org": 7 * 24 * 3600,       # ILOSTAT SDMX
+    "api.worldbank.org": 24 * 3600,     # World Bank WDI / WGI
+    "ghoapi.azureedge.net": 24 * 3600,  # WHO GHO OData
+}
+DEFAULT_TTL = 12 * 3600
+
+# Hop-by-hop headers are not replayed from cache. Bodies are stored as
+# httpx decoded them, so the upstream content-encoding / content-length no
+# longer describe them (replaying them makes httpx decode the body twice).
+_SKIP_HEADERS = {"connection", "keep-alive", "transfer-encoding", "content-encoding", "content-length"}
+
+_OFFLINE_HEADERS = [("content-type", "application/json"), ("x-gohip-cache", "offline-miss")]
+
+
+def _cache_key(request: httpx.Request) -> str:
+    return hashlib.sha256(f"{request.method} {request.url}".encode("utf-8")).hexdigest()
+
+
+# =============================================================================
+# CACHE ENTRY
+# =============================================================================
+
+class CacheEntry:
+    """A stored response: status, headers, raw body and validators."""
+
+    def __init__(self, status_code: int, headers: List[Tuple[str, str]], body: bytes, stored_at: float, url: str):
+        self.status_code = status_code
+        self.headers = headers
+        self.body = body
+        self.stored_at = stored_at
+        self.url = url
+
+    def header(self, name: str) -> Optional[str]:
+        for key, value in self.headers:
+            if key.lower() == name:
+                return value
+        return None
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.header("etag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.header("last-modified")
+
+    def age(self) -> float:
+        return time.time() - self.stored_at
+
+    def to_response(self, cache_status: str) -> httpx.Response:
+        # Entries written before content-encoding was skipped still carry it
+        headers = [(key, value) for key, value in self.headers if key.lower() not in _SKIP_HEADERS]
+        return httpx.Response(
+            status_code=self.status_code,
+            headers=headers + [("x-gohip-cache", cache_status)],
+            content=self.body,
+            extensions={"http_version": b"HTTP/1.1"},
+        )
+
+    def serialize(self) -> bytes:
+        meta = {
+            "url": self.url,
+            "status_code": self.status_code,
+            "headers": self.headers,
+            "stored_at": self.stored_at,
+        }
+        return gzip.compress(json.dumps(meta).encode("utf-8") + b"\n" + self.body)
+
+    @classmethod
+    def deserialize(cls, data: bytes) -> "CacheEntry":
+        meta_line, _, body = gzip.decompress(data).partition(b"\n")
+        meta = json.loads(meta_line)
+        return cls(
+            status_code=meta["status_code"],
+            headers=[tuple(pair) for pair in meta["headers"]],
+            body=body,
+            stored_at=meta["stored_at"],
+            url=meta["url"],
+        )
+
+
+# =============================================================================
+# DISK STORE
+# =============================================================================
+
+class ResponseCache:
+    """Size-bounded, LRU-evicted on-disk response store."""
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_bytes: int,
+        enabled: bool = True,
+        offline: bool = False,
+        ttls: Optional[Dict[str, int]] = None,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.offline = offline
+        self.ttls = {**SOURCE_TTLS, **(ttls or {})}
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[str, List[float]]] = None  # key -> [size, last_access]
+        self._total_bytes = 0
+        self._stats = {"hits": 0, "misses": 0, "revalidated": 0, "stores": 0,
+                       "evictions": 0, "offline_hits": 0, "offline_misses": 0}
+
+    # -------------------------------------------------------------------------
+    # Index / eviction
+    # -------------------------------------------------------------------------
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.gz"
+
+    def _load_index(self) -> Dict[str, List[float]]:
+        """Scan the cache directory once (under self._lock)."""
+        if self._index is None:
+            self._index = {}
+            self._total_bytes = 0
+            if self.cache_dir.exists():
+                for path in self.cache_dir.glob("*/*.gz"):
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    self._index[path.stem] = [stat.st_size, stat.st_mtime]
+                    self._total_bytes += stat.st_size
+        return self._index
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until under 90% of max_bytes (under self._lock)."""
+        index = self._load_index()
+        if self._total_bytes <= self.max_bytes:
+            return
+        target = self.max_bytes * 0.9
+        for key, (size, _) in sorted(index.items(), key=lambda item: item[1][1]):
+            if self._total_bytes <= target:
+                break
+            try:
+                self._path(key).unlink()
+            except OSError:
+                pass
+            del index[key]
+            self._total_bytes -= size
+            self._stats["evictions"] += 1
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self._stats[stat] += 1
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    def ttl_for(self, host: str) -> int:
+        return self.ttls.get(host, DEFAULT_TTL)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        path = self._path(key)
+        try:
+            entry = CacheEntry.deserialize(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry {key[:12]}: {e}")
+            self.delete(key)
+            return None
+
+        now = time.time()
+        with self._lock:
+            index = self._load_index()
+            if key in index:
+                index[key][1] = now
+        try:
+            os.utime(path, (now, now))  # Persist LRU order across runs
+        except OSError:
+            pass
+        return entry
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        data = entry.serialize()
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write ETL cache entry for {entry.url}: {e}")
+            return
+
+        with self._lock:
+            index = self._load_index()
+            previous = index.get(key)
+            if previous:
+                self._total_bytes -= previous[0]
+            index[key] = [len(data), time.time()]
+            self._total_bytes += len(data)
+            self._stats["stores"] += 1
+            self._evict()
+
+    def delete(self, key: str) -> None:
+        try:
+            self._path(key).unlink()
+        except OSError:
+            pass
+        with self._lock:
+            index = self._load_index()
+            previous = index.pop(key, None)
+            if previous:
+                self._total_bytes -= previous[0]
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        with self._lock:
+            for key in list(self._load_index()):
+                try:
+                    self._path(key).unlink()
+                except OSError:
+                    pass
+            self._index = {}
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            index = self._load_index()
+            lookups = self._stats["hits"] + self._stats["revalidated"] + self._stats["misses"]
+            return {
+                "enabled": self.enabled,
+                "offline": self.offline,
+                "directory": str(self.cache_dir),
+                "entries": len(index),
+                "size_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hit_rate": round((self._stats["hits"] + self._stats["revalidated"]) / lookups, 3) if lookups else None,
+                **self._stats,
+            }
+
+    # -------------------------------------------------------------------------
+    # Request handling shared by the sync and async transports
+    # -------------------------------------------------------------------------
+
+    def lookup(self, request: httpx.Request) -> Tuple[Optional[str], Optional[CacheEntry], Optional[httpx.Response]]:
+        """
+        Decide how to serve a request.
+
+        Returns:
+            (key, entry, response): response is set when the request can be
+            answered without the network. Otherwise conditional headers have
+            been added to request for a stale entry (if any).
+        """
+        if not self.enabled or request.method != "GET":
+            return None, None, None
+
+        key = _cache_key(request)
+        entry = self.get(key)
+
+        if self.offline:
+            if entry is not None:
+                self._count("offline_hits")
+                return key, entry, entry.to_response("offline")
+            self._count("offline_misses")
+            logger.warning(f"Offline mode: no cached response for {request.url}")
+            return key, None, httpx.Response(504, headers=_OFFLINE_HEADERS, content=b"{}")
+
+        if entry is not None and entry.age() < self.ttl_for(request.url.host):
+            self._count("hits")
+            return key, entry, entry.to_response("hit")
+
+        if entry is not None:
+            if entry.etag:
+                request.headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                request.headers["If-Modified-Since"] = entry.last_modified
+        return key, entry, None
+
+    def store(self, key: str, entry: Optional[CacheEntry], request: httpx.Request, response: httpx.Response, body: bytes) -> httpx.Response:
+        """Update the cache from a network response and return the response to hand back."""
+        if response.status_code == 304 and entry is not None:
+            entry.stored_at = time.time()
+            self.put(key, entry)
+            self._count("revalidated")
+            return entry.to_response("revalidated")
+
+        self._count("misses")
+        headers = [
+            (name.decode("latin-1"), value.decode("latin-1"))
+            for name, value in response.headers.raw
+            if name.decode("latin-1").lower() not in _SKIP_HEADERS
+        ]
+        if response.status_code == 200:
+            self.put(key, CacheEntry(200, headers, body, time.time(), str(request.url)))
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=headers + [("x-gohip-cache", "miss")],
+            content=body,
+            extensions=response.extensions,
+        )
+
+
+# =============================================================================
+# CACHING TRANSPORTS
+# =============================================================================
+
+class CachingAsyncTransport(httpx.AsyncBaseTransport):
+    """Serves GET requests from the response cache before the wrapped transport."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, cache: "ResponseCache"):
+        self._transport = transport
+        self._cache = cache
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key, entry, cached = self._cache.lookup(request)
+        if cached is not None:
+            return cached
+        try:
+            response = await self._transport.handle_async_request(request)
+        except httpx.TransportError:
+            if entry is None:
+                raise
+            logger.warning(f"Network error, serving stale cached response for {request.url}")
+            return entry.to_response("stale")
+        if key is None:
+            return response
+        try:
+            body = await response.aread()
+        finally:
+            await response.aclose()
+        return self._cache.store(key, entry, request, response, body)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class CachingSyncTransport(httpx.BaseTransport):
+    """Sync counterpart of CachingAsyncTransport."""
+
+    def __init__(self, transport: httpx.BaseTransport, cache: "ResponseCache"):
+        self._transport = transport
+        self._cache = cache
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        key, entry, cached = self._cache.lookup(request)
+        if cached is not None:
+            return cached
+        try:
+            response = self._transport.handle_request(request)
+        except httpx.TransportError:
+            if entry is None:
+                raise
+            logger.warning(f"Network error, serving stale cached response for {request.url}")
+            return entry.to_response("stale")
+        if key is None:
+            return response
+        try:
+            body = response.read()
+        finally:
+            response.close()
+        return self._cache.store(key, entry, request, response, body)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+# Process-wide cache shared by all ETL clients
+response_cache = ResponseCache(
+    cache_dir=settings.ETL_CACHE_DIR,
+    max_bytes=settings.ETL_CACHE_MAX_MB * 1024 * 1024,
+    enabled=settings.ETL_CACHE_ENABLED,
+    offline=settings.ETL_OFFLINE,
+)
+
+
+def set_offline_mode(offline: bool) -> None:
+    """Serve ETL requests entirely from cache (no network) when offline is True."""
+    response_cache.offline = offline
+    if offline and not response_cache.enabled:
+        response_cache.enabled = True
+    logger.info(f"ETL offline mode {'enabled' if offline else 'disabled'}")
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    """Current response cache statistics for GET /etl/status."""
+    return response_cache.stats()
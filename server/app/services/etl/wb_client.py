@@ -31,23 +31,28 @@ World Bank indicators provide essential context that correlates with OH outcomes
 Features:
 - Supports 195 countries (global coverage)
 - Per-country synchronous fetching for resilient pipeline
+- Bulk mode: one paged /country/all/ request set per indicator, fanned out
+  into per-country results (indicators x pages instead of countries x indicators)
 - Handles API rate limits gracefully
 """
 
 import logging
 import asyncio
-from typing import Dict, Optional
+from typing import Dict, Iterable, List, Optional, Set
 from datetime import datetime
 
 import httpx
 
 from app.data.targets import GLOBAL_ECONOMIES_50, get_country_name
+from app.services.etl.http_pool import get_async_client
+from app.services.etl.loop_runner import run_sync
 
 logger = logging.getLogger(__name__)
 
 # World Bank API Configuration
 WB_BASE_URL = "http://api.worldbank.org/v2"
 WB_TIMEOUT = 30.0
+WB_BULK_PER_PAGE = 1000  # Records per page for /country/all/ requests
 
 # Indicators we fetch - Phase 22 Expanded
 INDICATORS = {
@@ -57,6 +62,52 @@ INDICATORS = {
     "health_expenditure": "SH.XPD.CHEX.GD.ZS",   # Health expenditure (% of GDP)
 }
 
+# Human-readable names used in logs and source_name
+INDICATOR_NAMES = {
+    "industry_pct_gdp": "Industry % GDP",
+    "gov_effectiveness": "Government Effectiveness",
+    "vulnerable_employment": "Vulnerable Employment",
+    "health_expenditure": "Health Expenditure",
+}
+
+
+class BulkFetchIncompleteError(RuntimeError):
+    """A bulk /country/all/ fetch could not retrieve every page of an indicator."""
+
+
+def fold_bulk_records(
+    records: Iterable[dict],
+    latest: Dict[str, dict],
+    country_codes: Optional[Set[str]] = None,
+) -> None:
+    """
+    Fold one page of a /country/all/ World Bank response into per-country results.
+    
+    Keeps, for each ISO-3 country, the most recent record with a non-null value.
+    Records outside country_codes are skipped when it is given; without it,
+    regional and income aggregates (WLD, EUU, HIC, ...) are kept as well,
+    since they carry ISO-3-like codes. Pages can be folded in any order.
+    
+    Args:
+        records: The data array of a World Bank response page
+        latest: Dict of iso_code -> raw record, updated in place
+        country_codes: Optional set of ISO-3 codes to keep
+    """
+    for record in records or []:
+        iso_code = record.get("countryiso3code")
+        value = record.get("value")
+        if not iso_code or value is None:
+            continue
+        if country_codes is not None and iso_code not in country_codes:
+            continue
+        try:
+            year = int(record.get("date"))
+        except (TypeError, ValueError):
+            continue
+        current = latest.get(iso_code)
+        if current is None or year > current["year"]:
+            latest[iso_code] = {"value": value, "year": year}
+
 
 class WorldBankClient:
     """
@@ -75,6 +126,10 @@ class WorldBankClient:
         """Build World Bank API URL for a specific country and indicator."""
         return f"{self.base_url}/country/{country_code}/indicator/{indicator}"
     
+    def _build_bulk_url(self, indicator: str) -> str:
+        """Build World Bank API URL for one indicator across all countries."""
+        return f"{self.base_url}/country/all/indicator/{indicator}"
+    
     def _parse_response(self, data: list, country_code: str, indicator_name: str) -> Optional[dict]:
         """
         Parse World Bank API response to extract the most recent non-null value.
@@ -137,18 +192,18 @@ class WorldBankClient:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
-                response = await client.get(url, params=params)
-                
-                if response.status_code == 404:
-                    logger.debug(f"No {indicator_name} data for {country_code}")
-                    return None
-                
-                response.raise_for_status()
-                data = response.json()
-                
-                return self._parse_response(data, country_code, indicator_name)
-                
+            client = get_async_client()
+            response = await client.get(url, params=params, timeout=self.timeout)
+            
+            if response.status_code == 404:
+                logger.debug(f"No {indicator_name} data for {country_code}")
+                return None
+            
+            response.raise_for_status()
+            data = response.json()
+            
+            return self._parse_response(data, country_code, indicator_name)
+            
         except httpx.TimeoutException:
             logger.error(f"Timeout fetching World Bank {indicator_name} for {country_code}")
             return None
@@ -188,13 +243,27 @@ class WorldBankClient:
             "Government Effectiveness"
         )
         
-        if result:
+        return self._finalize_result("gov_effectiveness", result)
+    
+    def _finalize_result(self, key: str, result: Optional[dict]) -> Optional[dict]:
+        """
+        Apply per-indicator post-processing shared by per-country and bulk fetches.
+        
+        - gov_effectiveness: normalize GE.EST from -2.5..+2.5 to 0..100
+        - all indicators except industry % GDP: point source at the indicator page
+        """
+        if not result:
+            return result
+        
+        if key == "gov_effectiveness":
             # Normalize from -2.5..+2.5 to 0..100
             raw_value = result["value"]
             normalized = round(((raw_value + 2.5) / 5.0) * 100, 1)
             result["raw_value"] = raw_value
             result["value"] = max(0, min(100, normalized))  # Clamp to 0-100
-            result["source"] = "https://data.worldbank.org/indicator/GE.EST"
+        
+        if key != "industry_pct_gdp":
+            result["source"] = f"https://data.worldbank.org/indicator/{INDICATORS[key]}"
         
         return result
     
@@ -219,10 +288,7 @@ class WorldBankClient:
             "Vulnerable Employment"
         )
         
-        if result:
-            result["source"] = "https://data.worldbank.org/indicator/SL.EMP.VULN.ZS"
-        
-        return result
+        return self._finalize_result("vulnerable_employment", result)
     
     async def fetch_health_expenditure(self, country_code: str) -> Optional[dict]:
         """
@@ -245,25 +311,138 @@ class WorldBankClient:
             "Health Expenditure"
         )
         
-        if result:
-            result["source"] = "https://data.worldbank.org/indicator/SH.XPD.CHEX.GD.ZS"
-        
-        return result
+        return self._finalize_result("health_expenditure", result)
     
-    def _run_async_sync(self, coro):
-        """Helper to run async code in sync context."""
+    # =========================================================================
+    # BULK MODE: ONE INDICATOR FOR ALL COUNTRIES
+    # =========================================================================
+    
+    async def _fetch_bulk_page(self, url: str, params: dict, page: int) -> Optional[list]:
+        """Fetch one page of a /country/all/ response (None if it holds no data)."""
+        client = get_async_client()
+        response = await client.get(url, params={**params, "page": page}, timeout=self.timeout)
+        response.raise_for_status()
+        data = response.json()
+        if not isinstance(data, list) or len(data) < 2:
+            return None
+        return data
+    
+    async def fetch_indicator_all_countries(
+        self,
+        indicator: str,
+        indicator_name: str = "unknown",
+        country_codes: Optional[List[str]] = None,
+    ) -> Dict[str, dict]:
+        """
+        Fetch one indicator for every country with paged /country/all/ requests.
+        
+        The first page reports the page count; remaining pages are requested
+        concurrently and folded into the per-country results.
+        
+        Args:
+            indicator: World Bank indicator code (e.g., "GE.EST")
+            indicator_name: Human-readable name for logging
+            country_codes: Optional ISO-3 codes to keep (default: every record,
+                including regional aggregates)
+            
+        Returns:
+            Dict mapping ISO-3 code to {value, year, indicator, source, source_name}
+            
+        Raises:
+            BulkFetchIncompleteError: a page could not be fetched; partial
+                results are never returned, so callers can fall back to
+                per-country fetches
+        """
+        url = self._build_bulk_url(indicator)
+        params = {
+            "format": "json",
+            "per_page": WB_BULK_PER_PAGE,
+            "mrnev": 1,  # Most recent non-empty value per country
+        }
+        wanted = set(country_codes) if country_codes else None
+        latest: Dict[str, dict] = {}
+        
         try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = None
-        
-        if loop and loop.is_running():
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                future = pool.submit(asyncio.run, coro)
-                return future.result()
-        else:
-            return asyncio.run(coro)
+            first_page = await self._fetch_bulk_page(url, params, 1)
+        except (httpx.HTTPError, ValueError) as e:
+            raise BulkFetchIncompleteError(f"World Bank bulk {indicator_name}: page 1 failed: {e!r}") from e
+        if not first_page:
+            logger.warning(f"No bulk {indicator_name} data returned by World Bank")
+            return {}
+        
+        fold_bulk_records(first_page[1], latest, wanted)
+        total_pages = int(first_page[0].get("pages") or 1)
+        
+        # Every page is awaited (no stray requests); one failure fails the indicator
+        pages = await asyncio.gather(
+            *(self._fetch_bulk_page(url, params, page) for page in range(2, total_pages + 1)),
+            return_exceptions=True,
+        )
+        failed = [
+            f"page {page}: {result!r}"
+            for page, result in enumerate(pages, start=2)
+            if isinstance(result, BaseException)
+        ]
+        if failed:
+            logger.error(f"World Bank bulk {indicator_name}: {len(failed)}/{total_pages} page(s) failed")
+            raise BulkFetchIncompleteError(f"World Bank bulk {indicator_name}: " + "; ".join(failed[:3]))
+        for page_data in pages:
+            if page_data:
+                fold_bulk_records(page_data[1], latest, wanted)
+        
+        logger.info(f"World Bank bulk {indicator_name}: {len(latest)} countries from {total_pages} page(s)")
+        
+        return {
+            iso_code: {
+                "value": round(float(record["value"]), 2),
+                "year": record["year"],
+                "indicator": indicator_name,
+                "source": f"https://data.worldbank.org/indicator/{indicator}",
+                "source_name": f"World Bank WDI ({record['year']})",
+            }
+            for iso_code, record in latest.items()
+        }
+    
+    async def fetch_all_context_indicators_bulk(
+        self,
+        country_codes: List[str],
+    ) -> Dict[str, Dict[str, Optional[dict]]]:
+        """
+        Fetch all contextual indicators for many countries in bulk mode.
+        
+        Args:
+            country_codes: ISO-3 codes to return results for
+            
+        Returns:
+            Dict mapping ISO-3 code to the same dict shape as
+            fetch_all_context_indicators (missing values are None)
+            
+        Raises:
+            BulkFetchIncompleteError: an indicator could not be fetched completely
+        """
+        keys = list(INDICATORS.keys())
+        per_indicator = await asyncio.gather(*(
+            self.fetch_indicator_all_countries(INDICATORS[key], INDICATOR_NAMES[key], country_codes)
+            for key in keys
+        ), return_exceptions=True)
+        for outcome in per_indicator:
+            if isinstance(outcome, BaseException):
+                raise outcome
+        
+        results: Dict[str, Dict[str, Optional[dict]]] = {}
+        for iso_code in country_codes:
+            results[iso_code] = {
+                key: self._finalize_result(key, dict(by_country[iso_code]) if iso_code in by_country else None)
+                for key, by_country in zip(keys, per_indicator)
+            }
+        return results
+    
+    def fetch_all_context_indicators_bulk_sync(
+        self,
+        country_codes: List[str],
+    ) -> Dict[str, Dict[str, Optional[dict]]]:
+        """Synchronous wrapper for bulk context indicator fetch."""
+        return run_sync(self.fetch_all_context_indicators_bulk(country_codes))
     
     def fetch_industry_pct_gdp_sync(self, country_code: str) -> Optional[dict]:
         """
@@ -277,37 +456,45 @@ class WorldBankClient:
         Returns:
             Dict with value, year, source or None if unavailable
         """
-        return self._run_async_sync(self.fetch_industry_pct_gdp(country_code))
+        return run_sync(self.fetch_industry_pct_gdp(country_code))
     
     def fetch_governance_score_sync(self, country_code: str) -> Optional[dict]:
         """Synchronous wrapper for Government Effectiveness fetch."""
-        return self._run_async_sync(self.fetch_governance_score(country_code))
+        return run_sync(self.fetch_governance_score(country_code))
     
     def fetch_vulnerable_employment_sync(self, country_code: str) -> Optional[dict]:
         """Synchronous wrapper for Vulnerable Employment fetch."""
-        return self._run_async_sync(self.fetch_vulnerable_employment(country_code))
+        return run_sync(self.fetch_vulnerable_employment(country_code))
     
     def fetch_health_expenditure_sync(self, country_code: str) -> Optional[dict]:
         """Synchronous wrapper for Health Expenditure fetch."""
-        return self._run_async_sync(self.fetch_health_expenditure(country_code))
+        return run_sync(self.fetch_health_expenditure(country_code))
     
     async def fetch_all_context_indicators(self, country_code: str) -> Dict[str, Optional[dict]]:
         """
         Fetch all contextual indicators for a country.
         
+        The four indicator requests are issued concurrently.
+        
         Returns:
             Dict with all indicator results
         """
+        industry, governance, vulnerable, health = await asyncio.gather(
+            self.fetch_industry_pct_gdp(country_code),
+            self.fetch_governance_score(country_code),
+            self.fetch_vulnerable_employment(country_code),
+            self.fetch_health_expenditure(country_code),
+        )
         return {
-            "industry_pct_gdp": await self.fetch_industry_pct_gdp(country_code),
-            "gov_effectiveness": await self.fetch_governance_score(country_code),
-            "vulnerable_employment": await self.fetch_vulnerable_employment(country_code),
-            "health_expenditure": await self.fetch_health_expenditure(country_code),
+            "industry_pct_gdp": industry,
+            "gov_effectiveness": governance,
+            "vulnerable_employment": vulnerable,
+            "health_expenditure": health,
         }
     
     def fetch_all_context_indicators_sync(self, country_code: str) -> Dict[str, Optional[dict]]:
         """Synchronous wrapper to fetch all context indicators."""
-        return self._run_async_sync(self.fetch_all_context_indicators(country_code))
+        return run_sync(self.fetch_all_context_indicators(country_code))
     
     async def fetch_all_industry_data(self) -> Dict[str, dict]:
         """
@@ -339,21 +526,7 @@ def fetch_industry_data_sync() -> Dict[str, dict]:
     Use this in non-async contexts like standalone scripts.
     """
     client = WorldBankClient()
-    
-    # Handle running loop in different contexts
-    try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        loop = None
-    
-    if loop and loop.is_running():
-        # We're in an async context, create a new thread
-        import concurrent.futures
-        with concurrent.futures.ThreadPoolExecutor() as pool:
-            future = pool.submit(asyncio.run, client.fetch_all_industry_data())
-            return future.result()
-    else:
-        return asyncio.run(client.fetch_all_industry_data())
+    return run_sync(client.fetch_all_industry_data())
 
 
 if __name__ == "__main__":
@@ -32,6 +32,8 @@ from datetime import datetime
 import httpx
 
 from app.data.targets import GLOBAL_ECONOMIES_50, get_country_name
+from app.services.etl.http_pool import get_async_client
+from app.services.etl.loop_runner import run_sync
 
 logger = logging.getLogger(__name__)
 
@@ -119,18 +121,18 @@ class WHOClient:
         }
         
         try:
-            async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
-                response = await client.get(url, params=params)
-                
-                if response.status_code == 404:
-                    logger.debug(f"No WHO {indicator_name} data for {country_iso3}")
-                    return None
-                
-                response.raise_for_status()
-                data = response.json()
-                
-                return self._parse_odata_response(data, country_iso3, indicator_code, indicator_name)
-                
+            client = get_async_client()
+            response = await client.get(url, params=params, timeout=self.timeout)
+            
+            if response.status_code == 404:
+                logger.debug(f"No WHO {indicator_name} data for {country_iso3}")
+                return None
+            
+            response.raise_for_status()
+            data = response.json()
+            
+            return self._parse_odata_response(data, country_iso3, indicator_code, indicator_name)
+            
         except httpx.TimeoutException:
             logger.error(f"Timeout fetching WHO {indicator_name} for {country_iso3}")
             return None
@@ -243,26 +245,11 @@ class WHOClient:
     
     def fetch_uhc_index_sync(self, country_iso3: str) -> Optional[dict]:
         """Synchronous wrapper for UHC Index fetch."""
-        return self._run_async(self.fetch_uhc_index(country_iso3))
+        return run_sync(self.fetch_uhc_index(country_iso3))
     
     def fetch_road_safety_sync(self, country_iso3: str) -> Optional[dict]:
         """Synchronous wrapper for Road Safety fetch."""
-        return self._run_async(self.fetch_road_safety(country_iso3))
-    
-    def _run_async(self, coro):
-        """Helper to run async code in sync context."""
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = None
-        
-        if loop and loop.is_running():
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                future = pool.submit(asyncio.run, coro)
-                return future.result()
-        else:
-            return asyncio.run(coro)
+        return run_sync(self.fetch_road_safety(country_iso3))
     
     async def fetch_all_indicators(self, country_iso3: str) -> Dict[str, Optional[dict]]:
         """
@@ -271,11 +258,15 @@ class WHOClient:
         Args:
             country_iso3: ISO 3166-1 alpha-3 country code
             
+        Both indicator requests are issued concurrently.
+        
         Returns:
             Dict with 'uhc_index' and 'road_safety' results
         """
-        uhc_result = await self.fetch_uhc_index(country_iso3)
-        road_result = await self.fetch_road_safety(country_iso3)
+        uhc_result, road_result = await asyncio.gather(
+            self.fetch_uhc_index(country_iso3),
+            self.fetch_road_safety(country_iso3),
+        )
         
         return {
             "uhc_index": uhc_result,
@@ -284,7 +275,7 @@ class WHOClient:
     
     def fetch_all_indicators_sync(self, country_iso3: str) -> Dict[str, Optional[dict]]:
         """Synchronous wrapper to fetch all WHO indicators for a country."""
-        return self._run_async(self.fetch_all_indicators(country_iso3))
+        return run_sync(self.fetch_all_indicators(country_iso3))
 
 
 def calculate_proxy_fatal_rate(road_safety_value: float) -> float:
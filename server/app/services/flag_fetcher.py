@@ -10,7 +10,6 @@ Phase 27: Enhanced flag fetching for all 195 countries with DB check
 """
 
 import os
-import httpx
 import asyncio
 from pathlib import Path
 from typing import Optional, Dict, List
@@ -18,6 +17,7 @@ import logging
 
 # Import complete country names from targets
 from app.data.targets import COUNTRY_NAMES
+from app.services.etl.http_pool import get_async_client
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +27,10 @@ FLAGS_DIR = Path(__file__).parent.parent.parent / "static" / "flags"
 # Wikipedia API endpoint for querying images
 WIKIPEDIA_API = "https://en.wikipedia.org/w/api.php"
 
+# Flags downloaded at the same time (request pacing is handled by the
+# per-host rate limiter on the pooled ETL HTTP client)
+FLAG_FETCH_CONCURRENCY = 5
+
 # Wikipedia article name overrides for countries with non-standard names
 # These override the names from COUNTRY_NAMES for Wikipedia lookups
 WIKIPEDIA_NAME_OVERRIDES: Dict[str, str] = {
@@ -123,76 +127,80 @@ async def fetch_flag_from_wikipedia(iso_code: str, country_name: Optional[str] =
             "User-Agent": "GOHIP-Platform/1.0 (Occupational Health Intelligence; https://github.com/gohip)",
             "Accept": "application/json",
         }
-        async with httpx.AsyncClient(timeout=30.0, headers=headers) as client:
-            # Step 1: Get the flag image filename from Wikipedia
-            # Query for the country's flag file name
-            params = {
-                "action": "query",
-                "titles": f"Flag of {wiki_name}",
-                "prop": "images",
-                "format": "json",
-            }
-            
-            response = await client.get(WIKIPEDIA_API, params=params)
-            data = response.json()
-            
-            # Find the SVG flag file
-            pages = data.get("query", {}).get("pages", {})
-            flag_filename = None
-            
-            for page in pages.values():
-                images = page.get("images", [])
-                for img in images:
-                    title = img.get("title", "")
-                    # Look for SVG flags
-                    if "Flag" in title and title.endswith(".svg"):
-                        flag_filename = title.replace("File:", "")
-                        break
-                if flag_filename:
-                    break
-            
-            if not flag_filename:
-                # Try alternative: direct flag file name
-                flag_filename = f"Flag_of_{wiki_name.replace(' ', '_')}.svg"
-            
-            # Step 2: Get the actual image URL from Wikimedia Commons
-            params = {
-                "action": "query",
-                "titles": f"File:{flag_filename}",
-                "prop": "imageinfo",
-                "iiprop": "url",
-                "format": "json",
-            }
-            
-            response = await client.get(WIKIPEDIA_API, params=params)
-            data = response.json()
-            
-            # Extract the image URL
-            pages = data.get("query", {}).get("pages", {})
-            image_url = None
-            
-            for page in pages.values():
-                imageinfo = page.get("imageinfo", [])
-                if imageinfo:
-                    image_url = imageinfo[0].get("url")
+        # Pooled ETL client: Wikipedia / Wikimedia requests go through the
+        # per-host rate limiter (with Retry-After aware retries). Flags are
+        # stored on disk once fetched, so the ETL response cache is skipped.
+        client = get_async_client(cached=False)
+        
+        # Step 1: Get the flag image filename from Wikipedia
+        # Query for the country's flag file name
+        params = {
+            "action": "query",
+            "titles": f"Flag of {wiki_name}",
+            "prop": "images",
+            "format": "json",
+        }
+        
+        response = await client.get(WIKIPEDIA_API, params=params, headers=headers, timeout=30.0)
+        data = response.json()
+        
+        # Find the SVG flag file
+        pages = data.get("query", {}).get("pages", {})
+        flag_filename = None
+        
+        for page in pages.values():
+            images = page.get("images", [])
+            for img in images:
+                title = img.get("title", "")
+                # Look for SVG flags
+                if "Flag" in title and title.endswith(".svg"):
+                    flag_filename = title.replace("File:", "")
                     break
+            if flag_filename:
+                break
+        
+        if not flag_filename:
+            # Try alternative: direct flag file name
+            flag_filename = f"Flag_of_{wiki_name.replace(' ', '_')}.svg"
+        
+        # Step 2: Get the actual image URL from Wikimedia Commons
+        params = {
+            "action": "query",
+            "titles": f"File:{flag_filename}",
+            "prop": "imageinfo",
+            "iiprop": "url",
+            "format": "json",
+        }
+        
+        response = await client.get(WIKIPEDIA_API, params=params, headers=headers, timeout=30.0)
+        data = response.json()
+        
+        # Extract the image URL
+        pages = data.get("query", {}).get("pages", {})
+        image_url = None
+        
+        for page in pages.values():
+            imageinfo = page.get("imageinfo", [])
+            if imageinfo:
+                image_url = imageinfo[0].get("url")
+                break
+        
+        if not image_url:
+            logger.warning(f"Could not find flag URL for {iso_code} ({wiki_name})")
+            return None
+        
+        # Step 3: Download the flag image
+        response = await client.get(image_url, headers=headers, timeout=30.0)
+        
+        if response.status_code == 200:
+            # Save the SVG file
+            flag_path.write_bytes(response.content)
+            logger.info(f"Downloaded flag for {iso_code}")
+            return get_flag_url(iso_code)
+        else:
+            logger.warning(f"Failed to download flag for {iso_code}: HTTP {response.status_code}")
+            return None
             
-            if not image_url:
-                logger.warning(f"Could not find flag URL for {iso_code} ({wiki_name})")
-                return None
-            
-            # Step 3: Download the flag image
-            response = await client.get(image_url)
-            
-            if response.status_code == 200:
-                # Save the SVG file
-                flag_path.write_bytes(response.content)
-                logger.info(f"Downloaded flag for {iso_code}")
-                return get_flag_url(iso_code)
-            else:
-                logger.warning(f"Failed to download flag for {iso_code}: HTTP {response.status_code}")
-                return None
-                
     except Exception as e:
         logger.error(f"Error fetching flag for {iso_code}: {e}")
         return None
@@ -212,23 +220,21 @@ async def fetch_flags_for_countries(iso_codes: list[str]) -> dict[str, Optional[
     
     results = {}
     
-    # Process in batches to avoid overwhelming Wikipedia
-    batch_size = 5
-    for i in range(0, len(iso_codes), batch_size):
-        batch = iso_codes[i:i + batch_size]
-        tasks = [fetch_flag_from_wikipedia(code) for code in batch]
-        batch_results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        for code, result in zip(batch, batch_results):
-            if isinstance(result, Exception):
-                logger.error(f"Exception fetching flag for {code}: {result}")
-                results[code] = None
-            else:
-                results[code] = result
-        
-        # Small delay between batches to be nice to Wikipedia
-        if i + batch_size < len(iso_codes):
-            await asyncio.sleep(0.5)
+    # Bound concurrent downloads; request pacing comes from the rate limiter
+    semaphore = asyncio.Semaphore(FLAG_FETCH_CONCURRENCY)
+    
+    async def fetch_one(code: str) -> Optional[str]:
+        async with semaphore:
+            return await fetch_flag_from_wikipedia(code)
+    
+    fetched = await asyncio.gather(*(fetch_one(code) for code in iso_codes), return_exceptions=True)
+    
+    for code, result in zip(iso_codes, fetched):
+        if isinstance(result, Exception):
+            logger.error(f"Exception fetching flag for {code}: {result}")
+            results[code] = None
+        else:
+            results[code] = result
     
     return results
 
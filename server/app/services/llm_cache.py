@@ -0,0 +1,322 @@
+"""
+GOHIP Platform - LLM Response Cache
+====================================
+
+Shared response cache under AgentRunner.run, ai_service.call_ai_api and
+ai_orchestrator.call_orchestrator_llm.
+
+Every one of those sent a paid, multi-second LLM request, even when the
+filled prompt (agent template + injected country context) was byte-identical
+to one answered an hour earlier. Regenerating insights or analyses for
+unchanged data now costs a database lookup:
+
+- Exact tier: entries are keyed by the SHA-256 of (provider, model, system
+  prompt, user prompt, temperature)
+- Semantic tier (optional, LLM_CACHE_SEMANTIC): a miss is answered by the
+  cached response whose user prompt embedding is closest, if its cosine
+  similarity reaches LLM_CACHE_SEMANTIC_THRESHOLD. Candidates share the
+  request scope - provider, model, temperature, system prompt and the
+  caller's partition (the country) - so a near-duplicate can never answer
+  for another country or another agent
+- Entries expire after LLM_CACHE_TTL_HOURS; beyond LLM_CACHE_MAX_ENTRIES
+  the least recently hit entries are evicted
+- Only deterministic requests (temperature 0) are cached unless the caller
+  passes use_cache=True; regenerate paths pass use_cache=False (see
+  cache_enabled)
+
+Storage is the llm_response_cache table, in the application database by
+default or in the database named by LLM_CACHE_URL (e.g. a local
+sqlite:///.llm_cache.db, created on first use).
+
+The default embedder hashes character trigrams of the prompt (no model
+download, no API call); set_embedder() plugs in a real embedding model.
+Cache failures are logged and treated as misses - they never fail the
+LLM call itself.
+
+Configuration (app.core.config.Settings):
+    LLM_CACHE_ENABLED, LLM_CACHE_URL, LLM_CACHE_TTL_HOURS, LLM_CACHE_MAX_ENTRIES,
+    LLM_CACHE_SEMANTIC, LLM_CACHE_SEMANTIC_THRESHOLD
+
+Usage:
+    request = LLMRequest("openai", "gpt-4o", system_prompt, user_prompt, 0.0, partition="DEU")
+    output, cache_status = llm_cache.lookup(request) if cache_enabled(request, use_cache) else (None, None)
+    if output is None:
+        output = llm.invoke(messages).content
+        llm_cache.store(request, output)
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.llm_cache import LLMResponseCacheEntry
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_DIMS = 512
+
+# Most recently hit entries of a scope compared against a new prompt
+SEMANTIC_CANDIDATES = 200
+
+# Trace cache_status values (None: cache not consulted)
+CACHE_HIT = "hit"
+CACHE_SEMANTIC_HIT = "semantic_hit"
+CACHE_MISS = "miss"
+
+Embedder = Callable[[str], np.ndarray]
+
+
+def _digest(*parts: Any) -> str:
+    return hashlib.sha256(json.dumps(parts, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def hashed_ngram_embedding(text: str, dims: int = EMBEDDING_DIMS) -> np.ndarray:
+    """Unit-length float32 vector of hashed character-trigram counts."""
+    data = np.frombuffer(" ".join(text.lower().split()).encode("utf-8"), dtype=np.uint8).astype(np.uint64)
+    vector = np.zeros(dims, dtype=np.float32)
+    if len(data) >= 3:
+        hashes = (data[:-2] * 1000003 + data[1:-1]) * 1000003 + data[2:]
+        vector += np.bincount(hashes % dims, minlength=dims).astype(np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+@dataclass(frozen=True)
+class LLMRequest:
+    """Everything that determines an LLM response, as far as the cache is concerned."""
+    provider: str
+    model: str
+    system_prompt: str
+    user_prompt: str
+    temperature: Optional[float] = None
+    # Near-duplicates only match within a partition (e.g. the country ISO code)
+    partition: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        return _digest(self.provider, self.model, self.system_prompt, self.user_prompt, self.temperature)
+
+    @property
+    def scope(self) -> str:
+        return _digest(self.provider, self.model, self.system_prompt, self.temperature, self.partition)
+
+    @property
+    def deterministic(self) -> bool:
+        return self.temperature == 0
+
+
+def cache_enabled(request: LLMRequest, use_cache: Optional[bool] = None) -> bool:
+    """
+    Whether a call may answer from / store in the cache.
+
+    use_cache=None caches deterministic requests only: a sampled (temperature
+    > 0) response replayed for the whole TTL would make every regenerate
+    return the same text.
+    """
+    return request.deterministic if use_cache is None else use_cache
+
+
+class LLMResponseCache:
+    """TTL + LRU bounded LLM response store with an optional semantic tier."""
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        enabled: bool = True,
+        ttl_hours: int = 24 * 7,
+        max_entries: int = 5000,
+        semantic: bool = False,
+        semantic_threshold: float = 0.98,
+        embedder: Optional[Embedder] = None,
+    ):
+        self.url = url
+        self.enabled = enabled
+        self.ttl = timedelta(hours=ttl_hours)
+        self.max_entries = max_entries
+        self.semantic = semantic
+        self.semantic_threshold = semantic_threshold
+        self.embedder: Embedder = embedder or hashed_ngram_embedding
+        self._sessions: Optional[sessionmaker] = None
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "semantic_hits": 0, "misses": 0, "stores": 0, "evictions": 0, "errors": 0}
+
+    def _session(self) -> Session:
+        """Session on the cache backend (created on first use)."""
+        if self._sessions is None:
+            with self._lock:
+                if self._sessions is None:
+                    if self.url:
+                        engine = create_engine(self.url, pool_pre_ping=True)
+                        LLMResponseCacheEntry.__table__.create(engine, checkfirst=True)
+                        self._sessions = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+                    else:
+                        self._sessions = SessionLocal
+        return self._sessions()
+
+    def _count(self, stat: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[stat] += amount
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    def lookup(self, request: LLMRequest) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Cached response for a request.
+
+        Returns:
+            (response, cache_status): response is None on a miss;
+            cache_status is None when the cache is disabled
+        """
+        if not self.enabled:
+            return None, None
+
+        now = datetime.utcnow()
+        try:
+            with self._session() as db:
+                status = CACHE_HIT
+                entry = db.get(LLMResponseCacheEntry, request.key)
+                if entry is not None and entry.expires_at <= now:
+                    entry = None
+                if entry is None and self.semantic:
+                    status = CACHE_SEMANTIC_HIT
+                    entry = self._nearest(db, request, now)
+                if entry is None:
+                    self._count("misses")
+                    return None, CACHE_MISS
+
+                entry.hit_count = (entry.hit_count or 0) + 1
+                entry.last_hit_at = now
+                response = entry.response
+                db.commit()
+        except Exception as e:
+            logger.warning(f"LLM cache lookup failed, treating as miss: {e}")
+            self._count("errors")
+            return None, CACHE_MISS
+
+        self._count("hits" if status == CACHE_HIT else "semantic_hits")
+        logger.info(f"[LLM Cache] {status} for {request.provider}/{request.model} ({len(response)} chars)")
+        return response, status
+
+    def _nearest(self, db: Session, request: LLMRequest, now: datetime) -> Optional[LLMResponseCacheEntry]:
+        """Most similar live entry of the request scope, if similar enough."""
+        query = self.embedder(request.user_prompt).astype(np.float32)
+        candidates = [
+            row for row in db.query(LLMResponseCacheEntry.key, LLMResponseCacheEntry.embedding)
+            .filter(
+                LLMResponseCacheEntry.scope == request.scope,
+                LLMResponseCacheEntry.expires_at > now,
+                LLMResponseCacheEntry.embedding.isnot(None),
+            )
+            .order_by(LLMResponseCacheEntry.last_hit_at.desc())
+            .limit(SEMANTIC_CANDIDATES)
+            # Skip embeddings of another embedder
+            if len(row.embedding) == query.nbytes
+        ]
+        if not candidates:
+            return None
+
+        matrix = np.frombuffer(b"".join(row.embedding for row in candidates), dtype=np.float32)
+        similarities = matrix.reshape(len(candidates), -1) @ query
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.semantic_threshold:
+            return None
+        logger.debug(f"[LLM Cache] Near-duplicate prompt (similarity {similarities[best]:.4f})")
+        return db.get(LLMResponseCacheEntry, candidates[best].key)
+
+    def store(self, request: LLMRequest, response: Any) -> None:
+        """Cache a successful response (non-string or empty responses are skipped)."""
+        if not self.enabled or not isinstance(response, str) or not response.strip():
+            return
+
+        now = datetime.utcnow()
+        try:
+            embedding = self.embedder(request.user_prompt).astype(np.float32).tobytes() if self.semantic else None
+            with self._session() as db:
+                db.merge(LLMResponseCacheEntry(
+                    key=request.key,
+                    scope=request.scope,
+                    provider=request.provider,
+                    model_name=request.model,
+                    temperature=request.temperature,
+                    prompt_preview=request.user_prompt[:200],
+                    response=response,
+                    embedding=embedding,
+                    created_at=now,
+                    last_hit_at=now,
+                    expires_at=now + self.ttl,
+                    hit_count=0,
+                ))
+                db.commit()
+                self._count("stores")
+                self._evict(db, now)
+        except Exception as e:
+            logger.warning(f"Could not store LLM response in cache: {e}")
+            self._count("errors")
+
+    def _evict(self, db: Session, now: datetime) -> None:
+        """Drop expired entries, then the least recently hit beyond max_entries."""
+        evicted = db.query(LLMResponseCacheEntry).filter(
+            LLMResponseCacheEntry.expires_at <= now
+        ).delete(synchronize_session=False)
+
+        overflow = (db.query(func.count(LLMResponseCacheEntry.key)).scalar() or 0) - self.max_entries
+        if overflow > 0:
+            oldest = select(LLMResponseCacheEntry.key).order_by(LLMResponseCacheEntry.last_hit_at).limit(overflow)
+            evicted += db.query(LLMResponseCacheEntry).filter(
+                LLMResponseCacheEntry.key.in_(oldest.scalar_subquery())
+            ).delete(synchronize_session=False)
+
+        db.commit()
+        if evicted:
+            self._count("evictions", evicted)
+
+    def clear(self) -> int:
+        """Remove every cached response; returns the number removed."""
+        with self._session() as db:
+            removed = db.query(LLMResponseCacheEntry).delete(synchronize_session=False)
+            db.commit()
+        return removed
+
+    def set_embedder(self, embedder: Embedder) -> None:
+        """Use another embedding function for the semantic tier (old embeddings are ignored)."""
+        self.embedder = embedder
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            answered = self._stats["hits"] + self._stats["semantic_hits"]
+            lookups = answered + self._stats["misses"]
+            return {
+                "enabled": self.enabled,
+                "semantic": self.semantic,
+                "backend": "LLM_CACHE_URL" if self.url else "application database",
+                "hit_rate": round(answered / lookups, 3) if lookups else None,
+                **self._stats,
+            }
+
+
+# Process-wide cache shared by every LLM caller
+llm_cache = LLMResponseCache(
+    url=settings.LLM_CACHE_URL,
+    enabled=settings.LLM_CACHE_ENABLED,
+    ttl_hours=settings.LLM_CACHE_TTL_HOURS,
+    max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+    semantic=settings.LLM_CACHE_SEMANTIC,
+    semantic_threshold=settings.LLM_CACHE_SEMANTIC_THRESHOLD,
+)
+
+
+def get_llm_cache_stats() -> Dict[str, Any]:
+    """Current LLM response cache statistics (this process)."""
+    return llm_cache.stats()
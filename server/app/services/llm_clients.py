@@ -0,0 +1,140 @@
+"""
+GOHIP Platform - LLM Client Registry
+=====================================
+
+Process-wide registry of warmed LangChain chat models, shared by
+ai_orchestrator.get_llm_from_config and ai_service.
+
+Both factories used to build a new ChatOpenAI / ChatAnthropic / ... per
+call: the Fernet-encrypted API key was decrypted again, the provider module
+import and SDK client setup were paid again, and the new SDK client opened
+fresh connections (TCP + TLS) to the provider. A batch of insight
+generations built thousands of identical clients.
+
+Clients are now built once per ClientKey - factory, provider, model,
+endpoint, API key fingerprint and the generation settings baked into the
+client (temperature, max tokens) - and reused:
+
+- A hit costs a dictionary lookup: no decryption (the fingerprint is taken
+  from the encrypted key), no import, no client setup
+- The SDK clients inside each model keep their HTTP connection pools, so
+  calls reuse keep-alive connections to the provider
+- Async connections belong to the event loop that opened them, so callers
+  inside a running loop get clients of their own per loop (as the ETL
+  pools in etl.http_pool); the loop's clients go away with the loop
+- At most MAX_CLIENTS clients per scope, least recently used dropped first
+- invalidate_llm_clients() drops every client; PUT /ai-config calls it, and
+  a changed key, model or endpoint maps to a new ClientKey anyway
+
+LangChain chat models are safe to share between threads and tasks.
+
+Usage:
+    key = ClientKey("orchestrator", "openai", "gpt-4o", None, key_fingerprint(encrypted), 0.7, 4096)
+    llm = llm_clients.get(key, lambda: _create_llm(...))  # build only runs on a miss
+"""
+
+import asyncio
+import hashlib
+import logging
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, NamedTuple, Optional
+
+logger = logging.getLogger(__name__)
+
+MAX_CLIENTS = 32
+
+
+class ClientKey(NamedTuple):
+    """Everything a built chat model depends on."""
+    factory: str
+    provider: str
+    model: str
+    endpoint: Optional[str]
+    key_fingerprint: Optional[str]
+    temperature: Optional[float]
+    max_tokens: Optional[int]
+
+
+def key_fingerprint(api_key_encrypted: Optional[str]) -> Optional[str]:
+    """Stable identifier of an encrypted API key (no decryption needed)."""
+    if not api_key_encrypted:
+        return None
+    return hashlib.sha256(api_key_encrypted.encode("utf-8")).hexdigest()[:16]
+
+
+class LLMClientRegistry:
+    """Thread-safe, LRU-bounded store of built chat models."""
+
+    def __init__(self, max_clients: int = MAX_CLIENTS):
+        self.max_clients = max_clients
+        self._lock = threading.Lock()
+        # Callers outside an event loop (sync invoke, thread pools)
+        self._clients: "OrderedDict[ClientKey, Any]" = OrderedDict()
+        self._loop_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, OrderedDict]" = weakref.WeakKeyDictionary()
+        self._stats = {"hits": 0, "builds": 0, "evictions": 0, "invalidations": 0}
+
+    def _scope(self) -> "OrderedDict[ClientKey, Any]":
+        """Client store of the running event loop, or the shared one (under self._lock)."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self._clients
+        clients = self._loop_clients.get(loop)
+        if clients is None:
+            clients = self._loop_clients[loop] = OrderedDict()
+        return clients
+
+    def get(self, key: ClientKey, build: Callable[[], Any]) -> Any:
+        """Warmed client for key, built with build() on first use."""
+        with self._lock:
+            clients = self._scope()
+            client = clients.get(key)
+            if client is not None:
+                clients.move_to_end(key)
+                self._stats["hits"] += 1
+                return client
+
+        # Built outside the lock: a concurrent build of the same key is harmless
+        client = build()
+        with self._lock:
+            clients[key] = client
+            clients.move_to_end(key)
+            self._stats["builds"] += 1
+            while len(clients) > self.max_clients:
+                clients.popitem(last=False)
+                self._stats["evictions"] += 1
+        logger.info(f"[LLM Clients] Built {key.provider}/{key.model} client ({key.factory})")
+        return client
+
+    def invalidate(self) -> None:
+        """Drop every client (AI configuration changed)."""
+        with self._lock:
+            self._clients.clear()
+            self._loop_clients.clear()
+            self._stats["invalidations"] += 1
+        logger.info("[LLM Clients] Registry invalidated")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "clients": len(self._clients),
+                "event_loops": len(self._loop_clients),
+                "loop_clients": sum(len(clients) for clients in self._loop_clients.values()),
+                **self._stats,
+            }
+
+
+# Process-wide registry shared by every LLM caller
+llm_clients = LLMClientRegistry()
+
+
+def invalidate_llm_clients() -> None:
+    """Drop cached clients (called when the AI configuration is updated)."""
+    llm_clients.invalidate()
+
+
+def get_llm_client_stats() -> Dict[str, Any]:
+    """Current registry statistics (this process)."""
+    return llm_clients.stats()
@@ -23,6 +23,7 @@ from app.models.country import Country
 from app.models.user import MetricExplanation, AIConfig, User
 from app.core.config import settings
 from app.services.ai_call_tracer import AICallTracer
+from app.services.rank_index import MetricRanking, get_rank_index
 
 logger = logging.getLogger(__name__)
 
@@ -196,8 +197,14 @@ def get_metric_value(country: Country, pillar_id: str, metric_name: str) -> tupl
     return value, formatted_value
 
 
-def calculate_percentile(value: float, benchmark: dict) -> float:
-    """Calculate percentile rank based on value and benchmark."""
+def calculate_percentile(value: float, benchmark: dict, ranking: Optional[MetricRanking] = None) -> float:
+    """
+    Calculate percentile rank based on value and benchmark.
+    
+    With a ranking (app.services.rank_index) holding data, the percentile is
+    the value's actual position among all countries; the benchmark
+    interpolation is the fallback for categorical metrics and empty data.
+    """
     if value is None:
         return 50.0  # Default to median if no value
     
@@ -205,6 +212,9 @@ def calculate_percentile(value: float, benchmark: dict) -> float:
     best = benchmark.get("best", 100)
     lower_better = benchmark.get("lower_better", False)
     
+    if ranking is not None and ranking.size:
+        return ranking.percentile(value, higher_is_better=not lower_better)
+    
     if lower_better:
         # For metrics where lower is better (e.g., fatal_accident_rate)
         if value <= best:
@@ -275,6 +285,14 @@ PILLAR_METRICS = {
     ],
 }
 
+# Country snapshot layer of each pillar (rank index fields are "layer.metric")
+PILLAR_LAYERS = {
+    "governance": "governance",
+    "pillar1": "pillar_1_hazard",
+    "pillar2": "pillar_2_vigilance",
+    "pillar3": "pillar_3_restoration",
+}
+
 PILLAR_NAMES = {
     "governance": "Governance Layer",
     "pillar1": "Pillar 1: Hazard Control",
@@ -304,7 +322,8 @@ def generate_metric_explanation_with_ai(
     # Get metric value
     value, formatted_value = get_metric_value(country, pillar_id, metric_id)
     global_avg = benchmark.get("global_avg")
-    percentile = calculate_percentile(value, benchmark) if value is not None else 50.0
+    ranking = get_rank_index(db).ranking(f"{PILLAR_LAYERS.get(pillar_id, pillar_id)}.{metric_id}")
+    percentile = calculate_percentile(value, benchmark, ranking) if value is not None else 50.0
     
     # Get AI config
     ai_config = db.query(AIConfig).filter(AIConfig.is_active == True).first()
@@ -13,6 +13,8 @@ from datetime import datetime
 from typing import List, Optional, Dict, Any
 from enum import Enum
 
+from app.services.etl.rate_limiter import get_rate_limit_stats
+
 
 class LogLevel(str, Enum):
     """Log severity levels."""
@@ -166,6 +168,9 @@ class PipelineLogger:
         with self._lock:
             if iso_code not in self._failed_countries:
                 self._failed_countries.append(iso_code)
+            # A country can fail after completing (e.g. its batched database write)
+            if iso_code in self._completed_countries:
+                self._completed_countries.remove(iso_code)
             if iso_code in self._country_data:
                 self._country_data[iso_code]["status"] = CountryStatus.FAILED.value
                 self._country_data[iso_code]["finished_at"] = datetime.utcnow().isoformat()
@@ -263,6 +268,7 @@ class PipelineLogger:
             - is_running: Boolean pipeline status
             - started_at: Timestamp when pipeline started
             - finished_at: Timestamp when pipeline finished (if done)
+            - rate_limits: Per-host throughput, throttle and retry counts
         """
         with self._lock:
             completed_count = len(self._completed_countries) + len(self._failed_countries)
@@ -278,6 +284,7 @@ class PipelineLogger:
                 "is_running": self._is_running,
                 "started_at": self._started_at.isoformat() if self._started_at else None,
                 "finished_at": self._finished_at.isoformat() if self._finished_at else None,
+                "rate_limits": get_rate_limit_stats(),
             }
 
 
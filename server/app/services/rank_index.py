@@ -0,0 +1,199 @@
+"""
+GOHIP Platform - Metric Rank Index
+Pre-sorted per-metric rankings over every numeric country metric
+
+/intelligence/rankings/{metric} used to sort the whole country_intelligence
+table per request, and the metric explanation agent estimated percentiles
+from static benchmarks. Both now read a shared in-process index:
+
+- One MetricRanking per numeric column of the snapshot layers
+  ("intelligence.gdp_per_capita_ppp", "pillar_1_hazard.fatal_accident_rate")
+  holding the values sorted ascending
+- Dense ranks and percentiles for any value or country in O(log n)
+  (bisect over the sorted values and the distinct values)
+- Top / bottom N are slices of the sorted entries
+
+The index follows the country snapshot: when its state moves on (e.g. the
+intelligence pipeline rescored some countries), only the rows rewritten
+since the last sync are re-read and moved within each ranking. A row
+count that no longer matches (countries removed) triggers a full rebuild.
+
+Usage:
+    ranking = get_rank_index(db).ranking("intelligence.hdi_score")
+    rank = ranking.rank_of("DEU", higher_is_better=True)
+    percentile = ranking.percentile(0.9, higher_is_better=True)
+"""
+
+import logging
+import threading
+from bisect import bisect_left, bisect_right
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import Float, Integer, inspect
+from sqlalchemy.orm import Session
+
+from app.services.country_snapshot import (
+    EXCLUDED_COLUMNS,
+    SNAPSHOT_LAYERS,
+    current_state,
+    project_snapshot,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def ranked_fields() -> List[str]:
+    """Snapshot fields ("layer.column") of every numeric metric column."""
+    return [
+        f"{layer}.{column.key}"
+        for layer, model in SNAPSHOT_LAYERS.items()
+        for column in inspect(model).columns
+        if isinstance(column.type, (Float, Integer))
+        and not column.primary_key
+        and not column.foreign_keys
+        and column.key not in EXCLUDED_COLUMNS
+    ]
+
+
+class MetricRanking:
+    """Values of one metric sorted ascending, with O(log n) rank lookups."""
+
+    __slots__ = ("values_by_iso", "values", "entries", "distinct", "counts")
+
+    def __init__(self):
+        self.values_by_iso: Dict[str, float] = {}
+        self.values: List[float] = []
+        self.entries: List[Tuple[float, str]] = []
+        self.distinct: List[float] = []
+        self.counts: Dict[float, int] = {}
+
+    @property
+    def size(self) -> int:
+        return len(self.values)
+
+    def copy(self) -> "MetricRanking":
+        ranking = MetricRanking()
+        ranking.values_by_iso = dict(self.values_by_iso)
+        ranking.values = list(self.values)
+        ranking.entries = list(self.entries)
+        ranking.distinct = list(self.distinct)
+        ranking.counts = dict(self.counts)
+        return ranking
+
+    def set(self, iso_code: str, value: Optional[float]) -> None:
+        """Insert, move or (value None) remove a country."""
+        previous = self.values_by_iso.pop(iso_code, None)
+        if previous is not None:
+            position = bisect_left(self.entries, (previous, iso_code))
+            del self.entries[position]
+            del self.values[position]
+            self.counts[previous] -= 1
+            if not self.counts[previous]:
+                del self.counts[previous]
+                del self.distinct[bisect_left(self.distinct, previous)]
+
+        if value is not None:
+            self.values_by_iso[iso_code] = value
+            position = bisect_left(self.entries, (value, iso_code))
+            self.entries.insert(position, (value, iso_code))
+            self.values.insert(position, value)
+            if value not in self.counts:
+                self.distinct.insert(bisect_left(self.distinct, value), value)
+            self.counts[value] = self.counts.get(value, 0) + 1
+
+    def rank(self, value: float, higher_is_better: bool) -> int:
+        """Dense rank of a value (1 = best; ties share a rank)."""
+        if higher_is_better:
+            return len(self.distinct) - bisect_right(self.distinct, value) + 1
+        return bisect_left(self.distinct, value) + 1
+
+    def percentile(self, value: float, higher_is_better: bool) -> float:
+        """Share of countries (0-100) ranked at or below a value."""
+        if not self.values:
+            return 50.0
+        if higher_is_better:
+            at_or_below = bisect_right(self.values, value)
+        else:
+            at_or_below = len(self.values) - bisect_left(self.values, value)
+        return at_or_below / len(self.values) * 100
+
+    def rank_of(self, iso_code: str, higher_is_better: bool) -> Optional[int]:
+        value = self.values_by_iso.get(iso_code)
+        return None if value is None else self.rank(value, higher_is_better)
+
+    def top(self, count: int, higher_is_better: bool) -> List[Tuple[str, float]]:
+        """Best count countries, best first, as (iso_code, value)."""
+        entries = self.entries[::-1][:count] if higher_is_better else self.entries[:count]
+        return [(iso_code, value) for value, iso_code in entries]
+
+    def bottom(self, count: int, higher_is_better: bool) -> List[Tuple[str, float]]:
+        """Worst count countries, in rank order (worst last), as (iso_code, value)."""
+        entries = self.entries[:count][::-1] if higher_is_better else self.entries[-count:]
+        return [(iso_code, value) for value, iso_code in entries]
+
+
+class RankIndex:
+    """MetricRanking per ranked field, kept in step with the country snapshot."""
+
+    def __init__(self):
+        self.fields = ranked_fields()
+        self.rankings: Dict[str, MetricRanking] = {}
+        self.names: Dict[str, str] = {}
+        self.state: Optional[Tuple[int, int]] = None
+        self._lock = threading.Lock()
+
+    def ranking(self, field: str) -> Optional[MetricRanking]:
+        return self.rankings.get(field)
+
+    def _apply(self, rankings: Dict[str, MetricRanking], names: Dict[str, str], row: Dict) -> None:
+        names[row["iso_code"]] = row["name"]
+        for field in self.fields:
+            layer, _, column = field.partition(".")
+            value = (row[layer] or {}).get(column)
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                value = None
+            rankings[field].set(row["iso_code"], value)
+
+    def sync(self, db: Session) -> "RankIndex":
+        """
+        Bring the index up to the current snapshot state. Updates are made
+        on copies and swapped in, so concurrent readers never see a
+        half-moved ranking.
+        """
+        state = current_state(db)
+        if state == self.state:
+            return self
+        with self._lock:
+            if state == self.state:
+                return self
+            layers = list(SNAPSHOT_LAYERS)
+            incremental = self.state is not None
+            if incremental:
+                rankings = {field: ranking.copy() for field, ranking in self.rankings.items()}
+                names = dict(self.names)
+                for row in project_snapshot(db, layers, refresh=False, since_version=self.state[0]):
+                    self._apply(rankings, names, row)
+            if not incremental or len(names) != state[1]:
+                rankings = {field: MetricRanking() for field in self.fields}
+                names = {}
+                for row in project_snapshot(db, layers, refresh=False):
+                    self._apply(rankings, names, row)
+            self.rankings, self.names, self.state = rankings, names, state
+            logger.debug(
+                f"Rank index at snapshot v{state[0]} ({'incremental' if incremental else 'full'}, "
+                f"{len(names)} countries, {len(self.fields)} metrics)"
+            )
+        return self
+
+
+_index: Optional[RankIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_rank_index(db: Session) -> RankIndex:
+    """Shared rank index, synced with the current snapshot."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = RankIndex()
+    return _index.sync(db)
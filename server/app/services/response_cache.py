@@ -0,0 +1,135 @@
+"""
+GOHIP Platform - Versioned Response Cache
+In-process read-through cache of serialised, pre-compressed JSON responses
+
+Endpoints whose payload only changes when the underlying data does (the
+global map metadata, for example) cache the response body keyed by a data
+version (for country data: country_snapshot.current_state). A repeat request
+then costs a version check and a dictionary lookup:
+
+- The body is serialised once and stored as JSON bytes, plus gzip and
+  (when the brotli package is installed) brotli encodings
+- Every entry carries an ETag derived from the version; a matching
+  If-None-Match is answered with 304 Not Modified and no body
+- Responses are sent with Cache-Control: no-cache, so browsers keep the
+  body and revalidate on every load
+
+Only the latest version of each cache is kept: once the data version moves
+on, older bodies can never be served again.
+
+Usage:
+    cache = ResponseCache("geojson-metadata")
+    entry = cache.get(version) or cache.put(version, build_response().model_dump_json())
+    return entry.respond(request)
+"""
+
+import gzip
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+from fastapi import Request, Response
+
+logger = logging.getLogger(__name__)
+
+try:
+    import brotli
+except ImportError:  # Optional: gzip only
+    brotli = None
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 11
+
+# Preferred first when the client accepts several
+ENCODINGS = ("br", "gzip")
+
+
+def _accepted_encodings(header: str) -> set:
+    """Content codings accepted by an Accept-Encoding header (q=0 excluded)."""
+    accepted = set()
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = params.strip()
+        if quality.startswith("q="):
+            try:
+                if float(quality[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        if coding:
+            accepted.add(coding.strip().lower())
+    return accepted
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """If-None-Match comparison (weak, as for GET requests)."""
+    if header.strip() == "*":
+        return True
+    bare = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == bare for candidate in header.split(","))
+
+
+@dataclass
+class CachedResponse:
+    """One serialised response body with its pre-compressed encodings."""
+    version: Any
+    etag: str
+    body: bytes
+    encoded: Dict[str, bytes] = field(default_factory=dict)
+    media_type: str = "application/json"
+
+    @classmethod
+    def build(cls, version: Any, body: bytes, media_type: str = "application/json") -> "CachedResponse":
+        encoded = {"gzip": gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)}
+        if brotli is not None:
+            encoded["br"] = brotli.compress(body, quality=BROTLI_QUALITY)
+        # Weak: the same ETag covers every content coding of the body
+        etag = f'W/"{hashlib.sha256(body).hexdigest()[:32]}"'
+        return cls(version, etag, body, encoded, media_type)
+
+    def respond(self, request: Request) -> Response:
+        """304 when the client already holds this version, else the best accepted encoding."""
+        headers = {"ETag": self.etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, self.etag):
+            return Response(status_code=304, headers=headers)
+
+        accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+        for coding in ENCODINGS:
+            if coding in self.encoded and coding in accepted:
+                headers["Content-Encoding"] = coding
+                return Response(content=self.encoded[coding], media_type=self.media_type, headers=headers)
+        return Response(content=self.body, media_type=self.media_type, headers=headers)
+
+
+class ResponseCache:
+    """Latest-version-only cache of one endpoint's response."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._entry: Optional[CachedResponse] = None
+        self._lock = threading.Lock()
+
+    def get(self, version: Any) -> Optional[CachedResponse]:
+        entry = self._entry
+        return entry if entry is not None and entry.version == version else None
+
+    def put(self, version: Any, body: str | bytes) -> CachedResponse:
+        """Serialise and compress a body for version and make it current."""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        entry = CachedResponse.build(version, body)
+        with self._lock:
+            self._entry = entry
+        logger.debug(
+            f"Cached {self.name} response for version {version}: {len(body)} bytes "
+            f"({', '.join(f'{coding} {len(data)}' for coding, data in entry.encoded.items())})"
+        )
+        return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entry = None
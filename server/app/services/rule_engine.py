@@ -0,0 +1,264 @@
+"""
+GOHIP Platform - Compiled Maturity Rule Engine
+Compiles MaturityScoringRule configs into closures, once per rule set
+
+calculate_score_with_rules used to re-interpret every rule's JSON condition
+for every country: a string dispatch on condition_type and operator, and the
+enum expectation re-normalised with .lower().replace(...) on each check.
+compile_rules() does that work once and returns a CompiledRuleSet whose
+conditions are plain closures, so scoring thousands of countries or
+scenarios is a tight loop over pre-built predicates.
+
+Compiled rule sets are cached by a hash of the rule fields that affect
+scoring (key, condition, impact, active flag and order). The cache is
+cleared when a rule is updated via PUT /rules/{rule_key}; a changed rule set
+also hashes differently, so other processes never serve a stale compile.
+
+Semantics match the interpreted evaluate_condition / compare_values
+functions in app.api.endpoints.metric_config exactly, except that an enum
+condition without a string "equals" value raises ValueError when compiled.
+"""
+
+import hashlib
+import json
+import logging
+import operator
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+Condition = Callable[[Dict[str, Any]], bool]
+
+# Comparison operators supported by threshold conditions
+OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+# Rule fields that affect scoring (name, description, timestamps do not)
+SCORING_RULE_FIELDS = ("rule_key", "condition_type", "condition_config", "impact_type", "impact_value", "is_active")
+
+# Compiled rule sets kept in memory (preview overrides create short-lived variants)
+MAX_CACHED_RULE_SETS = 32
+
+
+def normalize_enum(value: str) -> str:
+    """Normalise an enum string for comparison ("Risk-Based" == "risk_based")."""
+    return value.lower().replace("-", "_").replace(" ", "_")
+
+
+# =============================================================================
+# CONDITION COMPILER
+# =============================================================================
+
+def _never(metrics: Dict[str, Any]) -> bool:
+    return False
+
+
+def _always(metrics: Dict[str, Any]) -> bool:
+    return True
+
+
+def _compile_comparison(op: Optional[Callable[[Any, Any], bool]], expected: Any) -> Callable[[Any], bool]:
+    if op is None:
+        return lambda actual: False
+
+    def compare(actual: Any) -> bool:
+        try:
+            return op(actual, expected)
+        except (TypeError, ValueError):
+            return False
+
+    return compare
+
+
+def compile_condition(condition_type: Optional[str], config: Optional[Dict[str, Any]]) -> Condition:
+    """
+    Compile one rule condition into a predicate over a metrics dict.
+
+    Raises ValueError for an enum condition whose "equals" is not a string.
+    """
+    config = config or {}
+
+    if condition_type == "always":
+        return _always
+
+    if condition_type == "threshold":
+        metric_key = config.get("metric")
+        compare = _compile_comparison(OPERATORS.get(config.get("operator", "==")), config.get("value"))
+        and_condition = compile_condition("threshold", config["and"]) if "and" in config else None
+
+        def threshold(metrics: Dict[str, Any]) -> bool:
+            metric_value = metrics.get(metric_key)
+            if metric_value is None or not compare(metric_value):
+                return False
+            return and_condition(metrics) if and_condition is not None else True
+
+        return threshold
+
+    if condition_type == "boolean":
+        metric_key = config.get("metric")
+        expected = config.get("equals")
+        return lambda metrics: metrics.get(metric_key) == expected
+
+    if condition_type == "enum":
+        metric_key = config.get("metric")
+        expected = config.get("equals")
+        # Enum conditions compare against an enum label. The interpreter only
+        # failed on a non-string label once it met a string metric value
+        # (AttributeError mid-recalculation); reject the rule up front instead.
+        if not isinstance(expected, str):
+            raise ValueError(
+                f"Enum condition on '{metric_key}' needs a string 'equals' value, got {expected!r}"
+            )
+        expected_text = expected
+        expected_normalized = normalize_enum(expected)
+
+        def enum(metrics: Dict[str, Any]) -> bool:
+            metric_value = metrics.get(metric_key)
+            if metric_value is None:
+                return False
+            # Handle enum comparison (might be stored as different formats)
+            if isinstance(metric_value, str):
+                return normalize_enum(metric_value) == expected_normalized
+            return str(metric_value) == expected_text
+
+        return enum
+
+    if condition_type == "compound":
+        conditions = [
+            compile_condition("threshold" if "operator" in cond else "boolean", cond)
+            for cond in config.get("conditions", [])
+        ]
+        combinator = config.get("operator", "AND")
+        if combinator == "AND":
+            return lambda metrics: all(condition(metrics) for condition in conditions)
+        if combinator == "OR":
+            return lambda metrics: any(condition(metrics) for condition in conditions)
+        return _never
+
+    return _never
+
+
+# =============================================================================
+# COMPILED RULE SET
+# =============================================================================
+
+class CompiledRule:
+    """One active rule with its condition compiled."""
+
+    __slots__ = ("rule_key", "condition_type", "condition_config", "condition", "impact_type", "impact_value")
+
+    def __init__(self, rule: Dict[str, Any]):
+        self.rule_key = rule.get("rule_key")
+        # Source condition kept for the vectorised evaluator (app.services.scoring_engine)
+        self.condition_type = rule.get("condition_type")
+        self.condition_config = rule.get("condition_config", {})
+        try:
+            self.condition = compile_condition(self.condition_type, self.condition_config)
+        except ValueError as e:
+            raise ValueError(f"Rule '{self.rule_key}': {e}") from e
+        self.impact_type = rule.get("impact_type", "add")
+        self.impact_value = rule.get("impact_value", 0)
+
+
+class CompiledRuleSet:
+    """Active rules, in priority order, ready to score metric dicts."""
+
+    def __init__(self, rules: List[Dict[str, Any]], version: str):
+        self.version = version
+        self.rules = [CompiledRule(rule) for rule in rules if rule.get("is_active", True)]
+
+    def score(self, metrics: Dict[str, Any]) -> float:
+        """
+        Maturity score (1.0 - 4.0) for one country's metrics.
+
+        Rules apply in priority order; once a cap rule fires, only further
+        cap rules are evaluated.
+        """
+        score = 1.0  # Base score
+        capped = False
+        cap_value = 4.0
+
+        for rule in self.rules:
+            impact_type = rule.impact_type
+
+            # Skip if already capped and this isn't a cap rule
+            if capped and impact_type != "cap":
+                continue
+
+            if rule.condition(metrics):
+                if impact_type == "set":
+                    score = rule.impact_value
+                elif impact_type == "add":
+                    score += rule.impact_value
+                elif impact_type == "multiply":
+                    score *= rule.impact_value
+                elif impact_type == "cap":
+                    capped = True
+                    cap_value = min(cap_value, rule.impact_value)
+
+        # Apply cap
+        if capped:
+            score = min(score, cap_value)
+
+        # Ensure within bounds
+        score = max(1.0, min(4.0, score))
+
+        return round(score, 1)
+
+    def score_many(self, metric_rows: Dict[str, Dict[str, Any]]) -> Dict[str, float]:
+        """Score many countries or scenarios, {key: metrics} -> {key: score}."""
+        return {key: self.score(metrics) for key, metrics in metric_rows.items()}
+
+    def conditions(self, metrics: Dict[str, Any]) -> List[Tuple[str, bool]]:
+        """(rule_key, condition met) for every active rule, for score breakdowns."""
+        return [(rule.rule_key, rule.condition(metrics)) for rule in self.rules]
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+_cache: "OrderedDict[str, CompiledRuleSet]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def rule_set_version(rules: List[Dict[str, Any]]) -> str:
+    """Stable hash of the scoring-relevant fields of a rule set (order matters)."""
+    material = [{field: rule.get(field) for field in SCORING_RULE_FIELDS} for rule in rules]
+    encoded = json.dumps(material, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def compile_rules(rules: List[Dict[str, Any]]) -> CompiledRuleSet:
+    """
+    Compiled form of a rule set (rule dicts as returned by
+    MaturityScoringRule.to_dict, in priority order), cached by version hash.
+    """
+    version = rule_set_version(rules)
+    with _cache_lock:
+        compiled = _cache.get(version)
+        if compiled is not None:
+            _cache.move_to_end(version)
+            return compiled
+
+    compiled = CompiledRuleSet(rules, version)
+    with _cache_lock:
+        _cache[version] = compiled
+        while len(_cache) > MAX_CACHED_RULE_SETS:
+            _cache.popitem(last=False)
+    logger.debug(f"Compiled maturity rule set {version[:12]} ({len(compiled.rules)} active rules)")
+    return compiled
+
+
+def invalidate_rule_cache() -> None:
+    """Drop all compiled rule sets (called when a rule is updated)."""
+    with _cache_lock:
+        _cache.clear()
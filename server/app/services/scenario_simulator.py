@@ -0,0 +1,284 @@
+"""
+GOHIP Platform - What-If Scenario Simulator
+Batch maturity and pillar scoring under rule / weight perturbations
+
+/metric-config/preview-calculation scores one country against one rule set.
+The simulator scores every country under many scenarios at once, in memory:
+
+- The joined metric matrix is loaded once into a MetricSnapshot and reused
+  across requests (SNAPSHOT_TTL_SECONDS, or until invalidated after a
+  database fill or ETL batch writes new metrics)
+- Pillar scores are cached per (snapshot, weight set) and maturity scores
+  per (snapshot, compiled rule set version), so a sweep over a rule
+  threshold recomputes only the maturity column, and repeated scenarios
+  are served from cache
+- Nothing is written to the countries table
+
+Each scenario's maturity scores are compared with a baseline (the current
+active rules and pillar weights, scored the same way) to report the stage
+distribution and stage transitions per country.
+
+Usage:
+    snapshot = get_metric_snapshot(db)
+    baseline = Scenario("baseline", rule_config, pillar_weights)
+    results = simulate(snapshot, baseline, [baseline.with_rule_overrides("x", {...})])
+"""
+
+import copy
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.services.rule_engine import compile_rules
+from app.services.scoring_engine import (
+    MATURITY_METRICS,
+    SCORE_FIELDS,
+    MetricMatrix,
+    load_metric_matrix,
+    profile_from_pillar_weights,
+    score_maturity,
+    score_pillars,
+    to_optional_list,
+)
+
+logger = logging.getLogger(__name__)
+
+# Metric snapshot reuse window (metrics only change on ETL runs and fills)
+SNAPSHOT_TTL_SECONDS = 300
+
+# Cached pillar / maturity score arrays (each entry is one column per country)
+MAX_CACHED_RESULTS = 1024
+
+# Maturity stages, as used in the /recalculate score distribution
+STAGES = ("reactive", "compliant", "proactive", "resilient")
+STAGE_THRESHOLDS = (2.0, 3.0, 3.5)
+
+
+def maturity_stages(scores: np.ndarray) -> np.ndarray:
+    """Stage index (into STAGES) for every maturity score."""
+    return np.searchsorted(STAGE_THRESHOLDS, scores, side="right")
+
+
+# =============================================================================
+# METRIC SNAPSHOT
+# =============================================================================
+
+@dataclass
+class MetricSnapshot:
+    """Metric matrix shared by all scenario evaluations until it expires."""
+    matrix: MetricMatrix
+    version: str
+    loaded_at: float
+    maturity_matrix: MetricMatrix = field(init=False)
+
+    def __post_init__(self):
+        self.maturity_matrix = self.matrix.select(MATURITY_METRICS)
+
+    @property
+    def age_seconds(self) -> float:
+        return time.monotonic() - self.loaded_at
+
+
+_snapshot: Optional[MetricSnapshot] = None
+_snapshot_lock = threading.Lock()
+
+
+def get_metric_snapshot(db: Session, max_age: float = SNAPSHOT_TTL_SECONDS, refresh: bool = False) -> MetricSnapshot:
+    """Current metric snapshot, reloaded when older than max_age or on refresh."""
+    global _snapshot
+    with _snapshot_lock:
+        snapshot = _snapshot
+        if snapshot is not None and not refresh and snapshot.age_seconds < max_age:
+            return snapshot
+
+        matrix = load_metric_matrix(db)
+        # Content hash: an unchanged reload keeps its cached scenario results
+        encoded = json.dumps([matrix.keys, matrix.row_metrics()], sort_keys=True, default=str).encode("utf-8")
+        _snapshot = MetricSnapshot(matrix, hashlib.sha256(encoded).hexdigest(), time.monotonic())
+        logger.debug(f"Loaded metric snapshot {_snapshot.version[:12]} ({matrix.size} countries)")
+        return _snapshot
+
+
+def invalidate_metric_snapshot() -> None:
+    """Drop the metric snapshot (called after metrics are written)."""
+    global _snapshot
+    with _snapshot_lock:
+        _snapshot = None
+
+
+# =============================================================================
+# SCENARIOS
+# =============================================================================
+
+def _set_path(config: Dict[str, Any], path: str, value: Any) -> None:
+    """Set a dotted path ("and.value") inside a nested config dict."""
+    *parents, leaf = path.split(".")
+    for key in parents:
+        config = config.setdefault(key, {})
+    config[leaf] = value
+
+
+@dataclass
+class Scenario:
+    """
+    A rule set and pillar weight set to score every country against.
+
+    rules: Rule dicts in priority order (MaturityScoringRule.to_dict)
+    pillar_weights: {pillar value: component_weights}
+    """
+    name: str
+    rules: List[Dict[str, Any]]
+    pillar_weights: Dict[str, Dict[str, Any]]
+
+    def with_rule_overrides(self, name: str, overrides: Dict[str, Dict[str, Any]]) -> "Scenario":
+        """
+        Copy with rule fields replaced ({rule_key: {field: value}}). Dotted
+        condition paths ("condition_config.and.value") update a single
+        nested value; a plain "condition_config" replaces the whole config,
+        like the preview endpoint does.
+        """
+        rules = copy.deepcopy(self.rules)
+        for rule in rules:
+            for field_name, value in overrides.get(rule.get("rule_key"), {}).items():
+                if "." in field_name:
+                    _set_path(rule, field_name, value)
+                else:
+                    rule[field_name] = value
+        return Scenario(name, rules, self.pillar_weights)
+
+    def with_weight_overrides(self, name: str, overrides: Dict[str, Dict[str, float]]) -> "Scenario":
+        """Copy with component weights replaced ({pillar: {metric_key: weight}})."""
+        pillar_weights = copy.deepcopy(self.pillar_weights)
+        for pillar, weights in overrides.items():
+            components = pillar_weights.setdefault(pillar, {})
+            for metric_key, weight in weights.items():
+                components[metric_key] = dict(components.get(metric_key) or {}, weight=weight)
+        return Scenario(name, self.rules, pillar_weights)
+
+
+# =============================================================================
+# CACHED EVALUATION
+# =============================================================================
+
+_results: "OrderedDict[Tuple[str, str, str], Any]" = OrderedDict()
+_results_lock = threading.Lock()
+
+
+def _cached(key: Tuple[str, str, str], compute):
+    with _results_lock:
+        if key in _results:
+            _results.move_to_end(key)
+            return _results[key]
+    value = compute()
+    with _results_lock:
+        _results[key] = value
+        while len(_results) > MAX_CACHED_RESULTS:
+            _results.popitem(last=False)
+    return value
+
+
+def clear_scenario_cache() -> None:
+    """Drop all cached scenario score arrays."""
+    with _results_lock:
+        _results.clear()
+
+
+def weights_version(pillar_weights: Dict[str, Dict[str, Any]]) -> str:
+    """Stable hash of a pillar weight set (component order affects rounding, so it is kept)."""
+    encoded = json.dumps(pillar_weights, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def scenario_scores(snapshot: MetricSnapshot, scenario: Scenario) -> Dict[str, np.ndarray]:
+    """Pillar and maturity score arrays for a scenario (cached per snapshot)."""
+    compiled = compile_rules(scenario.rules)
+    pillars = _cached(
+        (snapshot.version, "pillars", weights_version(scenario.pillar_weights)),
+        lambda: score_pillars(snapshot.matrix, profile_from_pillar_weights(scenario.pillar_weights)),
+    )
+    maturity = _cached(
+        (snapshot.version, "maturity", compiled.version),
+        lambda: score_maturity(snapshot.maturity_matrix, compiled),
+    )
+    return {**pillars, "maturity_score": maturity}
+
+
+def _mean(values: np.ndarray) -> Optional[float]:
+    present = values[~np.isnan(values)]
+    return round(float(present.mean()), 2) if present.size else None
+
+
+def summarize(
+    snapshot: MetricSnapshot,
+    name: str,
+    scores: Dict[str, np.ndarray],
+    baseline_stages: np.ndarray,
+    country_detail: str = "changed",
+) -> Dict[str, Any]:
+    """
+    Distribution, transitions and (optionally) per-country scores.
+
+    country_detail: "none", "changed" (countries whose stage moved) or "all"
+    """
+    stages = maturity_stages(scores["maturity_score"])
+    transitions = np.zeros((len(STAGES), len(STAGES)), dtype=int)
+    np.add.at(transitions, (baseline_stages, stages), 1)
+    changed = stages != baseline_stages
+
+    result = {
+        "name": name,
+        "distribution": dict(zip(STAGES, np.bincount(stages, minlength=len(STAGES)).tolist())),
+        "transitions": {
+            STAGES[source]: {STAGES[target]: int(transitions[source, target]) for target in range(len(STAGES))}
+            for source in range(len(STAGES))
+        },
+        "countries_changed": int(changed.sum()),
+        "mean_scores": {field_name: _mean(scores[field_name]) for field_name in ("maturity_score",) + SCORE_FIELDS},
+    }
+
+    if country_detail != "none":
+        rows = np.arange(snapshot.matrix.size) if country_detail == "all" else np.flatnonzero(changed)
+        columns = {field_name: to_optional_list(scores[field_name][rows]) for field_name in scores}
+        result["countries"] = [
+            {
+                "iso_code": snapshot.matrix.keys[row],
+                "stage": STAGES[stages[row]],
+                "baseline_stage": STAGES[baseline_stages[row]],
+                **{field_name: columns[field_name][position] for field_name in columns},
+            }
+            for position, row in enumerate(rows)
+        ]
+    return result
+
+
+def simulate(
+    snapshot: MetricSnapshot,
+    baseline: Scenario,
+    scenarios: List[Scenario],
+    country_detail: str = "changed",
+) -> Dict[str, Any]:
+    """Score every country under the baseline and every scenario, in memory."""
+    start = time.perf_counter()
+    baseline_scores = scenario_scores(snapshot, baseline)
+    baseline_stages = maturity_stages(baseline_scores["maturity_score"])
+
+    results = [
+        summarize(snapshot, scenario.name, scenario_scores(snapshot, scenario), baseline_stages, country_detail)
+        for scenario in scenarios
+    ]
+    return {
+        "snapshot_version": snapshot.version[:12],
+        "snapshot_age_seconds": int(snapshot.age_seconds),
+        "countries": snapshot.matrix.size,
+        "baseline": summarize(snapshot, baseline.name, baseline_scores, baseline_stages, "none"),
+        "scenarios": results,
+        "execution_time_ms": int((time.perf_counter() - start) * 1000),
+    }
@@ -0,0 +1,605 @@
+"""
+GOHIP Platform - Columnar Scoring Engine
+Vectorised governance, pillar 1-3 and maturity scoring over all countries
+
+The joined country metric matrix is loaded once (load_metric_matrix) and
+scored column by column with NumPy: normalisation, inversion, NaN-aware
+weighted averages with weight redistribution, and maturity rules with caps
+are array operations over every country at once, instead of per-country
+Python loops calling safe_normalize value by value.
+
+Scoring profiles describe how each pillar is built:
+- EXPERT_PROFILE: fixed WHO/ILO expert weights (countries endpoints)
+- FILL_AGENT_PROFILE: weights used after a database fill (rounded components)
+- profile_from_pillar_weights(): admin-configured PillarSummaryMetric weights
+
+The scalar functions in app.api.endpoints.countries, app.api.endpoints.
+metric_config and app.services.database_fill_agent are thin wrappers over
+this engine; tests/test_scoring_engine.py checks them against frozen scores
+of the previous row-by-row implementations.
+
+Computed scores are written back with write_scores(): one set-based
+UPDATE ... FROM (VALUES ...) statement per WRITE_CHUNK_SIZE countries
+instead of one UPDATE per country.
+
+Usage:
+    matrix = load_metric_matrix(db)
+    scores = score_matrix(matrix, profile, rules=compile_rules(rule_config))
+    # {"governance_score": [...], "pillar1_score": [...], ..., "maturity_score": [...]}
+    stats = write_scores(db, matrix.keys, scores)
+    db.commit()
+"""
+
+import logging
+import operator
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.services.country_listing import invalidate_country_counts
+from app.services.rule_engine import OPERATORS, CompiledRuleSet, compile_condition
+
+logger = logging.getLogger(__name__)
+
+# Country score columns, in output order
+SCORE_FIELDS = ("governance_score", "pillar1_score", "pillar2_score", "pillar3_score")
+
+# PillarSummaryMetric.pillar value -> country score column
+PILLAR_SCORE_FIELDS = {
+    "governance": "governance_score",
+    "pillar_1_hazard": "pillar1_score",
+    "pillar_2_vigilance": "pillar2_score",
+    "pillar_3_restoration": "pillar3_score",
+}
+
+# Score columns write_scores() may update
+WRITABLE_SCORE_FIELDS = SCORE_FIELDS + ("maturity_score",)
+
+# Countries per UPDATE ... FROM (VALUES ...) statement (at most 6 bind
+# parameters each, well under the PostgreSQL limit of 65535)
+WRITE_CHUNK_SIZE = 2000
+
+# Metrics maturity rules are evaluated against (as in /recalculate and /preview-calculation)
+MATURITY_METRICS = (
+    "fatal_accident_rate",
+    "inspector_density",
+    "surveillance_logic",
+    "reintegration_law",
+    "payer_mechanism",
+)
+
+# Every metric the recalculation paths read, one row per country
+METRIC_MATRIX_QUERY = text("""
+    SELECT
+        c.iso_code,
+        g.ilo_c187_status, g.ilo_c155_status, g.inspector_density,
+        g.mental_health_policy, g.strategic_capacity_score,
+        p1.fatal_accident_rate, p1.oel_compliance_pct, p1.safety_training_hours_avg,
+        p1.carcinogen_exposure_pct, p1.control_maturity_score,
+        p2.vulnerability_index, p2.disease_detection_rate,
+        p2.occupational_disease_reporting_rate, p2.lead_exposure_screening_rate,
+        p2.surveillance_logic,
+        p3.rehab_access_score, p3.return_to_work_success_pct,
+        p3.rehab_participation_rate, p3.avg_claim_settlement_days,
+        p3.reintegration_law, p3.payer_mechanism
+    FROM countries c
+    LEFT JOIN governance_layer g ON c.iso_code = g.country_iso_code
+    LEFT JOIN pillar_1_hazard p1 ON c.iso_code = p1.country_iso_code
+    LEFT JOIN pillar_2_vigilance p2 ON c.iso_code = p2.country_iso_code
+    LEFT JOIN pillar_3_restoration p3 ON c.iso_code = p3.country_iso_code
+""")
+
+
+# =============================================================================
+# METRIC MATRIX
+# =============================================================================
+
+class MetricMatrix:
+    """
+    Column-oriented view of per-country metrics.
+
+    Raw values are kept as object arrays (None = missing); numeric views are
+    float arrays with NaN for missing values, built on first use.
+    """
+
+    def __init__(self, keys: List[Any], columns: Dict[str, List[Any]]):
+        self.keys = list(keys)
+        self.size = len(self.keys)
+        self._raw = {name: values for name, values in columns.items()}
+        self._values: Dict[str, np.ndarray] = {}
+        self._numeric: Dict[str, np.ndarray] = {}
+        self._rows: Optional[List[Dict[str, Any]]] = None
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Any], key: str = "iso_code") -> "MetricMatrix":
+        """Build from SQL result rows (or dicts); key names the row identifier column."""
+        mappings = [row._mapping if hasattr(row, "_mapping") else row for row in rows]
+        names = list(mappings[0].keys()) if mappings else []
+        columns = {name: [mapping[name] for mapping in mappings] for name in names if name != key}
+        return cls([mapping[key] for mapping in mappings], columns)
+
+    @classmethod
+    def from_values(cls, values: Mapping[str, Any]) -> "MetricMatrix":
+        """Single-row matrix (used by the scalar wrapper functions)."""
+        return cls([None], {name: [value] for name, value in values.items()})
+
+    def select(self, columns: Iterable[str]) -> "MetricMatrix":
+        """Matrix restricted to the given columns (others read as missing)."""
+        return MetricMatrix(self.keys, {name: self._raw[name] for name in columns if name in self._raw})
+
+    def values(self, column: str) -> np.ndarray:
+        """Raw values as an object array (all None for an unknown column)."""
+        if column not in self._values:
+            array = np.empty(self.size, dtype=object)
+            array[:] = self._raw.get(column, [None] * self.size)
+            self._values[column] = array
+        return self._values[column]
+
+    def numeric(self, column: str) -> np.ndarray:
+        """Float view: booleans as 1.0/0.0, missing as NaN."""
+        if column not in self._numeric:
+            self._numeric[column] = np.array(
+                [np.nan if value is None else value for value in self._raw.get(column, [None] * self.size)],
+                dtype=float,
+            ).reshape(self.size)
+        return self._numeric[column]
+
+    def row_metrics(self) -> List[Dict[str, Any]]:
+        """Per-row metric dicts (fallback path for conditions NumPy cannot express)."""
+        if self._rows is None:
+            names = list(self._raw)
+            self._rows = [
+                {name: self._raw[name][index] for name in names}
+                for index in range(self.size)
+            ]
+        return self._rows
+
+
+def load_metric_matrix(db: Session) -> MetricMatrix:
+    """Load every country's scoring metrics in one joined query."""
+    return MetricMatrix.from_rows(db.execute(METRIC_MATRIX_QUERY).fetchall())
+
+
+# =============================================================================
+# SCORING PROFILES
+# =============================================================================
+
+@dataclass(frozen=True)
+class Component:
+    """
+    One weighted input of a pillar score.
+
+    transform:
+        "value"     - used as-is (already 0-100)
+        "flag"      - truthy -> 100.0, falsy -> 0.0
+        "normalize" - (value / max_value) * 100 clipped to 0-100, inverted
+                      (100 - x) when invert is set
+    """
+    column: str
+    weight: float
+    transform: str = "value"
+    max_value: float = 100.0
+    invert: bool = False
+
+
+@dataclass(frozen=True)
+class ScoringProfile:
+    """
+    How each pillar score is computed.
+
+    divide_weights_first: sum(v * (w / total)) (endpoint formula) instead of
+        sum(v * w) / total (database fill agent formula)
+    component_decimals: Round normalised components before averaging
+    """
+    pillars: Tuple[Tuple[str, Tuple[Component, ...]], ...]
+    divide_weights_first: bool = True
+    component_decimals: Optional[int] = None
+
+
+def _flag(column: str, weight: float) -> Component:
+    return Component(column, weight, "flag")
+
+
+def _norm(column: str, weight: float, max_value: float, invert: bool = False) -> Component:
+    return Component(column, weight, "normalize", max_value, invert)
+
+
+# WHO/ILO expert weights (countries endpoints). Pillar 1 excludes the
+# derived control_maturity_score
+EXPERT_PROFILE = ScoringProfile(pillars=(
+    ("governance_score", (
+        _flag("ilo_c187_status", 0.20),
+        _flag("ilo_c155_status", 0.20),
+        _norm("inspector_density", 0.30, 3.0),
+        _flag("mental_health_policy", 0.15),
+        Component("strategic_capacity_score", 0.15),
+    )),
+    ("pillar1_score", (
+        _norm("fatal_accident_rate", 0.40, 10.0, invert=True),
+        Component("oel_compliance_pct", 0.25),
+        _norm("safety_training_hours_avg", 0.20, 40.0),
+        _norm("carcinogen_exposure_pct", 0.15, 50.0, invert=True),
+    )),
+    ("pillar2_score", (
+        _norm("vulnerability_index", 0.30, 100.0, invert=True),
+        Component("disease_detection_rate", 0.30),
+        Component("occupational_disease_reporting_rate", 0.20),
+        Component("lead_exposure_screening_rate", 0.20),
+    )),
+    ("pillar3_score", (
+        Component("rehab_access_score", 0.30),
+        Component("return_to_work_success_pct", 0.30),
+        Component("rehab_participation_rate", 0.20),
+        _norm("avg_claim_settlement_days", 0.20, 365.0, invert=True),
+    )),
+))
+
+# Weights aligned with DEFAULT_PILLAR_SUMMARIES (database fill agent)
+FILL_AGENT_PROFILE = ScoringProfile(
+    pillars=(
+        ("governance_score", EXPERT_PROFILE.pillars[0][1]),
+        ("pillar1_score", (
+            _norm("fatal_accident_rate", 0.35, 10.0, invert=True),
+            Component("oel_compliance_pct", 0.25),
+            Component("control_maturity_score", 0.20),
+            _norm("safety_training_hours_avg", 0.10, 40.0),
+            _norm("carcinogen_exposure_pct", 0.10, 50.0, invert=True),
+        )),
+        ("pillar2_score", EXPERT_PROFILE.pillars[2][1]),
+        ("pillar3_score", EXPERT_PROFILE.pillars[3][1]),
+    ),
+    divide_weights_first=False,
+    component_decimals=1,
+)
+
+# Metrics available to admin-configured pillar weights, with their transforms
+CONFIGURABLE_METRICS: Dict[str, Dict[str, Component]] = {
+    "governance": {
+        "ilo_c187_status": _flag("ilo_c187_status", 0),
+        "ilo_c155_status": _flag("ilo_c155_status", 0),
+        "inspector_density": _norm("inspector_density", 0, 3.0),
+        "mental_health_policy": _flag("mental_health_policy", 0),
+        "strategic_capacity_score": Component("strategic_capacity_score", 0),
+    },
+    "pillar_1_hazard": {
+        "fatal_accident_rate": _norm("fatal_accident_rate", 0, 10.0, invert=True),
+        "oel_compliance_pct": Component("oel_compliance_pct", 0),
+        "safety_training_hours_avg": _norm("safety_training_hours_avg", 0, 40.0),
+        "carcinogen_exposure_pct": _norm("carcinogen_exposure_pct", 0, 50.0, invert=True),
+        "control_maturity_score": Component("control_maturity_score", 0),
+    },
+    "pillar_2_vigilance": {
+        "vulnerability_index": _norm("vulnerability_index", 0, 100.0, invert=True),
+        "disease_detection_rate": Component("disease_detection_rate", 0),
+        "occupational_disease_reporting_rate": Component("occupational_disease_reporting_rate", 0),
+        "lead_exposure_screening_rate": Component("lead_exposure_screening_rate", 0),
+    },
+    "pillar_3_restoration": {
+        "rehab_access_score": Component("rehab_access_score", 0),
+        "return_to_work_success_pct": Component("return_to_work_success_pct", 0),
+        "rehab_participation_rate": Component("rehab_participation_rate", 0),
+        "avg_claim_settlement_days": _norm("avg_claim_settlement_days", 0, 365.0, invert=True),
+    },
+}
+
+
+def weighted_components(
+    weight_config: Optional[Dict[str, Any]],
+    available: Mapping[str, Component],
+) -> Tuple[Component, ...]:
+    """
+    Components for a PillarSummaryMetric.component_weights config, in config
+    order. Metrics with weight <= 0 or without a known transform are skipped.
+    """
+    components = []
+    for metric_key, config in (weight_config or {}).items():
+        weight = config.get("weight", 0)
+        if metric_key not in available or weight <= 0:
+            continue
+        template = available[metric_key]
+        components.append(Component(template.column, weight, template.transform, template.max_value, template.invert))
+    return tuple(components)
+
+
+def profile_from_pillar_weights(pillar_weights: Dict[str, Dict[str, Any]]) -> ScoringProfile:
+    """Profile for admin-configured weights ({pillar value: component_weights})."""
+    return ScoringProfile(pillars=tuple(
+        (score_field, weighted_components(pillar_weights.get(pillar), CONFIGURABLE_METRICS[pillar]))
+        for pillar, score_field in PILLAR_SCORE_FIELDS.items()
+    ))
+
+
+# =============================================================================
+# ARRAY OPERATIONS
+# =============================================================================
+
+def round_half_even_safe(values: np.ndarray, decimals: int) -> np.ndarray:
+    """
+    Round like Python's round() (correctly rounded decimal), vectorised.
+
+    np.round scales by 10**decimals first, which can round a value such as
+    0.15 (really 0.1499...) up; only values within a hair of a .5 tie are
+    re-rounded with Python's round().
+    """
+    rounded = np.round(values, decimals)
+    scaled = values * (10 ** decimals)
+    near_tie = np.isfinite(values) & (np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < 1e-6)
+    for index in np.flatnonzero(near_tie):
+        rounded[index] = round(float(values[index]), decimals)
+    return rounded
+
+
+def component_values(matrix: MetricMatrix, component: Component, decimals: Optional[int] = None) -> np.ndarray:
+    """Transformed component column (NaN = missing)."""
+    raw = matrix.numeric(component.column)
+    if component.transform == "flag":
+        return np.where(np.isnan(raw), np.nan, np.where(raw != 0, 100.0, 0.0))
+    if component.transform == "normalize":
+        with np.errstate(invalid="ignore"):
+            normalized = np.minimum(100.0, np.maximum(0.0, (raw / component.max_value) * 100))
+        if component.invert:
+            normalized = 100.0 - normalized
+        if decimals is not None:
+            normalized = round_half_even_safe(normalized, decimals)
+        return normalized
+    return raw
+
+
+def weighted_average(
+    columns: List[np.ndarray],
+    weights: List[float],
+    divide_weights_first: bool = True,
+) -> np.ndarray:
+    """
+    NaN-aware weighted average per row, weights redistributed over the
+    components present. Accumulates component by component so the float
+    operations match the scalar implementations exactly. NaN when no
+    component is present.
+    """
+    size = len(columns[0]) if columns else 0
+    total = np.zeros(size)
+    for values, weight in zip(columns, weights):
+        total = total + np.where(np.isnan(values), 0.0, weight)
+
+    present = total != 0
+    safe_total = np.where(present, total, 1.0)
+    accumulated = np.zeros(size)
+    for values, weight in zip(columns, weights):
+        contribution = values * (weight / safe_total) if divide_weights_first else values * weight
+        accumulated = accumulated + np.where(np.isnan(values), 0.0, contribution)
+
+    if not divide_weights_first:
+        accumulated = accumulated / safe_total
+    return np.where(present, accumulated, np.nan)
+
+
+def score_pillars(matrix: MetricMatrix, profile: ScoringProfile) -> Dict[str, np.ndarray]:
+    """Every pillar score of the profile, rounded to 1 decimal (NaN = no data)."""
+    scores = {}
+    for score_field, components in profile.pillars:
+        if not components:
+            scores[score_field] = np.full(matrix.size, np.nan)
+            continue
+        columns = [component_values(matrix, component, profile.component_decimals) for component in components]
+        average = weighted_average(columns, [component.weight for component in components], profile.divide_weights_first)
+        scores[score_field] = round_half_even_safe(average, 1)
+    return scores
+
+
+# =============================================================================
+# MATURITY RULES
+# =============================================================================
+
+_ARRAY_OPERATORS: Dict[str, Callable[[np.ndarray, Any], np.ndarray]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+def _row_fallback(matrix: MetricMatrix, condition_type: str, config: Dict[str, Any]) -> np.ndarray:
+    """Evaluate a condition row by row with the compiled scalar predicate."""
+    condition = compile_condition(condition_type, config)
+    return np.fromiter((condition(metrics) for metrics in matrix.row_metrics()), dtype=bool, count=matrix.size)
+
+
+def _column_predicate(matrix: MetricMatrix, condition_type: str, config: Dict[str, Any]) -> np.ndarray:
+    """Single-metric condition applied to that metric's column only."""
+    metric_key = config.get("metric")
+    condition = compile_condition(condition_type, config)
+    column = matrix.values(metric_key)
+    return np.fromiter((condition({metric_key: value}) for value in column), dtype=bool, count=matrix.size)
+
+
+def condition_mask(matrix: MetricMatrix, condition_type: Optional[str], config: Optional[Dict[str, Any]]) -> np.ndarray:
+    """Boolean mask of rows meeting a rule condition (same semantics as rule_engine)."""
+    config = config or {}
+
+    if condition_type == "always":
+        return np.ones(matrix.size, dtype=bool)
+
+    if condition_type == "threshold":
+        expected = config.get("value")
+        op = config.get("operator", "==")
+        if op not in OPERATORS:
+            return np.zeros(matrix.size, dtype=bool)
+        numeric_expected = isinstance(expected, (int, float))
+        try:
+            column = matrix.numeric(config.get("metric")) if numeric_expected else None
+        except (TypeError, ValueError):
+            column = None
+        if column is None:
+            return _row_fallback(matrix, condition_type, config)
+        with np.errstate(invalid="ignore"):
+            mask = ~np.isnan(column) & _ARRAY_OPERATORS[op](column, expected)
+        if "and" in config:
+            mask &= condition_mask(matrix, "threshold", config["and"])
+        return mask
+
+    if condition_type in ("boolean", "enum"):
+        return _column_predicate(matrix, condition_type, config)
+
+    if condition_type == "compound":
+        masks = [
+            condition_mask(matrix, "threshold" if "operator" in cond else "boolean", cond)
+            for cond in config.get("conditions", [])
+        ]
+        combinator = config.get("operator", "AND")
+        if combinator == "AND":
+            return np.logical_and.reduce(masks) if masks else np.ones(matrix.size, dtype=bool)
+        if combinator == "OR":
+            return np.logical_or.reduce(masks) if masks else np.zeros(matrix.size, dtype=bool)
+
+    return np.zeros(matrix.size, dtype=bool)
+
+
+def score_maturity(matrix: MetricMatrix, rules: CompiledRuleSet) -> np.ndarray:
+    """
+    Maturity score (1.0 - 4.0) for every row, applying the compiled rule set
+    as masked array updates in priority order.
+    """
+    score = np.ones(matrix.size)
+    capped = np.zeros(matrix.size, dtype=bool)
+    cap_value = np.full(matrix.size, 4.0)
+
+    for rule in rules.rules:
+        met = condition_mask(matrix, rule.condition_type, rule.condition_config)
+        if rule.impact_type != "cap":
+            # Once capped, only further cap rules apply
+            met &= ~capped
+        if rule.impact_type == "set":
+            score = np.where(met, rule.impact_value, score)
+        elif rule.impact_type == "add":
+            score = np.where(met, score + rule.impact_value, score)
+        elif rule.impact_type == "multiply":
+            score = np.where(met, score * rule.impact_value, score)
+        elif rule.impact_type == "cap":
+            capped |= met
+            cap_value = np.where(met, np.minimum(cap_value, rule.impact_value), cap_value)
+
+    score = np.where(capped, np.minimum(score, cap_value), score)
+    score = np.maximum(1.0, np.minimum(4.0, score))
+    return round_half_even_safe(score, 1)
+
+
+# =============================================================================
+# ENTRY POINTS
+# =============================================================================
+
+def to_optional_list(values: np.ndarray) -> List[Optional[float]]:
+    """Float array -> list of Python floats with None for NaN."""
+    return [None if np.isnan(value) else float(value) for value in values]
+
+
+def score_matrix(
+    matrix: MetricMatrix,
+    profile: ScoringProfile,
+    rules: Optional[CompiledRuleSet] = None,
+    maturity: Optional[Callable[[MetricMatrix], np.ndarray]] = None,
+) -> Dict[str, List[Optional[float]]]:
+    """
+    All pillar scores (and the maturity score, from a compiled rule set or a
+    custom vectorised maturity function) for every row, in one pass.
+
+    Returns:
+        {score_field: [value per matrix row]} with None for missing scores
+    """
+    scores = {field: to_optional_list(values) for field, values in score_pillars(matrix, profile).items()}
+    if rules is not None:
+        scores["maturity_score"] = to_optional_list(score_maturity(matrix.select(MATURITY_METRICS), rules))
+    elif maturity is not None:
+        scores["maturity_score"] = to_optional_list(maturity(matrix))
+    return scores
+
+
+def score_one(profile: ScoringProfile, score_field: str, values: Mapping[str, Any]) -> Optional[float]:
+    """One pillar score for a single set of metric values (scalar wrappers)."""
+    components = dict(profile.pillars)[score_field]
+    single = ScoringProfile(((score_field, components),), profile.divide_weights_first, profile.component_decimals)
+    return to_optional_list(score_pillars(MetricMatrix.from_values(values), single)[score_field])[0]
+
+
+# =============================================================================
+# WRITE BACK
+# =============================================================================
+
+@dataclass
+class WriteStats:
+    """Outcome of a write_scores() call."""
+    rows: int
+    statements: int
+    elapsed_ms: int
+
+
+def _update_statement(fields: List[str], count: int):
+    """UPDATE countries from a VALUES list of count rows (iso_code + fields)."""
+    rows = ",\n".join(
+        "(:iso_code_{i}, {values})".format(
+            i=i,
+            values=", ".join(f"CAST(:{field}_{i} AS DOUBLE PRECISION)" for field in fields),
+        )
+        for i in range(count)
+    )
+    assignments = ", ".join(f"{field} = v.{field}" for field in fields)
+    return text(f"""
+        WITH v (iso_code, {", ".join(fields)}) AS (
+            VALUES {rows}
+        )
+        UPDATE countries
+        SET {assignments}, updated_at = :now
+        FROM v
+        WHERE countries.iso_code = v.iso_code
+    """)
+
+
+def write_scores(
+    db: Session,
+    keys: List[str],
+    scores: Mapping[str, List[Optional[float]]],
+    chunk_size: int = WRITE_CHUNK_SIZE,
+) -> WriteStats:
+    """
+    Write computed scores to the countries table with set-based UPDATEs.
+
+    Marks the countries stale in the display snapshot and drops the cached
+    listing totals (band and score-range filters read maturity_score).
+    Does not commit: the caller owns the transaction.
+
+    Args:
+        keys: ISO codes, aligned with every score list
+        scores: {score column: [value per key]} (None writes NULL)
+        chunk_size: Countries per statement
+    """
+    fields = [field for field in scores if field in WRITABLE_SCORE_FIELDS]
+    unknown = set(scores) - set(fields)
+    if unknown:
+        raise ValueError(f"Not a writable score column: {', '.join(sorted(unknown))}")
+
+    start = time.perf_counter()
+    now = datetime.utcnow()
+    statements = 0
+    for offset in range(0, len(keys), chunk_size):
+        chunk = keys[offset:offset + chunk_size]
+        params: Dict[str, Any] = {"now": now}
+        for i, iso_code in enumerate(chunk):
+            params[f"iso_code_{i}"] = iso_code
+            for field in fields:
+                params[f"{field}_{i}"] = scores[field][offset + i]
+        db.execute(_update_statement(fields, len(chunk)), params)
+        statements += 1
+
+    from app.services.country_snapshot import mark_stale
+    mark_stale(db, keys)
+    invalidate_country_counts()
+
+    stats = WriteStats(len(keys), statements, int((time.perf_counter() - start) * 1000))
+    logger.info(f"Wrote scores for {stats.rows} countries in {stats.statements} statement(s), {stats.elapsed_ms}ms")
+    return stats
@@ -0,0 +1,265 @@
+"""
+GOHIP Platform - Async Web Research
+====================================
+
+Non-blocking counterpart of ai_orchestrator.perform_extended_research for
+callers running on the event loop (AgentRunner).
+
+The synchronous research path runs its queries one after another, each
+walking the Tavily -> SerpAPI -> Bing -> Google -> DuckDuckGo fallback chain
+with blocking HTTP calls; called from an async handler it stalled every
+other request for the whole research. Here:
+
+- All queries of a research run concurrently; each one still fails over
+  from provider to provider in the same priority order
+- Each query is capped at QUERY_TIMEOUT seconds (a slow provider costs one
+  query, not the research)
+- Results are deduplicated by URL as the queries complete, so research
+  latency is that of the slowest query instead of the sum of all of them
+- HTTP goes through one shared httpx.AsyncClient per event loop (keep-alive
+  connections to the search APIs are reused across queries and requests)
+- Tavily and SerpAPI are called over their REST APIs; the DuckDuckGo client
+  library is synchronous and runs in a worker thread
+- Results are shared with the synchronous search chain through the
+  persistent web search cache (app.services.web_search_cache)
+
+Usage:
+    queries = build_research_queries("Germany", "Governance", num_queries=3)
+    results = await gather_research(queries, results_per_query=8)
+
+    async for result in stream_research(queries):
+        ...  # unique results as soon as their query completes
+"""
+
+import asyncio
+import logging
+import threading
+import weakref
+from contextlib import aclosing
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, List, Optional
+
+import httpx
+
+from app.core.config import settings
+from app.services.ai_orchestrator import (
+    _parse_bing_results,
+    _parse_google_results,
+    build_research_queries,
+)
+from app.services.web_search_cache import search_cache
+
+logger = logging.getLogger(__name__)
+
+QUERY_TIMEOUT = 15.0     # Seconds per query, across its whole fallback chain
+PROVIDER_TIMEOUT = 10.0  # Seconds per provider request
+
+# Agent research (AgentRunner web search); also the query set warmed by web_search_cache
+RESEARCH_QUERIES = 3
+RESEARCH_RESULTS_PER_QUERY = 8
+
+_BROWSER_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+}
+
+
+@dataclass
+class SearchResult:
+    """One search hit."""
+    title: str
+    url: str
+    snippet: str
+    provider: str
+
+    def to_dict(self) -> dict:
+        return {"title": self.title, "url": self.url, "snippet": self.snippet, "provider": self.provider}
+
+
+# =============================================================================
+# SHARED CLIENT
+# =============================================================================
+
+_lock = threading.Lock()
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def get_research_client() -> httpx.AsyncClient:
+    """Shared AsyncClient for the running event loop (do not close it)."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        client = _clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=PROVIDER_TIMEOUT,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            )
+            _clients[loop] = client
+        return client
+
+
+async def aclose_research_client() -> None:
+    """Close the client bound to the running event loop (application shutdown)."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        client = _clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+
+
+# =============================================================================
+# PROVIDERS (same priority order as ai_orchestrator.perform_web_search)
+# =============================================================================
+
+async def _tavily(query: str, num_results: int) -> List[SearchResult]:
+    response = await get_research_client().post(
+        "https://api.tavily.com/search",
+        headers={"Authorization": f"Bearer {settings.TAVILY_API_KEY}"},
+        json={
+            "api_key": settings.TAVILY_API_KEY,
+            "query": query,
+            "search_depth": "advanced",
+            "max_results": num_results,
+            "include_answer": False,
+            "include_raw_content": False,
+        },
+    )
+    response.raise_for_status()
+    return [
+        SearchResult(r.get("title", "No title"), r.get("url", ""), (r.get("content") or "")[:300], "tavily")
+        for r in response.json().get("results", [])
+    ]
+
+
+async def _serpapi(query: str, num_results: int) -> List[SearchResult]:
+    response = await get_research_client().get(
+        "https://serpapi.com/search.json",
+        params={"engine": "google", "q": query, "num": num_results, "api_key": settings.SERPAPI_KEY},
+    )
+    response.raise_for_status()
+    return [
+        SearchResult(r.get("title", "No title"), r.get("link", ""), r.get("snippet", ""), "serpapi")
+        for r in response.json().get("organic_results", [])[:num_results]
+    ]
+
+
+async def _scrape(url: str, parse: Callable, num_results: int, provider: str) -> List[SearchResult]:
+    response = await get_research_client().get(url, headers=_BROWSER_HEADERS)
+    response.raise_for_status()
+    # HTML parsing is CPU work; keep it off the event loop
+    parsed = await asyncio.to_thread(parse, response.text, num_results)
+    return [SearchResult(r["title"], r["url"], r["description"], provider) for r in parsed]
+
+
+async def _bing(query: str, num_results: int) -> List[SearchResult]:
+    url = str(httpx.URL("https://www.bing.com/search", params={"q": query, "count": num_results}))
+    return await _scrape(url, _parse_bing_results, num_results, "bing")
+
+
+async def _google(query: str, num_results: int) -> List[SearchResult]:
+    url = str(httpx.URL("https://www.google.com/search", params={"q": query, "num": num_results, "hl": "en"}))
+    return await _scrape(url, _parse_google_results, num_results, "google")
+
+
+async def _duckduckgo(query: str, num_results: int) -> List[SearchResult]:
+    from duckduckgo_search import DDGS
+
+    def run() -> list:
+        with DDGS() as ddgs:
+            return list(ddgs.text(query, max_results=num_results))
+
+    return [
+        SearchResult(r.get("title", "No title"), r.get("href", ""), r.get("body", ""), "duckduckgo")
+        for r in await asyncio.to_thread(run)
+    ]
+
+
+def _providers() -> List[tuple]:
+    providers = []
+    if settings.TAVILY_API_KEY:
+        providers.append(("tavily", _tavily))
+    if settings.SERPAPI_KEY:
+        providers.append(("serpapi", _serpapi))
+    providers += [("bing", _bing), ("google", _google), ("duckduckgo", _duckduckgo)]
+    return providers
+
+
+# =============================================================================
+# PUBLIC API
+# =============================================================================
+
+async def search(query: str, num_results: int = 10) -> List[SearchResult]:
+    """
+    Results of the first provider that answers (empty if none does).
+    Fresh results in the web search cache are served without a search.
+    """
+    providers = _providers()
+    # The cache is database-backed: keep its round-trips off the event loop
+    cached = await asyncio.to_thread(search_cache.get, query, num_results, [name for name, _ in providers])
+    if cached:
+        return [SearchResult(r["title"], r["url"], r["snippet"], cached.provider) for r in cached.results]
+
+    for name, provider in providers:
+        try:
+            results = [r for r in await provider(query, num_results) if r.url]
+        except ImportError:
+            continue
+        except Exception as e:
+            logger.warning(f"[ResearchAgent] {name} search failed for '{query[:50]}': {e}")
+            continue
+        if results:
+            logger.info(f"[ResearchAgent] {name} search completed: {len(results)} results")
+            await asyncio.to_thread(search_cache.put, name, query, num_results, [r.to_dict() for r in results])
+            return results
+    return []
+
+
+async def _bounded_search(query: str, num_results: int, timeout: float) -> List[SearchResult]:
+    try:
+        return await asyncio.wait_for(search(query, num_results), timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"[ResearchAgent] Query timed out after {timeout:g}s: {query[:50]}")
+        return []
+
+
+async def stream_research(
+    queries: List[str],
+    results_per_query: int = 8,
+    timeout: float = QUERY_TIMEOUT,
+) -> AsyncIterator[SearchResult]:
+    """
+    Run every query concurrently and yield each new (URL-deduplicated)
+    result as soon as its query completes.
+    """
+    seen_urls = set()
+    tasks: List[Awaitable] = [
+        asyncio.ensure_future(_bounded_search(query, results_per_query, timeout)) for query in queries
+    ]
+    try:
+        for completed in asyncio.as_completed(tasks):
+            for result in await completed:
+                if result.url not in seen_urls:
+                    seen_urls.add(result.url)
+                    yield result
+    finally:
+        # Consumer stopped early: do not leave searches running
+        for task in tasks:
+            task.cancel()
+
+
+async def gather_research(
+    queries: List[str],
+    results_per_query: int = 8,
+    timeout: float = QUERY_TIMEOUT,
+    limit: Optional[int] = None,
+) -> List[SearchResult]:
+    """Unique results of all queries (at most limit), in completion order."""
+    results = []
+    async with aclosing(stream_research(queries, results_per_query, timeout)) as stream:
+        async for result in stream:
+            results.append(result)
+            if limit is not None and len(results) >= limit:
+                break
+    return results
@@ -0,0 +1,301 @@
+"""
+GOHIP Platform - Web Search Result Cache
+=========================================
+
+Persistent store of parsed web search results, shared by the synchronous
+search chain (ai_orchestrator.search_web / perform_web_search) and the
+async research of AgentRunner (web_research.search).
+
+Deep dives, comparison reports and persona research send the same queries
+("{country} occupational health safety ILO WHO", "{country} {topic} policy
+regulations legislation", ...) to Tavily, SerpAPI and the scraped engines
+every time they run for a country. With the cache:
+
+- Entries are keyed by provider + normalised query (case, whitespace and
+  surrounding punctuation do not matter) and hold the parsed hits
+  ([{title, url, snippet}]) plus the provider summary, not formatted text
+- A lookup accepts a fresh entry from any provider of the fallback chain,
+  best provider first, so one round-trip serves the whole chain
+- Freshness depends on the query class: news-like queries ("latest
+  developments 2025") expire within a day, statistics within a week,
+  policy and reference queries (ILO / WHO conventions, compensation
+  systems) after weeks
+- warm_search_cache() pre-fetches the queries the research callers send for
+  every target country (run it off-peak, e.g. from cron:
+  python -m app.services.web_search_cache --warm). By default it searches
+  with the free scrapers only, skips queries that expire within a day and
+  stops after WARM_MAX_QUERIES uncached searches, so a run never spends the
+  Tavily / SerpAPI monthly quota
+
+Cache failures are logged and treated as misses.
+
+Configuration (app.core.config.Settings):
+    WEB_SEARCH_CACHE_ENABLED
+"""
+
+import hashlib
+import logging
+import re
+import threading
+import time
+import unicodedata
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.web_search_cache import WebSearchCacheEntry
+
+logger = logging.getLogger(__name__)
+
+# Query classes, first match wins: (name, pattern, freshness)
+QUERY_CLASSES: List[Tuple[str, re.Pattern, timedelta]] = [
+    ("recent", re.compile(r"\b(latest|recent|news|developments?|20\d\d)\b"), timedelta(days=1)),
+    ("statistics", re.compile(r"\b(statistics|data|reports?|rates?|figures)\b"), timedelta(days=7)),
+    ("policy", re.compile(r"\b(policy|policies|regulations?|legislation|laws?|reforms?|strategy)\b"), timedelta(days=14)),
+    ("reference", re.compile(r"\b(ilo|who|conventions?|system|compensation|insurance|prevention)\b"), timedelta(days=30)),
+]
+DEFAULT_QUERY_CLASS = ("general", timedelta(days=3))
+
+# Research topics pre-fetched by warm_search_cache, per caller
+WARM_AGENT_TOPICS = [
+    "Comprehensive Occupational Health Assessment",  # Strategic deep dive report agent (AgentRunner)
+]
+WARM_DEEP_DIVE_TOPICS = [
+    "occupational health strategy",  # Deep dive analysis (DeepDiveOrchestrator) default
+]
+DEEP_DIVE_RESULTS = 10  # perform_web_search default
+
+# Provider names of the search fallback chain, best first
+SEARCH_PROVIDERS = ("tavily", "serpapi", "bing", "google", "duckduckgo")
+
+# Warm-up budget: free providers only, no queries that expire within a day
+WARM_PROVIDERS = ("bing", "google", "duckduckgo")
+WARM_SKIP_CLASSES = {"recent"}
+WARM_MAX_QUERIES = 200  # Uncached searches per run
+
+
+def normalise_query(query: str) -> str:
+    """Case-, whitespace- and punctuation-insensitive form of a query."""
+    text = unicodedata.normalize("NFKC", query).lower()
+    return " ".join(text.split()).strip(" \"'.,;:!?")
+
+
+def classify_query(query: str) -> Tuple[str, timedelta]:
+    """Freshness class and window of a (normalised) query."""
+    for name, pattern, freshness in QUERY_CLASSES:
+        if pattern.search(query):
+            return name, freshness
+    return DEFAULT_QUERY_CLASS
+
+
+def _key(provider: str, normalised: str) -> str:
+    return hashlib.sha256(f"{provider}\n{normalised}".encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedSearch:
+    """Fresh cached results of one provider."""
+    provider: str
+    results: List[Dict[str, str]]
+    answer: Optional[str]
+    fetched_at: datetime
+
+
+class WebSearchCache:
+    """Database-backed store of parsed search results with per-class freshness."""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "errors": 0}
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self._stats[stat] += 1
+
+    def get(self, query: str, num_results: int, providers: Sequence[str]) -> Optional[CachedSearch]:
+        """
+        Fresh results for query from the first provider (in the given
+        priority order) with a cached entry of at least num_results hits
+        (or all the provider had).
+        """
+        if not self.enabled:
+            return None
+        normalised = normalise_query(query)
+        keys = {_key(provider, normalised): provider for provider in providers}
+        now = datetime.utcnow()
+        try:
+            with SessionLocal() as db:
+                entries = {
+                    entry.provider: entry
+                    for entry in db.query(WebSearchCacheEntry).filter(
+                        WebSearchCacheEntry.key.in_(list(keys)),
+                        WebSearchCacheEntry.expires_at > now,
+                    )
+                }
+                for provider in providers:
+                    entry = entries.get(provider)
+                    # A short list only answers larger requests if the provider had no more
+                    if entry is None or (entry.num_results < num_results and len(entry.results) >= entry.num_results):
+                        continue
+                    entry.hit_count = (entry.hit_count or 0) + 1
+                    cached = CachedSearch(provider, list(entry.results)[:num_results], entry.answer, entry.fetched_at)
+                    db.commit()
+                    self._count("hits")
+                    logger.info(f"[SearchCache] {provider} hit for: {normalised[:60]}")
+                    return cached
+        except Exception as e:
+            logger.warning(f"Web search cache lookup failed, treating as miss: {e}")
+            self._count("errors")
+        self._count("misses")
+        return None
+
+    def put(
+        self,
+        provider: str,
+        query: str,
+        num_results: int,
+        results: List[Dict[str, str]],
+        answer: Optional[str] = None,
+    ) -> None:
+        """Store the parsed results of a successful search."""
+        if not self.enabled or not results:
+            return
+        normalised = normalise_query(query)
+        query_class, freshness = classify_query(normalised)
+        now = datetime.utcnow()
+        try:
+            with SessionLocal() as db:
+                db.merge(WebSearchCacheEntry(
+                    key=_key(provider, normalised),
+                    provider=provider,
+                    query=normalised[:500],
+                    query_class=query_class,
+                    num_results=num_results,
+                    results=[
+                        {"title": r.get("title", ""), "url": r.get("url", ""), "snippet": r.get("snippet", "")}
+                        for r in results
+                    ],
+                    answer=answer,
+                    fetched_at=now,
+                    expires_at=now + freshness,
+                    hit_count=0,
+                ))
+                db.commit()
+            self._count("stores")
+        except Exception as e:
+            logger.warning(f"Could not store web search results in cache: {e}")
+            self._count("errors")
+
+    def purge_expired(self) -> int:
+        """Delete expired entries; returns the number removed."""
+        with SessionLocal() as db:
+            removed = db.query(WebSearchCacheEntry).filter(
+                WebSearchCacheEntry.expires_at <= datetime.utcnow()
+            ).delete(synchronize_session=False)
+            db.commit()
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                "enabled": self.enabled,
+                "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else None,
+                **self._stats,
+            }
+
+
+# Process-wide cache shared by every web search caller
+search_cache = WebSearchCache(enabled=settings.WEB_SEARCH_CACHE_ENABLED)
+
+
+def get_search_cache_stats() -> Dict[str, Any]:
+    """Current web search cache statistics (this process)."""
+    return search_cache.stats()
+
+
+# =============================================================================
+# WARM-UP
+# =============================================================================
+
+def standard_queries(country_name: str) -> List[Tuple[str, int]]:
+    """(query, num_results) pairs the research callers send for a country."""
+    from app.services.ai_orchestrator import build_research_queries, deep_dive_search_query
+    from app.services.web_research import RESEARCH_QUERIES, RESEARCH_RESULTS_PER_QUERY
+
+    queries: Dict[str, int] = {}
+    for topic in WARM_AGENT_TOPICS:
+        for query in build_research_queries(country_name, topic, num_queries=RESEARCH_QUERIES):
+            queries[query] = max(queries.get(query, 0), RESEARCH_RESULTS_PER_QUERY)
+    for topic in WARM_DEEP_DIVE_TOPICS:
+        query = deep_dive_search_query(country_name, topic)
+        queries[query] = max(queries.get(query, 0), DEEP_DIVE_RESULTS)
+    return list(queries.items())
+
+
+def warm_search_cache(
+    iso_codes: Optional[Sequence[str]] = None,
+    max_queries: int = WARM_MAX_QUERIES,
+    providers: Optional[Sequence[str]] = WARM_PROVIDERS,
+    delay_seconds: float = 1.0,
+) -> Dict[str, Any]:
+    """
+    Pre-fetch the research queries for the target countries (all UN member
+    states by default). Queries with fresh cached results cost a lookup;
+    the rest are searched one at a time, delay_seconds apart, with the
+    given providers only (None: the whole fallback chain, API providers
+    included), until max_queries searches have been made.
+    """
+    from app.data.targets import UN_MEMBER_STATES, get_country_name
+    from app.services.ai_orchestrator import search_web
+
+    summary = {"countries": 0, "queries": 0, "fresh": 0, "fetched": 0, "empty": 0, "skipped": 0, "capped": False}
+    for iso_code in iso_codes or UN_MEMBER_STATES:
+        if summary["fetched"] + summary["empty"] >= max_queries:
+            summary["capped"] = True
+            logger.info(f"[SearchCache] Warm-up stopped at the {max_queries} search cap before {iso_code}")
+            break
+        summary["countries"] += 1
+        for query, num_results in standard_queries(get_country_name(iso_code)):
+            summary["queries"] += 1
+            if classify_query(normalise_query(query))[0] in WARM_SKIP_CLASSES:
+                summary["skipped"] += 1
+                continue
+            if summary["fetched"] + summary["empty"] >= max_queries:
+                summary["capped"] = True
+                break
+            results = search_web(query, num_results, providers=providers)
+            if results.cached:
+                summary["fresh"] += 1
+                continue
+            summary["fetched" if results.results else "empty"] += 1
+            time.sleep(delay_seconds)
+        logger.info(f"[SearchCache] Warmed {iso_code} ({summary['queries']} queries so far)")
+
+    logger.info(f"[SearchCache] Warm-up complete: {summary}")
+    return summary
+
+
+if __name__ == "__main__":
+    import argparse
+
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description="GOHIP web search cache")
+    parser.add_argument("--warm", action="store_true", help="Pre-fetch the standard query set")
+    parser.add_argument("--countries", nargs="*", help="ISO codes to warm (default: all UN member states)")
+    parser.add_argument("--delay", type=float, default=1.0, help="Seconds between uncached searches")
+    parser.add_argument("--max-queries", type=int, default=WARM_MAX_QUERIES, help="Uncached searches per run")
+    parser.add_argument(
+        "--providers", nargs="*", default=list(WARM_PROVIDERS),
+        help="Providers to search with (default: the free scrapers; tavily / serpapi spend API quota)",
+    )
+    parser.add_argument("--purge", action="store_true", help="Delete expired entries")
+    args = parser.parse_args()
+
+    if args.purge:
+        print(f"Purged {search_cache.purge_expired()} expired entries")
+    if args.warm:
+        print(warm_search_cache(args.countries, args.max_queries, args.providers, delay_seconds=args.delay))
@@ -0,0 +1,281 @@
+"""
+GOHIP Platform - ETL Fetch Benchmark
+====================================
+
+Measures wall-clock time of the core ILO + World Bank + WHO fetch stage for
+the sequential pipeline path versus the concurrent fetch engine.
+
+No real upstream API is touched: a local mock HTTP server (FastAPI + uvicorn
+on 127.0.0.1) serves ILOSTAT SDMX, World Bank JSON and WHO GHO OData shaped
+payloads with a configurable per-request latency, and the ETL clients are
+pointed at it. No database is required.
+
+Usage:
+    python benchmark_etl.py                        # 195 countries, both paths
+    python benchmark_etl.py --countries 30         # quicker run
+    python benchmark_etl.py --skip-sequential      # concurrent path only
+    python benchmark_etl.py --latency 0.15 --workers 32
+    python benchmark_etl.py --bulk-worldbank       # World Bank via /country/all/ pages
+    python benchmark_etl.py --cache                # cold vs warm on-disk response cache
+    python benchmark_etl.py --throttle 0.1         # 10% of mock responses are 429s
+"""
+
+import argparse
+import asyncio
+import random
+import socket
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import uvicorn
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from app.data.targets import UN_MEMBER_STATES
+from app.services.etl.ilo_client import ILOClient
+from app.services.etl.wb_client import WorldBankClient
+from app.services.etl.who_client import WHOClient
+from app.services.etl.concurrent_fetcher import ConcurrentSourceFetcher, DEFAULT_COUNTRY_WORKERS
+from app.services.etl.http_pool import pool_stats
+from app.services.etl.response_cache import response_cache
+from app.services.etl.rate_limiter import HostLimit, rate_limiter
+from run_pipeline import fetch_core_sources
+
+
+# =============================================================================
+# MOCK UPSTREAM SERVER
+# =============================================================================
+
+def build_mock_app(latency: float, throttle: float = 0.0) -> FastAPI:
+    """Create a FastAPI app mimicking the three upstream APIs."""
+    app = FastAPI()
+
+    @app.middleware("http")
+    async def throttle_requests(request, call_next):
+        # Simulate an upstream rate limit: a fraction of requests get 429
+        if throttle and random.random() < throttle:
+            return JSONResponse({"error": "Too Many Requests"}, status_code=429, headers={"Retry-After": "0.2"})
+        return await call_next(request)
+
+    @app.get("/ilo/data/{flow}/{key}")
+    async def ilo_data(flow: str, key: str):
+        await asyncio.sleep(latency)
+        return {
+            "dataSets": [{"observations": {"0:0:0:0": [2.4], "0:0:0:1": [2.1]}}],
+            "structure": {
+                "dimensions": {
+                    "observation": [
+                        {"id": "TIME_PERIOD", "values": [{"id": "2021"}, {"id": "2022"}]}
+                    ]
+                }
+            },
+        }
+
+    @app.get("/wb/country/all/indicator/{indicator}")
+    async def wb_indicator_all(indicator: str, page: int = 1, per_page: int = 50):
+        await asyncio.sleep(latency)
+        records = [
+            record
+            for iso_code in UN_MEMBER_STATES
+            for record in (
+                {"countryiso3code": iso_code, "value": 1.25, "date": "2022"},
+                {"countryiso3code": iso_code, "value": 1.1, "date": "2021"},
+            )
+        ]
+        pages = max(1, -(-len(records) // per_page))
+        start = (page - 1) * per_page
+        return JSONResponse([
+            {"page": page, "pages": pages, "per_page": per_page, "total": len(records)},
+            records[start:start + per_page],
+        ])
+
+    @app.get("/wb/country/{iso_code}/indicator/{indicator}")
+    async def wb_indicator(iso_code: str, indicator: str):
+        await asyncio.sleep(latency)
+        return JSONResponse([
+            {"page": 1, "pages": 1, "per_page": 50, "total": 2},
+            [{"value": None, "date": "2023"}, {"value": 1.25, "date": "2022"}],
+        ])
+
+    @app.get("/who/{indicator}")
+    async def who_indicator(indicator: str):
+        await asyncio.sleep(latency)
+        return {"value": [{"NumericValue": 78.0, "TimeDim": 2021}]}
+
+    return app
+
+
+class MockServer:
+    """Runs the mock app with uvicorn in a background thread."""
+
+    def __init__(self, latency: float, throttle: float = 0.0):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            self.port = sock.getsockname()[1]
+        config = uvicorn.Config(
+            build_mock_app(latency, throttle),
+            host="127.0.0.1",
+            port=self.port,
+            log_level="warning",
+            access_log=False,
+        )
+        self.server = uvicorn.Server(config)
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def __enter__(self) -> "MockServer":
+        self.thread.start()
+        while not self.server.started:
+            time.sleep(0.05)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.server.should_exit = True
+        self.thread.join(timeout=5)
+
+
+def build_clients(base_url: str):
+    """Create ETL clients pointed at the mock server."""
+    ilo_client = ILOClient()
+    ilo_client.base_url = f"{base_url}/ilo"
+    wb_client = WorldBankClient()
+    wb_client.base_url = f"{base_url}/wb"
+    who_client = WHOClient()
+    who_client.base_url = f"{base_url}/who"
+    return ilo_client, wb_client, who_client
+
+
+# =============================================================================
+# BENCHMARK RUNS
+# =============================================================================
+
+def print_pool_stats(label: str) -> None:
+    """Print request, connection and throttle counts recorded by the shared HTTP pool."""
+    stats = pool_stats.snapshot()
+    print(f"  {label}: {stats['requests']} requests, {stats['tcp_connects']} TCP connects "
+          f"(reuse rate: {stats['connection_reuse_rate']})")
+    for host, limits in rate_limiter.stats().items():
+        print(f"  {host}: {limits['throttled']} throttled, {limits['retries']} retries, "
+              f"rate {limits['current_rate']} req/s, {limits['throughput_rps']} req/s observed")
+    pool_stats.reset()
+    rate_limiter.reset()
+
+
+def run_sequential(countries: List[str], base_url: str, bulk_worldbank: bool) -> float:
+    """Time the run_full_pipeline sequential fetch loop."""
+    ilo_client, wb_client, who_client = build_clients(base_url)
+    start = time.perf_counter()
+    wb_prefetched = wb_client.fetch_all_context_indicators_bulk_sync(countries) if bulk_worldbank else {}
+    for iso_code in countries:
+        fetch_core_sources(iso_code, ilo_client, wb_client, who_client, wb_data=wb_prefetched.get(iso_code))
+    return time.perf_counter() - start
+
+
+def run_concurrent(
+    countries: List[str],
+    base_url: str,
+    workers: int,
+    concurrency: Dict[str, int],
+    bulk_worldbank: bool,
+) -> float:
+    """Time the concurrent fetch engine over the same countries."""
+    ilo_client, wb_client, who_client = build_clients(base_url)
+    start = time.perf_counter()
+    wb_prefetched = wb_client.fetch_all_context_indicators_bulk_sync(countries) if bulk_worldbank else None
+    fetcher = ConcurrentSourceFetcher(
+        ilo_client=ilo_client,
+        wb_client=wb_client,
+        who_client=who_client,
+        source_concurrency=concurrency,
+        country_workers=workers,
+        wb_prefetched=wb_prefetched,
+    )
+    results = fetcher.fetch_all_sync(countries)
+    elapsed = time.perf_counter() - start
+    missing = len(countries) - len(results)
+    if missing:
+        print(f"  WARNING: {missing} countries failed in concurrent mode")
+    return elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="GOHIP ETL fetch benchmark (mock HTTP)")
+    parser.add_argument("--countries", type=int, default=len(UN_MEMBER_STATES),
+                        help=f"Number of countries to fetch (default: {len(UN_MEMBER_STATES)})")
+    parser.add_argument("--latency", type=float, default=0.08,
+                        help="Simulated upstream latency per request in seconds (default: 0.08)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_COUNTRY_WORKERS,
+                        help=f"Concurrent country workers (default: {DEFAULT_COUNTRY_WORKERS})")
+    parser.add_argument("--source-concurrency", type=int, default=None,
+                        help="Override the per-source concurrency limit for all sources")
+    parser.add_argument("--host-rate", type=float, default=None,
+                        help="Apply an adaptive token bucket of this many req/s to the mock host")
+    parser.add_argument("--throttle", type=float, default=0.0,
+                        help="Fraction of mock responses answered with 429 + Retry-After (default: 0)")
+    parser.add_argument("--skip-sequential", action="store_true",
+                        help="Only run the concurrent path")
+    parser.add_argument("--bulk-worldbank", action="store_true",
+                        help="Prefetch World Bank indicators with paged /country/all/ requests")
+    parser.add_argument("--cache", action="store_true",
+                        help="Run the concurrent path cold, then warm and offline against a temporary response cache")
+    args = parser.parse_args()
+
+    countries = UN_MEMBER_STATES[:args.countries]
+    concurrency = None
+    if args.source_concurrency:
+        concurrency = {source: args.source_concurrency for source in ("ilo", "worldbank", "who")}
+
+    print("=" * 60)
+    print("GOHIP ETL Fetch Benchmark (local mock HTTP)")
+    print("=" * 60)
+    print(f"Countries: {len(countries)}  |  Latency: {args.latency * 1000:.0f}ms/request  |  "
+          f"World Bank: {'bulk' if args.bulk_worldbank else 'per-country'}")
+
+    # Never let a developer's real response cache serve (or absorb) mock payloads
+    response_cache.enabled = args.cache
+    response_cache.cache_dir = Path(tempfile.mkdtemp(prefix="gohip-etl-cache-"))
+    response_cache.clear()
+
+    if args.host_rate:
+        rate_limiter.configure_host("127.0.0.1", HostLimit(
+            rate=args.host_rate, burst=int(args.host_rate), min_rate=1.0, max_rate=args.host_rate * 2,
+        ))
+
+    with MockServer(args.latency, args.throttle) as server:
+        pool_stats.reset()
+        sequential = None
+        if not args.skip_sequential:
+            print("Running sequential path...")
+            sequential = run_sequential(countries, server.base_url, args.bulk_worldbank)
+            print(f"  Sequential: {sequential:.2f}s")
+            print_pool_stats("Sequential pool")
+
+        print(f"Running concurrent path ({args.workers} workers)...")
+        concurrent = run_concurrent(countries, server.base_url, args.workers, concurrency, args.bulk_worldbank)
+        print(f"  Concurrent: {concurrent:.2f}s")
+        print_pool_stats("Concurrent pool")
+
+        if args.cache:
+            print("Running concurrent path again (warm cache)...")
+            warm = run_concurrent(countries, server.base_url, args.workers, concurrency, args.bulk_worldbank)
+            print(f"  Warm cache: {warm:.2f}s")
+            print_pool_stats("Warm pool")
+            response_cache.offline = True
+            print("Running concurrent path offline (cache only)...")
+            offline = run_concurrent(countries, server.base_url, args.workers, concurrency, args.bulk_worldbank)
+            print(f"  Offline: {offline:.2f}s")
+            print_pool_stats("Offline pool")
+            stats = response_cache.stats()
+            print(f"  Cache: {stats['entries']} entries, {stats['size_bytes'] / 1024:.0f} KiB, "
+                  f"{stats['hits']} hits, {stats['offline_hits']} offline hits")
+
+    print("=" * 60)
+    if sequential is not None:
+        print(f"Speedup: {sequential / concurrent:.1f}x")
+    print("=" * 60)
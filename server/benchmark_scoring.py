@@ -0,0 +1,106 @@
+"""
+GOHIP Platform - Intelligence Scoring Benchmark
+===============================================
+
+Measures wall-clock time of the CPU-side intelligence scoring stage
+(app.services.etl.intelligence_scoring.score_countries) for 1, 2, 4 and 8
+worker processes, over what-if variants of the whole country set.
+
+Inputs are built from the bundled reference datasets (CPI, HDI, EPI, IHME
+GBD, WJP, OECD) with seeded random perturbations per variant, so no network
+and no database is required. Every worker count must produce exactly the
+same scores as the single-process run.
+
+Usage:
+    python benchmark_scoring.py                       # 200 variants x 195 countries
+    python benchmark_scoring.py --variants 1000
+    python benchmark_scoring.py --workers 1 2 4 8 16 --chunk-size 512
+"""
+
+import argparse
+import os
+import random
+import time
+from typing import Any, Dict, List
+
+from app.data.targets import UN_MEMBER_STATES
+from app.data.intelligence_reference import get_ihme_gbd_data, get_wjp_data, get_oecd_data
+from app.services.etl.intelligence_client import get_cpi_data, get_hdi_data, get_epi_data
+from app.services.etl.intelligence_scoring import DEFAULT_CHUNK_SIZE, score_countries
+
+
+def reference_scoring_inputs(iso_code: str) -> Dict[str, Any]:
+    """Scoring inputs available from the bundled reference data for a country."""
+    cpi = get_cpi_data(iso_code) or {}
+    hdi = get_hdi_data(iso_code) or {}
+    epi = get_epi_data(iso_code) or {}
+    gbd = get_ihme_gbd_data(iso_code) or {}
+    wjp = get_wjp_data(iso_code) or {}
+    oecd = get_oecd_data(iso_code) or {}
+    return {
+        "corruption_perception_index": cpi.get("score"),
+        "rule_of_law_index": wjp.get("rule_of_law_index"),
+        "government_effectiveness": None,
+        "daly_occupational_total": gbd.get("daly_occupational_total"),
+        "epi_air_quality": epi.get("air_quality"),
+        "uhc_service_coverage_index": None,
+        "health_expenditure_per_capita": None,
+        "life_expectancy_at_birth": None,
+        "hdi_score": hdi.get("score"),
+        "oecd_work_life_balance": oecd.get("work_life_balance"),
+        "gdp_per_capita_ppp": None,
+    }
+
+
+def build_variants(countries: List[str], variants: int, seed: int) -> Dict[str, Dict[str, Any]]:
+    """What-if variants: every country's inputs, each numeric value scaled by +/-20%."""
+    rng = random.Random(seed)
+    base = {iso_code: reference_scoring_inputs(iso_code) for iso_code in countries}
+    inputs = {}
+    for variant in range(variants):
+        for iso_code, values in base.items():
+            inputs[f"{variant:05d}:{iso_code}"] = {
+                field: value * rng.uniform(0.8, 1.2) if isinstance(value, (int, float)) else value
+                for field, value in values.items()
+            }
+    return inputs
+
+
+def run(inputs: Dict[str, Dict[str, Any]], workers: int, chunk_size: int):
+    """Time one score_countries call."""
+    start = time.perf_counter()
+    scores = score_countries(inputs, workers=workers, chunk_size=chunk_size)
+    return time.perf_counter() - start, scores
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="GOHIP intelligence scoring benchmark (process pool)")
+    parser.add_argument("--variants", type=int, default=200,
+                        help="What-if variants of the full country set (default: 200)")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8],
+                        help="Worker process counts to compare (default: 1 2 4 8)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f"Countries per worker task (default: {DEFAULT_CHUNK_SIZE})")
+    parser.add_argument("--seed", type=int, default=42,
+                        help="Random seed for the what-if perturbations (default: 42)")
+    args = parser.parse_args()
+
+    inputs = build_variants(UN_MEMBER_STATES, args.variants, args.seed)
+
+    print("=" * 60)
+    print("GOHIP Intelligence Scoring Benchmark")
+    print("=" * 60)
+    print(f"Rows: {len(inputs)} ({args.variants} variants x {len(UN_MEMBER_STATES)} countries)  |  "
+          f"Chunk size: {args.chunk_size}  |  CPUs: {os.cpu_count()}")
+
+    baseline_time = None
+    baseline_scores = None
+    for workers in args.workers:
+        elapsed, scores = run(inputs, workers, args.chunk_size)
+        if baseline_scores is None:
+            baseline_time, baseline_scores = elapsed, scores
+        identical = scores == baseline_scores and list(scores) == list(baseline_scores)
+        print(f"  {workers} worker(s): {elapsed:.2f}s  "
+              f"({baseline_time / elapsed:.2f}x)  {'identical' if identical else 'MISMATCH'}")
+
+    print("=" * 60)
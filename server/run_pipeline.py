@@ -25,6 +25,8 @@ Pipeline Features:
 - Real-time status tracking via pipeline_logger
 - Comprehensive logging of all data sources fetched
 - Rate limiting between API calls
+- Batched INSERT ... ON CONFLICT writes (one transaction per batch)
+- Checkpointed runs: an interrupted run resumes where it stopped
 - Maturity score calculation
 - Pillar score calculation
 - Intelligence score calculation
@@ -33,17 +35,19 @@ Usage:
     # From CLI
     python run_pipeline.py
     
+    # Resume an interrupted run
+    python run_pipeline.py --resume <run_id>
+    
     # Programmatic (from API endpoint)
-    from run_pipeline import run_full_pipeline
+    from run_pipeline import run_full_pipeline, resume_run
     run_full_pipeline(batch_size=50, use_pipeline_logger=True)
+    resume_run(run_id)
 """
 
-import asyncio
 import logging
 import time
-import uuid
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Set
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -51,30 +55,27 @@ logger = logging.getLogger(__name__)
 
 # Database
 from app.core.database import SessionLocal
-from app.models.country import (
-    Country,
-    Pillar1Hazard,
-    Pillar2Vigilance,
-    Pillar3Restoration,
-    GovernanceLayer,
-)
+from app.models.pipeline_run import PipelineRun
+from app.services.etl.bulk_writer import BulkUpsertWriter, CountryWrite
+from app.services.etl.checkpoints import RunCheckpointStore
 
 # ETL Clients
 from app.services.etl.ilo_client import ILOClient
-from app.services.etl.wb_client import WorldBankClient
+from app.services.etl.wb_client import BulkFetchIncompleteError, WorldBankClient
 from app.services.etl.who_client import WHOClient, calculate_proxy_fatal_rate
+from app.services.etl.concurrent_fetcher import ConcurrentSourceFetcher, DEFAULT_COUNTRY_WORKERS
+from app.services.etl.loop_runner import run_sync
+from app.services.etl.response_cache import response_cache, set_offline_mode, get_cache_stats
+from app.services.etl.rate_limiter import get_rate_limit_stats
+from app.services.etl.incremental import CORE_SOURCES, IncrementalPlanner, inputs_fingerprint, probe_worldbank_years
 
-# Intelligence Pipeline and Reference Data (Additional 6 Sources)
-from app.services.etl.intelligence_pipeline import IntelligencePipeline
-from app.services.etl.intelligence_client import get_cpi_data, get_hdi_data, get_epi_data
+# Intelligence Client and Reference Data (Additional 6 Sources)
+from app.services.etl.intelligence_client import IntelligenceClient, get_cpi_data, get_hdi_data, get_epi_data
 from app.data.intelligence_reference import get_ihme_gbd_data, get_wjp_data, get_oecd_data
 
 # Pipeline Logger for Live Ops Center
 from app.services.pipeline_logger import pipeline_logger, LogLevel
 
-# Scoring
-from app.services.scoring import calculate_maturity_score
-
 # Flag Fetcher
 from app.services.flag_fetcher import fetch_flag_from_wikipedia, get_flag_url, get_existing_flag_url
 
@@ -157,6 +158,348 @@ def calculate_pillar_scores(
     return scores
 
 
+# =============================================================================
+# PER-COUNTRY PROCESSING
+# =============================================================================
+
+def fetch_core_sources(
+    iso_code: str,
+    ilo_client: ILOClient,
+    wb_client: WorldBankClient,
+    who_client: WHOClient,
+    wb_data: Optional[Dict[str, Any]] = None,
+    sources: Optional[Set[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Fetch ILO, World Bank and WHO data for a single country (sequential mode).
+    
+    Args:
+        wb_data: Pre-fetched World Bank context indicators (bulk mode);
+            fetched per-country when omitted
+        sources: Incremental / resumed runs - only fetch these core sources
+            ("ilo", "worldbank", "who"); the others are left out
+    
+    Returns:
+        Dict with "ilo", "worldbank" and "who" results, in the same shape
+        produced by ConcurrentSourceFetcher
+    """
+    # Request pacing and retries are handled per upstream host by the
+    # adaptive rate limiter on the shared ETL HTTP pool
+    source_data: Dict[str, Any] = {}
+    
+    if sources is None or "ilo" in sources:
+        source_data["ilo"] = ilo_client.fetch_fatality_rate_sync(iso_code)
+    
+    if wb_data is not None:
+        source_data["worldbank"] = wb_data
+    elif sources is None or "worldbank" in sources:
+        source_data["worldbank"] = wb_client.fetch_all_context_indicators_sync(iso_code)
+    
+    if sources is None or "who" in sources:
+        source_data["who"] = who_client.fetch_all_indicators_sync(iso_code)
+    
+    return source_data
+
+
+def process_country(
+    iso_code: str,
+    source_data: Dict[str, Any],
+    use_pipeline_logger: bool = True,
+    fetch_flags: bool = True,
+) -> CountryWrite:
+    """
+    Score one country from its fetched core source data.
+    
+    Covers steps 1-8 of the pipeline: reading ILO/WB/WHO values, the six
+    intelligence reference sources, pillar scoring, the rows to write,
+    World Bank extended inputs for the intelligence pipeline and flag
+    download. Nothing is written here: the returned CountryWrite is handed
+    to BulkUpsertWriter, which computes the maturity and intelligence scores
+    and upserts the whole batch in one transaction.
+    
+    Raises on failure so the caller can mark the country failed.
+    """
+    country_name = get_country_name(iso_code)
+    
+    # =====================================================================
+    # STEP 1: ILO Fatal Rate
+    # =====================================================================
+    ilo_data = source_data.get("ilo")
+    fatal_rate = ilo_data.get("value") if ilo_data else None
+    fatal_source = ilo_data.get("source") if ilo_data else None
+    
+    if fatal_rate is not None:
+        if use_pipeline_logger:
+            pipeline_logger.success(f"  ILO Fatal Rate: {fatal_rate} per 100k")
+    else:
+        if use_pipeline_logger:
+            pipeline_logger.log(f"  ILO Fatal Rate: No data")
+    
+    # =====================================================================
+    # STEP 2: World Bank Data
+    # =====================================================================
+    wb_data = source_data.get("worldbank") or {}
+    
+    gov_data = wb_data.get("gov_effectiveness")
+    gov_effectiveness = gov_data.get("value") if gov_data else None
+    
+    vuln_data = wb_data.get("vulnerable_employment")
+    vulnerable_employment = vuln_data.get("value") if vuln_data else None
+    
+    health_data = wb_data.get("health_expenditure")
+    health_expenditure = health_data.get("value") if health_data else None
+    
+    industry_data = wb_data.get("industry_pct_gdp")
+    industry_pct = industry_data.get("value") if industry_data else None
+    
+    if use_pipeline_logger:
+        if gov_effectiveness is not None:
+            pipeline_logger.success(f"  World Bank Gov Effectiveness: {gov_effectiveness:.1f}")
+        if vulnerable_employment is not None:
+            pipeline_logger.log(f"  World Bank Vulnerable Emp: {vulnerable_employment:.1f}%")
+        if health_expenditure is not None:
+            pipeline_logger.log(f"  World Bank Health Exp: {health_expenditure:.1f}% GDP")
+    
+    # =====================================================================
+    # STEP 3: WHO Data (UHC Index, Road Safety as proxy)
+    # =====================================================================
+    who_data = source_data.get("who") or {}
+    
+    uhc_data = who_data.get("uhc_index")
+    uhc_index = uhc_data.get("value") if uhc_data else None
+    
+    road_data = who_data.get("road_safety")
+    road_safety = road_data.get("value") if road_data else None
+    
+    if use_pipeline_logger:
+        if uhc_index is not None:
+            pipeline_logger.success(f"  WHO UHC Index: {uhc_index}")
+        if road_safety is not None:
+            pipeline_logger.log(f"  WHO Road Safety: {road_safety} per 100k")
+    
+    # Use road safety as proxy for fatal rate if ILO is missing
+    if fatal_rate is None and road_safety is not None:
+        fatal_rate = calculate_proxy_fatal_rate(road_safety)
+        fatal_source = "WHO Road Safety Proxy"
+        if use_pipeline_logger:
+            pipeline_logger.warning(f"  Using WHO proxy fatal rate: {fatal_rate}")
+    
+    # =====================================================================
+    # STEP 4: Fetch Intelligence Data (6 Additional Sources)
+    # =====================================================================
+    intel_sources_fetched = []
+    
+    # SOURCE 4: Transparency International CPI
+    cpi_data = get_cpi_data(iso_code)
+    if cpi_data:
+        cpi_score = cpi_data.get("score")
+        cpi_rank = cpi_data.get("rank")
+        intel_sources_fetched.append("CPI")
+        if use_pipeline_logger:
+            pipeline_logger.success(f"  TI CPI: Score={cpi_score}, Rank={cpi_rank}")
+    else:
+        if use_pipeline_logger:
+            pipeline_logger.log(f"  TI CPI: No data")
+    
+    # SOURCE 5: UNDP Human Development Index
+    hdi_data = get_hdi_data(iso_code)
+    if hdi_data:
+        hdi_score = hdi_data.get("score")
+        hdi_rank = hdi_data.get("rank")
+        intel_sources_fetched.append("HDI")
+        if use_pipeline_logger:
+            pipeline_logger.success(f"  UNDP HDI: Score={hdi_score:.3f}, Rank={hdi_rank}")
+    else:
+        if use_pipeline_logger:
+            pipeline_logger.log(f"  UNDP HDI: No data")
+    
+    # SOURCE 6: Yale Environmental Performance Index
+    epi_data = get_epi_data(iso_code)
+    if epi_data:
+        epi_score = epi_data.get("score")
+        epi_rank = epi_data.get("rank")
+        epi_air = epi_data.get("air_quality")
+        intel_sources_fetched.append("EPI")
+        if use_pipeline_logger:
+            pipeline_logger.success(f"  Yale EPI: Score={epi_score:.1f}, Rank={epi_rank}, Air={epi_air}")
+    else:
+        if use_pipeline_logger:
+            pipeline_logger.log(f"  Yale EPI: No data")
+    
+    # SOURCE 7: IHME Global Burden of Disease
+    gbd_data = get_ihme_gbd_data(iso_code)
+    if gbd_data:
+        daly_total = gbd_data.get("daly_occupational_total")
+        deaths_total = gbd_data.get("deaths_occupational_total")
+        intel_sources_fetched.append("IHME_GBD")
+        if use_pipeline_logger:
+            pipeline_logger.success(f"  IHME GBD: DALYs={daly_total}, Deaths={deaths_total}")
+    else:
+        if use_pipeline_logger:
+            pipeline_logger.log(f"  IHME GBD: No data")
+    
+    # SOURCE 8: World Justice Project Rule of Law
+    wjp_data = get_wjp_data(iso_code)
+    if wjp_data:
+        rol_index = wjp_data.get("rule_of_law_index")
+        reg_enforcement = wjp_data.get("regulatory_enforcement")
+        intel_sources_fetched.append("WJP")
+        if use_pipeline_logger:
+            pipeline_logger.success(f"  WJP Rule of Law: Index={rol_index:.2f}, Enforcement={reg_enforcement:.2f}")
+    else:
+        if use_pipeline_logger:
+            pipeline_logger.log(f"  WJP Rule of Law: No data")
+    
+    # SOURCE 9: OECD Work-Life Balance (OECD countries only)
+    oecd_data = get_oecd_data(iso_code)
+    if oecd_data:
+        work_life = oecd_data.get("work_life_balance")
+        hours_annual = oecd_data.get("hours_worked_annual")
+        intel_sources_fetched.append("OECD")
+        if use_pipeline_logger:
+            pipeline_logger.success(f"  OECD Work-Life: Balance={work_life:.1f}, Hours/yr={hours_annual}")
+    else:
+        if use_pipeline_logger:
+            pipeline_logger.log(f"  OECD Work-Life: No data (non-OECD)")
+    
+    # Log intelligence summary
+    if use_pipeline_logger:
+        if intel_sources_fetched:
+            pipeline_logger.log(f"  Intelligence Sources: {', '.join(intel_sources_fetched)} ({len(intel_sources_fetched)}/6)")
+        else:
+            pipeline_logger.log(f"  Intelligence Sources: None available")
+    
+    # =====================================================================
+    # STEP 5: Calculate Pillar Scores
+    # =====================================================================
+    if use_pipeline_logger:
+        pipeline_logger.log(f"  Calculating pillar scores...")
+        
+    scores = calculate_pillar_scores(
+        fatal_rate=fatal_rate,
+        gov_effectiveness=gov_effectiveness,
+        uhc_index=uhc_index,
+        vulnerable_employment=vulnerable_employment,
+        health_expenditure=health_expenditure,
+    )
+    
+    if use_pipeline_logger:
+        pipeline_logger.log(f"  Scores: Gov={scores['governance_score']}, P1={scores['pillar1_score']}, P2={scores['pillar2_score']}, P3={scores['pillar3_score']}")
+    
+    # =====================================================================
+    # STEP 6: Core Rows (written in bulk by BulkUpsertWriter)
+    # =====================================================================
+    now_iso = datetime.utcnow().isoformat()
+    
+    # Convert health expenditure to rehab access score (0-100)
+    rehab_score = None
+    if health_expenditure is not None:
+        rehab_score = min(health_expenditure * 5.5, 100)
+    
+    write = CountryWrite(
+        iso_code=iso_code,
+        name=country_name,
+        country={
+            "governance_score": scores["governance_score"],
+            "pillar1_score": scores["pillar1_score"],
+            "pillar2_score": scores["pillar2_score"],
+            "pillar3_score": scores["pillar3_score"],
+        },
+        layers={
+            "pillar1": {
+                "fatal_accident_rate": fatal_rate,
+                "control_maturity_score": scores["pillar1_score"],
+                "source_urls": {
+                    "fatal_rate": fatal_source,
+                    "updated_at": now_iso,
+                },
+            },
+            "pillar2": {
+                "disease_detection_rate": uhc_index,
+                "vulnerability_index": vulnerable_employment,
+                "source_urls": {
+                    "uhc_index": "https://www.who.int/data/gho",
+                    "vulnerability": "https://data.worldbank.org",
+                    "updated_at": now_iso,
+                },
+            },
+            "pillar3": {
+                "rehab_access_score": rehab_score,
+                "source_urls": {
+                    "health_expenditure": "https://data.worldbank.org",
+                    "updated_at": now_iso,
+                },
+            },
+            "governance": {
+                "strategic_capacity_score": gov_effectiveness,
+                "source_urls": {
+                    "gov_effectiveness": "https://data.worldbank.org/indicator/GE.EST",
+                    "economic_context": {
+                        "industry_pct_gdp": industry_pct,
+                    },
+                    "updated_at": now_iso,
+                },
+            },
+        },
+    )
+    
+    # =====================================================================
+    # STEP 7: Intelligence Inputs (IntelligencePipeline runs at write time)
+    # =====================================================================
+    write.wb_extended = source_data.get("worldbank_extended")
+    if write.wb_extended is None:
+        try:
+            write.wb_extended = IntelligenceClient().fetch_all_intelligence(iso_code)
+        except Exception as e:
+            logger.warning(f"World Bank extended fetch failed for {iso_code}: {e}")
+            if use_pipeline_logger:
+                pipeline_logger.warning(f"  World Bank extended fetch error: {e}")
+    
+    # =====================================================================
+    # STEP 8: Fetch Flag (if enabled)
+    # =====================================================================
+    if fetch_flags:
+        # Check if flag already exists
+        existing_flag = get_existing_flag_url(iso_code)
+        if existing_flag:
+            write.country["flag_url"] = existing_flag
+        else:
+            try:
+                flag_url = run_sync(fetch_flag_from_wikipedia(iso_code, country_name))
+                if flag_url:
+                    write.country["flag_url"] = flag_url
+                    if use_pipeline_logger:
+                        pipeline_logger.success(f"  Flag downloaded")
+            except Exception as e:
+                if use_pipeline_logger:
+                    pipeline_logger.warning(f"  Flag fetch failed: {e}")
+    
+    # Compile list of all data sources fetched for this country
+    all_sources = []
+    if fatal_rate is not None:
+        all_sources.append("ILO")
+    if uhc_index is not None or road_safety is not None:
+        all_sources.append("WHO")
+    if gov_effectiveness is not None or health_expenditure is not None:
+        all_sources.append("WorldBank")
+    all_sources.extend(intel_sources_fetched)
+    
+    if use_pipeline_logger:
+        pipeline_logger.complete_country(iso_code, fatal_rate)
+        pipeline_logger.success(f"  COMPLETE: {country_name} | Sources: {', '.join(all_sources) if all_sources else 'None'} ({len(all_sources)} sources)")
+    
+    return write
+
+
+def _report_write_failures(failures: Dict[str, str], use_pipeline_logger: bool) -> int:
+    """Mark countries whose bulk write failed; returns how many failed."""
+    if use_pipeline_logger:
+        for iso_code, error in failures.items():
+            pipeline_logger.error(f"  ERROR: database write failed for {iso_code}: {error}")
+            pipeline_logger.fail_country(iso_code, error)
+    return len(failures)
+
+
 # =============================================================================
 # MAIN PIPELINE FUNCTION
 # =============================================================================
@@ -166,6 +509,13 @@ def run_full_pipeline(
     use_pipeline_logger: bool = True,
     country_filter: Optional[List[str]] = None,
     fetch_flags: bool = True,
+    concurrent: bool = False,
+    source_concurrency: Optional[Dict[str, int]] = None,
+    country_workers: int = DEFAULT_COUNTRY_WORKERS,
+    bulk_worldbank: bool = False,
+    incremental: bool = False,
+    write_batch_size: Optional[int] = None,
+    run_id: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Execute the full 9-Source Data Engine ETL pipeline.
@@ -179,6 +529,24 @@ def run_full_pipeline(
         use_pipeline_logger: Whether to use pipeline_logger for status tracking
         country_filter: Optional list of ISO codes to process (None = all)
         fetch_flags: Whether to fetch flag images from Wikipedia
+        concurrent: Fetch ILO/WB/WHO data for many countries in parallel
+            (asyncio worker pool) instead of one country at a time
+        source_concurrency: Per-source limit on countries with in-flight
+            requests in concurrent mode, e.g. {"ilo": 4, "worldbank": 8, "who": 8}
+        country_workers: Number of countries fetched at once in concurrent mode
+        bulk_worldbank: Prefetch World Bank core and extended indicators for
+            all target countries up front with paged /country/all/ requests
+            (indicators x pages requests instead of countries x indicators)
+        incremental: Delta refresh - only fetch sources that are stale or
+            have new upstream data (see app.services.etl.incremental), and
+            skip rescoring countries whose inputs are unchanged. Implies
+            bulk_worldbank, which doubles as the World Bank metadata probe
+        write_batch_size: Countries per bulk upsert transaction
+            (default: settings.ETL_WRITE_BATCH_SIZE)
+        run_id: Persistent run ID (generated when omitted). Passing the ID
+            of an existing run resumes it: countries already written are
+            skipped and checkpointed source payloads are reused (see
+            app.services.etl.checkpoints and resume_run)
     
     Returns:
         Summary dict with counts and statistics
@@ -199,6 +567,21 @@ def run_full_pipeline(
     12. [FLAGS]  Wikipedia → Country flag images
     """
     start_time = time.time()
+    options = {
+        "batch_size": batch_size,
+        "country_filter": country_filter,
+        "fetch_flags": fetch_flags,
+        "concurrent": concurrent,
+        "source_concurrency": source_concurrency,
+        "country_workers": country_workers,
+        "bulk_worldbank": bulk_worldbank,
+        "incremental": incremental,
+        "write_batch_size": write_batch_size,
+    }
+    
+    # The bulk World Bank fetch is the upstream probe for incremental runs
+    if incremental:
+        bulk_worldbank = True
     
     # Determine countries to process
     if country_filter:
@@ -226,372 +609,196 @@ def run_full_pipeline(
         pipeline_logger.log("  [9] OECD - Work-Life Balance (OECD countries)")
         pipeline_logger.log("=" * 50)
         pipeline_logger.log(f"Flags: {'Enabled' if fetch_flags else 'Disabled'}")
+        pipeline_logger.log(f"Fetch Mode: {'Concurrent (' + str(country_workers) + ' workers)' if concurrent else 'Sequential'}")
+        pipeline_logger.log(f"Response Cache: {'Offline (cache only)' if response_cache.offline else ('Enabled' if response_cache.enabled else 'Disabled')}")
+        pipeline_logger.log(f"World Bank Mode: {'Bulk (all countries per request)' if bulk_worldbank else 'Per-country'}")
+        pipeline_logger.log(f"Refresh Mode: {'Incremental' if incremental else 'Full'}")
+    
+    # Create database session and open (or resume) the run
+    db = SessionLocal()
+    store = RunCheckpointStore(db, run_id)
+    store.start(options, target_countries)
+    
+    # Countries written by an earlier attempt of this run are done
+    remaining = [iso for iso in target_countries if iso not in store.written_countries]
+    if use_pipeline_logger:
+        pipeline_logger.log(f"Run ID: {store.run_id}")
+        if store.resumed:
+            pipeline_logger.log(
+                f"Resuming run: {total_countries - len(remaining)} countries already written, "
+                f"{len(remaining)} remaining"
+            )
+            for iso_code in target_countries:
+                if iso_code in store.written_countries:
+                    pipeline_logger.complete_country(iso_code)
     
     # Initialize ETL clients
     ilo_client = ILOClient()
     wb_client = WorldBankClient()
     who_client = WHOClient()
     
-    # Create database session
-    db = SessionLocal()
+    # Bulk mode: fetch World Bank data for every target country up front
+    wb_prefetched: Optional[Dict[str, Dict[str, Any]]] = None
+    wb_extended: Dict[str, Dict[str, Any]] = {}
+    wb_extended_fallback = False
+    if bulk_worldbank:
+        if use_pipeline_logger:
+            pipeline_logger.log("Prefetching World Bank indicators in bulk...")
+        try:
+            wb_prefetched = wb_client.fetch_all_context_indicators_bulk_sync(remaining)
+        except BulkFetchIncompleteError as e:
+            # Partial bulk data would leave countries without indicators: fetch per country instead
+            logger.warning(f"World Bank bulk prefetch incomplete, falling back to per-country fetches: {e}")
+            if use_pipeline_logger:
+                pipeline_logger.warning(f"World Bank bulk prefetch incomplete ({e}) - fetching per country")
+        try:
+            wb_extended = IntelligenceClient().fetch_all_intelligence_bulk(remaining)
+        except BulkFetchIncompleteError as e:
+            wb_extended_fallback = True
+            logger.warning(f"World Bank extended bulk fetch incomplete, falling back to per-country fetches: {e}")
+            if use_pipeline_logger:
+                pipeline_logger.warning(f"World Bank extended bulk fetch incomplete ({e}) - fetching per country")
+        if use_pipeline_logger and wb_prefetched is not None:
+            covered = sum(1 for data in wb_prefetched.values() if any(data.values()))
+            pipeline_logger.success(f"World Bank bulk prefetch: {covered}/{len(remaining)} countries with core data")
+    
+    # Countries are checkpointed as written in the same transaction as their batch
+    writer = BulkUpsertWriter(db, batch_size=write_batch_size, before_commit=store.mark_written)
+    planner = IncrementalPlanner(db)
+    planner.load(remaining)
     
     # Statistics
-    success_count = 0
+    success_count = total_countries - len(remaining)
     failed_count = 0
+    unchanged_count = 0
+    
+    # Incremental mode: only countries with a due source are fetched, and
+    # only their due sources
+    source_plan: Optional[Dict[str, Set[str]]] = None
+    fetch_countries = remaining
+    if incremental:
+        plans = planner.plan(
+            remaining,
+            upstream_years=probe_worldbank_years(wb_prefetched or {}),
+            upstream_data={iso: {"worldbank": data} for iso, data in (wb_prefetched or {}).items()},
+        )
+        source_plan = {iso: plan.due_sources for iso, plan in plans.items()}
+        fetch_countries = [iso for iso in remaining if plans[iso].is_due]
+        up_to_date = [iso for iso in remaining if not plans[iso].is_due]
+        success_count += len(up_to_date)
+        unchanged_count += len(up_to_date)
+        if use_pipeline_logger:
+            pipeline_logger.log(f"Incremental: {len(fetch_countries)} countries due, {len(up_to_date)} up to date")
+            for iso_code in up_to_date:
+                pipeline_logger.complete_country(iso_code)
+    
+    # Resumed run: sources checkpointed by the earlier attempt are not refetched
+    if store.resumed:
+        source_plan = {
+            iso: (source_plan[iso] if source_plan is not None else set(CORE_SOURCES))
+            - set(store.fetched_sources(iso))
+            for iso in fetch_countries
+        }
+    
+    # Concurrent mode streams (iso_code, source_data, error) in completion order;
+    # sequential mode fetches each country inside the loop below
+    fetcher = None
+    if concurrent:
+        fetcher = ConcurrentSourceFetcher(
+            ilo_client=ilo_client,
+            wb_client=wb_client,
+            who_client=who_client,
+            source_concurrency=source_concurrency,
+            country_workers=country_workers,
+            wb_prefetched=wb_prefetched,
+            source_plan=source_plan,
+        )
+        country_stream = fetcher.iter_results(fetch_countries)
+    else:
+        country_stream = ((iso_code, None, None) for iso_code in fetch_countries)
     
     try:
-        for idx, iso_code in enumerate(target_countries):
+        for idx, (iso_code, source_data, fetch_error) in enumerate(country_stream):
             country_name = get_country_name(iso_code)
             
             # Check for stop request
             if use_pipeline_logger and pipeline_logger.stop_requested:
-                pipeline_logger.warning(f"Stop requested - halting at {idx}/{total_countries}")
+                pipeline_logger.warning(f"Stop requested - halting at {idx}/{len(fetch_countries)}")
+                if fetcher:
+                    fetcher.stop()
                 break
             
             # Mark country as processing
             if use_pipeline_logger:
                 pipeline_logger.start_country(iso_code)
-                pipeline_logger.log(f"[{idx+1}/{total_countries}] Processing {country_name} ({iso_code})")
+                pipeline_logger.log(f"[{idx+1}/{len(fetch_countries)}] Processing {country_name} ({iso_code})")
             
             try:
-                # =====================================================================
-                # STEP 1: Fetch ILO Fatal Rate
-                # =====================================================================
-                ilo_data = ilo_client.fetch_fatality_rate_sync(iso_code)
-                fatal_rate = ilo_data.get("value") if ilo_data else None
-                fatal_source = ilo_data.get("source") if ilo_data else None
-                
-                if fatal_rate is not None:
-                    if use_pipeline_logger:
-                        pipeline_logger.success(f"  ILO Fatal Rate: {fatal_rate} per 100k")
-                else:
-                    if use_pipeline_logger:
-                        pipeline_logger.log(f"  ILO Fatal Rate: No data")
-                
-                # =====================================================================
-                # STEP 2: Fetch World Bank Data
-                # =====================================================================
-                wb_data = wb_client.fetch_all_context_indicators_sync(iso_code)
-                
-                gov_data = wb_data.get("gov_effectiveness")
-                gov_effectiveness = gov_data.get("value") if gov_data else None
-                
-                vuln_data = wb_data.get("vulnerable_employment")
-                vulnerable_employment = vuln_data.get("value") if vuln_data else None
-                
-                health_data = wb_data.get("health_expenditure")
-                health_expenditure = health_data.get("value") if health_data else None
-                
-                industry_data = wb_data.get("industry_pct_gdp")
-                industry_pct = industry_data.get("value") if industry_data else None
-                
-                if use_pipeline_logger:
-                    if gov_effectiveness is not None:
-                        pipeline_logger.success(f"  World Bank Gov Effectiveness: {gov_effectiveness:.1f}")
-                    if vulnerable_employment is not None:
-                        pipeline_logger.log(f"  World Bank Vulnerable Emp: {vulnerable_employment:.1f}%")
-                    if health_expenditure is not None:
-                        pipeline_logger.log(f"  World Bank Health Exp: {health_expenditure:.1f}% GDP")
-                
-                # Rate limit between API calls
-                time.sleep(0.3)
-                
-                # =====================================================================
-                # STEP 3: Fetch WHO Data (UHC Index, Road Safety as proxy)
-                # =====================================================================
-                who_data = who_client.fetch_all_indicators_sync(iso_code)
-                
-                uhc_data = who_data.get("uhc_index")
-                uhc_index = uhc_data.get("value") if uhc_data else None
-                
-                road_data = who_data.get("road_safety")
-                road_safety = road_data.get("value") if road_data else None
-                
-                if use_pipeline_logger:
-                    if uhc_index is not None:
-                        pipeline_logger.success(f"  WHO UHC Index: {uhc_index}")
-                    if road_safety is not None:
-                        pipeline_logger.log(f"  WHO Road Safety: {road_safety} per 100k")
-                
-                # Use road safety as proxy for fatal rate if ILO is missing
-                if fatal_rate is None and road_safety is not None:
-                    fatal_rate = calculate_proxy_fatal_rate(road_safety)
-                    fatal_source = "WHO Road Safety Proxy"
-                    if use_pipeline_logger:
-                        pipeline_logger.warning(f"  Using WHO proxy fatal rate: {fatal_rate}")
-                
-                # =====================================================================
-                # STEP 4: Fetch Intelligence Data (6 Additional Sources)
-                # =====================================================================
-                intel_sources_fetched = []
-                
-                # SOURCE 4: Transparency International CPI
-                cpi_data = get_cpi_data(iso_code)
-                if cpi_data:
-                    cpi_score = cpi_data.get("score")
-                    cpi_rank = cpi_data.get("rank")
-                    intel_sources_fetched.append("CPI")
-                    if use_pipeline_logger:
-                        pipeline_logger.success(f"  TI CPI: Score={cpi_score}, Rank={cpi_rank}")
-                else:
-                    if use_pipeline_logger:
-                        pipeline_logger.log(f"  TI CPI: No data")
-                
-                # SOURCE 5: UNDP Human Development Index
-                hdi_data = get_hdi_data(iso_code)
-                if hdi_data:
-                    hdi_score = hdi_data.get("score")
-                    hdi_rank = hdi_data.get("rank")
-                    intel_sources_fetched.append("HDI")
-                    if use_pipeline_logger:
-                        pipeline_logger.success(f"  UNDP HDI: Score={hdi_score:.3f}, Rank={hdi_rank}")
-                else:
-                    if use_pipeline_logger:
-                        pipeline_logger.log(f"  UNDP HDI: No data")
-                
-                # SOURCE 6: Yale Environmental Performance Index
-                epi_data = get_epi_data(iso_code)
-                if epi_data:
-                    epi_score = epi_data.get("score")
-                    epi_rank = epi_data.get("rank")
-                    epi_air = epi_data.get("air_quality")
-                    intel_sources_fetched.append("EPI")
-                    if use_pipeline_logger:
-                        pipeline_logger.success(f"  Yale EPI: Score={epi_score:.1f}, Rank={epi_rank}, Air={epi_air}")
-                else:
-                    if use_pipeline_logger:
-                        pipeline_logger.log(f"  Yale EPI: No data")
-                
-                # SOURCE 7: IHME Global Burden of Disease
-                gbd_data = get_ihme_gbd_data(iso_code)
-                if gbd_data:
-                    daly_total = gbd_data.get("daly_occupational_total")
-                    deaths_total = gbd_data.get("deaths_occupational_total")
-                    intel_sources_fetched.append("IHME_GBD")
-                    if use_pipeline_logger:
-                        pipeline_logger.success(f"  IHME GBD: DALYs={daly_total}, Deaths={deaths_total}")
-                else:
-                    if use_pipeline_logger:
-                        pipeline_logger.log(f"  IHME GBD: No data")
-                
-                # SOURCE 8: World Justice Project Rule of Law
-                wjp_data = get_wjp_data(iso_code)
-                if wjp_data:
-                    rol_index = wjp_data.get("rule_of_law_index")
-                    reg_enforcement = wjp_data.get("regulatory_enforcement")
-                    intel_sources_fetched.append("WJP")
-                    if use_pipeline_logger:
-                        pipeline_logger.success(f"  WJP Rule of Law: Index={rol_index:.2f}, Enforcement={reg_enforcement:.2f}")
-                else:
-                    if use_pipeline_logger:
-                        pipeline_logger.log(f"  WJP Rule of Law: No data")
-                
-                # SOURCE 9: OECD Work-Life Balance (OECD countries only)
-                oecd_data = get_oecd_data(iso_code)
-                if oecd_data:
-                    work_life = oecd_data.get("work_life_balance")
-                    hours_annual = oecd_data.get("hours_worked_annual")
-                    intel_sources_fetched.append("OECD")
-                    if use_pipeline_logger:
-                        pipeline_logger.success(f"  OECD Work-Life: Balance={work_life:.1f}, Hours/yr={hours_annual}")
-                else:
-                    if use_pipeline_logger:
-                        pipeline_logger.log(f"  OECD Work-Life: No data (non-OECD)")
-                
-                # Log intelligence summary
-                if use_pipeline_logger:
-                    if intel_sources_fetched:
-                        pipeline_logger.log(f"  Intelligence Sources: {', '.join(intel_sources_fetched)} ({len(intel_sources_fetched)}/6)")
-                    else:
-                        pipeline_logger.log(f"  Intelligence Sources: None available")
-                
-                # =====================================================================
-                # STEP 5: Calculate Pillar Scores
-                # =====================================================================
-                if use_pipeline_logger:
-                    pipeline_logger.log(f"  Calculating pillar scores...")
-                    
-                scores = calculate_pillar_scores(
-                    fatal_rate=fatal_rate,
-                    gov_effectiveness=gov_effectiveness,
-                    uhc_index=uhc_index,
-                    vulnerable_employment=vulnerable_employment,
-                    health_expenditure=health_expenditure,
-                )
-                
-                if use_pipeline_logger:
-                    pipeline_logger.log(f"  Scores: Gov={scores['governance_score']}, P1={scores['pillar1_score']}, P2={scores['pillar2_score']}, P3={scores['pillar3_score']}")
-                
-                # =====================================================================
-                # STEP 6: Upsert Core Data to Database
-                # =====================================================================
-                
-                # Get or create Country record
-                country = db.query(Country).filter(Country.iso_code == iso_code).first()
-                if not country:
-                    country = Country(
-                        iso_code=iso_code,
-                        name=country_name,
-                    )
-                    db.add(country)
-                
-                # Update pillar scores on country
-                country.governance_score = scores["governance_score"]
-                country.pillar1_score = scores["pillar1_score"]
-                country.pillar2_score = scores["pillar2_score"]
-                country.pillar3_score = scores["pillar3_score"]
-                
-                # Update or create Pillar1Hazard
-                pillar1 = db.query(Pillar1Hazard).filter(
-                    Pillar1Hazard.country_iso_code == iso_code
-                ).first()
-                if not pillar1:
-                    pillar1 = Pillar1Hazard(
-                        id=str(uuid.uuid4()),
-                        country_iso_code=iso_code,
-                    )
-                    db.add(pillar1)
-                
-                pillar1.fatal_accident_rate = fatal_rate
-                pillar1.control_maturity_score = scores["pillar1_score"]
-                pillar1.source_urls = {
-                    "fatal_rate": fatal_source,
-                    "updated_at": datetime.utcnow().isoformat(),
-                }
+                if fetch_error:
+                    raise RuntimeError(fetch_error)
                 
-                # Update or create Pillar2Vigilance
-                pillar2 = db.query(Pillar2Vigilance).filter(
-                    Pillar2Vigilance.country_iso_code == iso_code
-                ).first()
-                if not pillar2:
-                    pillar2 = Pillar2Vigilance(
-                        id=str(uuid.uuid4()),
-                        country_iso_code=iso_code,
+                due_sources = source_plan[iso_code] if source_plan is not None else None
+                if source_data is None:
+                    source_data = fetch_core_sources(
+                        iso_code, ilo_client, wb_client, who_client,
+                        wb_data=wb_prefetched.get(iso_code) if wb_prefetched is not None else None,
+                        sources=due_sources,
                     )
-                    db.add(pillar2)
                 
-                pillar2.disease_detection_rate = uhc_index
-                pillar2.vulnerability_index = vulnerable_employment
-                pillar2.source_urls = {
-                    "uhc_index": "https://www.who.int/data/gho",
-                    "vulnerability": "https://data.worldbank.org",
-                    "updated_at": datetime.utcnow().isoformat(),
+                # Checkpoint fresh payloads before scoring, so a crash from here
+                # on does not cost the upstream requests again
+                checkpointed = dict(store.fetched_sources(iso_code))
+                fetched_sources = [
+                    source for source in CORE_SOURCES
+                    if source in source_data and source not in checkpointed
+                ]
+                # Sources fetched by an earlier attempt of this run keep their fetch time
+                checkpoint_times = {
+                    source: fetched_at for source, fetched_at in store.fetched_at(iso_code).items()
+                    if source in CORE_SOURCES and source in checkpointed
                 }
+                store.record_fetch(iso_code, {
+                    source: payload for source, payload in source_data.items()
+                    if source not in checkpointed
+                })
+                for source, payload in checkpointed.items():
+                    source_data.setdefault(source, payload)
                 
-                # Update or create Pillar3Restoration
-                pillar3 = db.query(Pillar3Restoration).filter(
-                    Pillar3Restoration.country_iso_code == iso_code
-                ).first()
-                if not pillar3:
-                    pillar3 = Pillar3Restoration(
-                        id=str(uuid.uuid4()),
-                        country_iso_code=iso_code,
+                # Sources that were not due reuse their last fetched payload
+                for source, payload in planner.stored_source_data(iso_code).items():
+                    source_data.setdefault(source, payload)
+                if iso_code in wb_extended:
+                    source_data["worldbank_extended"] = wb_extended[iso_code]
+                elif wb_extended_fallback and not (source_data.get("worldbank_extended") or {}).get("sources_used"):
+                    source_data["worldbank_extended"] = IntelligenceClient().fetch_all_intelligence(
+                        iso_code, fast_mode=False
                     )
-                    db.add(pillar3)
                 
-                # Convert health expenditure to rehab access score (0-100)
-                rehab_score = None
-                if health_expenditure is not None:
-                    rehab_score = min(health_expenditure * 5.5, 100)
-                pillar3.rehab_access_score = rehab_score
-                pillar3.source_urls = {
-                    "health_expenditure": "https://data.worldbank.org",
-                    "updated_at": datetime.utcnow().isoformat(),
-                }
-                
-                # Update or create GovernanceLayer
-                governance = db.query(GovernanceLayer).filter(
-                    GovernanceLayer.country_iso_code == iso_code
-                ).first()
-                if not governance:
-                    governance = GovernanceLayer(
-                        id=str(uuid.uuid4()),
-                        country_iso_code=iso_code,
+                fingerprint = inputs_fingerprint(iso_code, source_data)
+                scored = not (incremental and fingerprint == planner.previous_fingerprint(iso_code))
+                if scored:
+                    write = process_country(
+                        iso_code,
+                        source_data,
+                        use_pipeline_logger=use_pipeline_logger,
+                        fetch_flags=fetch_flags,
                     )
-                    db.add(governance)
-                
-                governance.strategic_capacity_score = gov_effectiveness
-                governance.source_urls = {
-                    "gov_effectiveness": "https://data.worldbank.org/indicator/GE.EST",
-                    "economic_context": {
-                        "industry_pct_gdp": industry_pct,
-                    },
-                    "updated_at": datetime.utcnow().isoformat(),
-                }
-                
-                # Commit country data before calculating maturity
-                db.commit()
-                
-                # Refresh to get relationships
-                db.refresh(country)
-                
-                # Calculate maturity score
-                try:
-                    maturity_score, maturity_label = calculate_maturity_score(country)
-                    country.maturity_score = maturity_score
-                    db.commit()
-                    if use_pipeline_logger:
-                        pipeline_logger.log(f"  Maturity: {maturity_score} ({maturity_label})")
-                except Exception as e:
-                    logger.warning(f"Could not calculate maturity for {iso_code}: {e}")
-                
-                # =====================================================================
-                # STEP 7: Save Intelligence Data (via IntelligencePipeline)
-                # =====================================================================
-                try:
-                    intel_pipeline = IntelligencePipeline(db)
-                    intel_result = intel_pipeline.process_country(iso_code)
-                    
-                    if intel_result["success"]:
-                        sources_saved = intel_result.get("sources_used", [])
-                        if use_pipeline_logger and sources_saved:
-                            pipeline_logger.success(f"  Intelligence saved: {', '.join(sources_saved)}")
-                    else:
-                        if use_pipeline_logger and intel_result.get("error"):
-                            pipeline_logger.warning(f"  Intelligence save warning: {intel_result['error']}")
-                except Exception as e:
-                    logger.warning(f"Intelligence pipeline failed for {iso_code}: {e}")
+                    # An extended payload without data is never checkpointed for reuse
+                    if (write.wb_extended or {}).get("sources_used") and "worldbank_extended" not in checkpointed:
+                        store.record_fetch(iso_code, {"worldbank_extended": write.wb_extended})
+                else:
+                    write = CountryWrite(iso_code=iso_code, name=country_name)
+                    unchanged_count += 1
                     if use_pipeline_logger:
-                        pipeline_logger.warning(f"  Intelligence pipeline error: {e}")
-                
-                # =====================================================================
-                # STEP 8: Fetch Flag (if enabled)
-                # =====================================================================
-                if fetch_flags:
-                    # Check if flag already exists
-                    existing_flag = get_existing_flag_url(iso_code)
-                    if existing_flag:
-                        country.flag_url = existing_flag
-                    else:
-                        try:
-                            flag_url = asyncio.run(fetch_flag_from_wikipedia(iso_code, country_name))
-                            if flag_url:
-                                country.flag_url = flag_url
-                                if use_pipeline_logger:
-                                    pipeline_logger.success(f"  Flag downloaded")
-                        except Exception as e:
-                            if use_pipeline_logger:
-                                pipeline_logger.warning(f"  Flag fetch failed: {e}")
-                    
-                    db.commit()
+                        pipeline_logger.log(f"  Inputs unchanged - scores kept")
+                        pipeline_logger.complete_country(iso_code)
                 
-                # Mark country as complete
+                write.refresh = planner.refresh_update(
+                    iso_code, source_data, fetched_sources + list(checkpoint_times), fingerprint, scored,
+                    fetched_at=checkpoint_times,
+                )
                 success_count += 1
                 
-                # Compile list of all data sources fetched for this country
-                all_sources = []
-                if fatal_rate is not None:
-                    all_sources.append("ILO")
-                if uhc_index is not None or road_safety is not None:
-                    all_sources.append("WHO")
-                if gov_effectiveness is not None or health_expenditure is not None:
-                    all_sources.append("WorldBank")
-                all_sources.extend(intel_sources_fetched)
-                
-                if use_pipeline_logger:
-                    pipeline_logger.complete_country(iso_code, fatal_rate)
-                    pipeline_logger.success(f"  COMPLETE: {country_name} | Sources: {', '.join(all_sources) if all_sources else 'None'} ({len(all_sources)} sources)")
-                
             except Exception as e:
                 failed_count += 1
                 error_msg = str(e)
@@ -599,12 +806,25 @@ def run_full_pipeline(
                 if use_pipeline_logger:
                     pipeline_logger.error(f"  ERROR: {error_msg}")
                     pipeline_logger.fail_country(iso_code, error_msg)
-                
-                # Rollback on error
-                db.rollback()
+                store.record_failures({iso_code: error_msg})
+                continue
             
-            # Rate limit between countries
-            time.sleep(0.5)
+            # Buffered; written in one transaction per batch
+            failures = writer.add(write)
+            store.record_failures(failures)
+            write_failures = _report_write_failures(failures, use_pipeline_logger)
+            success_count -= write_failures
+            failed_count += write_failures
+        
+        # Write whatever is left in the buffer (also after a stop request)
+        failures = writer.flush()
+        store.record_failures(failures)
+        write_failures = _report_write_failures(failures, use_pipeline_logger)
+        success_count -= write_failures
+        failed_count += write_failures
+        
+        stopped = use_pipeline_logger and pipeline_logger.stop_requested
+        store.finish("stopped" if stopped else "completed", success_count, failed_count)
         
         # Pipeline complete
         elapsed = time.time() - start_time
@@ -616,7 +836,14 @@ def run_full_pipeline(
             pipeline_logger.log("=" * 50)
             pipeline_logger.log(f"Countries Processed: {success_count}/{total_countries}")
             pipeline_logger.log(f"Countries Failed: {failed_count}")
+            if incremental:
+                pipeline_logger.log(f"Countries Unchanged (not rescored): {unchanged_count}")
+            pipeline_logger.log(
+                f"Database Writes: {writer.stats['batches']} batches, "
+                f"{writer.stats['statements']} upsert statements"
+            )
             pipeline_logger.log(f"Duration: {elapsed:.1f}s")
+            pipeline_logger.log(f"Run ID: {store.run_id}{' (resumed)' if store.resumed else ''}")
             pipeline_logger.log("=" * 50)
             pipeline_logger.log("DATA SOURCES AVAILABLE:")
             pipeline_logger.log("  [1] ILO ILOSTAT - Fetched via API")
@@ -629,14 +856,26 @@ def run_full_pipeline(
             pipeline_logger.log("  [8] WJP Rule of Law - Reference data")
             pipeline_logger.log("  [9] OECD Work-Life - Reference data (OECD only)")
             pipeline_logger.log("=" * 50)
+            for host, limits in get_rate_limit_stats().items():
+                pipeline_logger.log(
+                    f"  {host}: {limits['requests']} requests, {limits['throughput_rps']} req/s, "
+                    f"{limits['throttled']} throttled, {limits['retries']} retries"
+                )
             pipeline_logger.finish(success=failed_count == 0)
         
         return {
             "success": True,
+            "run_id": store.run_id,
+            "resumed": store.resumed,
             "total": total_countries,
             "processed": success_count,
             "failed": failed_count,
             "duration_seconds": round(elapsed, 1),
+            "fetch_mode": "concurrent" if concurrent else "sequential",
+            "worldbank_mode": "bulk" if bulk_worldbank else "per-country",
+            "refresh_mode": "incremental" if incremental else "full",
+            "unchanged": unchanged_count,
+            "write_batches": writer.stats["batches"],
             "data_sources": [
                 "ILO_ILOSTAT",
                 "WHO_GHO", 
@@ -652,6 +891,11 @@ def run_full_pipeline(
         
     except Exception as e:
         logger.error(f"Pipeline crashed: {e}")
+        try:
+            db.rollback()
+            store.finish("failed", success_count, failed_count, error=str(e))
+        except Exception as finish_error:
+            logger.warning(f"Could not record run failure: {finish_error}")
         if use_pipeline_logger:
             pipeline_logger.error(f"Pipeline crashed: {e}")
             pipeline_logger.finish(success=False)
@@ -661,6 +905,28 @@ def run_full_pipeline(
         db.close()
 
 
+def resume_run(run_id: str, use_pipeline_logger: bool = True) -> Dict[str, Any]:
+    """
+    Resume an interrupted run_full_pipeline run with its original options.
+    
+    Countries already written are skipped and checkpointed source payloads
+    are reused, so only the unfinished part of the run is fetched again.
+    
+    Raises:
+        ValueError: If no run with this ID exists
+    """
+    db = SessionLocal()
+    try:
+        run = db.get(PipelineRun, run_id)
+        if run is None:
+            raise ValueError(f"Unknown pipeline run: {run_id}")
+        options = dict(run.options or {})
+    finally:
+        db.close()
+    
+    return run_full_pipeline(**options, use_pipeline_logger=use_pipeline_logger, run_id=run_id)
+
+
 # =============================================================================
 # CLI ENTRY POINT
 # =============================================================================
@@ -686,6 +952,45 @@ if __name__ == "__main__":
         action="store_true",
         help="Skip flag fetching"
     )
+    parser.add_argument(
+        "--concurrent",
+        action="store_true",
+        help="Fetch ILO/WB/WHO data for many countries in parallel"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_COUNTRY_WORKERS,
+        help=f"Countries fetched at once in concurrent mode (default: {DEFAULT_COUNTRY_WORKERS})"
+    )
+    parser.add_argument(
+        "--bulk-worldbank",
+        action="store_true",
+        help="Fetch World Bank indicators for all countries per request (paged bulk mode)"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only refresh stale sources / new upstream data; keep scores of unchanged countries"
+    )
+    parser.add_argument(
+        "--write-batch-size",
+        type=int,
+        default=None,
+        help="Countries per bulk database write transaction (default: ETL_WRITE_BATCH_SIZE)"
+    )
+    parser.add_argument(
+        "--resume",
+        type=str,
+        default=None,
+        metavar="RUN_ID",
+        help="Resume an interrupted run (its original options are reused)"
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Serve ILO/WB/WHO data from the on-disk response cache only (no network)"
+    )
     parser.add_argument(
         "--quiet",
         action="store_true",
@@ -694,6 +999,9 @@ if __name__ == "__main__":
     
     args = parser.parse_args()
     
+    if args.offline:
+        set_offline_mode(True)
+    
     print("=" * 60)
     print("GOHIP Platform - 9-Source Data Engine ETL Pipeline")
     print("=" * 60)
@@ -704,16 +1012,30 @@ if __name__ == "__main__":
     print("=" * 60)
     print()
     
-    result = run_full_pipeline(
-        batch_size=args.batch_size,
-        use_pipeline_logger=not args.quiet,
-        country_filter=args.countries,
-        fetch_flags=not args.no_flags,
-    )
+    if args.resume:
+        result = resume_run(args.resume, use_pipeline_logger=not args.quiet)
+    else:
+        result = run_full_pipeline(
+            batch_size=args.batch_size,
+            use_pipeline_logger=not args.quiet,
+            country_filter=args.countries,
+            fetch_flags=not args.no_flags,
+            concurrent=args.concurrent,
+            country_workers=args.workers,
+            bulk_worldbank=args.bulk_worldbank,
+            incremental=args.incremental,
+            write_batch_size=args.write_batch_size,
+        )
     
     print()
     print("=" * 60)
     print(f"Pipeline Complete: {result['processed']}/{result['total']} countries")
+    print(f"Run ID: {result['run_id']}{' (resumed)' if result['resumed'] else ''}")
     print(f"Failed: {result['failed']}")
-    print(f"Duration: {result['duration_seconds']}s")
+    if result["refresh_mode"] == "incremental":
+        print(f"Unchanged (not rescored): {result['unchanged']}")
+    print(f"Duration: {result['duration_seconds']}s ({result['fetch_mode']} fetch)")
+    cache = get_cache_stats()
+    print(f"Response cache: {cache['hits']} hits, {cache['revalidated']} revalidated, "
+          f"{cache['misses']} misses, {cache['offline_misses']} offline misses")
     print("=" * 60)
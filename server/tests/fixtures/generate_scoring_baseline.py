@@ -0,0 +1,270 @@
+"""
+Regenerate scoring_baseline.json from the row-by-row scoring implementation.
+
+The fixture freezes the scores produced by the per-country functions that
+preceded the columnar scoring engine (commit 6b1f203), run on seeded random
+metric rows with missing values, booleans, enum strings and rounding ties:
+
+- countries.calculate_governance_score / calculate_pillar1-3_score
+- countries POST /recalculate-scores (framework maturity rules)
+- metric_config POST /recalculate (default and randomised weights and rules)
+- database_fill_agent.recalculate_all_scores_standalone
+
+The endpoints are driven through a minimal in-memory session that serves
+the metric rows and records the UPDATE parameters.
+
+Usage (from server/):
+    git worktree add --detach /tmp/baseline 6b1f203
+    python tests/fixtures/generate_scoring_baseline.py --baseline /tmp/baseline/server
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+FIXTURE_PATH = Path(__file__).with_name("scoring_baseline.json")
+
+NUMERIC_RANGES = {
+    "inspector_density": 5.0,
+    "strategic_capacity_score": 100.0,
+    "fatal_accident_rate": 15.0,
+    "oel_compliance_pct": 100.0,
+    "safety_training_hours_avg": 60.0,
+    "carcinogen_exposure_pct": 60.0,
+    "control_maturity_score": 100.0,
+    "vulnerability_index": 100.0,
+    "disease_detection_rate": 100.0,
+    "occupational_disease_reporting_rate": 100.0,
+    "lead_exposure_screening_rate": 100.0,
+    "rehab_access_score": 100.0,
+    "return_to_work_success_pct": 100.0,
+    "rehab_participation_rate": 100.0,
+    "avg_claim_settlement_days": 500.0,
+}
+BOOLEAN_METRICS = ("ilo_c187_status", "ilo_c155_status", "mental_health_policy", "reintegration_law")
+ENUM_VALUES = {
+    "surveillance_logic": ["Risk-Based", "risk_based", "Mandatory", "None"],
+    "payer_mechanism": ["No-Fault", "Litigation", "no fault"],
+}
+CONFIGURABLE_METRICS = {
+    "governance": ["ilo_c187_status", "ilo_c155_status", "inspector_density",
+                   "mental_health_policy", "strategic_capacity_score"],
+    "pillar_1_hazard": ["fatal_accident_rate", "oel_compliance_pct", "safety_training_hours_avg",
+                        "carcinogen_exposure_pct", "control_maturity_score"],
+    "pillar_2_vigilance": ["vulnerability_index", "disease_detection_rate",
+                           "occupational_disease_reporting_rate", "lead_exposure_screening_rate"],
+    "pillar_3_restoration": ["rehab_access_score", "return_to_work_success_pct",
+                             "rehab_participation_rate", "avg_claim_settlement_days"],
+}
+
+# Column order of the joined SELECT in /recalculate and the fill agent
+SELECT_COLUMNS = (
+    "iso_code",
+    "ilo_c187_status", "ilo_c155_status", "inspector_density",
+    "mental_health_policy", "strategic_capacity_score",
+    "fatal_accident_rate", "oel_compliance_pct", "safety_training_hours_avg",
+    "carcinogen_exposure_pct", "control_maturity_score",
+    "vulnerability_index", "disease_detection_rate",
+    "occupational_disease_reporting_rate", "lead_exposure_screening_rate",
+    "surveillance_logic",
+    "rehab_access_score", "return_to_work_success_pct",
+    "rehab_participation_rate", "avg_claim_settlement_days",
+    "reintegration_law", "payer_mechanism",
+)
+FRAMEWORK_COLUMNS = ("iso_code", "fatal_accident_rate", "inspector_density", "reintegration_law")
+
+
+# =============================================================================
+# RANDOM INPUTS
+# =============================================================================
+
+def random_value(rng: random.Random, max_value: float) -> Optional[float]:
+    """None, a boundary, a two-decimal tie candidate or a uniform float."""
+    kind = rng.random()
+    if kind < 0.2:
+        return None
+    if kind < 0.3:
+        return rng.choice([0.0, max_value, -1.0, max_value * 2, 1.0, 3.0])
+    if kind < 0.5:
+        return round(rng.uniform(0, max_value), 2)
+    return rng.uniform(0, max_value)
+
+
+def random_rows(rng: random.Random, rows: int) -> List[Dict[str, Any]]:
+    metric_rows = []
+    for index in range(rows):
+        metrics = {"iso_code": f"R{index:04d}"}
+        metrics.update({name: random_value(rng, max_value) for name, max_value in NUMERIC_RANGES.items()})
+        for name in BOOLEAN_METRICS:
+            metrics[name] = rng.choice([True, False, None])
+        for name, values in ENUM_VALUES.items():
+            metrics[name] = rng.choice(values + [None])
+        metric_rows.append(metrics)
+    return metric_rows
+
+
+def random_pillar_weights(rng: random.Random) -> Dict[str, Dict[str, Any]]:
+    """Admin-style pillar weights: shuffled order, zero and unknown metrics included."""
+    pillar_weights = {}
+    for pillar, metrics in CONFIGURABLE_METRICS.items():
+        keys = list(metrics) + ["unknown_metric"]
+        rng.shuffle(keys)
+        pillar_weights[pillar] = {
+            key: {"weight": rng.choice([0, 0.05, 0.1, 0.15, 0.2, 0.25, 0.3, 0.35, 1, 2])}
+            for key in keys if rng.random() < 0.85
+        }
+    return pillar_weights
+
+
+def random_rules(rng: random.Random, default_rules: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Default rules with randomised impacts, thresholds and active flags, shuffled."""
+    rules = []
+    for rule in default_rules:
+        rule = dict(rule, condition_config=dict(rule.get("condition_config") or {}))
+        rule["impact_value"] = rng.choice([0.5, 1.0, 1.5, 2.0, 0.1, 0.3])
+        if isinstance(rule["condition_config"].get("value"), (int, float)):
+            rule["condition_config"]["value"] = rng.choice([0.5, 1.0, 2.0, 3.0, 5.0])
+        rule["is_active"] = rng.random() < 0.85
+        rules.append(rule)
+    rng.shuffle(rules)
+    return rules
+
+
+# =============================================================================
+# IN-MEMORY SESSION
+# =============================================================================
+
+class _Query:
+    def __init__(self, items: List[Any]):
+        self._items = items
+
+    def filter(self, *args):
+        return self
+
+    def order_by(self, *args):
+        return self
+
+    def all(self):
+        return self._items
+
+
+class RecordingSession:
+    """Serves the metric SELECT and the config queries, records UPDATE params by ISO code."""
+
+    def __init__(self, rows: List[tuple], summaries: List[Any] = (), rules: List[Any] = ()):
+        self._rows = rows
+        self._models = {"PillarSummaryMetric": list(summaries), "MaturityScoringRule": list(rules)}
+        self.updates: Dict[str, Dict[str, Any]] = {}
+
+    def query(self, model):
+        return _Query(self._models[model.__name__])
+
+    def execute(self, statement, params=None):
+        if str(statement).lstrip().upper().startswith("UPDATE"):
+            params = dict(params)
+            iso_code = params.pop("iso_code", None) or params.pop("iso")
+            params.pop("now", None)
+            self.updates[iso_code] = params
+            return None
+        return SimpleNamespace(fetchall=lambda: self._rows)
+
+    def commit(self):
+        pass
+
+
+def _table(metric_rows: List[Dict[str, Any]], columns) -> List[tuple]:
+    return [tuple(m[column] for column in columns) for m in metric_rows]
+
+
+# =============================================================================
+# BASELINE SCORES
+# =============================================================================
+
+def generate(rows: int, configs: int, seed: int) -> Dict[str, Any]:
+    from app.api.endpoints import countries, metric_config
+    from app.models.metric_config import DEFAULT_MATURITY_RULES, DEFAULT_PILLAR_SUMMARIES
+    from app.services.database_fill_agent import recalculate_all_scores_standalone
+
+    rng = random.Random(seed)
+    metric_rows = random_rows(rng, rows)
+    table = _table(metric_rows, SELECT_COLUMNS)
+
+    expert = [{
+        "governance_score": countries.calculate_governance_score(
+            m["ilo_c187_status"], m["ilo_c155_status"], m["inspector_density"],
+            m["mental_health_policy"], m["strategic_capacity_score"]),
+        "pillar1_score": countries.calculate_pillar1_score(
+            m["fatal_accident_rate"], m["oel_compliance_pct"], m["safety_training_hours_avg"],
+            m["carcinogen_exposure_pct"], m["control_maturity_score"]),
+        "pillar2_score": countries.calculate_pillar2_score(
+            m["vulnerability_index"], m["disease_detection_rate"],
+            m["occupational_disease_reporting_rate"], m["lead_exposure_screening_rate"]),
+        "pillar3_score": countries.calculate_pillar3_score(
+            m["rehab_access_score"], m["return_to_work_success_pct"],
+            m["rehab_participation_rate"], m["avg_claim_settlement_days"]),
+    } for m in metric_rows]
+
+    session = RecordingSession(_table(metric_rows, FRAMEWORK_COLUMNS))
+    asyncio.run(countries.recalculate_all_scores(db=session))
+    framework_maturity = [session.updates[m["iso_code"]]["score"] for m in metric_rows]
+
+    default_weights = {s["pillar"].value: s["component_weights"] for s in DEFAULT_PILLAR_SUMMARIES}
+    configured = []
+    for config in range(configs):
+        pillar_weights = default_weights if config == 0 else random_pillar_weights(rng)
+        rules = DEFAULT_MATURITY_RULES if config == 0 else random_rules(rng, DEFAULT_MATURITY_RULES)
+        # Rules as the endpoint loads them: active only, in priority order
+        rules = sorted((dict(r) for r in rules if r.get("is_active", True)), key=lambda r: r.get("priority", 0))
+        session = RecordingSession(
+            table,
+            summaries=[SimpleNamespace(pillar=SimpleNamespace(value=pillar), component_weights=weights)
+                       for pillar, weights in pillar_weights.items()],
+            rules=[SimpleNamespace(to_dict=lambda rule=rule: rule) for rule in rules],
+        )
+        asyncio.run(metric_config.recalculate_all_scores(
+            db=session, current_user=SimpleNamespace(email="fixture@gohip.local")))
+        configured.append({
+            "pillar_weights": pillar_weights,
+            "rules": rules,
+            "scores": [session.updates[m["iso_code"]] for m in metric_rows],
+        })
+
+    session = RecordingSession(table)
+    recalculate_all_scores_standalone(session)
+    fill_agent = [{
+        "governance_score": update["gov"],
+        "pillar1_score": update["p1"],
+        "pillar2_score": update["p2"],
+        "pillar3_score": update["p3"],
+        "maturity_score": update["maturity"],
+    } for update in (session.updates[m["iso_code"]] for m in metric_rows)]
+
+    return {
+        "seed": seed,
+        "rows": metric_rows,
+        "expert": expert,
+        "framework_maturity": framework_maturity,
+        "configured": configured,
+        "fill_agent": fill_agent,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Regenerate the frozen scoring baseline fixture")
+    parser.add_argument("--baseline", required=True,
+                        help="server/ directory of a checkout of the row-by-row implementation")
+    parser.add_argument("--rows", type=int, default=300, help="Random metric rows (default: 300)")
+    parser.add_argument("--configs", type=int, default=5,
+                        help="Weight / rule configurations, the first is the default (default: 5)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(Path(args.baseline).resolve()))
+    fixture = generate(args.rows, args.configs, args.seed)
+    FIXTURE_PATH.write_text(json.dumps(fixture, separators=(",", ":")) + "\n")
+    print(f"Wrote {FIXTURE_PATH} ({args.rows} rows, {args.configs} configurations)")
@@ -0,0 +1,62 @@
+"""Tests for AI call traces written outside the caller's session."""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+from app.models.user import AIProvider
+from app.services import ai_call_tracer, ai_service
+from app.services.ai_call_tracer import AICallTracer
+from app.services.llm_cache import llm_cache
+
+
+class _Session:
+    def __init__(self, fail_commit=False):
+        self.fail_commit = fail_commit
+        self.events = []
+
+    def add(self, trace):
+        self.events.append("add")
+
+    def commit(self):
+        if self.fail_commit:
+            raise RuntimeError("database unavailable")
+        self.events.append("commit")
+
+    def rollback(self):
+        self.events.append("rollback")
+
+    def close(self):
+        self.events.append("close")
+
+
+def test_trace_detached_uses_and_closes_its_own_session(monkeypatch):
+    sessions = []
+    monkeypatch.setattr(ai_call_tracer, "SessionLocal", lambda: sessions.append(_Session(fail_commit=True)) or sessions[-1])
+
+    AICallTracer.trace_detached(provider="openai", model_name="gpt-4o", operation_type="ai_service", success=True)
+
+    assert sessions[0].events == ["add", "rollback", "close"]
+
+
+def test_call_ai_api_traces_off_the_event_loop(monkeypatch):
+    traced = []
+    session = _Session()
+    monkeypatch.setattr(ai_call_tracer, "SessionLocal", lambda: session)
+    monkeypatch.setattr(
+        AICallTracer, "trace",
+        staticmethod(lambda db, **fields: traced.append((db, threading.get_ident(), fields["success"]))),
+    )
+    monkeypatch.setattr(llm_cache, "lookup", lambda request: (None, "miss"))
+    monkeypatch.setattr(ai_service, "_call_llm_sync_safe", lambda config, prompt, system: "fresh")
+    caller_session = _Session()
+    ai_config = SimpleNamespace(
+        provider=AIProvider.openai, model_name="gpt-4o", api_key_encrypted=None,
+        temperature=0.7, max_tokens=None,
+    )
+
+    asyncio.run(ai_service.call_ai_api(caller_session, ai_config, "prompt"))
+
+    assert [(db, success) for db, _, success in traced] == [(session, True)]
+    assert traced[0][1] != threading.get_ident()
+    assert caller_session.events == [] and session.events == ["close"]
@@ -0,0 +1,21 @@
+"""Tests for the pooled ETL HTTP clients."""
+
+import asyncio
+
+from app.services.etl.http_pool import aclose_async_client, get_async_client
+from app.services.etl.response_cache import CachingAsyncTransport
+
+
+def test_uncached_async_client_skips_response_cache():
+    async def transports():
+        try:
+            cached, uncached = get_async_client(), get_async_client(cached=False)
+            assert get_async_client(cached=False) is uncached
+            return cached._transport, uncached._transport
+        finally:
+            await aclose_async_client()
+
+    cached, uncached = asyncio.run(transports())
+
+    assert isinstance(cached, CachingAsyncTransport)
+    assert not isinstance(uncached, CachingAsyncTransport)
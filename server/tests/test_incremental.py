@@ -0,0 +1,39 @@
+"""Tests for incremental refresh state on resumed runs."""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+from app.services.etl.checkpoints import RunCheckpointStore
+from app.services.etl.incremental import IncrementalPlanner
+
+EARLIER = datetime(2026, 1, 5, 8, 30)
+
+
+def test_refresh_update_keeps_checkpoint_fetch_time():
+    planner = IncrementalPlanner(None)
+    planner._snapshots["DEU"] = None
+    source_data = {"ilo": {"fatal_accident_rate": 0.8}, "worldbank": {}, "who": {}}
+
+    update = planner.refresh_update(
+        "DEU", source_data, ["ilo", "worldbank"], "fingerprint", scored=True,
+        fetched_at={"worldbank": EARLIER},
+    )
+
+    assert update.timestamps["last_worldbank_update"] == EARLIER
+    assert update.state["sources"]["worldbank"]["fetched_at"] == EARLIER.isoformat()
+    assert datetime.utcnow() - update.timestamps["last_ilostat_update"] < timedelta(minutes=1)
+    assert "who" not in update.state["sources"]
+
+
+def test_checkpoint_store_loads_fetch_times():
+    checkpoints = [
+        SimpleNamespace(country_iso_code="DEU", source="worldbank", status="fetched", payload={}, updated_at=EARLIER),
+        SimpleNamespace(country_iso_code="DEU", source="pipeline", status="failed", payload=None, updated_at=EARLIER),
+    ]
+    query = SimpleNamespace(filter=lambda *args: SimpleNamespace(all=lambda: checkpoints))
+    store = RunCheckpointStore(SimpleNamespace(query=lambda model: query), "run-1")
+
+    store._load()
+
+    assert store.fetched_sources("DEU") == {"worldbank": {}}
+    assert store.fetched_at("DEU") == {"worldbank": EARLIER}
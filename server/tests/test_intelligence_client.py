@@ -0,0 +1,64 @@
+"""Tests for the World Bank extended-indicator bulk fetch."""
+
+import httpx
+import pytest
+
+from app.services.etl import intelligence_client
+from app.services.etl.intelligence_client import IntelligenceClient
+from app.services.etl.wb_client import BulkFetchIncompleteError
+
+PAGES = {
+    1: [{"country": "DEU", "date": "2022", "value": 25.0}, {"country": "WLD", "date": "2022", "value": 27.0}],
+    2: [{"country": "FRA", "date": "2021", "value": 17.5}],
+    3: [{"country": "DEU", "date": "2023", "value": 26.0}],
+}
+
+
+def _client_for(failing_page=None, status_code=503):
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        if page == failing_page:
+            return httpx.Response(status_code)
+        records = [
+            {"countryiso3code": r["country"], "date": r["date"], "value": r["value"]} for r in PAGES[page]
+        ]
+        return httpx.Response(200, json=[{"page": page, "pages": len(PAGES)}, records])
+
+    return httpx.Client(transport=httpx.MockTransport(handler))
+
+
+def test_bulk_fetch_folds_every_page(monkeypatch):
+    monkeypatch.setattr(intelligence_client, "get_sync_client", lambda: _client_for())
+
+    results = IntelligenceClient().fetch_wb_indicator_bulk_sync("GE.EST", ["DEU", "FRA"])
+
+    assert set(results) == {"DEU", "FRA"}
+    assert results["DEU"]["value"] == 26.0 and results["DEU"]["year"] == "2023"
+    assert results["FRA"]["source"] == "https://data.worldbank.org/indicator/GE.EST"
+
+
+@pytest.mark.parametrize("failing_page", [1, 2, 3])
+def test_bulk_fetch_raises_on_failed_page(monkeypatch, failing_page):
+    monkeypatch.setattr(intelligence_client, "get_sync_client", lambda: _client_for(failing_page))
+
+    with pytest.raises(BulkFetchIncompleteError):
+        IntelligenceClient().fetch_wb_indicator_bulk_sync("GE.EST", ["DEU", "FRA"])
+
+
+def test_bulk_fetch_raises_on_error_message_page(monkeypatch):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=[{"message": [{"id": "120", "value": "Invalid value"}]}])
+
+    monkeypatch.setattr(
+        intelligence_client, "get_sync_client", lambda: httpx.Client(transport=httpx.MockTransport(handler))
+    )
+
+    with pytest.raises(BulkFetchIncompleteError):
+        IntelligenceClient().fetch_wb_indicator_bulk_sync("GE.EST")
+
+
+def test_all_intelligence_bulk_never_returns_partial_results(monkeypatch):
+    monkeypatch.setattr(intelligence_client, "get_sync_client", lambda: _client_for(failing_page=2))
+
+    with pytest.raises(BulkFetchIncompleteError):
+        IntelligenceClient().fetch_all_intelligence_bulk(["DEU", "FRA"])
@@ -0,0 +1,96 @@
+"""Tests for IntelligencePipeline.run batched writes."""
+
+from types import SimpleNamespace
+
+from app.models.country import CountryIntelligence
+from app.services.etl import bulk_writer
+from app.services.etl.bulk_writer import BulkUpsertWriter, CountryWrite
+from app.services.etl.incremental import REFRESH_STATE_KEY
+from app.services.etl.intelligence_pipeline import IntelligencePipeline
+
+WB_DATA = {"iso_code": "DEU", "sources_used": ["WB_GOVERNANCE"], "government_effectiveness": 1.5}
+
+
+class _Session:
+    """Serves the two preload queries of IntelligencePipeline.run."""
+
+    def __init__(self, names, stored):
+        self._names = names
+        self._stored = stored
+
+    def query(self, *entities):
+        rows = self._stored if entities[0] is CountryIntelligence else list(self._names.items())
+        return SimpleNamespace(filter=lambda *args: rows)
+
+
+class _RecordingWriter:
+    """Stands in for BulkUpsertWriter: buffers writes and records each flushed batch."""
+
+    instances = []
+
+    def __init__(self, db, batch_size=None, before_commit=None, intelligence=None):
+        self.batch_size = batch_size or 2
+        self.batches = []
+        self._buffer = []
+        self.stats = {"batches": 0, "statements": 0}
+        _RecordingWriter.instances.append(self)
+
+    @property
+    def pending(self):
+        return len(self._buffer)
+
+    def add(self, write):
+        self._buffer.append(write)
+        return self.flush() if len(self._buffer) >= self.batch_size else {}
+
+    def flush(self):
+        if self._buffer:
+            self.batches.append(self._buffer)
+            self._buffer = []
+        return {}
+
+
+def test_run_writes_in_batches_with_fingerprints(monkeypatch):
+    monkeypatch.setattr(bulk_writer, "BulkUpsertWriter", _RecordingWriter)
+    stored = [SimpleNamespace(country_iso_code="FRA")]
+    pipeline = IntelligencePipeline(_Session({"DEU": "Germany", "FRA": "France", "ITA": "Italy"}, stored))
+    monkeypatch.setattr(pipeline.client, "fetch_all_intelligence_bulk", lambda codes: {"DEU": WB_DATA})
+
+    stats = pipeline.run(["DEU", "FRA", "ITA", "XXX"], bulk_worldbank=True, batch_size=2)
+
+    writer = _RecordingWriter.instances[-1]
+    assert [[write.iso_code for write in batch] for batch in writer.batches] == [["DEU", "FRA"], ["ITA"]]
+    writes = {write.iso_code: write for batch in writer.batches for write in batch}
+    assert all(write.intelligence_only for write in writes.values())
+    assert writes["DEU"].wb_extended == WB_DATA and writes["DEU"].intelligence_fingerprint
+    assert writes["FRA"].intelligence_fingerprint is None
+    assert stats["countries_processed"] == 3
+    assert stats["intelligence_created"] == 2 and stats["intelligence_updated"] == 1
+    assert stats["errors"] == ["XXX: Country XXX not found in database"]
+
+
+def test_intelligence_only_write_stores_fingerprint_with_existing_state():
+    writer = BulkUpsertWriter(None, intelligence=IntelligencePipeline(None))
+    current = CountryIntelligence(
+        id="intel-deu",
+        country_iso_code="DEU",
+        data_sources={REFRESH_STATE_KEY: {"inputs_fingerprint": "core"}},
+    )
+
+    intel = writer._build_intelligence(
+        CountryWrite(
+            iso_code="DEU",
+            name="Germany",
+            wb_extended=WB_DATA,
+            intelligence_only=True,
+            intelligence_fingerprint="extended",
+        ),
+        current,
+    )
+
+    assert intel.government_effectiveness == 1.5
+    assert intel.overall_intelligence_score is not None
+    assert intel.data_sources[REFRESH_STATE_KEY] == {
+        "inputs_fingerprint": "core",
+        "intelligence_fingerprint": "extended",
+    }
@@ -0,0 +1,42 @@
+"""Tests for when LLM calls consult the response cache."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.models.user import AIProvider
+from app.services import ai_service
+from app.services.llm_cache import LLMRequest, cache_enabled, llm_cache
+
+
+def _request(temperature):
+    return LLMRequest("openai", "gpt-4o", "system", "user", temperature, partition="DEU")
+
+
+@pytest.mark.parametrize("temperature, expected", [(0, True), (0.0, True), (0.7, False), (None, False)])
+def test_default_caches_deterministic_requests_only(temperature, expected):
+    assert cache_enabled(_request(temperature)) is expected
+
+
+def test_explicit_use_cache_overrides_default():
+    assert cache_enabled(_request(0.7), use_cache=True)
+    assert not cache_enabled(_request(0), use_cache=False)
+
+
+@pytest.mark.parametrize("temperature, use_cache, consulted", [(0.7, None, False), (0, None, True), (0, False, False)])
+def test_call_ai_api_consults_cache_per_policy(monkeypatch, temperature, use_cache, consulted):
+    lookups = []
+    monkeypatch.setattr(llm_cache, "lookup", lambda request: lookups.append(request) or (None, "miss"))
+    monkeypatch.setattr(llm_cache, "store", lambda request, response: None)
+    monkeypatch.setattr(ai_service, "_call_llm_sync_safe", lambda config, prompt, system: "fresh")
+    monkeypatch.setattr(ai_service, "_trace_call", lambda *args, **kwargs: None)
+    ai_config = SimpleNamespace(
+        provider=AIProvider.openai, model_name="gpt-4o", api_key_encrypted=None,
+        temperature=temperature, max_tokens=None,
+    )
+
+    result = asyncio.run(ai_service.call_ai_api(None, ai_config, "prompt", use_cache=use_cache))
+
+    assert result == "fresh"
+    assert bool(lookups) is consulted
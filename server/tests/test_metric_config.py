@@ -0,0 +1,47 @@
+"""Tests for the metric configuration recalculation endpoint."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.endpoints.metric_config import recalculate_all_scores
+from app.models.metric_config import MaturityScoringRule
+
+INVALID_RULE = {
+    "rule_key": "payer_bonus",
+    "condition_type": "enum",
+    "condition_config": {"metric": "payer_mechanism", "equals": 1},
+    "impact_type": "add",
+    "impact_value": 0.5,
+}
+
+
+class _Query:
+    def __init__(self, items):
+        self._items = items
+
+    def filter(self, *args):
+        return self
+
+    def order_by(self, *args):
+        return self
+
+    def all(self):
+        return self._items
+
+
+class _Session:
+    def query(self, model):
+        if model is MaturityScoringRule:
+            return _Query([SimpleNamespace(to_dict=lambda: INVALID_RULE)])
+        return _Query([])
+
+
+def test_recalculate_rejects_stored_invalid_rule():
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(recalculate_all_scores(db=_Session(), current_user=SimpleNamespace(email="admin@gohip.local")))
+
+    assert error.value.status_code == 400
+    assert "payer_bonus" in error.value.detail
@@ -0,0 +1,71 @@
+"""Regression tests for the ETL HTTP response cache transports."""
+
+import asyncio
+import gzip
+import json
+
+import httpx
+
+from app.services.etl.response_cache import (
+    CachingAsyncTransport,
+    CachingSyncTransport,
+    ResponseCache,
+)
+
+PAYLOAD = {"page": 1, "data": [{"country": "DEU", "value": 42.0}]}
+URL = "https://api.worldbank.org/v2/country/all/indicator/SP.POP.TOTL?format=json"
+
+
+def _gzip_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(
+        200,
+        headers={"content-type": "application/json", "content-encoding": "gzip"},
+        content=gzip.compress(json.dumps(PAYLOAD).encode("utf-8")),
+    )
+
+
+def _cache(tmp_path) -> ResponseCache:
+    return ResponseCache(cache_dir=str(tmp_path), max_bytes=10 * 1024 * 1024)
+
+
+def test_sync_transport_gzip_round_trip(tmp_path):
+    transport = CachingSyncTransport(httpx.MockTransport(_gzip_handler), _cache(tmp_path))
+    with httpx.Client(transport=transport) as client:
+        miss = client.get(URL)
+        hit = client.get(URL)
+
+    assert miss.headers["x-gohip-cache"] == "miss"
+    assert hit.headers["x-gohip-cache"] == "hit"
+    for response in (miss, hit):
+        assert response.json() == PAYLOAD
+        assert "content-encoding" not in response.headers
+
+
+def test_async_transport_gzip_round_trip(tmp_path):
+    async def fetch_twice():
+        transport = CachingAsyncTransport(httpx.MockTransport(_gzip_handler), _cache(tmp_path))
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await client.get(URL), await client.get(URL)
+
+    miss, hit = asyncio.run(fetch_twice())
+
+    assert miss.headers["x-gohip-cache"] == "miss"
+    assert hit.headers["x-gohip-cache"] == "hit"
+    for response in (miss, hit):
+        assert response.json() == PAYLOAD
+
+
+def test_entries_stored_with_content_encoding_replay_decoded(tmp_path):
+    cache = _cache(tmp_path)
+    transport = CachingSyncTransport(httpx.MockTransport(_gzip_handler), cache)
+    with httpx.Client(transport=transport) as client:
+        client.get(URL)
+
+    # Simulate an entry written before content-encoding was dropped
+    key = next(iter(cache._load_index()))
+    entry = cache.get(key)
+    entry.headers.append(("content-encoding", "gzip"))
+    cache.put(key, entry)
+
+    with httpx.Client(transport=transport) as client:
+        assert client.get(URL).json() == PAYLOAD
@@ -0,0 +1,33 @@
+"""Tests for the compiled maturity rule engine."""
+
+import pytest
+
+from app.services.rule_engine import compile_condition, compile_rules
+
+
+def test_enum_condition_normalises_labels():
+    condition = compile_condition("enum", {"metric": "payer_mechanism", "equals": "No-Fault"})
+
+    assert condition({"payer_mechanism": "no fault"})
+    assert condition({"payer_mechanism": "NO_FAULT"})
+    assert not condition({"payer_mechanism": "Litigation"})
+    assert not condition({"payer_mechanism": None})
+
+
+@pytest.mark.parametrize("expected", [None, 1, True, ["No-Fault"]])
+def test_enum_condition_rejects_non_string_expectation(expected):
+    with pytest.raises(ValueError, match="payer_mechanism"):
+        compile_condition("enum", {"metric": "payer_mechanism", "equals": expected})
+
+
+def test_rule_set_with_invalid_enum_condition_fails_to_compile():
+    rules = [{
+        "rule_key": "payer_bonus",
+        "condition_type": "enum",
+        "condition_config": {"metric": "payer_mechanism", "equals": 1},
+        "impact_type": "add",
+        "impact_value": 0.5,
+    }]
+
+    with pytest.raises(ValueError, match="Rule 'payer_bonus'"):
+        compile_rules(rules)
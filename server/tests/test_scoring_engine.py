@@ -0,0 +1,124 @@
+"""
+Parity tests for the columnar scoring engine.
+
+Scores are compared with frozen outputs of the row-by-row implementation
+that preceded the engine (tests/fixtures/scoring_baseline.json, see
+tests/fixtures/generate_scoring_baseline.py). They must match exactly,
+None for None.
+"""
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from app.api.endpoints.countries import (
+    FRAMEWORK_MATURITY_RULES,
+    calculate_governance_score,
+    calculate_pillar1_score,
+    calculate_pillar2_score,
+    calculate_pillar3_score,
+)
+from app.api.endpoints.metric_config import calculate_score_with_rules
+from app.services import country_listing
+from app.services.database_fill_agent import _fill_agent_maturity
+from app.services.rule_engine import compile_rules
+from app.services.scoring_engine import (
+    EXPERT_PROFILE,
+    FILL_AGENT_PROFILE,
+    MetricMatrix,
+    profile_from_pillar_weights,
+    score_matrix,
+    score_maturity,
+    write_scores,
+)
+
+BASELINE = json.loads((Path(__file__).parent / "fixtures" / "scoring_baseline.json").read_text())
+ROWS = BASELINE["rows"]
+
+
+@pytest.fixture(scope="module")
+def matrix() -> MetricMatrix:
+    return MetricMatrix.from_rows(ROWS)
+
+
+def _by_row(scores):
+    fields = list(scores)
+    return [dict(zip(fields, values)) for values in zip(*scores.values())]
+
+
+def test_expert_profile_matches_baseline(matrix):
+    assert _by_row(score_matrix(matrix, EXPERT_PROFILE)) == BASELINE["expert"]
+
+
+def test_countries_score_functions_match_baseline():
+    scores = [{
+        "governance_score": calculate_governance_score(
+            m["ilo_c187_status"], m["ilo_c155_status"], m["inspector_density"],
+            m["mental_health_policy"], m["strategic_capacity_score"]),
+        "pillar1_score": calculate_pillar1_score(
+            m["fatal_accident_rate"], m["oel_compliance_pct"], m["safety_training_hours_avg"],
+            m["carcinogen_exposure_pct"], m["control_maturity_score"]),
+        "pillar2_score": calculate_pillar2_score(
+            m["vulnerability_index"], m["disease_detection_rate"],
+            m["occupational_disease_reporting_rate"], m["lead_exposure_screening_rate"]),
+        "pillar3_score": calculate_pillar3_score(
+            m["rehab_access_score"], m["return_to_work_success_pct"],
+            m["rehab_participation_rate"], m["avg_claim_settlement_days"]),
+    } for m in ROWS]
+    assert scores == BASELINE["expert"]
+
+
+def test_framework_maturity_matches_baseline(matrix):
+    scores = score_maturity(matrix, compile_rules(FRAMEWORK_MATURITY_RULES)).tolist()
+    assert scores == BASELINE["framework_maturity"]
+
+
+@pytest.mark.parametrize("config", range(len(BASELINE["configured"])))
+def test_configured_weights_and_rules_match_baseline(matrix, config):
+    expected = BASELINE["configured"][config]
+    scores = score_matrix(
+        matrix,
+        profile_from_pillar_weights(expected["pillar_weights"]),
+        rules=compile_rules(expected["rules"]),
+    )
+    assert _by_row(scores) == [
+        {field: row[field] for field in scores} for row in expected["scores"]
+    ]
+
+
+@pytest.mark.parametrize("config", range(len(BASELINE["configured"])))
+def test_calculate_score_with_rules_matches_baseline(config):
+    expected = BASELINE["configured"][config]
+    scores = [
+        calculate_score_with_rules(
+            expected["rules"],
+            fatal_rate=m["fatal_accident_rate"],
+            inspector_density=m["inspector_density"],
+            surveillance_logic=m["surveillance_logic"],
+            reintegration_law=m["reintegration_law"],
+            payer_mechanism=m["payer_mechanism"],
+        )
+        for m in ROWS
+    ]
+    assert scores == [row["maturity_score"] for row in expected["scores"]]
+
+
+def test_fill_agent_profile_matches_baseline(matrix):
+    scores = score_matrix(matrix, FILL_AGENT_PROFILE, maturity=_fill_agent_maturity)
+    assert _by_row(scores) == BASELINE["fill_agent"]
+
+
+def test_write_scores_drops_cached_listing_totals(monkeypatch):
+    statements = []
+    db = SimpleNamespace(
+        execute=lambda statement, params: statements.append(params),
+        connection=lambda: SimpleNamespace(execute=lambda statement: None),
+    )
+    monkeypatch.setitem(country_listing._counts, country_listing.CountryFilters(), (195, 0.0))
+
+    stats = write_scores(db, ["DEU", "FRA"], {"maturity_score": [3.5, 2.0]})
+
+    assert stats.rows == 2 and len(statements) == 1
+    assert country_listing._counts == {}
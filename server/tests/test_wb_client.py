@@ -0,0 +1,52 @@
+"""Tests for the World Bank bulk (/country/all/) fetch."""
+
+import httpx
+import pytest
+
+from app.services.etl import wb_client
+from app.services.etl.loop_runner import run_sync
+from app.services.etl.wb_client import BulkFetchIncompleteError, WorldBankClient
+
+PAGES = {
+    1: [{"country": "DEU", "date": "2022", "value": 25.0}, {"country": "WLD", "date": "2022", "value": 27.0}],
+    2: [{"country": "FRA", "date": "2021", "value": 17.5}],
+    3: [{"country": "DEU", "date": "2023", "value": 26.0}],
+}
+
+
+def _client_for(failing_page=None):
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        if page == failing_page:
+            return httpx.Response(500)
+        records = [
+            {"countryiso3code": r["country"], "date": r["date"], "value": r["value"]} for r in PAGES[page]
+        ]
+        return httpx.Response(200, json=[{"page": page, "pages": len(PAGES)}, records])
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def test_bulk_fetch_folds_every_page(monkeypatch):
+    monkeypatch.setattr(wb_client, "get_async_client", lambda: _client_for())
+
+    results = run_sync(WorldBankClient().fetch_indicator_all_countries("SL.EMP.VULN.ZS", "Vulnerable Employment", ["DEU", "FRA"]))
+
+    assert set(results) == {"DEU", "FRA"}
+    assert results["DEU"]["value"] == 26.0 and results["DEU"]["year"] == 2023
+    assert results["FRA"]["source"] == "https://data.worldbank.org/indicator/SL.EMP.VULN.ZS"
+
+
+def test_bulk_fetch_without_country_codes_keeps_aggregates(monkeypatch):
+    monkeypatch.setattr(wb_client, "get_async_client", lambda: _client_for())
+
+    results = run_sync(WorldBankClient().fetch_indicator_all_countries("SL.EMP.VULN.ZS"))
+
+    assert "WLD" in results
+
+
+def test_bulk_fetch_raises_on_failed_page(monkeypatch):
+    monkeypatch.setattr(wb_client, "get_async_client", lambda: _client_for(failing_page=3))
+
+    with pytest.raises(BulkFetchIncompleteError):
+        run_sync(WorldBankClient().fetch_indicator_all_countries("SL.EMP.VULN.ZS", "Vulnerable Employment"))
@@ -0,0 +1,35 @@
+"""Tests for the web search cache warm-up query set and budget."""
+
+from app.services import ai_orchestrator
+from app.services.ai_orchestrator import WebSearchResults, build_research_queries, deep_dive_search_query
+from app.services.web_research import RESEARCH_QUERIES
+from app.services.web_search_cache import (
+    WARM_AGENT_TOPICS,
+    WARM_DEEP_DIVE_TOPICS,
+    standard_queries,
+    warm_search_cache,
+)
+
+
+def test_standard_queries_match_the_research_callers():
+    queries = dict(standard_queries("Germany"))
+
+    expected = build_research_queries("Germany", WARM_AGENT_TOPICS[0], num_queries=RESEARCH_QUERIES)
+    expected.append(deep_dive_search_query("Germany", WARM_DEEP_DIVE_TOPICS[0]))
+    assert list(queries) == expected
+
+
+def test_warm_up_respects_cap_and_provider_allow_list(monkeypatch):
+    calls = []
+
+    def fake_search_web(query, num_results=10, providers=None):
+        calls.append((query, providers))
+        return WebSearchResults(query, "bing", [{"title": "t", "url": "https://example.org", "snippet": ""}])
+
+    monkeypatch.setattr(ai_orchestrator, "search_web", fake_search_web)
+
+    summary = warm_search_cache(["DEU", "FRA", "ITA"], max_queries=4, delay_seconds=0)
+
+    assert summary["fetched"] == 4 and summary["capped"]
+    assert summary["skipped"] >= 1  # "latest developments" queries expire within a day
+    assert all(providers == ("bing", "google", "duckduckgo") for _, providers in calls)